@@ -0,0 +1,137 @@
+"""Store task history and artifacts as rows.
+
+Revision ID: 20261018_0001
+Revises: 20260119_0001
+Create Date: 2026-10-18 09:00:00.000000
+
+Appending to tasks.history and tasks.artifacts with jsonb concatenation makes
+PostgreSQL rewrite the whole TOASTed value, and update its GIN index, on every
+turn. This migration moves them into task_messages and task_artifacts, one row
+per message or artifact keyed by (task_id, seq):
+- appends become plain inserts
+- the last N messages of a task are a primary key range scan
+
+Existing data is copied over in order, then the JSONB columns and their GIN
+indexes are dropped. Downgrade aggregates the rows back into the columns.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0001"
+down_revision: Union[str, None] = "20260119_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_item_table(name: str, column: str, comment: str) -> None:
+    """Create a task_messages-style table holding one JSONB item per row."""
+    op.create_table(
+        name,
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column(column, postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("task_id", "seq", name=f"pk_{name}"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        comment=comment,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade database schema - move history and artifacts into row tables."""
+    _create_item_table(
+        "task_messages", "message", "A2A protocol task history, one message per row"
+    )
+    _create_item_table(
+        "task_artifacts",
+        "artifact",
+        "A2A protocol task artifacts, one artifact per row",
+    )
+
+    # Copy existing arrays, preserving order
+    op.execute("""
+        INSERT INTO task_messages (task_id, seq, message)
+        SELECT t.id, e.ordinality - 1, e.value
+        FROM tasks t,
+             jsonb_array_elements(COALESCE(t.history, '[]'::jsonb))
+                 WITH ORDINALITY AS e(value, ordinality)
+    """)
+    op.execute("""
+        INSERT INTO task_artifacts (task_id, seq, artifact)
+        SELECT t.id, e.ordinality - 1, e.value
+        FROM tasks t,
+             jsonb_array_elements(COALESCE(t.artifacts, '[]'::jsonb))
+                 WITH ORDINALITY AS e(value, ordinality)
+    """)
+
+    op.drop_index("idx_tasks_history_gin", table_name="tasks")
+    op.drop_index("idx_tasks_artifacts_gin", table_name="tasks")
+    op.drop_column("tasks", "history")
+    op.drop_column("tasks", "artifacts")
+    op.execute("COMMENT ON TABLE tasks IS 'A2A protocol tasks'")
+
+
+def downgrade() -> None:
+    """Downgrade database schema - fold rows back into JSONB columns."""
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "history",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default="[]",
+        ),
+    )
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "artifacts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            server_default="[]",
+        ),
+    )
+
+    op.execute("""
+        UPDATE tasks t
+        SET history = m.items
+        FROM (
+            SELECT task_id, jsonb_agg(message ORDER BY seq) AS items
+            FROM task_messages
+            GROUP BY task_id
+        ) m
+        WHERE m.task_id = t.id
+    """)
+    op.execute("""
+        UPDATE tasks t
+        SET artifacts = a.items
+        FROM (
+            SELECT task_id, jsonb_agg(artifact ORDER BY seq) AS items
+            FROM task_artifacts
+            GROUP BY task_id
+        ) a
+        WHERE a.task_id = t.id
+    """)
+
+    op.create_index(
+        "idx_tasks_history_gin", "tasks", ["history"], postgresql_using="gin"
+    )
+    op.create_index(
+        "idx_tasks_artifacts_gin", "tasks", ["artifacts"], postgresql_using="gin"
+    )
+    op.execute(
+        "COMMENT ON TABLE tasks IS 'A2A protocol tasks with JSONB history and artifacts'"
+    )
+
+    op.drop_table("task_artifacts")
+    op.drop_table("task_messages")
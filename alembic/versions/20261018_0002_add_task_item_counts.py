@@ -0,0 +1,50 @@
+"""Track the number of history messages and artifacts per task.
+
+Revision ID: 20261018_0002
+Revises: 20261018_0001
+Create Date: 2026-10-18 11:00:00.000000
+
+tasks.message_count and tasks.artifact_count hold the next seq for
+task_messages and task_artifacts. Task writes bump them in the same UPDATE
+that locks the task row, so a single statement can insert items with the
+right seq even when appends to one task race.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0002"
+down_revision: Union[str, None] = "20261018_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add and backfill item counters."""
+    op.add_column(
+        "tasks",
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "tasks",
+        sa.Column("artifact_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.execute("""
+        UPDATE tasks t
+        SET message_count = COALESCE(
+                (SELECT MAX(seq) + 1 FROM task_messages m WHERE m.task_id = t.id), 0
+            ),
+            artifact_count = COALESCE(
+                (SELECT MAX(seq) + 1 FROM task_artifacts a WHERE a.task_id = t.id), 0
+            )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema - drop item counters."""
+    op.drop_column("tasks", "artifact_count")
+    op.drop_column("tasks", "message_count")
@@ -0,0 +1,59 @@
+"""Add the task_operations queue table.
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18 13:00:00.000000
+
+PostgresScheduler queues task operations in task_operations. Workers claim
+the oldest rows whose available_at has passed with FOR UPDATE SKIP LOCKED and
+push available_at out by a visibility timeout; handled rows are deleted, and
+rows of a crashed worker become claimable again once the timeout expires.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0003"
+down_revision: Union[str, None] = "20261018_0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add the scheduler queue table."""
+    op.create_table(
+        "task_operations",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("operation", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column(
+            "available_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("claimed_by", sa.String(length=255), nullable=True),
+        sa.Column(
+            "enqueued_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Task operations queued by PostgresScheduler",
+    )
+    op.create_index(
+        "idx_task_operations_available_at",
+        "task_operations",
+        ["available_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - drop the scheduler queue table."""
+    op.drop_index("idx_task_operations_available_at", table_name="task_operations")
+    op.drop_table("task_operations")
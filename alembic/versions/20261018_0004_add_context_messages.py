@@ -0,0 +1,80 @@
+"""Store materialized context chat history as rows.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18 15:00:00.000000
+
+The chat history workers materialize per context moves out of
+contexts.context_data["chat_history"], a JSONB array rewritten on every turn
+and replaced by update_context, into context_messages, one row per message.
+seq is global and never reused, so workers resume reading after the last seq
+they hold. contexts.history_initialized marks the contexts whose history has
+been rebuilt from their finished tasks.
+
+Existing chat_history values are dropped rather than copied: they do not
+record which task each message came from, and each context is rebuilt once
+from its tasks on its next run.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0004"
+down_revision: Union[str, None] = "20261018_0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - add context_messages."""
+    op.create_table(
+        "context_messages",
+        sa.Column("seq", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("context_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("message", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.ForeignKeyConstraint(["context_id"], ["contexts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("seq"),
+        sa.UniqueConstraint(
+            "context_id", "task_id", "position", name="uq_context_messages_task"
+        ),
+        comment="Chat history of each context, one message per row",
+    )
+    op.create_index(
+        "idx_context_messages_context_seq",
+        "context_messages",
+        ["context_id", "seq"],
+    )
+    op.add_column(
+        "contexts",
+        sa.Column(
+            "history_initialized",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+
+    op.execute("""
+        UPDATE contexts
+        SET context_data = context_data - 'chat_history'
+        WHERE context_data ? 'chat_history'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema - drop context_messages."""
+    op.drop_column("contexts", "history_initialized")
+    op.drop_index("idx_context_messages_context_seq", table_name="context_messages")
+    op.drop_table("context_messages")
@@ -0,0 +1,147 @@
+"""Compare A2A request validation and response serialization, union vs method.
+
+The endpoint validates requests with a2a_request_ta, a union tagged by
+method, and used to serialize responses with a2a_response_ta, a plain union
+that pydantic tries member by member. This measures each against the
+adapter of the method alone (bindu.server.endpoints.a2a_protocol.
+dump_a2a_response for responses), for a small request and one of about
+--payload-kb KiB.
+
+Usage:
+    PYTHONPATH=. python benchmarks/a2a_validation.py --payload-kb 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from bindu.common.protocol.types import (
+    GetTaskRequest,
+    a2a_request_ta,
+    a2a_response_ta,
+    send_message_request_ta,
+)
+from bindu.server.endpoints.a2a_protocol import dump_a2a_response
+
+get_task_request_ta = TypeAdapter(GetTaskRequest)
+
+
+def build_send_body(payload_kb: int) -> bytes:
+    """A message/send request with payload_kb text parts of 1 KiB each."""
+    parts = [{"kind": "text", "text": "x" * 1024} for _ in range(payload_kb)]
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": str(uuid4()),
+            "method": "message/send",
+            "params": {
+                "message": {
+                    "kind": "message",
+                    "messageId": str(uuid4()),
+                    "contextId": str(uuid4()),
+                    "taskId": str(uuid4()),
+                    "role": "user",
+                    "parts": parts,
+                },
+                "configuration": {"acceptedOutputModes": ["text/plain"]},
+            },
+        }
+    ).encode()
+
+
+def build_get_body() -> bytes:
+    """A tasks/get request."""
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": str(uuid4()),
+            "method": "tasks/get",
+            "params": {"taskId": str(uuid4())},
+        }
+    ).encode()
+
+
+def build_task_response(message, history: int):
+    """A tasks/get response whose task history repeats message."""
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid4(),
+        "result": {
+            "id": uuid4(),
+            "context_id": uuid4(),
+            "kind": "task",
+            "status": {
+                "state": "completed",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+            "history": [message] * history,
+            "artifacts": [],
+        },
+    }
+
+
+def measure(label: str, func, number: int) -> float:
+    """Print and return the time per call of func."""
+    seconds = timeit.timeit(func, number=number) / number
+    print(f"{label:<40} {seconds * 1e6:11.1f} us")
+    return seconds
+
+
+def compare(label: str, union, method, number: int) -> None:
+    """Measure the union path against the method path."""
+    before = measure(f"{label}, union", union, number)
+    after = measure(f"{label}, method", method, number)
+    print(f"{'':<40} {before / after:10.2f}x")
+
+
+def main(payload_kb: int, history: int, number: int) -> None:
+    """Run the comparison."""
+    small, large = build_get_body(), build_send_body(payload_kb)
+    print(f"request bodies: {len(small)} B and {len(large)} B")
+    compare(
+        "validate tasks/get",
+        lambda: a2a_request_ta.validate_json(small),
+        lambda: get_task_request_ta.validate_json(small),
+        number,
+    )
+    compare(
+        "validate message/send",
+        lambda: a2a_request_ta.validate_json(large),
+        lambda: send_message_request_ta.validate_json(large),
+        max(number // 100, 1),
+    )
+
+    message = send_message_request_ta.validate_json(large)["params"]["message"]
+    short = {**message, "parts": [{"kind": "text", "text": "Hello"}]}
+    for label, response, iterations in (
+        ("dump tasks/get, small task", build_task_response(short, 1), number),
+        (
+            f"dump tasks/get, {history} x {payload_kb} KiB",
+            build_task_response(message, history),
+            max(number // 1000, 1),
+        ),
+    ):
+        compare(
+            label,
+            lambda response=response: a2a_response_ta.dump_json(
+                response, by_alias=True, serialize_as_any=True
+            ),
+            lambda response=response: dump_a2a_response("tasks/get", response),
+            iterations,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload-kb", type=int, default=1024)
+    parser.add_argument("--history", type=int, default=10)
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    main(args.payload_kb, args.history, args.number)
@@ -0,0 +1,128 @@
+"""Compare encode/decode cost of queued task operations, old path vs codec.
+
+The old path serialized params with json after walking them to stringify
+UUIDs, and on decode tried UUID() on every string in the tree, message text
+included. The codec (bindu.server.scheduler.codec) writes a versioned layout
+with orjson and converts only the fields its schema declares as UUIDs.
+
+Usage:
+    python benchmarks/scheduler_codec.py --parts 20 --file-kb 256
+
+Each run prints the time per operation and the encoded size for three
+payloads: the full message, the codec's full layout, and the codec's
+reference envelope (message left in storage).
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import timeit
+from uuid import UUID, uuid4
+
+from opentelemetry.trace import get_current_span
+
+from bindu.server.scheduler.codec import (
+    decode_legacy,
+    decode_task_operation,
+    encode_task_operation,
+)
+
+
+def _convert_uuids(obj):
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, dict):
+        return {k: _convert_uuids(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_convert_uuids(item) for item in obj]
+    return obj
+
+
+def legacy_encode(task_operation) -> str:
+    """The serializer RedisScheduler used before the codec."""
+    return json.dumps(
+        {
+            "operation": task_operation["operation"],
+            "params": _convert_uuids(task_operation["params"]),
+            "span_id": None,
+            "trace_id": None,
+        }
+    )
+
+
+def build_operation(parts: int, file_kb: int):
+    """A run operation whose message has text parts and one file part."""
+    task_id, context_id = uuid4(), uuid4()
+    message_parts = [
+        {"kind": "text", "text": f"Paragraph {i} of the user's request. " * 8}
+        for i in range(parts)
+    ]
+    if file_kb:
+        message_parts.append(
+            {
+                "kind": "file",
+                "file": {
+                    "name": "attachment.bin",
+                    "mime_type": "application/octet-stream",
+                    "bytes": base64.b64encode(os.urandom(file_kb * 1024)).decode(),
+                },
+            }
+        )
+    return {
+        "operation": "run",
+        "params": {
+            "task_id": task_id,
+            "context_id": context_id,
+            "message": {
+                "message_id": uuid4(),
+                "task_id": task_id,
+                "context_id": context_id,
+                "kind": "message",
+                "role": "user",
+                "parts": message_parts,
+            },
+            "history_length": 10,
+        },
+        "_current_span": get_current_span(),
+    }
+
+
+def measure(label: str, encode, decode, operation, number: int) -> None:
+    """Print per-operation encode and decode time and the encoded size."""
+    encoded = encode(operation)
+    encode_us = timeit.timeit(lambda: encode(operation), number=number) / number
+    decode_us = timeit.timeit(lambda: decode(encoded), number=number) / number
+    print(
+        f"{label:<22} encode {encode_us * 1e6:9.1f} us   "
+        f"decode {decode_us * 1e6:9.1f} us   size {len(encoded):>9} B"
+    )
+
+
+def main(parts: int, file_kb: int, number: int) -> None:
+    """Run the comparison."""
+    operation = build_operation(parts, file_kb)
+    print(f"message: {parts} text parts, {file_kb} KiB file, {number} iterations")
+    measure("legacy json", legacy_encode, decode_legacy, operation, number)
+    measure(
+        "codec full", encode_task_operation, decode_task_operation, operation, number
+    )
+    measure(
+        "codec by reference",
+        lambda op: encode_task_operation(op, include_message=False),
+        decode_task_operation,
+        operation,
+        number,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parts", type=int, default=20)
+    parser.add_argument("--file-kb", type=int, default=0)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    main(args.parts, args.file_kb, args.number)
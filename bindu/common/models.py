@@ -65,7 +65,7 @@ class SchedulerConfig:
     managing asynchronous tasks and workflows.
     """
 
-    type: Literal["redis", "memory"]
+    type: Literal["redis", "memory", "postgres"]
     redis_url: str | None = None
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -75,6 +75,35 @@ class SchedulerConfig:
     max_connections: int = 10
     retry_on_timeout: bool = True
     poll_timeout: int = 1
+    batch_size: int = 1
+    payload_mode: Literal["full", "reference"] = "full"
+    redis_queue_type: Literal["list", "stream", "fair", "sharded"] = "list"
+    stream_group: str = "bindu:workers"
+    stream_consumer: str | None = None
+    claim_idle_timeout: float = 60.0
+    redis_shards: int = 16
+    shard_lease_ttl: float = 15.0
+    visibility_timeout: float = 60.0
+    postgres_poll_interval: float = 5.0
+    queue_size: int = 1000
+    overflow_policy: Literal["reject", "wait"] = "wait"
+    enqueue_timeout: float = 5.0
+    priority_classes: tuple[str, ...] = ("interactive", "normal", "batch")
+    default_priority: str = "normal"
+    tenant_weights: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ExecutionConfig:
+    """Configuration for where synchronous agent handlers are executed.
+
+    Async handlers always run on the event loop. Sync functions and sync
+    generators block it, so by default they are offloaded to a thread pool.
+    """
+
+    backend: Literal["inline", "thread", "process"] = "thread"
+    max_workers: int | None = None
+    """Pool size. Defaults to 40 threads or one process per CPU."""
 
 
 @dataclass(frozen=True)
@@ -571,6 +571,18 @@ class TaskSendParams(TypedDict):
     metadata: NotRequired[dict[str, Any]]
     """Additional metadata."""
 
+    priority: NotRequired[str]
+    """Scheduling priority class requested for the task."""
+
+    tenant: NotRequired[str]
+    """Caller identity (DID or OAuth subject) the task is fairly scheduled under."""
+
+    run_at: NotRequired[float]
+    """Unix time (seconds) before which the task is not run."""
+
+    reschedules: NotRequired[int]
+    """How many times the agent has already asked to retry the task later."""
+
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class TaskIdParams(TypedDict):
@@ -590,6 +602,20 @@ class TaskQueryParams(TaskIdParams):
     history_length: NotRequired[int]
     """The length of the history."""
 
+    wait_for_change_ms: NotRequired[int]
+    """Wait up to this long for the task to leave known_state before answering. <NotPartOfA2A>."""
+
+    known_state: NotRequired[TaskState]
+    """State the client already has (default: the current one). <NotPartOfA2A>."""
+
+
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class ResubscribeTaskParams(TaskIdParams):
+    """Defines parameters for resubscribing to a task's event stream."""
+
+    after_sequence: NotRequired[int]
+    """Sequence of the last event the client saw; replays the later ones. <NotPartOfA2A>."""
+
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class ListTasksParams(TypedDict):
@@ -602,6 +628,57 @@ class ListTasksParams(TypedDict):
     """Additional metadata."""
 
 
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class ListDeadLettersParams(TypedDict):
+    """Defines parameters for listing dead-lettered task operations. <NotPartOfA2A>."""
+
+    limit: NotRequired[int]
+    """Maximum number of entries to return, newest first."""
+
+    metadata: NotRequired[dict[str, Any]]
+    """Additional metadata."""
+
+
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class ReplayDeadLettersParams(TypedDict):
+    """Defines parameters for queueing dead-lettered operations again. <NotPartOfA2A>."""
+
+    ids: NotRequired[list[str]]
+    """Dead letters to replay; all of them if omitted."""
+
+    metadata: NotRequired[dict[str, Any]]
+    """Additional metadata."""
+
+
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class DeadLetter(TypedDict):
+    """A task operation taken out of the queue after failing. <NotPartOfA2A>."""
+
+    id: Required[str]
+    """The ID of the dead letter."""
+
+    reason: Required[Literal["failed", "max_attempts", "undecodable"]]
+    """Why the operation was dead-lettered."""
+
+    error: Required[str]
+    """The error the operation failed with."""
+
+    attempts: Required[int]
+    """How many times the operation was delivered."""
+
+    dead_at: Required[str]
+    """When the operation was dead-lettered (ISO 8601)."""
+
+    operation: NotRequired[str]
+    """The operation (run, cancel, pause, resume), if it could be decoded."""
+
+    task_id: NotRequired[str]
+    """The ID of the task, if it could be decoded."""
+
+    payload: Required[str]
+    """The encoded operation, as queued."""
+
+
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class TaskFeedbackParams(TypedDict):
     """Defines parameters for providing feedback on a task. <NotPartOfA2A>."""
@@ -642,6 +719,12 @@ class MessageSendConfiguration(TypedDict):
     across server restarts. Defaults to False if not specified.
     """
 
+    priority: NotRequired[str]
+    """Scheduling priority class, e.g. interactive, normal or batch. <NotPartOfA2A>
+
+    Unknown or missing values use the scheduler's default class.
+    """
+
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class MessageSendParams(TypedDict):
@@ -1479,13 +1562,24 @@ SkillNotFoundError = JSONRPCError[
     ],
 ]
 
+# Capacity errors (-32040 to -32049)
+# Bindu-specific load-shedding extensions
+ServerBusyError = JSONRPCError[
+    Literal[-32040],
+    Literal[
+        "The agent's task queue is full and cannot accept new tasks right now. "
+        "Retry the request later."
+    ],
+]
+
 # -----------------------------------------------------------------------------
 # JSON-RPC Request & Response Types
 # -----------------------------------------------------------------------------
 
 SendMessageRequest = JSONRPCRequest[Literal["message/send"], MessageSendParams]
 SendMessageResponse = JSONRPCResponse[
-    Union[Task, Message], Union[TaskImmutableError, JSONRPCError[Any, Any]]
+    Union[Task, Message],
+    Union[TaskImmutableError, ServerBusyError, JSONRPCError[Any, Any]],
 ]
 
 StreamMessageRequest = JSONRPCRequest[Literal["message/stream"], MessageSendParams]
@@ -1507,6 +1601,18 @@ ListTasksResponse = JSONRPCResponse[
 TaskFeedbackRequest = JSONRPCRequest[Literal["tasks/feedback"], TaskFeedbackParams]
 TaskFeedbackResponse = JSONRPCResponse[Dict[str, str], TaskNotFoundError]
 
+ListDeadLettersRequest = JSONRPCRequest[
+    Literal["tasks/deadLetters/list"], ListDeadLettersParams
+]
+ListDeadLettersResponse = JSONRPCResponse[List[DeadLetter], JSONRPCError[Any, Any]]
+
+ReplayDeadLettersRequest = JSONRPCRequest[
+    Literal["tasks/deadLetters/replay"], ReplayDeadLettersParams
+]
+ReplayDeadLettersResponse = JSONRPCResponse[
+    Dict[str, List[str]], JSONRPCError[Any, Any]
+]
+
 ListContextsRequest = JSONRPCRequest[Literal["contexts/list"], ListContextsParams]
 ListContextsResponse = JSONRPCResponse[
     List[Context], Union[ContextNotFoundError, ContextNotCancelableError]
@@ -1531,7 +1637,9 @@ GetTaskPushNotificationResponse = JSONRPCResponse[
     TaskPushNotificationConfig, PushNotificationNotSupportedError
 ]
 
-ResubscribeTaskRequest = JSONRPCRequest[Literal["tasks/resubscribe"], TaskIdParams]
+ResubscribeTaskRequest = JSONRPCRequest[
+    Literal["tasks/resubscribe"], ResubscribeTaskParams
+]
 ResubscribeTaskResponse = JSONRPCResponse[
     Task, Union[TaskNotCancelableError, TaskNotFoundError]
 ]
@@ -1559,6 +1667,8 @@ A2ARequest = Annotated[
         CancelTaskRequest,
         ListTasksRequest,
         TaskFeedbackRequest,
+        ListDeadLettersRequest,
+        ReplayDeadLettersRequest,
         ListContextsRequest,
         ClearContextsRequest,
         SetTaskPushNotificationRequest,
@@ -1577,6 +1687,8 @@ A2AResponse: TypeAlias = Union[
     CancelTaskResponse,
     ListTasksResponse,
     TaskFeedbackResponse,
+    ListDeadLettersResponse,
+    ReplayDeadLettersResponse,
     ListContextsResponse,
     ClearContextsResponse,
     SetTaskPushNotificationResponse,
@@ -1601,6 +1713,32 @@ stream_message_response_ta: TypeAdapter[StreamMessageResponse] = TypeAdapter(
     StreamMessageResponse
 )
 
+# The request union is tagged by method, so validating it already picks the
+# method's type in one lookup. The response union is not: serializing through
+# it tries each member in turn, so responses are dumped with their method's.
+a2a_response_tas: dict[str, TypeAdapter[Any]] = {
+    "message/send": send_message_response_ta,
+    "message/stream": stream_message_response_ta,
+    "tasks/get": TypeAdapter(GetTaskResponse),
+    "tasks/cancel": TypeAdapter(CancelTaskResponse),
+    "tasks/list": TypeAdapter(ListTasksResponse),
+    "tasks/feedback": TypeAdapter(TaskFeedbackResponse),
+    "tasks/deadLetters/list": TypeAdapter(ListDeadLettersResponse),
+    "tasks/deadLetters/replay": TypeAdapter(ReplayDeadLettersResponse),
+    "contexts/list": TypeAdapter(ListContextsResponse),
+    "contexts/clear": TypeAdapter(ClearContextsResponse),
+    "tasks/pushNotification/set": TypeAdapter(SetTaskPushNotificationResponse),
+    "tasks/pushNotification/get": TypeAdapter(GetTaskPushNotificationResponse),
+    "tasks/resubscribe": TypeAdapter(ResubscribeTaskResponse),
+    "tasks/pushNotificationConfig/list": TypeAdapter(
+        ListTaskPushNotificationConfigResponse
+    ),
+    "tasks/pushNotificationConfig/delete": TypeAdapter(
+        DeleteTaskPushNotificationConfigResponse
+    ),
+}
+"""Response adapter of each A2A method."""
+
 
 # -----------------------------------------------------------------------------
 # Trust
@@ -1940,3 +2078,5 @@ send_message_request_ta.rebuild()
 send_message_response_ta.rebuild()
 stream_message_request_ta.rebuild()
 stream_message_response_ta.rebuild()
+for _response_ta in a2a_response_tas.values():
+    _response_ta.rebuild()
@@ -20,6 +20,7 @@ from uuid import uuid4
 from bindu.common.models import (
     AgentManifest,
     DeploymentConfig,
+    ExecutionConfig,
     TelemetryConfig,
 )
 from bindu.extensions.x402 import X402AgentExtension
@@ -133,6 +134,8 @@ def bindufy(
             - scheduler: Task scheduler configuration dict
             - global_webhook_url: Default webhook URL for all tasks (optional)
             - global_webhook_token: Authentication token for global webhook (optional)
+            - execution: Where sync handlers run - {"backend": "inline" | "thread" | "process",
+              "max_workers": int} (default: thread pool)
         handler: The handler function that processes messages and returns responses.
                 Must have signature: (messages: str) -> str
         run_server: If True, starts the uvicorn server (blocking). If False, returns manifest
@@ -277,6 +280,7 @@ def bindufy(
         capabilities = add_extension_to_capabilities(capabilities, x402_extension)
 
     # Create agent manifest with loaded skills
+    execution_config = validated_config.get("execution") or {}
     _manifest = create_manifest(
         agent_function=handler,
         id=agent_id,
@@ -308,6 +312,10 @@ def bindufy(
         extra_metadata=validated_config["extra_metadata"],
         global_webhook_url=validated_config.get("global_webhook_url"),
         global_webhook_token=validated_config.get("global_webhook_token"),
+        execution=ExecutionConfig(
+            backend=execution_config.get("backend", "thread"),
+            max_workers=execution_config.get("max_workers"),
+        ),
     )
 
     # Log manifest creation
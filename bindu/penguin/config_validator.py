@@ -25,6 +25,7 @@ class ConfigValidator:
         "capabilities": {},
         "storage": {"type": "memory"},
         "scheduler": {"type": "memory"},
+        "execution": {"backend": "thread"},
         "kind": "agent",
         "debug_mode": False,
         "debug_level": 1,
@@ -161,6 +162,29 @@ class ConfigValidator:
         if config.get("kind") not in ["agent", "team", "workflow"]:
             raise ValueError("Field 'kind' must be one of: agent, team, workflow")
 
+        # Validate execution backend for sync handlers
+        execution = config.get("execution")
+        if execution is not None:
+            if not isinstance(execution, dict):
+                raise ValueError("Field 'execution' must be a dictionary")
+            if execution.get("backend", "thread") not in [
+                "inline",
+                "thread",
+                "process",
+            ]:
+                raise ValueError(
+                    "Field 'execution.backend' must be one of: inline, thread, process"
+                )
+            max_workers = execution.get("max_workers")
+            if max_workers is not None and (
+                not isinstance(max_workers, int)
+                or isinstance(max_workers, bool)
+                or max_workers < 1
+            ):
+                raise ValueError(
+                    "Field 'execution.max_workers' must be a positive integer"
+                )
+
     @classmethod
     def _validate_auth_config(cls, auth_config: Dict[str, Any]) -> None:
         """Validate authentication configuration.
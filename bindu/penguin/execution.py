@@ -0,0 +1,168 @@
+#
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Execution backends for synchronous agent handlers.
+
+A sync handler that performs blocking I/O or heavy computation would otherwise
+run directly on the event loop and freeze every endpoint (including /health)
+until it returns. The backends here move that work off the loop:
+
+- inline: call the handler on the event loop (legacy behaviour)
+- thread: run the handler in a bounded thread pool
+- process: run the handler in a bounded process pool (handler must be picklable)
+
+Pool usage is reported to Prometheus so saturation is visible.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, AsyncIterator, Callable
+
+import anyio
+import anyio.to_process
+import anyio.to_thread
+
+from bindu.common.models import ExecutionConfig
+from bindu.server.metrics import get_metrics
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.penguin.execution")
+
+DEFAULT_THREAD_WORKERS = 40
+
+_EXHAUSTED = object()
+
+
+def _next_or_sentinel(iterator: Any) -> Any:
+    """Advance a sync iterator, returning a sentinel instead of raising StopIteration.
+
+    StopIteration cannot cross a thread boundary into a coroutine, so the
+    sentinel marks exhaustion instead.
+    """
+    return next(iterator, _EXHAUSTED)
+
+
+def _drain_generator(gen_func: Callable[..., Any], *args: Any) -> list[Any]:
+    """Run a sync generator to completion and return every yielded chunk.
+
+    Generators cannot be pickled, so in a worker process the whole generator
+    is consumed there and the chunks are sent back as a list.
+    """
+    return list(gen_func(*args))
+
+
+class ExecutionBackend:
+    """Runs sync callables and sync generators according to an ExecutionConfig."""
+
+    def __init__(self, config: ExecutionConfig | None = None):
+        """Initialize the backend.
+
+        Args:
+            config: Execution configuration (defaults to a thread pool)
+        """
+        self.config = config or ExecutionConfig()
+        self.kind = self.config.backend
+        if self.config.max_workers is not None:
+            self.max_workers = self.config.max_workers
+        elif self.kind == "process":
+            self.max_workers = os.cpu_count() or 1
+        else:
+            self.max_workers = DEFAULT_THREAD_WORKERS
+        # Created lazily: CapacityLimiter needs a running event loop
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._pool_limiter: anyio.CapacityLimiter | None = None
+        self._waiting = 0
+
+    @property
+    def offloads(self) -> bool:
+        """Whether sync handlers leave the event loop."""
+        return self.kind != "inline"
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        """Capacity limiter bounding concurrent pool usage."""
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+            # Separate limiter handed to anyio so a held slot never waits twice
+            self._pool_limiter = anyio.CapacityLimiter(self.max_workers)
+        return self._limiter
+
+    async def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a sync callable on the configured backend.
+
+        Args:
+            func: Synchronous callable
+            *args: Positional arguments for func
+
+        Returns:
+            The callable's return value
+        """
+        if not self.offloads:
+            return func(*args)
+
+        limiter = self.limiter
+        self._waiting += 1
+        self._report()
+        acquired = False
+        try:
+            async with limiter:
+                self._waiting -= 1
+                acquired = True
+                self._report()
+                if self.kind == "process":
+                    return await anyio.to_process.run_sync(
+                        func, *args, limiter=self._pool_limiter
+                    )
+                return await anyio.to_thread.run_sync(
+                    func, *args, limiter=self._pool_limiter
+                )
+        finally:
+            if not acquired:
+                self._waiting -= 1
+            self._report()
+
+    async def iterate(
+        self, gen_func: Callable[..., Any], *args: Any
+    ) -> AsyncIterator[Any]:
+        """Consume a sync generator without blocking the event loop.
+
+        Thread backend: each next() runs in the pool, so chunks stream as produced.
+        Process backend: the generator runs to completion in a worker process.
+
+        Args:
+            gen_func: Synchronous generator function
+            *args: Positional arguments for gen_func
+
+        Yields:
+            Chunks produced by the generator
+        """
+        if self.kind == "process":
+            for chunk in await self.call(_drain_generator, gen_func, *args):
+                yield chunk
+            return
+
+        generator = gen_func(*args)
+        while True:
+            chunk = await self.call(_next_or_sentinel, generator)
+            if chunk is _EXHAUSTED:
+                return
+            yield chunk
+
+    def _report(self) -> None:
+        """Export pool usage to Prometheus metrics."""
+        if self._limiter is None:
+            return
+        get_metrics().set_execution_pool(
+            self.kind,
+            busy=int(self._limiter.borrowed_tokens),
+            size=self.max_workers,
+            waiting=self._waiting,
+        )
@@ -20,13 +20,14 @@ from datetime import UTC, datetime
 from typing import Any, Callable, Literal
 from uuid import UUID
 
-from bindu.common.models import AgentManifest
+from bindu.common.models import AgentManifest, ExecutionConfig
 from bindu.extensions.did import DIDAgentExtension
 from bindu.common.protocol.types import (
     AgentCapabilities,
     AgentTrust,
     Skill,
 )
+from bindu.penguin.execution import ExecutionBackend
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.penguin.manifest")
@@ -106,6 +107,7 @@ def create_manifest(
     extra_metadata: dict[str, Any] | None = None,
     global_webhook_url: str | None = None,
     global_webhook_token: str | None = None,
+    execution: ExecutionConfig | None = None,
 ) -> AgentManifest:
     """Create a protocol-compliant AgentManifest from any Python function.
 
@@ -143,6 +145,8 @@ def create_manifest(
         extra_metadata: Additional metadata dictionary to attach to the agent manifest (default: {}).
         global_webhook_url: Default webhook URL for all tasks (optional).
         global_webhook_token: Authentication token for global webhook (optional).
+        execution: Where synchronous agent functions run - inline on the event loop,
+                   or in a thread/process pool (default: thread pool).
 
     Returns:
         AgentManifest: A protocol-compliant agent manifest with proper execution methods.
@@ -207,6 +211,9 @@ def create_manifest(
         global_webhook_token=global_webhook_token,
     )
 
+    # Sync functions are offloaded so they cannot block the event loop
+    backend = ExecutionBackend(execution)
+
     # Create execution method based on function type
     def _create_run_method():
         """Create the appropriate run method based on function type."""
@@ -266,19 +273,42 @@ def create_manifest(
 
         # Sync generator function
         elif inspect.isgeneratorfunction(agent_function):
-            logger.debug(f"Creating sync generator run method for '{manifest_name}'")
+            if backend.offloads:
+                logger.debug(
+                    f"Creating {backend.kind}-pool generator run method for '{manifest_name}'"
+                )
+
+                async def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    async for chunk in backend.iterate(agent_function, *params):
+                        yield chunk
 
-            def run(input_msg: str, **kwargs):
-                params = _resolve_params(input_msg, **kwargs)
-                yield from agent_function(*params)
+            else:
+                logger.debug(
+                    f"Creating sync generator run method for '{manifest_name}'"
+                )
+
+                def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    yield from agent_function(*params)
 
         # Regular sync function
         else:
-            logger.debug(f"Creating sync function run method for '{manifest_name}'")
+            if backend.offloads:
+                logger.debug(
+                    f"Creating {backend.kind}-pool function run method for '{manifest_name}'"
+                )
 
-            def run(input_msg: str, **kwargs):
-                params = _resolve_params(input_msg, **kwargs)
-                return agent_function(*params)
+                async def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    yield await backend.call(agent_function, *params)
+
+            else:
+                logger.debug(f"Creating sync function run method for '{manifest_name}'")
+
+                def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    return agent_function(*params)
 
         return run
 
@@ -334,6 +334,7 @@ class BinduApplication(Starlette):
                 max_attempts=app_settings.retry.scheduler_max_attempts,
                 min_wait=app_settings.retry.scheduler_min_wait,
                 max_wait=app_settings.retry.scheduler_max_wait,
+                storage=storage,
             )
             app._scheduler = scheduler
             logger.info(f"✅ Scheduler initialized: {type(scheduler).__name__}")
@@ -392,8 +393,13 @@ class BinduApplication(Starlette):
             # Start TaskManager
             if manifest:
                 logger.info("🔧 Starting TaskManager...")
+                from .events.factory import create_event_bus
+
                 task_manager = TaskManager(
-                    scheduler=scheduler, storage=storage, manifest=manifest
+                    scheduler=scheduler,
+                    storage=storage,
+                    manifest=manifest,
+                    event_bus=create_event_bus(),
                 )
                 async with task_manager:
                     app.task_manager = task_manager
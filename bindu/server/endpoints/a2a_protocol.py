@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from typing import Any
+
+from pydantic_core import PydanticSerializationError
 from starlette.requests import Request
 from starlette.responses import Response
 
 from bindu.common.protocol.types import (
     InternalError,
+    InvalidRequestError,
     JSONParseError,
     MethodNotFoundError,
     a2a_request_ta,
     a2a_response_ta,
+    a2a_response_tas,
 )
 from bindu.server.applications import BinduApplication
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
-from bindu.utils.request_utils import extract_error_fields, get_client_ip, jsonrpc_error
+from bindu.utils.request_utils import (
+    extract_error_fields,
+    get_caller_identity,
+    get_client_ip,
+    jsonrpc_error,
+    jsonrpc_error_body,
+)
 from bindu.extensions.x402.extension import (
     is_activation_requested as x402_is_requested,
     add_activation_header as x402_add_header,
@@ -23,6 +36,9 @@ from bindu.extensions.x402.extension import (
 
 logger = get_logger("bindu.server.endpoints.a2a_protocol")
 
+STREAMING_METHODS = ("message/stream", "tasks/resubscribe")
+"""Methods answered with an event stream, which a batch response cannot hold."""
+
 
 async def agent_run_endpoint(app: BinduApplication, request: Request) -> Response:
     """Handle A2A protocol requests for agent-to-agent communication.
@@ -35,6 +51,9 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
         2.2. The task was "canceled".
         2.3. The task "failed".
     3. The server will send a "working" on the first chunk on `tasks/pushNotification/get`.
+
+    A JSON-RPC 2.0 batch (an array of requests) is answered with an array of
+    responses in request order; see run_batch.
     """
     client_ip = get_client_ip(request)
     request_id = None
@@ -42,6 +61,9 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
     try:
         data = await request.body()
 
+        if data.lstrip()[:1] == b"[":
+            return await run_batch(app, request, data, client_ip)
+
         try:
             a2a_request = a2a_request_ta.validate_json(data)
         except Exception as e:
@@ -63,45 +85,18 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
             )
 
         handler = getattr(app.task_manager, handler_name)
-
-        # Pass payment details from middleware to handler if available
-        # Payment context is passed through the metadata field in params
-        if hasattr(request.state, "payment_payload") and method == "message/send":
-            # Inject payment context into message metadata
-            if "params" in a2a_request and "message" in a2a_request["params"]:
-                message = a2a_request["params"]["message"]
-                if "metadata" not in message:
-                    message["metadata"] = {}
-
-                # Add payment context to message metadata (internal use only)
-                # Serialize Pydantic models and dataclasses to dicts for JSON compatibility
-                from dataclasses import asdict, is_dataclass
-
-                def serialize_to_dict(obj):
-                    """Serialize Pydantic models or dataclasses to dict."""
-                    if hasattr(obj, "model_dump"):
-                        return obj.model_dump()
-                    elif is_dataclass(obj):
-                        return asdict(obj)
-                    else:
-                        return dict(obj)
-
-                message["metadata"]["_payment_context"] = {
-                    "payment_payload": serialize_to_dict(request.state.payment_payload),
-                    "payment_requirements": serialize_to_dict(
-                        request.state.payment_requirements
-                    ),
-                    "verify_response": serialize_to_dict(request.state.verify_response),
-                }
+        _inject_request_context(request, a2a_request)
 
         jsonrpc_response = await handler(a2a_request)
 
+        # message/stream answers with its own Server-Sent Events response
+        if isinstance(jsonrpc_response, Response):
+            return jsonrpc_response
+
         logger.debug(f"A2A response to {client_ip}: method={method}, id={request_id}")
 
         resp = Response(
-            content=a2a_response_ta.dump_json(
-                jsonrpc_response, by_alias=True, serialize_as_any=True
-            ),
+            content=dump_a2a_response(method, jsonrpc_response),
             media_type="application/json",
         )
 
@@ -114,3 +109,170 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
         logger.error(f"Error processing A2A request from {client_ip}", exc_info=True)
         code, message = extract_error_fields(InternalError)
         return jsonrpc_error(code, message, str(e), request_id, 500)
+
+
+async def run_batch(
+    app: BinduApplication, request: Request, data: bytes, client_ip: str
+) -> Response:
+    """Answer a JSON-RPC 2.0 batch.
+
+    The requests are dispatched concurrently, at most
+    app_settings.agent.batch_concurrency at a time, and each gets its own
+    response (or error) in the array, in request order. Streaming methods
+    cannot be batched.
+
+    Args:
+        app: The Bindu application
+        request: The HTTP request carrying the batch
+        data: Request body
+        client_ip: Client address, for logging
+
+    Returns:
+        The array of responses, or a single error if the batch is invalid
+    """
+    try:
+        items = json.loads(data)
+    except ValueError as e:
+        logger.warning(f"Invalid A2A batch from {client_ip}: {e}")
+        code, message = extract_error_fields(JSONParseError)
+        return jsonrpc_error(code, message, str(e))
+
+    max_batch_size = app_settings.agent.max_batch_size
+    if not items or len(items) > max_batch_size:
+        code, message = extract_error_fields(InvalidRequestError)
+        return jsonrpc_error(
+            code, message, f"A batch must hold 1 to {max_batch_size} requests"
+        )
+
+    logger.debug(f"A2A batch of {len(items)} requests from {client_ip}")
+
+    semaphore = asyncio.Semaphore(app_settings.agent.batch_concurrency)
+
+    async def run(item: Any) -> bytes:
+        async with semaphore:
+            return await _run_batch_item(app, request, item, client_ip)
+
+    responses = await asyncio.gather(*(run(item) for item in items))
+
+    resp = Response(
+        content=b"[" + b",".join(responses) + b"]", media_type="application/json"
+    )
+    if x402_is_requested(request):
+        resp = x402_add_header(resp)
+    return resp
+
+
+async def _run_batch_item(
+    app: BinduApplication, request: Request, item: Any, client_ip: str
+) -> bytes:
+    """Run one request of a batch and serialize its response or error."""
+    if not isinstance(item, dict) or not isinstance(item.get("method"), str):
+        request_id = item.get("id") if isinstance(item, dict) else None
+        return _batch_error(
+            InvalidRequestError, "Request must be an object with a method", request_id
+        )
+    request_id = item.get("id")
+
+    method = item["method"]
+    if method in STREAMING_METHODS:
+        return _batch_error(
+            InvalidRequestError, f"Method '{method}' cannot be batched", request_id
+        )
+    handler_name = app_settings.agent.method_handlers.get(method)
+    if handler_name is None:
+        return _batch_error(
+            MethodNotFoundError, f"Method '{method}' is not implemented", request_id
+        )
+
+    try:
+        a2a_request = a2a_request_ta.validate_python(item)
+    except Exception as e:
+        logger.warning(f"Invalid A2A request in batch from {client_ip}: {e}")
+        return _batch_error(InvalidRequestError, str(e), request_id)
+
+    try:
+        _inject_request_context(request, a2a_request)
+        jsonrpc_response = await getattr(app.task_manager, handler_name)(a2a_request)
+        return dump_a2a_response(method, jsonrpc_response)
+    except Exception as e:
+        logger.error(
+            f"Error processing A2A request {request_id} in batch from {client_ip}",
+            exc_info=True,
+        )
+        return _batch_error(InternalError, str(e), request_id)
+
+
+def dump_a2a_response(method: str, jsonrpc_response: Any) -> bytes:
+    """Serialize a handler's response with the response type of its method.
+
+    Much cheaper than the union of all response types, which is tried member
+    by member. A response that does not fit its method's type is serialized
+    through the union, as before.
+
+    Args:
+        method: The JSON-RPC method that was called
+        jsonrpc_response: The handler's response
+
+    Returns:
+        The response as JSON
+    """
+    if adapter := a2a_response_tas.get(method):
+        try:
+            return adapter.dump_json(
+                jsonrpc_response, by_alias=True, serialize_as_any=True, warnings="error"
+            )
+        except PydanticSerializationError:
+            pass
+    return a2a_response_ta.dump_json(
+        jsonrpc_response, by_alias=True, serialize_as_any=True
+    )
+
+
+def _batch_error(err_alias: Any, data: str, request_id: Any) -> bytes:
+    """Serialize a JSON-RPC error response for one request of a batch."""
+    code, message = extract_error_fields(err_alias)
+    return json.dumps(jsonrpc_error_body(code, message, data, request_id)).encode()
+
+
+def _inject_request_context(request: Request, a2a_request: Any) -> None:
+    """Add the caller and payment details to the message of a send request."""
+    method = a2a_request.get("method")
+
+    # Pass the authenticated caller (DID or OAuth subject) to the handler so
+    # the scheduler can queue its tasks fairly; never trust a client value
+    sends_message = method in ("message/send", "message/stream")
+    if sends_message and "message" in a2a_request.get("params", {}):
+        metadata = a2a_request["params"]["message"].setdefault("metadata", {})
+        metadata.pop("_caller", None)
+        if caller := get_caller_identity(request):
+            metadata["_caller"] = caller
+
+    # Pass payment details from middleware to handler if available
+    # Payment context is passed through the metadata field in params
+    if hasattr(request.state, "payment_payload") and sends_message:
+        # Inject payment context into message metadata
+        if "params" in a2a_request and "message" in a2a_request["params"]:
+            message = a2a_request["params"]["message"]
+            if "metadata" not in message:
+                message["metadata"] = {}
+
+            # Add payment context to message metadata (internal use only)
+            # Serialize Pydantic models and dataclasses to dicts for JSON compatibility
+            from dataclasses import asdict, is_dataclass
+
+            def serialize_to_dict(obj):
+                """Serialize Pydantic models or dataclasses to dict."""
+                if hasattr(obj, "model_dump"):
+                    return obj.model_dump()
+                elif is_dataclass(obj):
+                    return asdict(obj)
+                else:
+                    return dict(obj)
+
+            message["metadata"]["_payment_context"] = {
+                "payment_payload": serialize_to_dict(request.state.payment_payload),
+                "payment_requirements": serialize_to_dict(
+                    request.state.payment_requirements
+                ),
+                "verify_response": serialize_to_dict(request.state.verify_response),
+            }
@@ -0,0 +1,38 @@
+"""TASK EVENT BUS MODULE EXPORTS.
+
+Workers publish task status updates and artifact chunks on the bus while a
+task runs; message/stream subscribes to relay them to the client, whichever
+worker or process runs the task.
+
+AVAILABLE EVENT BUS OPTIONS:
+- InMemoryTaskEventBus: Delivers events within a single process
+- RedisTaskEventBus: Redis pub/sub channel per task, for multi-process systems
+"""
+
+from __future__ import annotations as _annotations
+
+from .base import (
+    SubscriberLaggedError,
+    TaskEvent,
+    TaskEventBus,
+    TaskEventSubscription,
+    artifact_event,
+    chunk_event,
+    ends_stream,
+    status_event,
+)
+from .memory_event_bus import InMemoryTaskEventBus
+from .redis_event_bus import RedisTaskEventBus
+
+__all__ = [
+    "InMemoryTaskEventBus",
+    "RedisTaskEventBus",
+    "SubscriberLaggedError",
+    "TaskEvent",
+    "TaskEventBus",
+    "TaskEventSubscription",
+    "artifact_event",
+    "chunk_event",
+    "ends_stream",
+    "status_event",
+]
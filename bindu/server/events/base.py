@@ -0,0 +1,278 @@
+"""Base task event bus module.
+
+Workers publish what happens to a task (status updates, artifact chunks) on
+the bus as it happens; message/stream subscribes to the task and relays the
+events to the client. The bus decouples the two, so the task can run on any
+worker of any process while the request that started it streams the result.
+
+Every subscriber has a bounded buffer. One that falls behind by more than
+the buffer is dropped (SubscriberLaggedError) instead of growing memory.
+
+The bus numbers the events of each task (sequence) and keeps the latest
+replay_buffer of them, so a client whose stream broke can resubscribe from
+the last sequence it saw (tasks/resubscribe). A task's buffer expires
+replay_ttl seconds after its final event, or IDLE_REPLAY_TTL seconds after
+its last event if none came.
+"""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from typing_extensions import Self
+
+from bindu.server.metrics import get_metrics
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.events.base")
+
+TaskEvent = dict[str, Any]
+"""A JSON-serializable status-update or artifact-update event."""
+
+_LAGGED = object()
+
+IDLE_REPLAY_TTL = 3600.0
+"""Seconds the replay buffer of a task without a final event outlives its last event."""
+
+
+class SubscriberLaggedError(Exception):
+    """Raised to a subscriber that fell more than its buffer behind."""
+
+
+def ends_stream(state: str) -> bool:
+    """Whether a task's stream ends at this state: terminal, or awaiting the client."""
+    return state in app_settings.agent.terminal_states or state in (
+        "input-required",
+        "auth-required",
+    )
+
+
+def status_event(
+    task_id: UUID, context_id: UUID, state: str, final: bool, **extra: Any
+) -> TaskEvent:
+    """Build a status-update event.
+
+    Args:
+        task_id: Task identifier
+        context_id: Context identifier
+        state: New task state
+        final: Whether no more events follow for the task
+        extra: Additional fields, e.g. error
+
+    Returns:
+        The event
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    return {
+        "kind": "status-update",
+        "task_id": str(task_id),
+        "context_id": str(context_id),
+        "status": {"state": state, "timestamp": timestamp},
+        "final": final,
+        **extra,
+    }
+
+
+def artifact_event(
+    task_id: UUID, context_id: UUID, artifact: Any, **extra: Any
+) -> TaskEvent:
+    """Build an artifact-update event.
+
+    Args:
+        task_id: Task identifier
+        context_id: Context identifier
+        artifact: The artifact, or the chunk of one
+        extra: Additional fields, e.g. append and last_chunk
+
+    Returns:
+        The event
+    """
+    return {
+        "kind": "artifact-update",
+        "task_id": str(task_id),
+        "context_id": str(context_id),
+        "artifact": artifact,
+        **extra,
+    }
+
+
+def chunk_event(
+    task_id: UUID, context_id: UUID, artifact_id: UUID, chunk: Any
+) -> TaskEvent:
+    """Build the artifact-update event of one chunk yielded by a streaming agent."""
+    return artifact_event(
+        task_id,
+        context_id,
+        {
+            "artifact_id": str(artifact_id),
+            "name": "streaming_response",
+            "parts": [{"kind": "text", "text": str(chunk)}],
+        },
+        append=True,
+        last_chunk=False,
+    )
+
+
+class TaskEventSubscription:
+    """The events of one task, as received by one subscriber.
+
+    Replayed events (backlog) come first, then live ones; live events the
+    replay already covered are skipped.
+    """
+
+    def __init__(self, task_id: str, buffer_size: int):
+        """Initialize an empty subscription buffering up to buffer_size events."""
+        self.task_id = task_id
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer_size + 1)
+        self._buffer_size = buffer_size
+        self.lagged = False
+        self.backlog: deque[TaskEvent] = deque()
+        self._last_sequence = 0
+
+    def prime(self, events: list[TaskEvent]) -> None:
+        """Queue replayed events ahead of the live ones."""
+        self.backlog.extend(events)
+        if events:
+            self._last_sequence = events[-1]["sequence"]
+
+    def put(self, event: TaskEvent) -> None:
+        """Buffer an event, dropping the subscriber if its buffer is full."""
+        if self.lagged:
+            return
+        if self._queue.qsize() >= self._buffer_size:
+            self.lagged = True
+            # Free the buffer at once: the subscriber only learns it lagged
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_LAGGED)
+            get_metrics().increment_task_event_subscribers_lagged()
+            logger.warning(f"Dropped a subscriber to task {self.task_id}: it lagged")
+            return
+        self._queue.put_nowait(event)
+
+    def __aiter__(self) -> Self:
+        """Iterate over the events as they arrive."""
+        return self
+
+    async def __anext__(self) -> TaskEvent:
+        """Wait for the next event.
+
+        Raises:
+            SubscriberLaggedError: If events were dropped because the
+                subscriber fell behind
+        """
+        if self.backlog:
+            return self.backlog.popleft()
+        while True:
+            event = await self._queue.get()
+            if event is _LAGGED:
+                raise SubscriberLaggedError(
+                    f"Subscriber fell more than {self._buffer_size} events behind; "
+                    "resubscribe from the last sequence received"
+                )
+            if event.get("sequence", 0) > self._last_sequence:
+                return event
+
+
+class TaskEventBus(ABC):
+    """Publishes task events to the subscribers of the task, in any process.
+
+    Subclasses only move events between processes (publish) and hand those
+    received to deliver(); fan-out to the local subscribers is shared.
+    """
+
+    def __init__(
+        self,
+        subscriber_buffer: int = 256,
+        replay_buffer: int = 256,
+        replay_ttl: float = 300.0,
+    ):
+        """Initialize the bus.
+
+        Args:
+            subscriber_buffer: Events buffered per subscriber before it is dropped
+            replay_buffer: Latest events kept per task for resubscribers (0: none)
+            replay_ttl: Seconds a task's events are kept after its final event
+        """
+        self.subscriber_buffer = subscriber_buffer
+        self.replay_buffer = replay_buffer
+        self.replay_ttl = replay_ttl
+        self._subscriptions: dict[str, set[TaskEventSubscription]] = {}
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Exit async context manager."""
+
+    @abstractmethod
+    async def publish(self, task_id: UUID, event: TaskEvent) -> TaskEvent:
+        """Number an event of a task, keep it for replay and publish it.
+
+        Returns:
+            The event as published, with its sequence
+        """
+
+    @abstractmethod
+    async def replay(self, task_id: UUID, after_sequence: int) -> list[TaskEvent]:
+        """Return the kept events of a task numbered after after_sequence, in order."""
+
+    def _expiry(self, event: TaskEvent) -> float:
+        """Seconds a task's replay buffer is kept after this event."""
+        return self.replay_ttl if event.get("final") else IDLE_REPLAY_TTL
+
+    @asynccontextmanager
+    async def subscribe(
+        self, task_id: UUID, after_sequence: int | None = None
+    ) -> AsyncIterator[TaskEventSubscription]:
+        """Receive the events of a task published from now on.
+
+        Subscribe before starting the task, or its first events may be missed.
+
+        Args:
+            task_id: Task to follow
+            after_sequence: Also replay the kept events numbered after this one
+        """
+        key = str(task_id)
+        subscription = TaskEventSubscription(key, self.subscriber_buffer)
+        first = key not in self._subscriptions
+        self._subscriptions.setdefault(key, set()).add(subscription)
+        try:
+            if first:
+                await self._watch(key)
+            # Replay once subscribed: events published meanwhile arrive twice
+            # and the subscription drops the live copy
+            if after_sequence is not None:
+                subscription.prime(await self.replay(task_id, after_sequence))
+            yield subscription
+        finally:
+            subscribers = self._subscriptions.get(key)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[key]
+                    await self._unwatch(key)
+
+    def has_subscribers(self, task_id: UUID) -> bool:
+        """Whether anyone in this process follows the task."""
+        return str(task_id) in self._subscriptions
+
+    def deliver(self, task_id: str, event: TaskEvent) -> None:
+        """Hand an event to the subscribers of its task in this process."""
+        for subscription in list(self._subscriptions.get(task_id, ())):
+            subscription.put(event)
+
+    async def _watch(self, task_id: str) -> None:
+        """Start receiving the task's events from other processes, if any."""
+
+    async def _unwatch(self, task_id: str) -> None:
+        """Stop receiving the task's events from other processes, if any."""
@@ -0,0 +1,75 @@
+"""Task event bus factory.
+
+Usage:
+    from bindu.server.events.factory import create_event_bus
+
+    event_bus = create_event_bus()
+    async with event_bus:
+        await event_bus.publish(task_id, event)
+"""
+
+from __future__ import annotations as _annotations
+
+from bindu.utils.logging import get_logger
+
+from .base import TaskEventBus
+from .memory_event_bus import InMemoryTaskEventBus
+
+try:
+    from .redis_event_bus import RedisTaskEventBus
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    RedisTaskEventBus = None  # type: ignore[assignment]  # redis not installed
+    REDIS_AVAILABLE = False
+
+logger = get_logger("bindu.server.events.factory")
+
+
+def create_event_bus() -> TaskEventBus:
+    """Create the task event bus configured in app_settings.events.
+
+    Supported backends:
+    - "memory": InMemoryTaskEventBus (default, single-process)
+    - "redis": RedisTaskEventBus (multi-process), on events.redis_url or
+      else the scheduler's Redis
+
+    Returns:
+        Task event bus, to be entered before use
+
+    Raises:
+        ValueError: If the backend is unknown, or redis is not installed or
+            has no URL
+    """
+    from bindu.settings import app_settings
+
+    settings = app_settings.events
+    backend = settings.backend
+    logger.info(f"Creating task event bus backend: {backend}")
+
+    if backend == "memory":
+        return InMemoryTaskEventBus(
+            subscriber_buffer=settings.subscriber_buffer,
+            replay_buffer=settings.replay_buffer,
+            replay_ttl=settings.replay_ttl,
+        )
+    if backend == "redis":
+        if not REDIS_AVAILABLE:
+            raise ValueError(
+                "Redis task event bus requires redis package. "
+                "Install with: pip install redis"
+            )
+        redis_url = settings.redis_url or app_settings.scheduler.redis_url
+        if not redis_url:
+            raise ValueError(
+                "Redis task event bus requires a Redis URL. "
+                "Please provide it via EVENT_BUS_REDIS_URL or REDIS_URL."
+            )
+        return RedisTaskEventBus(
+            redis_url=redis_url,
+            channel_prefix=settings.channel_prefix,
+            subscriber_buffer=settings.subscriber_buffer,
+            replay_buffer=settings.replay_buffer,
+            replay_ttl=settings.replay_ttl,
+        )
+    raise ValueError(f"Unknown task event bus backend: {backend}")
@@ -0,0 +1,77 @@
+"""In-memory task event bus for single-process deployments."""
+
+from __future__ import annotations as _annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from .base import TaskEvent, TaskEventBus
+
+SWEEP_INTERVAL = 1.0
+"""Minimum seconds between two sweeps of the expired replay buffers."""
+
+
+@dataclass
+class _ReplayBuffer:
+    """Latest events of one task and the sequence of the last one."""
+
+    events: deque[TaskEvent]
+    sequence: int = 0
+    expires_at: float = field(default=0.0)
+
+
+class InMemoryTaskEventBus(TaskEventBus):
+    """Task event bus delivering events within this process.
+
+    Enough when the workers run in the process serving the requests (the
+    in-memory scheduler, or one server process per worker).
+    """
+
+    def __init__(
+        self,
+        subscriber_buffer: int = 256,
+        replay_buffer: int = 256,
+        replay_ttl: float = 300.0,
+    ):
+        """Initialize in-memory task event bus (see TaskEventBus)."""
+        super().__init__(
+            subscriber_buffer=subscriber_buffer,
+            replay_buffer=replay_buffer,
+            replay_ttl=replay_ttl,
+        )
+        self._replay: dict[str, _ReplayBuffer] = {}
+        self._next_sweep = 0.0
+
+    async def publish(self, task_id: UUID, event: TaskEvent) -> TaskEvent:
+        """Number and keep an event, and deliver it in this process."""
+        key = str(task_id)
+        now = time.monotonic()
+        self._sweep(now)
+        buffer = self._replay.get(key)
+        if buffer is None:
+            buffer = self._replay[key] = _ReplayBuffer(deque(maxlen=self.replay_buffer))
+        buffer.sequence += 1
+        event = {**event, "sequence": buffer.sequence}
+        buffer.events.append(event)
+        buffer.expires_at = now + self._expiry(event)
+        self.deliver(key, event)
+        return event
+
+    async def replay(self, task_id: UUID, after_sequence: int) -> list[TaskEvent]:
+        """Return the kept events of a task numbered after after_sequence."""
+        self._sweep(time.monotonic())
+        buffer = self._replay.get(str(task_id))
+        if buffer is None:
+            return []
+        return [event for event in buffer.events if event["sequence"] > after_sequence]
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired replay buffers, at most once per SWEEP_INTERVAL."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + SWEEP_INTERVAL
+        expired = [key for key, buf in self._replay.items() if buf.expires_at <= now]
+        for key in expired:
+            del self._replay[key]
@@ -0,0 +1,166 @@
+"""Redis pub/sub task event bus for multi-process deployments."""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import json
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from bindu.utils.logging import get_logger
+
+from .base import TaskEvent, TaskEventBus
+
+logger = get_logger("bindu.server.events.redis_event_bus")
+
+
+class RedisTaskEventBus(TaskEventBus):
+    """Task event bus on Redis pub/sub.
+
+    Events of a task are published on "<channel_prefix>:<task_id>". A process
+    subscribes to that channel while it has local subscribers to the task,
+    over a single pub/sub connection, and fans the messages out to them. A
+    worker in any process therefore reaches the request streaming its task.
+
+    Live delivery is at-most-once, like pub/sub. The events are also kept,
+    numbered by an INCR counter ("<channel_prefix>:<task_id>:seq"), in a
+    capped list ("<channel_prefix>:<task_id>:replay") that any process can
+    replay from; both keys expire like the in-memory buffers.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        channel_prefix: str = "bindu:events",
+        subscriber_buffer: int = 256,
+        replay_buffer: int = 256,
+        replay_ttl: float = 300.0,
+    ):
+        """Initialize Redis task event bus.
+
+        Args:
+            redis_url: Redis URL (redis://[password@]host:port/db)
+            channel_prefix: Prefix of the per-task channels
+            subscriber_buffer: Events buffered per subscriber before it is dropped
+            replay_buffer: Latest events kept per task for resubscribers (0: none)
+            replay_ttl: Seconds a task's events are kept after its final event
+        """
+        super().__init__(
+            subscriber_buffer=subscriber_buffer,
+            replay_buffer=replay_buffer,
+            replay_ttl=replay_ttl,
+        )
+        self.redis_url = redis_url
+        self.channel_prefix = channel_prefix
+        self._redis_client: redis.Redis | None = None
+        self._pubsub: Any = None
+        self._listener: asyncio.Task | None = None
+
+    def channel(self, task_id: str) -> str:
+        """Channel carrying a task's events."""
+        return f"{self.channel_prefix}:{task_id}"
+
+    async def __aenter__(self):
+        """Connect and start listening for events."""
+        self._redis_client = redis.from_url(
+            self.redis_url, encoding="utf-8", decode_responses=True
+        )
+        try:
+            await self._redis_client.ping()
+        except redis.RedisError as e:
+            raise ConnectionError(
+                f"Unable to connect to Redis at {self.redis_url}: {e}"
+            )
+        self._pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+        # Keep the connection subscribed while no task is followed, so the
+        # listener always has something to read
+        await self._pubsub.subscribe(self.channel("_"))
+        self._listener = asyncio.create_task(self._listen())
+        logger.info(f"Redis task event bus connected to {self.redis_url}")
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop listening and close the connections."""
+        if self._listener and not self._listener.done():
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis_client:
+            await self._redis_client.aclose()
+            self._redis_client = None
+
+    async def publish(self, task_id: UUID, event: TaskEvent) -> TaskEvent:
+        """Number an event, keep it and publish it on the task's channel."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        channel = self.channel(str(task_id))
+        sequence = await self._redis_client.incr(f"{channel}:seq")
+        event = {**event, "sequence": sequence}
+        payload = json.dumps(event, default=str)
+        ttl_ms = int(self._expiry(event) * 1000)
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            if self.replay_buffer:
+                pipe.rpush(f"{channel}:replay", payload)
+                pipe.ltrim(f"{channel}:replay", -self.replay_buffer, -1)
+                pipe.pexpire(f"{channel}:replay", ttl_ms)
+            pipe.pexpire(f"{channel}:seq", ttl_ms)
+            pipe.publish(channel, payload)
+            await pipe.execute()
+        return event
+
+    async def replay(self, task_id: UUID, after_sequence: int) -> list[TaskEvent]:
+        """Return the kept events of a task numbered after after_sequence."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        entries = await self._redis_client.lrange(
+            f"{self.channel(str(task_id))}:replay", 0, -1
+        )
+        events = [json.loads(entry) for entry in entries]
+        return [event for event in events if event["sequence"] > after_sequence]
+
+    async def _watch(self, task_id: str) -> None:
+        """Subscribe to the task's channel."""
+        await self._pubsub.subscribe(self.channel(task_id))
+
+    async def _unwatch(self, task_id: str) -> None:
+        """Unsubscribe from the task's channel."""
+        try:
+            await self._pubsub.unsubscribe(self.channel(task_id))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to unsubscribe from task {task_id}: {e}")
+
+    async def _listen(self) -> None:
+        """Hand the events received to the local subscribers."""
+        prefix_length = len(self.channel_prefix) + 1
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except redis.RedisError as e:
+                # The connection resubscribes when it reconnects
+                logger.error(f"Redis error on the task event bus: {e}")
+                await asyncio.sleep(1)
+                continue
+            if message is None:
+                continue
+            try:
+                event = json.loads(message["data"])
+            except (TypeError, ValueError) as e:
+                logger.error(f"Failed to decode task event: {e}")
+                continue
+            self.deliver(message["channel"][prefix_length:], event)
@@ -37,6 +37,7 @@ class ContextHandlers:
 
     storage: Storage[Any]
     error_response_creator: Any = None
+    history_cache: Any | None = None
 
     @trace_context_operation("list_contexts")
     async def list_contexts(self, request: ListContextsRequest) -> ListContextsResponse:
@@ -70,6 +71,9 @@ class ContextHandlers:
                 ClearContextsResponse, request["id"], ContextNotFoundError, str(e)
             )
 
+        if self.history_cache is not None:
+            self.history_cache.invalidate(context_id)
+
         return ClearContextsResponse(
             jsonrpc="2.0",
             id=request["id"],
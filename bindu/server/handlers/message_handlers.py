@@ -11,29 +11,48 @@
 
 This module handles message-related RPC requests including
 sending messages and streaming responses.
+
+Both submit the task and hand it to the scheduler; message/stream also
+follows the run on the task event bus and relays it as Server-Sent Events.
 """
 
 from __future__ import annotations
 
-import inspect
+import asyncio
 import json
-import uuid
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any
 
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
 from bindu.common.protocol.types import (
+    ResubscribeTaskRequest,
+    ResubscribeTaskResponse,
     SendMessageRequest,
     SendMessageResponse,
+    ServerBusyError,
     StreamMessageRequest,
+    StreamMessageResponse,
     Task,
+    TaskNotFoundError,
     TaskSendParams,
 )
-
+from bindu.server.events import (
+    InMemoryTaskEventBus,
+    SubscriberLaggedError,
+    TaskEventBus,
+    TaskEventSubscription,
+    ends_stream,
+    status_event,
+)
+from bindu.server.scheduler import Scheduler, SchedulerBusyError
+from bindu.server.storage import Storage
 from bindu.utils.task_telemetry import trace_task_operation, track_active_task
 
-from bindu.server.scheduler import Scheduler
-from bindu.server.storage import Storage
+STREAM_IDLE_CHECK_INTERVAL = 5.0
+"""Seconds without events after which a stream checks the stored task state."""
 
 
 @dataclass
@@ -46,6 +65,13 @@ class MessageHandlers:
     workers: list[Any] | None = None
     context_id_parser: Any = None
     push_manager: Any | None = None
+    event_bus: TaskEventBus | None = None
+    error_response_creator: Any = None
+
+    def __post_init__(self) -> None:
+        """Fall back to an in-process event bus."""
+        if self.event_bus is None:
+            self.event_bus = InMemoryTaskEventBus()
 
     @trace_task_operation("send_message")
     @track_active_task
@@ -56,9 +82,155 @@ class MessageHandlers:
         If the request reaches here, payment has already been verified.
         Settlement will be handled by ManifestWorker when task completes.
         """
+        task, scheduler_params = await self._submit(request)
+        if error := await self._schedule(task, scheduler_params):
+            return SendMessageResponse(jsonrpc="2.0", id=request["id"], error=error)
+
+        return SendMessageResponse(jsonrpc="2.0", id=request["id"], result=task)
+
+    async def stream_message(
+        self, request: StreamMessageRequest
+    ) -> StreamingResponse | StreamMessageResponse:
+        """Send a message and stream the run as Server-Sent Events.
+
+        The task is submitted and scheduled like message/send and run by
+        whichever worker takes it; the worker's status updates and artifact
+        chunks reach this request through the task event bus. The stream
+        ends with the first final status-update. Every event carries the
+        sequence a client resumes from with tasks/resubscribe.
+
+        Returns:
+            A text/event-stream response, or a JSON-RPC error if the task
+            could not be scheduled
+        """
+        task, scheduler_params = await self._submit(request)  # type: ignore[arg-type]
+
+        # Subscribe before scheduling, so no event of the run is missed. The
+        # subscription is released when the stream ends, or after the
+        # response if the client left before it started
+        stack = AsyncExitStack()
+        subscription = await stack.enter_async_context(
+            self.event_bus.subscribe(task["id"])  # type: ignore[union-attr]
+        )
+        await self.event_bus.publish(  # type: ignore[union-attr]
+            task["id"],
+            status_event(task["id"], task["context_id"], "submitted", final=False),
+        )
+        if error := await self._schedule(task, scheduler_params):
+            await stack.aclose()
+            return StreamMessageResponse(jsonrpc="2.0", id=request["id"], error=error)
+
+        async def stream_generator():
+            """Relay the task's events until its final status-update."""
+            async with stack:
+                async for event in self._follow(task, subscription):
+                    yield _sse(event)
+
+        return StreamingResponse(
+            stream_generator(),
+            media_type="text/event-stream",
+            background=BackgroundTask(stack.aclose),
+        )
+
+    async def resubscribe_task(
+        self, request: ResubscribeTaskRequest
+    ) -> StreamingResponse | ResubscribeTaskResponse:
+        """Stream a task's events again after a dropped connection.
+
+        The events kept for the task and numbered after after_sequence (all
+        kept ones by default) are replayed, then live ones follow, until the
+        final status-update. If none are kept any more, the stream starts
+        with the stored state. A client resuming from a sequence older than
+        the kept events sees the gap in the sequence numbers.
+
+        Returns:
+            A text/event-stream response, or TaskNotFoundError
+        """
+        task_id = request["params"]["task_id"]
+        after_sequence = request["params"].get("after_sequence", 0)
+
+        stack = AsyncExitStack()
+        subscription = await stack.enter_async_context(
+            self.event_bus.subscribe(task_id, after_sequence)  # type: ignore[union-attr]
+        )
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
+        if task is None:
+            await stack.aclose()
+            return self.error_response_creator(
+                ResubscribeTaskResponse,
+                request["id"],
+                TaskNotFoundError,
+                "Task not found",
+            )
+
+        async def stream_generator():
+            """Replay, then relay the task's events until its final status-update."""
+            async with stack:
+                if not subscription.backlog:
+                    state = task["status"]["state"]
+                    current = status_event(
+                        task["id"], task["context_id"], state, ends_stream(state)
+                    )
+                    yield _sse(current)
+                    if current["final"]:
+                        return
+                async for event in self._follow(task, subscription):
+                    yield _sse(event)
+
+        return StreamingResponse(
+            stream_generator(),
+            media_type="text/event-stream",
+            background=BackgroundTask(stack.aclose),
+        )
+
+    async def _follow(self, task: Task, subscription: TaskEventSubscription):
+        """Yield the events of a task up to and including the final one.
+
+        A subscriber that lagged, or that heard nothing for a while (an event
+        lost on the way, a worker that failed the task silently), gets a
+        final event from the stored task once it is over.
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.__anext__(), timeout=STREAM_IDLE_CHECK_INTERVAL
+                )
+            except (SubscriberLaggedError, asyncio.TimeoutError) as e:
+                lagged = isinstance(e, SubscriberLaggedError)
+                stored = await self.storage.load_task(
+                    task["id"], include_history=False, include_artifacts=False
+                )
+                state = stored["status"]["state"] if stored else "unknown"
+                if not lagged and not ends_stream(state) and stored is not None:
+                    continue
+                extra = {"error": str(e)} if lagged else {}
+                yield status_event(
+                    task["id"], task["context_id"], state, final=True, **extra
+                )
+                return
+            yield event
+            if event.get("final"):
+                return
+
+    async def _submit(self, request: SendMessageRequest) -> tuple[Task, TaskSendParams]:
+        """Store the task of a message/send or message/stream request.
+
+        Returns:
+            The submitted task and the parameters to schedule its run with
+        """
         message = request["params"]["message"]
         context_id = self.context_id_parser(message.get("context_id"))
 
+        # Take payment context out of message metadata before it is stored.
+        # This is injected by the endpoint when x402 middleware verifies payment
+        # and is for internal use only.
+        message_metadata = message.get("metadata", {})
+        payment_context = message_metadata.pop("_payment_context", None)
+        # Likewise the authenticated caller, injected by the endpoint
+        caller = message_metadata.pop("_caller", None)
+
         # Submit task to storage
         task: Task = await self.storage.submit_task(context_id, message)
 
@@ -84,134 +256,38 @@ class MessageHandlers:
                 task["id"], push_config, persist=is_long_running
             )
 
-        # Pass payment context from message metadata to worker if available
-        # This is injected by the endpoint when x402 middleware verifies payment
-        message_metadata = message.get("metadata", {})
-        if "_payment_context" in message_metadata:
-            scheduler_params["payment_context"] = message_metadata["_payment_context"]
-            # Remove from message metadata to keep it clean (internal use only)
-            del message["metadata"]["_payment_context"]
+        # Pass payment context to worker if available
+        if payment_context is not None:
+            scheduler_params["payment_context"] = payment_context
 
-        await self.scheduler.run_task(scheduler_params)
-        return SendMessageResponse(jsonrpc="2.0", id=request["id"], result=task)
+        # Priority class and caller identity for fair scheduling
+        if priority := config.get("priority") or message_metadata.get("priority"):
+            scheduler_params["priority"] = priority
+        if caller:
+            scheduler_params["tenant"] = caller
 
-    async def stream_message(self, request: StreamMessageRequest):
-        """Stream messages using Server-Sent Events.
+        return task, scheduler_params
 
-        This method returns a StreamingResponse directly to support SSE,
-        which will be handled at the application layer.
+    async def _schedule(
+        self, task: Task, scheduler_params: TaskSendParams
+    ) -> ServerBusyError | None:
+        """Queue the run of a submitted task.
 
-        Note: Not fully implemented yet. #TODO
+        Returns:
+            The error to answer with if the queue is full, else None
         """
-        from starlette.responses import StreamingResponse
-
-        message = request["params"]["message"]
-        context_id = self.context_id_parser(message.get("context_id"))
+        try:
+            await self.scheduler.run_task(scheduler_params)
+        except SchedulerBusyError as e:
+            # Queue is full: take the message back, so the client can retry
+            # the same task once there is room
+            await self.storage.withdraw_message(
+                task["id"], scheduler_params["message"]["message_id"]
+            )
+            return ServerBusyError(code=-32040, message=str(e))
+        return None
 
-        # similar to the "messages/send flow submit the task to the configured storage"
-        task: Task = await self.storage.submit_task(context_id, message)
 
-        async def stream_generator():
-            """Generate a consumable stream based on the function which was decorated using pebblify."""
-            try:
-                await self.storage.update_task(task["id"], state="working")
-                # yield the initial status update event to indicate processing of the task has started
-                status_event = {
-                    "kind": "status-update",
-                    "task_id": str(task["id"]),
-                    "context_id": str(context_id),
-                    "status": {
-                        "state": "working",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "final": False,
-                }
-                yield f"data: {json.dumps(status_event)}\n\n"
-
-                if self.workers and self.manifest:
-                    worker = self.workers[0]
-                    message_history = await worker._build_complete_message_history(task)
-                    manifest_result = self.manifest.run(message_history)
-
-                    if inspect.isasyncgen(manifest_result):
-                        async for chunk in manifest_result:
-                            if chunk:
-                                artifact_event = {
-                                    "kind": "artifact-update",
-                                    "task_id": str(task["id"]),
-                                    "context_id": str(context_id),
-                                    "artifact": {
-                                        "artifact_id": str(uuid.uuid4()),
-                                        "name": "streaming_response",
-                                        "parts": [{"kind": "text", "text": str(chunk)}],
-                                    },
-                                    "append": True,
-                                    "last_chunk": False,
-                                }
-                                yield f"data: {json.dumps(artifact_event)}\n\n"
-
-                    elif inspect.isgenerator(manifest_result):
-                        for chunk in manifest_result:
-                            if chunk:
-                                artifact_event = {
-                                    "kind": "artifact-update",
-                                    "task_id": str(task["id"]),
-                                    "context_id": str(context_id),
-                                    "artifact": {
-                                        "artifact_id": str(uuid.uuid4()),
-                                        "name": "streaming_response",
-                                        "parts": [{"kind": "text", "text": str(chunk)}],
-                                    },
-                                    "append": True,
-                                    "last_chunk": False,
-                                }
-                                yield f"data: {json.dumps(artifact_event)}\n\n"
-
-                    else:
-                        if manifest_result:
-                            artifact_event = {
-                                "kind": "artifact-update",
-                                "task_id": str(task["id"]),
-                                "context_id": str(context_id),
-                                "artifact": {
-                                    "artifact_id": str(uuid.uuid4()),
-                                    "name": "response",
-                                    "parts": [
-                                        {"kind": "text", "text": str(manifest_result)}
-                                    ],
-                                },
-                                "last_chunk": True,
-                            }
-                            yield f"data: {json.dumps(artifact_event)}\n\n"
-
-                # Send completion status
-                completion_event = {
-                    "kind": "status-update",
-                    "task_id": str(task["id"]),
-                    "context_id": str(context_id),
-                    "status": {
-                        "state": "completed",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "final": True,
-                }
-                yield f"data: {json.dumps(completion_event)}\n\n"
-
-                # Update task state in storage
-                await self.storage.update_task(task["id"], state="completed")
-            except Exception as e:
-                error_event = {
-                    "kind": "status-update",
-                    "task_id": str(task["id"]),
-                    "context_id": str(context_id),
-                    "status": {
-                        "state": "failed",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "final": True,
-                    "error": str(e),
-                }
-                yield f"data: {json.dumps(error_event)}\n\n"
-                await self.storage.update_task(task["id"], state="failed")
-
-        return StreamingResponse(stream_generator(), media_type="text/event-stream")
+def _sse(event: dict[str, Any]) -> str:
+    """Format an event as a Server-Sent Events message."""
+    return f"data: {json.dumps(event, default=str)}\n\n"
@@ -10,11 +10,13 @@
 """Task handlers for Bindu server.
 
 This module handles task-related RPC requests including
-getting, listing, canceling tasks, and submitting feedback.
+getting, listing, canceling tasks, submitting feedback, and inspecting and
+replaying dead-lettered task operations.
 """
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -24,8 +26,12 @@ from bindu.common.protocol.types import (
     CancelTaskResponse,
     GetTaskRequest,
     GetTaskResponse,
+    ListDeadLettersRequest,
+    ListDeadLettersResponse,
     ListTasksRequest,
     ListTasksResponse,
+    ReplayDeadLettersRequest,
+    ReplayDeadLettersResponse,
     TaskFeedbackRequest,
     TaskFeedbackResponse,
     TaskNotCancelableError,
@@ -35,8 +41,20 @@ from bindu.settings import app_settings
 
 from bindu.utils.task_telemetry import trace_task_operation, track_active_task
 
+from bindu.server.events import SubscriberLaggedError, TaskEventBus
 from bindu.server.scheduler import Scheduler
+from bindu.server.scheduler.codec import decode_task_operation
 from bindu.server.storage import Storage
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.handlers.task_handlers")
+
+LONG_POLL_RECHECK_INTERVAL = 1.0
+"""Seconds between reads of the stored state while a tasks/get waits.
+
+They catch changes published where the event bus does not reach, e.g. a
+worker in another process with the in-memory bus.
+"""
 
 
 @dataclass
@@ -46,12 +64,23 @@ class TaskHandlers:
     scheduler: Scheduler
     storage: Storage[Any]
     error_response_creator: Any = None
+    event_bus: TaskEventBus | None = None
 
     @trace_task_operation("get_task")
     async def get_task(self, request: GetTaskRequest) -> GetTaskResponse:
-        """Get a task and return it to the client."""
-        task_id = request["params"]["task_id"]
-        history_length = request["params"].get("history_length")
+        """Get a task and return it to the client.
+
+        With wait_for_change_ms, the answer is held until the task leaves
+        known_state (by default its current state) or the time is up, so
+        clients can long-poll instead of polling on an interval.
+        """
+        params = request["params"]
+        task_id = params["task_id"]
+        history_length = params.get("history_length")
+        if wait_for_change_ms := params.get("wait_for_change_ms"):
+            await self._wait_for_change(
+                task_id, params.get("known_state"), wait_for_change_ms
+            )
         task = await self.storage.load_task(task_id, history_length)
 
         if task is None:
@@ -61,12 +90,66 @@ class TaskHandlers:
 
         return GetTaskResponse(jsonrpc="2.0", id=request["id"], result=task)
 
+    async def _wait_for_change(
+        self, task_id: Any, known_state: str | None, wait_for_change_ms: int
+    ) -> None:
+        """Wait until the task's state differs from known_state, or time out.
+
+        Woken by the status updates workers publish on the task event bus;
+        the stored state is also re-read every LONG_POLL_RECHECK_INTERVAL.
+        Returns at once for a missing or terminal task.
+
+        Args:
+            task_id: Task to watch
+            known_state: State the client has (default: the current one)
+            wait_for_change_ms: Longest wait, capped by max_wait_for_change_ms
+        """
+        if self.event_bus is None:
+            return
+        timeout = min(wait_for_change_ms, app_settings.agent.max_wait_for_change_ms)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+
+        # Subscribed before reading the state, so no change falls in between
+        async with self.event_bus.subscribe(task_id) as subscription:
+            state = await self._load_state(task_id)
+            known_state = known_state or state
+            while state == known_state and state not in (
+                None,
+                *app_settings.agent.terminal_states,
+            ):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.__anext__(),
+                        min(remaining, LONG_POLL_RECHECK_INTERVAL),
+                    )
+                except asyncio.TimeoutError:
+                    state = await self._load_state(task_id)
+                    continue
+                except SubscriberLaggedError:
+                    return
+                if event["kind"] == "status-update":
+                    state = event["status"]["state"]
+
+    async def _load_state(self, task_id: Any) -> str | None:
+        """Read only the state of a stored task, None if it does not exist."""
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
+        return task["status"]["state"] if task else None
+
     @trace_task_operation("cancel_task")
     @track_active_task
     async def cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
         """Cancel a running task."""
         task_id = request["params"]["task_id"]
-        task = await self.storage.load_task(task_id)
+        # Only the state is needed to check whether the task can be canceled
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
 
         if task is None:
             return self.error_response_creator(
@@ -94,7 +177,10 @@ class TaskHandlers:
     @trace_task_operation("list_tasks", include_params=False)
     async def list_tasks(self, request: ListTasksRequest) -> ListTasksResponse:
         """List all tasks in storage."""
-        tasks = await self.storage.list_tasks(request["params"].get("length"))
+        params = request["params"]
+        tasks = await self.storage.list_tasks(
+            params.get("length"), history_length=params.get("history_length")
+        )
 
         if tasks is None:
             return self.error_response_creator(
@@ -107,7 +193,9 @@ class TaskHandlers:
     async def task_feedback(self, request: TaskFeedbackRequest) -> TaskFeedbackResponse:
         """Submit feedback for a completed task."""
         task_id = request["params"]["task_id"]
-        task = await self.storage.load_task(task_id)
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
 
         if task is None:
             return self.error_response_creator(
@@ -133,3 +221,82 @@ class TaskHandlers:
                 "task_id": str(task_id),
             },
         )
+
+    @trace_task_operation("list_dead_letters", include_params=False)
+    async def list_dead_letters(
+        self, request: ListDeadLettersRequest
+    ) -> ListDeadLettersResponse:
+        """List dead-lettered task operations, newest first."""
+        limit = request["params"].get("limit") or 100
+        dead_letters = await self.scheduler.list_dead_letters(limit)
+        return ListDeadLettersResponse(
+            jsonrpc="2.0", id=request["id"], result=dead_letters
+        )
+
+    @trace_task_operation("replay_dead_letters", include_params=False)
+    async def replay_dead_letters(
+        self, request: ReplayDeadLettersRequest
+    ) -> ReplayDeadLettersResponse:
+        """Queue dead-lettered operations again, all of them if no ids are given.
+
+        A failed task is put back to submitted before its run is queued. Dead
+        letters that cannot be decoded, or whose task is gone or finished,
+        are skipped and stay dead-lettered.
+        """
+        ids = request["params"].get("ids")
+        dead_letters = await self.scheduler.list_dead_letters(
+            app_settings.scheduler.dead_letter_limit
+        )
+        if ids is not None:
+            dead_letters = [entry for entry in dead_letters if entry["id"] in ids]
+
+        replayable = {}
+        skipped = (
+            [] if ids is None else sorted(set(ids) - {e["id"] for e in dead_letters})
+        )
+        for entry in dead_letters:
+            try:
+                task_operation = decode_task_operation(entry["payload"])
+            except Exception:
+                skipped.append(entry["id"])
+                continue
+            if task_operation["operation"] == "run":
+                task = await self.storage.load_task(
+                    task_operation["params"]["task_id"],
+                    include_history=False,
+                    include_artifacts=False,
+                )
+                if task is None or task["status"]["state"] in ("completed", "canceled"):
+                    skipped.append(entry["id"])
+                    continue
+            replayable[entry["id"]] = task_operation
+
+        # Only the caller that removes a dead letter replays it
+        removed = await self.scheduler.remove_dead_letters(list(replayable))
+        replayed = []
+        for entry in removed:
+            task_operation = replayable[entry["id"]]
+            params = task_operation["params"]
+            if task_operation["operation"] == "run":
+                task_id = params["task_id"]
+                await self.storage.update_task(task_id, state="submitted")
+                params = {
+                    key: value
+                    for key, value in params.items()
+                    if key not in ("run_at", "reschedules")
+                }
+                await self.scheduler.run_task(params)  # type: ignore[arg-type]
+            elif task_operation["operation"] == "cancel":
+                await self.scheduler.cancel_task(params)
+            elif task_operation["operation"] == "pause":
+                await self.scheduler.pause_task(params)
+            else:
+                await self.scheduler.resume_task(params)
+            replayed.append(entry["id"])
+
+        logger.info(f"Replayed {len(replayed)} dead letters, skipped {len(skipped)}")
+        return ReplayDeadLettersResponse(
+            jsonrpc="2.0",
+            id=request["id"],
+            result={"replayed": replayed, "skipped": skipped},
+        )
@@ -60,6 +60,55 @@ class PrometheusMetrics:
         self._http_response_size_count = 0
         self._http_requests_in_flight = 0
 
+        # Worker operation gauges (single worker per process)
+        self._worker_operations_in_flight = 0
+        self._worker_operations_queued = 0
+        # Canceled runs by how the cancel reached them (interrupted or skipped)
+        self._worker_cancellations: dict[str, int] = defaultdict(int)
+        # Runs put back on the queue for later, by outcome (rescheduled or exhausted)
+        self._worker_reschedules: dict[str, int] = defaultdict(int)
+
+        # Scheduler queue: depth gauge, time-in-queue histogram, rejections
+        self._scheduler_queue_length = 0
+        self._scheduler_delayed_operations = 0
+        self._scheduler_leased_shards = 0
+        self._queue_wait_buckets = [0.01, 0.1, 1.0, 10.0, float("inf")]
+        self._queue_wait_counts: dict[float, int] = defaultdict(int)
+        self._queue_wait_sum = 0.0
+        self._queue_wait_total_count = 0
+        self._scheduler_rejections = 0
+        # Dead-lettered operations by reason (failed, max_attempts, undecodable)
+        self._scheduler_dead_letters: dict[str, int] = defaultdict(int)
+
+        # Time-in-queue of run operations per priority class
+        self._priority_wait_counts: dict[str, dict[float, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._priority_wait_sum: dict[str, float] = defaultdict(float)
+        self._priority_wait_total_count: dict[str, int] = defaultdict(int)
+
+        # Operations per Redis round trip: {direction: {bucket_le: count}}
+        self._batch_size_buckets = [1, 2, 5, 10, 25, 50, 100, float("inf")]
+        self._batch_size_counts: dict[str, dict[float, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._batch_size_sum: dict[str, int] = defaultdict(int)
+        self._batch_size_total_count: dict[str, int] = defaultdict(int)
+
+        # Redis stream consumer group: delivered but unacknowledged, undelivered
+        self._scheduler_stream: tuple[int, int] | None = None
+
+        # Agent execution pool gauges: backend -> (busy, size, waiting)
+        self._execution_pools: dict[str, tuple[int, int, int]] = {}
+
+        # In-memory storage: stored tasks, estimated bytes, evictions by reason
+        self._storage_tasks: int | None = None
+        self._storage_bytes = 0
+        self._storage_evictions: dict[str, int] = defaultdict(int)
+
+        # Task event bus: subscribers dropped for falling behind
+        self._task_event_subscribers_lagged = 0
+
     def record_http_request(
         self,
         method: str,
@@ -162,6 +211,162 @@ class PrometheusMetrics:
         with self._lock:
             self._http_requests_in_flight = max(0, self._http_requests_in_flight - 1)
 
+    def set_worker_operations(self, in_flight: int, queued: int) -> None:
+        """Set the number of worker operations executing and waiting.
+
+        Args:
+            in_flight: Operations currently being executed by the worker
+            queued: Operations waiting behind another operation of the same context
+        """
+        with self._lock:
+            self._worker_operations_in_flight = in_flight
+            self._worker_operations_queued = queued
+
+    def increment_worker_cancellations(self, outcome: str) -> None:
+        """Increment the count of runs stopped by a control-channel cancel.
+
+        Args:
+            outcome: "interrupted" for a running task, "skipped" for a queued one
+        """
+        with self._lock:
+            self._worker_cancellations[outcome] += 1
+
+    def increment_worker_reschedules(self, outcome: str) -> None:
+        """Increment the count of runs the agent asked to retry later.
+
+        Args:
+            outcome: "rescheduled" when queued again, "exhausted" when the
+                task failed because it ran out of reschedules
+        """
+        with self._lock:
+            self._worker_reschedules[outcome] += 1
+
+    def set_scheduler_queue_length(self, length: int) -> None:
+        """Set the number of operations buffered in the scheduler queue.
+
+        Args:
+            length: Operations waiting to be picked up by a worker
+        """
+        with self._lock:
+            self._scheduler_queue_length = length
+
+    def set_scheduler_delayed_operations(self, count: int) -> None:
+        """Set the number of run operations held back until their run_at.
+
+        Args:
+            count: Deferred operations not yet due
+        """
+        with self._lock:
+            self._scheduler_delayed_operations = count
+
+    def set_scheduler_leased_shards(self, count: int) -> None:
+        """Set the number of queue shards leased to this worker.
+
+        Args:
+            count: Shards this worker currently takes operations from
+        """
+        with self._lock:
+            self._scheduler_leased_shards = count
+
+    def record_scheduler_queue_wait(
+        self, wait: float, priority: str | None = None
+    ) -> None:
+        """Record how long an operation spent in the scheduler queue.
+
+        Args:
+            wait: Seconds between enqueue and dequeue
+            priority: Priority class of a run operation, if the scheduler has classes
+        """
+        with self._lock:
+            for bucket in self._queue_wait_buckets:
+                if wait <= bucket:
+                    self._queue_wait_counts[bucket] += 1
+                    if priority is not None:
+                        self._priority_wait_counts[priority][bucket] += 1
+            self._queue_wait_sum += wait
+            self._queue_wait_total_count += 1
+            if priority is not None:
+                self._priority_wait_sum[priority] += wait
+                self._priority_wait_total_count[priority] += 1
+
+    def increment_scheduler_rejections(self) -> None:
+        """Increment the count of operations rejected because the queue was full."""
+        with self._lock:
+            self._scheduler_rejections += 1
+
+    def increment_scheduler_dead_letters(self, reason: str) -> None:
+        """Increment the count of operations moved to the dead letters.
+
+        Args:
+            reason: "failed", "max_attempts" or "undecodable"
+        """
+        with self._lock:
+            self._scheduler_dead_letters[reason] += 1
+
+    def increment_task_event_subscribers_lagged(self) -> None:
+        """Increment the count of event subscribers dropped for falling behind."""
+        with self._lock:
+            self._task_event_subscribers_lagged += 1
+
+    def record_scheduler_batch(self, direction: str, size: int) -> None:
+        """Record how many operations one scheduler round trip carried.
+
+        Args:
+            direction: "enqueue" or "dequeue"
+            size: Operations pushed or popped in the round trip
+        """
+        with self._lock:
+            for bucket in self._batch_size_buckets:
+                if size <= bucket:
+                    self._batch_size_counts[direction][bucket] += 1
+            self._batch_size_sum[direction] += size
+            self._batch_size_total_count[direction] += 1
+
+    def set_scheduler_stream_lag(self, pending: int, lag: int) -> None:
+        """Set the backlog of the scheduler's Redis stream consumer group.
+
+        Args:
+            pending: Operations delivered to a worker but not yet acknowledged
+            lag: Operations in the stream not yet delivered to any worker
+        """
+        with self._lock:
+            self._scheduler_stream = (pending, lag)
+
+    def set_execution_pool(
+        self, backend: str, busy: int, size: int, waiting: int
+    ) -> None:
+        """Set usage of the pool running synchronous agent handlers.
+
+        Args:
+            backend: Execution backend (thread or process)
+            busy: Pool slots currently running a handler
+            size: Maximum number of pool slots
+            waiting: Calls waiting for a free slot
+        """
+        with self._lock:
+            self._execution_pools[backend] = (busy, size, waiting)
+
+    def set_storage_usage(self, tasks: int, size_bytes: int) -> None:
+        """Set how many tasks the in-memory storage holds and their estimated size.
+
+        Args:
+            tasks: Stored tasks
+            size_bytes: Estimated size of their history and artifacts
+        """
+        with self._lock:
+            self._storage_tasks = tasks
+            self._storage_bytes = size_bytes
+
+    def increment_storage_evictions(self, reason: str, count: int = 1) -> None:
+        """Increment the count of terminal tasks evicted from in-memory storage.
+
+        Args:
+            reason: Why the tasks were evicted (ttl, max_tasks or max_bytes)
+            count: Number of tasks evicted
+        """
+        with self._lock:
+            self._storage_evictions[reason] += count
+
     def generate_prometheus_text(self) -> str:
         """Generate Prometheus text format metrics.
 
@@ -289,6 +494,197 @@ class PrometheusMetrics:
             lines.append("# TYPE http_requests_in_flight gauge")
             lines.append(f"http_requests_in_flight {self._http_requests_in_flight}")
 
+            # Worker operations
+            lines.append("")
+            lines.append(
+                "# HELP worker_operations_in_flight Task operations currently executing"
+            )
+            lines.append("# TYPE worker_operations_in_flight gauge")
+            lines.append(
+                f"worker_operations_in_flight {self._worker_operations_in_flight}"
+            )
+            lines.append("")
+            lines.append(
+                "# HELP worker_operations_queued Task operations waiting for their context"
+            )
+            lines.append("# TYPE worker_operations_queued gauge")
+            lines.append(f"worker_operations_queued {self._worker_operations_queued}")
+            if self._worker_cancellations:
+                lines.append("")
+                lines.append(
+                    "# HELP worker_cancellations_total Runs stopped by a control-channel cancel"
+                )
+                lines.append("# TYPE worker_cancellations_total counter")
+                for outcome, count in sorted(self._worker_cancellations.items()):
+                    lines.append(
+                        f'worker_cancellations_total{{outcome="{outcome}"}} {count}'
+                    )
+            if self._worker_reschedules:
+                lines.append("")
+                lines.append(
+                    "# HELP worker_reschedules_total Runs the agent asked to retry later"
+                )
+                lines.append("# TYPE worker_reschedules_total counter")
+                for outcome, count in sorted(self._worker_reschedules.items()):
+                    lines.append(
+                        f'worker_reschedules_total{{outcome="{outcome}"}} {count}'
+                    )
+
+            # Scheduler queue
+            lines.append("")
+            lines.append(
+                "# HELP scheduler_queue_length Task operations buffered in the scheduler"
+            )
+            lines.append("# TYPE scheduler_queue_length gauge")
+            lines.append(f"scheduler_queue_length {self._scheduler_queue_length}")
+            lines.append("")
+            lines.append(
+                "# HELP scheduler_delayed_operations Run operations deferred until their run_at"
+            )
+            lines.append("# TYPE scheduler_delayed_operations gauge")
+            lines.append(
+                f"scheduler_delayed_operations {self._scheduler_delayed_operations}"
+            )
+            lines.append("")
+            lines.append(
+                "# HELP scheduler_leased_shards Queue shards leased to this worker"
+            )
+            lines.append("# TYPE scheduler_leased_shards gauge")
+            lines.append(f"scheduler_leased_shards {self._scheduler_leased_shards}")
+            lines.append("")
+            lines.append(
+                "# HELP scheduler_queue_wait_seconds Time task operations spend queued"
+            )
+            lines.append("# TYPE scheduler_queue_wait_seconds histogram")
+            for bucket in self._queue_wait_buckets:
+                count = self._queue_wait_counts[bucket]
+                bucket_str = "+Inf" if bucket == float("inf") else str(bucket)
+                lines.append(
+                    f'scheduler_queue_wait_seconds_bucket{{le="{bucket_str}"}} {count}'
+                )
+            lines.append(f"scheduler_queue_wait_seconds_sum {self._queue_wait_sum:.3f}")
+            lines.append(
+                f"scheduler_queue_wait_seconds_count {self._queue_wait_total_count}"
+            )
+            if self._priority_wait_total_count:
+                lines.append("")
+                lines.append(
+                    "# HELP scheduler_priority_wait_seconds Time run operations spend queued, per priority class"
+                )
+                lines.append("# TYPE scheduler_priority_wait_seconds histogram")
+                for priority in sorted(self._priority_wait_total_count):
+                    for bucket in self._queue_wait_buckets:
+                        count = self._priority_wait_counts[priority][bucket]
+                        bucket_str = "+Inf" if bucket == float("inf") else str(bucket)
+                        lines.append(
+                            f'scheduler_priority_wait_seconds_bucket{{priority="{priority}",le="{bucket_str}"}} {count}'
+                        )
+                    lines.append(
+                        f'scheduler_priority_wait_seconds_sum{{priority="{priority}"}} {self._priority_wait_sum[priority]:.3f}'
+                    )
+                    lines.append(
+                        f'scheduler_priority_wait_seconds_count{{priority="{priority}"}} {self._priority_wait_total_count[priority]}'
+                    )
+            lines.append("")
+            lines.append(
+                "# HELP scheduler_rejections_total Task operations rejected by a full queue"
+            )
+            lines.append("# TYPE scheduler_rejections_total counter")
+            lines.append(f"scheduler_rejections_total {self._scheduler_rejections}")
+            if self._scheduler_dead_letters:
+                lines.append("")
+                lines.append(
+                    "# HELP scheduler_dead_letters_total Task operations moved to the dead letters"
+                )
+                lines.append("# TYPE scheduler_dead_letters_total counter")
+                for reason, count in sorted(self._scheduler_dead_letters.items()):
+                    lines.append(
+                        f'scheduler_dead_letters_total{{reason="{reason}"}} {count}'
+                    )
+            if self._batch_size_total_count:
+                lines.append("")
+                lines.append(
+                    "# HELP scheduler_batch_size Task operations per scheduler round trip"
+                )
+                lines.append("# TYPE scheduler_batch_size histogram")
+                for direction in sorted(self._batch_size_total_count):
+                    for bucket in self._batch_size_buckets:
+                        count = self._batch_size_counts[direction][bucket]
+                        bucket_str = "+Inf" if bucket == float("inf") else str(bucket)
+                        lines.append(
+                            f'scheduler_batch_size_bucket{{direction="{direction}",le="{bucket_str}"}} {count}'
+                        )
+                    lines.append(
+                        f'scheduler_batch_size_sum{{direction="{direction}"}} {self._batch_size_sum[direction]}'
+                    )
+                    lines.append(
+                        f'scheduler_batch_size_count{{direction="{direction}"}} {self._batch_size_total_count[direction]}'
+                    )
+            if self._scheduler_stream is not None:
+                pending, lag = self._scheduler_stream
+                lines.append("")
+                lines.append(
+                    "# HELP scheduler_stream_pending Task operations delivered but not acknowledged"
+                )
+                lines.append("# TYPE scheduler_stream_pending gauge")
+                lines.append(f"scheduler_stream_pending {pending}")
+                lines.append("")
+                lines.append(
+                    "# HELP scheduler_stream_lag Task operations not yet delivered to a worker"
+                )
+                lines.append("# TYPE scheduler_stream_lag gauge")
+                lines.append(f"scheduler_stream_lag {lag}")
+
+            # Agent execution pool
+            if self._execution_pools:
+                for index, (name, help_text) in enumerate(
+                    (
+                        ("busy", "Execution pool slots running a handler"),
+                        ("size", "Maximum execution pool slots"),
+                        ("waiting", "Handler calls waiting for a pool slot"),
+                    )
+                ):
+                    lines.append("")
+                    lines.append(f"# HELP agent_execution_pool_{name} {help_text}")
+                    lines.append(f"# TYPE agent_execution_pool_{name} gauge")
+                    for backend, values in sorted(self._execution_pools.items()):
+                        lines.append(
+                            f'agent_execution_pool_{name}{{backend="{backend}"}} {values[index]}'
+                        )
+
+            # In-memory storage
+            if self._storage_tasks is not None:
+                lines.append("")
+                lines.append("# HELP storage_tasks Tasks held by in-memory storage")
+                lines.append("# TYPE storage_tasks gauge")
+                lines.append(f"storage_tasks {self._storage_tasks}")
+                lines.append("")
+                lines.append(
+                    "# HELP storage_bytes Estimated size of tasks held by in-memory storage"
+                )
+                lines.append("# TYPE storage_bytes gauge")
+                lines.append(f"storage_bytes {self._storage_bytes}")
+            if self._storage_evictions:
+                lines.append("")
+                lines.append(
+                    "# HELP storage_evictions_total Terminal tasks evicted from in-memory storage"
+                )
+                lines.append("# TYPE storage_evictions_total counter")
+                for reason, count in sorted(self._storage_evictions.items()):
+                    lines.append(
+                        f'storage_evictions_total{{reason="{reason}"}} {count}'
+                    )
+
+            # Task event bus
+            lines.append("")
+            lines.append(
+                "# HELP task_event_subscribers_lagged_total Event subscribers dropped for falling behind"
+            )
+            lines.append("# TYPE task_event_subscribers_lagged_total counter")
+            lines.append(
+                f"task_event_subscribers_lagged_total {self._task_event_subscribers_lagged}"
+            )
+
         return "\n".join(lines) + "\n"
 
 
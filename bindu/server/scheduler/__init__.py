@@ -24,6 +24,14 @@ Think of this as the restaurant's order board system catalog:
 2. SCHEDULER IMPLEMENTATIONS:
    - InMemoryScheduler: Simple whiteboard system (development/testing)
    - RedisScheduler: Distributed cloud system (production/multi-process)
+   - RedisStreamsScheduler: Same, but every order is ticked off when served,
+     and orders a crashed cook left behind go to another cook
+   - RedisFairScheduler: Same, but rush orders go first and no single
+     customer's catering order holds up everyone else's lunch
+   - RedisShardedScheduler: Same, but each table's orders always go to the
+     one cook working that section, so courses come out in order
+   - PostgresScheduler: Orders pinned in the ledger the restaurant already
+     keeps, with a bell that rings when a new one is added
 
 3. TASK OPERATIONS:
    - TaskOperation: Union type for all task operations (run, cancel, pause, resume)
@@ -37,22 +45,38 @@ Think of this as the restaurant's order board system catalog:
 AVAILABLE SCHEDULER OPTIONS:
 - InMemoryScheduler: Fast in-memory task queue for single-process deployments
 - RedisScheduler: Distributed task queue using Redis for multi-process systems
+- RedisStreamsScheduler: Redis Streams consumer group with acks and redelivery
+- RedisFairScheduler: Redis sorted set served by priority class and per-tenant fairness
+- RedisShardedScheduler: Context-hash shard lists leased to workers, in order per context
+- PostgresScheduler: SKIP LOCKED queue table on the PostgresStorage database
+
+Operations that fail, cannot be decoded or keep being redelivered are kept as
+dead letters by every scheduler (see dead_letter) for inspection and replay.
 """
 
 from __future__ import annotations as _annotations
 
 # Export the base scheduler interface
-from .base import Scheduler, TaskOperation
+from .base import Scheduler, SchedulerBusyError, TaskOperation
 
 # Export all scheduler implementations
 from .memory_scheduler import InMemoryScheduler
+from .postgres_scheduler import PostgresScheduler
+from .redis_fair_scheduler import RedisFairScheduler
 from .redis_scheduler import RedisScheduler
+from .redis_sharded_scheduler import RedisShardedScheduler
+from .redis_streams_scheduler import RedisStreamsScheduler
 
 __all__ = [
     # Base interface
     "Scheduler",
+    "SchedulerBusyError",
     "TaskOperation",
     # Scheduler implementations
     "InMemoryScheduler",
+    "PostgresScheduler",
+    "RedisFairScheduler",
     "RedisScheduler",
+    "RedisShardedScheduler",
+    "RedisStreamsScheduler",
 ]
@@ -2,31 +2,51 @@
 
 from __future__ import annotations as _annotations
 
+import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from typing import Annotated, Any, Generic, Literal, TypeVar
 
 from opentelemetry.trace import Span, get_tracer
 from pydantic import Discriminator
-from typing_extensions import Self, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
-from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.common.protocol.types import DeadLetter, TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 tracer = get_tracer(__name__)
 logger = get_logger("bindu.server.scheduler.base")
 
 
+class SchedulerBusyError(Exception):
+    """Raised when the scheduler queue is full and cannot accept an operation."""
+
+
 @dataclass
 class Scheduler(ABC):
     """The scheduler class is in charge of scheduling the tasks."""
 
     @abstractmethod
     async def run_task(self, params: TaskSendParams) -> None:
-        """Send a task to be executed by the worker."""
+        """Send a task to be executed by the worker.
+
+        A run_at (Unix time) in the future defers the task: it is held apart
+        from the queue, costs no worker slot and is only queued once due.
+        """
         raise NotImplementedError("send_run_task is not implemented yet.")
 
+    async def run_tasks(self, params_list: Sequence[TaskSendParams]) -> None:
+        """Send several tasks to be executed, in order.
+
+        Schedulers backed by a network broker override this to enqueue them in
+        one round trip; the default sends them one at a time.
+        """
+        for params in params_list:
+            await self.run_task(params)
+
     @abstractmethod
     async def cancel_task(self, params: TaskIdParams) -> None:
         """Cancel a task."""
@@ -60,6 +80,105 @@ class Scheduler(ABC):
         between the workers.
         """
 
+    async def receive_control_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive cancel operations as soon as they are sent, ahead of the queue.
+
+        cancel_task still queues the operation; it is also broadcast here to
+        every worker, so the one running the task can interrupt it and the
+        others can skip it when it is dequeued. Delivery is best effort (a
+        worker that is not listening misses it); the queued operation remains
+        the reliable path. The default has no control channel and yields
+        nothing.
+        """
+        return
+        yield
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge that a received task operation has been handled.
+
+        Called by the worker once the operation's handler returns. Schedulers
+        that redeliver unacknowledged operations (RedisStreamsScheduler) use it
+        to release them; the default does nothing.
+        """
+
+    async def release_task_operation(self, task_operation: TaskOperation) -> None:
+        """Give back a received operation whose handling raised, without acking it.
+
+        Called by the worker instead of ack_task_operation. Schedulers that
+        keep received operations hidden or their queue blocked while they are
+        handled stop doing so, leaving the operation to be redelivered once
+        its visibility or claim timeout passes; the default does nothing.
+        """
+
+    async def dead_letter_task_operation(
+        self,
+        task_operation: TaskOperation | None,
+        reason: str,
+        error: str,
+        payload: str | None = None,
+    ) -> None:
+        """Keep an operation that failed for inspection and replay (see dead_letter).
+
+        Args:
+            task_operation: The operation, or None if it could not be decoded
+            reason: "failed", "max_attempts" or "undecodable"
+            error: What went wrong
+            payload: The raw queued payload of an undecodable operation
+        """
+        from .dead_letter import new_dead_letter
+
+        dead_letter = new_dead_letter(task_operation, reason, error, payload)
+        await self._store_dead_letter(dead_letter)
+        get_metrics().increment_scheduler_dead_letters(reason)
+        logger.warning(
+            f"Dead-lettered {dead_letter.get('operation', 'operation')} of task "
+            f"{dead_letter.get('task_id')} ({reason}): {error}"
+        )
+
+    async def _dead_letter_undecodable(self, payload: str, error: Exception) -> None:
+        """Dead-letter a queued payload that cannot be decoded, logging any failure."""
+        try:
+            await self.dead_letter_task_operation(
+                None, "undecodable", str(error), payload=payload
+            )
+        except Exception as e:
+            logger.error(f"Failed to dead-letter undecodable operation: {e}")
+
+    async def list_dead_letters(self, limit: int = 100) -> list[DeadLetter]:
+        """Return up to limit dead letters, newest first."""
+        return self._dead_letter_ring().list(limit)
+
+    async def remove_dead_letters(self, ids: Sequence[str]) -> list[DeadLetter]:
+        """Remove dead letters, e.g. to replay them, and return those removed.
+
+        Only the caller that removes an entry gets it back, so concurrent
+        replays never queue an operation twice.
+        """
+        return self._dead_letter_ring().remove(ids)
+
+    async def _store_dead_letter(self, dead_letter: DeadLetter) -> None:
+        """Keep a dead letter; by default in a ring in this process."""
+        self._dead_letter_ring().add(dead_letter)
+
+    def _dead_letter_ring(self):
+        """The in-process dead letters, created on first use."""
+        from .dead_letter import DeadLetterRing
+
+        ring = getattr(self, "_dead_letters", None)
+        if ring is None:
+            ring = self._dead_letters = DeadLetterRing(
+                app_settings.scheduler.dead_letter_limit
+            )
+        return ring
+
+
+def seconds_until_due(params: Any) -> float:
+    """Seconds until a run operation's run_at, or 0 if it is due now."""
+    run_at = params.get("run_at")
+    if run_at is None:
+        return 0.0
+    return max(float(run_at) - time.time(), 0.0)
+
 
 OperationT = TypeVar("OperationT")
 ParamsT = TypeVar("ParamsT")
@@ -71,6 +190,10 @@ class _TaskOperation(TypedDict, Generic[OperationT, ParamsT]):
     operation: OperationT
     params: ParamsT
     _current_span: Span
+    _delivery_id: NotRequired[str]
+    """Broker-specific id used to acknowledge the operation, if any."""
+    _attempts: NotRequired[int]
+    """Deliveries so far, this one included, if the broker redelivers."""
 
 
 _RunTask = _TaskOperation[Literal["run"], TaskSendParams]
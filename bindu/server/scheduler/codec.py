@@ -0,0 +1,222 @@
+"""Wire format of task operations queued in Redis.
+
+Operations are encoded as compact JSON (orjson) with an explicit layout:
+
+    {"v": 2, "op": "run", "task_id": "...", "context_id": "...",
+     "message": {...}, "options": {...}, "span_id": "...", "trace_id": "..."}
+
+- task_id and context_id are the only top-level params
+- message is present unless the operation is queued by reference
+- options holds every other param (history_length, payment_context, ...) as is
+- span_id and trace_id identify the span that queued the operation; the
+  decoded operation carries it as a remote parent for the worker's spans
+
+Which fields are UUIDs is part of the layout (_MESSAGE_UUID_FIELDS), so
+decoding converts exactly those and never guesses from string contents.
+
+Entries written before the layout was versioned ({"operation", "params"} or
+the untagged reference envelope) are still read by decode_legacy, which keeps
+the old try-every-string-as-UUID behaviour for them.
+"""
+
+from __future__ import annotations as _annotations
+
+import json
+from typing import Any
+from uuid import UUID
+
+import orjson
+from opentelemetry.trace import (
+    NonRecordingSpan,
+    Span,
+    SpanContext,
+    TraceFlags,
+    get_current_span,
+)
+
+from bindu.utils.logging import get_logger
+
+from .base import TaskOperation
+
+logger = get_logger("bindu.server.scheduler.codec")
+
+FORMAT_VERSION = 2
+
+_OPERATIONS = ("run", "cancel", "pause", "resume")
+
+# Params carried as top-level fields; everything else except the message
+# travels in options
+_ENVELOPE_KEYS = ("task_id", "context_id")
+
+# UUID fields of a protocol Message
+_MESSAGE_UUID_FIELDS = ("message_id", "task_id", "context_id")
+_MESSAGE_UUID_LIST_FIELDS = ("reference_task_ids",)
+
+
+def _span_ids(span: Span) -> tuple[str | None, str | None]:
+    """Hex span and trace ids of a span, or None if it has no usable context."""
+    span_id = None
+    trace_id = None
+
+    try:
+        if hasattr(span, "get_span_context"):
+            span_context = span.get_span_context()
+        else:
+            # Real OpenTelemetry _Span object
+            span_context = span._context
+        span_id = span_context.span_id
+        trace_id = span_context.trace_id
+    except AttributeError as e:
+        logger.debug(f"Span has no usable context: {e}")
+
+    return (
+        format(span_id, "016x") if isinstance(span_id, int) and span_id else None,
+        format(trace_id, "032x") if isinstance(trace_id, int) and trace_id else None,
+    )
+
+
+def encode_task_operation(
+    task_operation: TaskOperation, include_message: bool = True
+) -> str:
+    """Encode a task operation for the queue.
+
+    Args:
+        task_operation: Operation to encode
+        include_message: False to queue by reference, leaving the message in
+            storage
+
+    Returns:
+        JSON string in the versioned layout
+    """
+    params: dict[str, Any] = dict(task_operation["params"])
+    span_id, trace_id = _span_ids(task_operation["_current_span"])
+
+    encoded: dict[str, Any] = {"v": FORMAT_VERSION, "op": task_operation["operation"]}
+    for key in _ENVELOPE_KEYS:
+        if key in params:
+            encoded[key] = params.pop(key)
+    message = params.pop("message", None)
+    if include_message and message is not None:
+        encoded["message"] = message
+    if params:
+        encoded["options"] = params
+    encoded["span_id"] = span_id
+    encoded["trace_id"] = trace_id
+
+    # orjson writes UUIDs and datetimes natively
+    return orjson.dumps(encoded).decode()
+
+
+def decode_task_operation(task_data: str | bytes) -> TaskOperation:
+    """Decode a queued task operation in any supported layout.
+
+    Raises:
+        ValueError: If the operation type is unknown or the entry is malformed
+    """
+    data = orjson.loads(task_data)
+    if not isinstance(data, dict):
+        raise ValueError("Task operation must be a JSON object")
+    if data.get("v") != FORMAT_VERSION:
+        return decode_legacy(data)
+
+    operation = data["op"]
+    params: dict[str, Any] = dict(data.get("options") or {})
+    for key in _ENVELOPE_KEYS:
+        if key in data:
+            params[key] = UUID(data[key])
+    if (message := data.get("message")) is not None:
+        params["message"] = _decode_message(message)
+
+    return _build_operation(
+        operation, params, _remote_span(data.get("span_id"), data.get("trace_id"))
+    )
+
+
+def _remote_span(span_id: Any, trace_id: Any) -> Span:
+    """Span that queued an operation, as a remote parent, or the current span."""
+    if not (isinstance(span_id, str) and isinstance(trace_id, str)):
+        return get_current_span()
+    try:
+        span_context = SpanContext(
+            trace_id=int(trace_id, 16),
+            span_id=int(span_id, 16),
+            is_remote=True,
+            # Flags are not queued; sampled keeps the worker's spans recorded
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        )
+    except ValueError as e:
+        logger.debug(f"Ignoring malformed span ids of a task operation: {e}")
+        return get_current_span()
+    return NonRecordingSpan(span_context)
+
+
+def _decode_message(message: dict[str, Any]) -> dict[str, Any]:
+    """Convert the UUID fields of a protocol Message."""
+    for key in _MESSAGE_UUID_FIELDS:
+        if isinstance(message.get(key), str):
+            message[key] = UUID(message[key])
+    for key in _MESSAGE_UUID_LIST_FIELDS:
+        if isinstance(message.get(key), list):
+            message[key] = [UUID(value) for value in message[key]]
+    return message
+
+
+def _build_operation(
+    operation: str, params: dict[str, Any], span: Span | None = None
+) -> TaskOperation:
+    """Reconstruct the operation under span (default: the current span)."""
+    if operation not in _OPERATIONS:
+        raise ValueError(f"Unknown operation type: {operation}")
+    return {
+        "operation": operation,
+        "params": params,
+        "_current_span": span if span is not None else get_current_span(),
+    }  # type: ignore[return-value]
+
+
+# -----------------------------------------------------------------------------
+# Compatibility reader for unversioned entries
+# -----------------------------------------------------------------------------
+
+
+def _convert_strings_to_uuids(obj: Any) -> Any:
+    """Recursively convert UUID strings back to UUID objects."""
+    if isinstance(obj, str):
+        try:
+            return UUID(obj)
+        except (ValueError, AttributeError):
+            return obj
+    elif isinstance(obj, dict):
+        return {k: _convert_strings_to_uuids(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_convert_strings_to_uuids(item) for item in obj]
+    return obj
+
+
+def decode_legacy(data: dict[str, Any] | str) -> TaskOperation:
+    """Decode an entry written before the layout was versioned.
+
+    Accepts {"operation", "params"} and the untagged reference envelope
+    {"operation", "task_id", "context_id", "options"}.
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+
+    if "params" in data:
+        params = _convert_strings_to_uuids(data["params"])
+    else:
+        # Reference envelope: ids are the only UUIDs, options stay as sent
+        params = {
+            **data.get("options", {}),
+            **{
+                key: _convert_strings_to_uuids(data[key])
+                for key in _ENVELOPE_KEYS
+                if key in data
+            },
+        }
+
+    return _build_operation(
+        data["operation"],
+        params,
+        _remote_span(data.get("span_id"), data.get("trace_id")),
+    )
@@ -0,0 +1,88 @@
+"""Dead letters: task operations taken out of the queue after failing.
+
+An operation is dead-lettered when its handler fails, when it was delivered
+more than max_attempts times (a worker kept dying on it), or when it cannot
+be decoded. It is kept, encoded as it was queued, so operators can inspect
+it (tasks/deadLetters/list) and queue it again (tasks/deadLetters/replay)
+once the cause is fixed, instead of it taking worker capacity on every
+redelivery.
+
+Schedulers keep them in-process in a DeadLetterRing by default; the Redis
+schedulers share a capped list between processes.
+"""
+
+from __future__ import annotations as _annotations
+
+from collections import deque
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from bindu.common.protocol.types import DeadLetter
+
+from .base import TaskOperation
+from .codec import encode_task_operation
+
+
+def new_dead_letter(
+    task_operation: TaskOperation | None,
+    reason: str,
+    error: str,
+    payload: str | None = None,
+) -> DeadLetter:
+    """Build the dead letter of an operation.
+
+    Args:
+        task_operation: The operation, or None if it could not be decoded
+        reason: "failed", "max_attempts" or "undecodable"
+        error: What went wrong
+        payload: The raw queued payload, when there is no decoded operation
+
+    Returns:
+        Dead letter holding the operation encoded without its message (replays
+        read it from storage)
+    """
+    dead_letter = DeadLetter(
+        id=uuid4().hex,
+        reason=reason,  # type: ignore[typeddict-item]
+        error=error,
+        attempts=1,
+        dead_at=datetime.now(timezone.utc).isoformat(),
+        payload=payload or "",
+    )
+    if task_operation is not None:
+        dead_letter["attempts"] = task_operation.get("_attempts", 1)
+        dead_letter["operation"] = task_operation["operation"]
+        dead_letter["task_id"] = str(task_operation["params"]["task_id"])
+        dead_letter["payload"] = encode_task_operation(
+            task_operation, include_message=False
+        )
+    return dead_letter
+
+
+class DeadLetterRing:
+    """The newest dead letters of this process, up to a limit."""
+
+    def __init__(self, limit: int):
+        """Initialize an empty ring keeping at most limit entries."""
+        self._entries: deque[DeadLetter] = deque(maxlen=limit)
+
+    def __len__(self) -> int:
+        """Number of dead letters kept."""
+        return len(self._entries)
+
+    def add(self, dead_letter: DeadLetter) -> None:
+        """Keep a dead letter, dropping the oldest when full."""
+        self._entries.appendleft(dead_letter)
+
+    def list(self, limit: int) -> list[DeadLetter]:
+        """Return up to limit dead letters, newest first."""
+        return [entry for _, entry in zip(range(limit), self._entries)]
+
+    def remove(self, ids: Sequence[str]) -> list[DeadLetter]:
+        """Remove the dead letters with the given ids and return them."""
+        wanted = set(ids)
+        removed = [entry for entry in self._entries if entry["id"] in wanted]
+        for entry in removed:
+            self._entries.remove(entry)
+        return removed
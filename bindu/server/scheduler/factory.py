@@ -16,25 +16,36 @@ Usage:
 
 from __future__ import annotations as _annotations
 
+from typing import Any
+
 from bindu.common.models import SchedulerConfig
 from bindu.utils.logging import get_logger
 
 from .base import Scheduler
 from .memory_scheduler import InMemoryScheduler
+from .postgres_scheduler import PostgresScheduler
 
 # Import RedisScheduler conditionally
 try:
+    from .redis_fair_scheduler import RedisFairScheduler
     from .redis_scheduler import RedisScheduler
+    from .redis_sharded_scheduler import RedisShardedScheduler
+    from .redis_streams_scheduler import RedisStreamsScheduler
 
     REDIS_AVAILABLE = True
 except ImportError:
     RedisScheduler = None  # type: ignore[assignment]  # redis not installed
+    RedisStreamsScheduler = None  # type: ignore[assignment]
+    RedisFairScheduler = None  # type: ignore[assignment]
+    RedisShardedScheduler = None  # type: ignore[assignment]
     REDIS_AVAILABLE = False
 
 logger = get_logger("bindu.server.scheduler.factory")
 
 
-async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
+async def create_scheduler(
+    config: SchedulerConfig | None = None, storage: Any = None
+) -> Scheduler:
     """Create scheduler backend based on configuration.
 
     Reads the scheduler type from config and creates the appropriate scheduler instance.
@@ -42,16 +53,23 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
 
     Supported backends:
     - "memory": InMemoryScheduler (default, single-process)
-    - "redis": RedisScheduler (distributed, multi-process)
+    - "redis": RedisScheduler (distributed, multi-process), or
+      RedisStreamsScheduler with at-least-once delivery when
+      redis_queue_type is "stream", or RedisFairScheduler with priority
+      classes and per-tenant fairness when it is "fair", or
+      RedisShardedScheduler with context-hash shards when it is "sharded"
+    - "postgres": PostgresScheduler (distributed, shares PostgresStorage's engine)
 
     Args:
         config: Scheduler configuration. If None, uses app_settings.scheduler.
+        storage: Connected storage; required by the "postgres" backend
 
     Returns:
         Scheduler instance ready to use
 
     Raises:
-        ValueError: If unknown scheduler backend is specified or Redis is not available
+        ValueError: If unknown scheduler backend is specified, Redis is not available
+            or the postgres backend is used without PostgresStorage
         ConnectionError: If unable to connect to Redis
 
     Example:
@@ -68,7 +86,21 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
         logger.info(f"No scheduler config provided, using settings: {backend}")
 
         if backend == "memory":
-            return InMemoryScheduler()
+            return InMemoryScheduler(
+                queue_size=scheduler_settings.queue_size,
+                overflow_policy=scheduler_settings.overflow_policy,
+                enqueue_timeout=scheduler_settings.enqueue_timeout,
+                priority_classes=scheduler_settings.priority_classes,
+                default_priority=scheduler_settings.default_priority,
+                tenant_weights=scheduler_settings.tenant_weights,
+            )
+        elif backend == "postgres":
+            config = SchedulerConfig(
+                type="postgres",
+                batch_size=scheduler_settings.batch_size,
+                visibility_timeout=scheduler_settings.visibility_timeout,
+                postgres_poll_interval=scheduler_settings.postgres_poll_interval,
+            )
         elif backend == "redis":
             # Build config from settings
             config = SchedulerConfig(
@@ -82,6 +114,17 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
                 max_connections=scheduler_settings.max_connections,
                 retry_on_timeout=scheduler_settings.retry_on_timeout,
                 poll_timeout=scheduler_settings.poll_timeout,
+                batch_size=scheduler_settings.batch_size,
+                payload_mode=scheduler_settings.payload_mode,
+                redis_queue_type=scheduler_settings.redis_queue_type,
+                stream_group=scheduler_settings.stream_group,
+                stream_consumer=scheduler_settings.stream_consumer,
+                claim_idle_timeout=scheduler_settings.claim_idle_timeout,
+                redis_shards=scheduler_settings.redis_shards,
+                shard_lease_ttl=scheduler_settings.shard_lease_ttl,
+                priority_classes=tuple(scheduler_settings.priority_classes),
+                default_priority=scheduler_settings.default_priority,
+                tenant_weights=scheduler_settings.tenant_weights,
             )
         else:
             raise ValueError(f"Unknown scheduler backend in settings: {backend}")
@@ -92,7 +135,14 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
 
     if backend == "memory":
         logger.info("Using in-memory scheduler (single-process)")
-        return InMemoryScheduler()
+        return InMemoryScheduler(
+            queue_size=config.queue_size,
+            overflow_policy=config.overflow_policy,
+            enqueue_timeout=config.enqueue_timeout,
+            priority_classes=config.priority_classes,
+            default_priority=config.default_priority,
+            tenant_weights=config.tenant_weights,
+        )
 
     elif backend == "redis":
         if not REDIS_AVAILABLE or RedisScheduler is None:
@@ -120,19 +170,85 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
                     "Please provide it via REDIS_URL environment variable or config."
                 )
 
+        if config.redis_queue_type == "stream":
+            logger.info("Using Redis stream with consumer group (at-least-once)")
+            return RedisStreamsScheduler(
+                redis_url=redis_url,
+                queue_name=config.queue_name,
+                group_name=config.stream_group,
+                consumer_name=config.stream_consumer,
+                max_connections=config.max_connections,
+                retry_on_timeout=config.retry_on_timeout,
+                poll_timeout=config.poll_timeout,
+                batch_size=config.batch_size,
+                payload_mode=config.payload_mode,
+                claim_idle_timeout=config.claim_idle_timeout,
+            )
+
+        if config.redis_queue_type == "fair":
+            logger.info("Using Redis sorted set with priority classes and fairness")
+            return RedisFairScheduler(
+                redis_url=redis_url,
+                queue_name=config.queue_name,
+                max_connections=config.max_connections,
+                retry_on_timeout=config.retry_on_timeout,
+                poll_timeout=config.poll_timeout,
+                batch_size=config.batch_size,
+                payload_mode=config.payload_mode,
+                priority_classes=config.priority_classes,
+                default_priority=config.default_priority,
+                tenant_weights=config.tenant_weights,
+            )
+
+        if config.redis_queue_type == "sharded":
+            logger.info(
+                f"Using {config.redis_shards} Redis shard queues leased to workers"
+            )
+            return RedisShardedScheduler(
+                redis_url=redis_url,
+                queue_name=config.queue_name,
+                consumer_name=config.stream_consumer,
+                max_connections=config.max_connections,
+                retry_on_timeout=config.retry_on_timeout,
+                poll_timeout=config.poll_timeout,
+                payload_mode=config.payload_mode,
+                shards=config.redis_shards,
+                lease_ttl=config.shard_lease_ttl,
+            )
+
         scheduler = RedisScheduler(
             redis_url=redis_url,
             queue_name=config.queue_name,
             max_connections=config.max_connections,
             retry_on_timeout=config.retry_on_timeout,
             poll_timeout=config.poll_timeout,
+            batch_size=config.batch_size,
+            payload_mode=config.payload_mode,
         )
 
         return scheduler
 
+    elif backend == "postgres":
+        from bindu.server.storage.postgres_storage import PostgresStorage
+
+        if not isinstance(storage, PostgresStorage):
+            raise ValueError(
+                "Postgres scheduler requires PostgresStorage. "
+                "Set STORAGE_TYPE=postgres or choose another scheduler backend."
+            )
+
+        logger.info("Using PostgreSQL scheduler (distributed, multi-process)")
+        return PostgresScheduler(
+            storage=storage,
+            batch_size=config.batch_size,
+            visibility_timeout=config.visibility_timeout,
+            poll_timeout=config.postgres_poll_interval,
+        )
+
     else:
         raise ValueError(
-            f"Unknown scheduler backend: {backend}. Supported backends: memory, redis"
+            f"Unknown scheduler backend: {backend}. "
+            "Supported backends: memory, redis, postgres"
         )
 
 
@@ -150,5 +266,8 @@ async def close_scheduler(scheduler: Scheduler) -> None:
     if REDIS_AVAILABLE and isinstance(scheduler, RedisScheduler):
         await scheduler.__aexit__(None, None, None)
         logger.info("Redis scheduler connection closed")
+    elif isinstance(scheduler, PostgresScheduler):
+        await scheduler.__aexit__(None, None, None)
+        logger.info("Postgres scheduler listener closed")
     else:
         logger.debug(f"Scheduler {type(scheduler).__name__} does not require cleanup")
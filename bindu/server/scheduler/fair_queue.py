@@ -0,0 +1,137 @@
+"""Priority classes and per-tenant weighted fair queueing for schedulers.
+
+Operations are ordered in two levels:
+
+- priority classes (e.g. interactive, normal, batch) are served strictly in
+  order, so interactive work never waits behind a batch backlog
+- within a class, tenants (the caller's DID or OAuth subject) share the
+  workers by weighted fair queueing: every operation gets a virtual finish
+  tag, max(class virtual time, tenant's last tag) + 1 / tenant weight, and
+  the lowest tag is served first. A tenant with 10k queued operations gets
+  the same turn rate as one with a single operation; a tenant of weight 2
+  gets twice the turns of weight 1. Operations of one tenant stay in order.
+
+The tag arithmetic is shared by the in-memory scheduler (FairQueue) and the
+Redis one, which stores the tags as sorted-set scores.
+"""
+
+from __future__ import annotations as _annotations
+
+import heapq
+import itertools
+from collections.abc import Mapping, Sequence
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PRIORITY_CLASSES = ("interactive", "normal", "batch")
+DEFAULT_TENANT = "anonymous"
+"""Tenant of operations whose caller is not authenticated."""
+
+
+class FairShare:
+    """Priority class resolution and tenant weights."""
+
+    def __init__(
+        self,
+        priority_classes: Sequence[str] = DEFAULT_PRIORITY_CLASSES,
+        default_priority: str = "normal",
+        tenant_weights: Mapping[str, float] | None = None,
+    ):
+        """Initialize the fair share policy.
+
+        Args:
+            priority_classes: Class names, highest priority first
+            default_priority: Class of operations without a known priority
+            tenant_weights: Relative share per tenant (default 1)
+
+        Raises:
+            ValueError: If default_priority is not one of priority_classes
+        """
+        if default_priority not in priority_classes:
+            raise ValueError(
+                f"Default priority '{default_priority}' is not one of {list(priority_classes)}"
+            )
+        self.priority_classes = tuple(priority_classes)
+        self.default_priority = default_priority
+        self.tenant_weights = dict(tenant_weights or {})
+
+    def resolve(self, params: Mapping[str, Any]) -> tuple[str, str]:
+        """Return the (priority class, tenant) of an operation's params."""
+        priority = params.get("priority")
+        if priority not in self.priority_classes:
+            priority = self.default_priority
+        return priority, params.get("tenant") or DEFAULT_TENANT
+
+    def cost(self, tenant: str) -> float:
+        """Virtual time one operation of the tenant takes."""
+        return 1.0 / self.tenant_weights.get(tenant, 1.0)
+
+
+class FairQueue(Generic[T]):
+    """In-memory queue ordered by priority class, then by fair finish tag."""
+
+    def __init__(self, share: FairShare):
+        """Initialize an empty queue for the given policy."""
+        self.share = share
+        self._heaps: dict[str, list[tuple[float, int, str, T]]] = {
+            priority: [] for priority in share.priority_classes
+        }
+        self._virtual_time: dict[str, float] = dict.fromkeys(
+            share.priority_classes, 0.0
+        )
+        self._last_tags: dict[str, dict[str, float]] = {
+            priority: {} for priority in share.priority_classes
+        }
+        self._sequence = itertools.count()
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Number of queued items."""
+        return self._length
+
+    def push(self, item: T, priority: str, tenant: str) -> None:
+        """Queue an item of a tenant in a (resolved) priority class."""
+        last_tags = self._last_tags[priority]
+        tag = max(
+            self._virtual_time[priority], last_tags.get(tenant, 0.0)
+        ) + self.share.cost(tenant)
+        last_tags[tenant] = tag
+        heapq.heappush(self._heaps[priority], (tag, next(self._sequence), tenant, item))
+        self._length += 1
+
+    def push_front(self, item: T, priority: str, tenant: str) -> None:
+        """Queue an item ahead of everything else in its class.
+
+        For an item that was already handed out and came back: it is tagged
+        with the virtual time, which no queued item is below, and leaves the
+        tenant's last tag as it is.
+        """
+        heapq.heappush(
+            self._heaps[priority],
+            (self._virtual_time[priority], -next(self._sequence), tenant, item),
+        )
+        self._length += 1
+
+    def pop(self) -> tuple[str, T]:
+        """Remove and return (priority class, item) of the next item to serve.
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        for priority in self.share.priority_classes:
+            heap = self._heaps[priority]
+            if not heap:
+                continue
+            tag, _, tenant, item = heapq.heappop(heap)
+            self._virtual_time[priority] = tag
+            # An idle tenant restarts from the virtual time, so forget it
+            if self._last_tags[priority].get(tenant) == tag:
+                del self._last_tags[priority][tenant]
+            self._length -= 1
+            return priority, item
+        raise IndexError("pop from an empty FairQueue")
+
+    def lengths(self) -> dict[str, int]:
+        """Number of queued items per priority class."""
+        return {priority: len(heap) for priority, heap in self._heaps.items()}
@@ -2,71 +2,194 @@
 
 from __future__ import annotations as _annotations
 
-from collections.abc import AsyncIterator
-from contextlib import AsyncExitStack
-from typing import Any
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any, Literal
 
 import anyio
+from anyio.abc import ObjectSendStream
 from opentelemetry.trace import get_current_span
 
 from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
 from bindu.server.scheduler.base import (
     Scheduler,
+    SchedulerBusyError,
     TaskOperation,
     _CancelTask,
     _PauseTask,
     _ResumeTask,
     _RunTask,
+    seconds_until_due,
+)
+from bindu.server.scheduler.fair_queue import (
+    DEFAULT_PRIORITY_CLASSES,
+    FairQueue,
+    FairShare,
 )
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_scheduler_operation
 
 logger = get_logger("bindu.server.scheduler.memory_scheduler")
 
+OverflowPolicy = Literal["reject", "wait"]
+
+
+class _Receiver:
+    """A worker waiting in receive_task_operations for the next operation."""
+
+    def __init__(self):
+        self.event = anyio.Event()
+        self.item: tuple[str | None, tuple[float, TaskOperation]] | None = None
+
 
 class InMemoryScheduler(Scheduler):
-    """A scheduler that schedules tasks in memory."""
+    """A scheduler that schedules tasks in memory.
 
-    async def __aenter__(self):
-        """Enter async context manager."""
-        self.aexit_stack = AsyncExitStack()
-        await self.aexit_stack.__aenter__()
+    Operations are held in a bounded buffer so submitting a task returns as soon
+    as it is queued, rather than waiting for the worker to pick it up. When the
+    buffer is full, run operations follow the overflow policy:
+
+    - reject: fail immediately with SchedulerBusyError
+    - wait: wait up to enqueue_timeout seconds for space, then fail
+
+    Run operations are served by priority class, then fairly between tenants
+    (see fair_queue); with a single class and tenant this is plain FIFO.
+
+    Runs with a run_at in the future are held in a heap, outside the buffer
+    and its queue_size, and join the queue once due.
 
-        self._write_stream, self._read_stream = anyio.create_memory_object_stream[
-            TaskOperation
-        ]()
-        await self.aexit_stack.enter_async_context(self._read_stream)
-        await self.aexit_stack.enter_async_context(self._write_stream)
+    Control operations (cancel, pause, resume) always wait for space so they
+    are never dropped, and are served ahead of any run. Cancels are also
+    broadcast to every worker listening on receive_control_operations, so a
+    running task is interrupted at once instead of after everything queued
+    ahead of the cancel.
+    """
 
+    def __init__(
+        self,
+        queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = "wait",
+        enqueue_timeout: float = 5.0,
+        priority_classes: Sequence[str] = DEFAULT_PRIORITY_CLASSES,
+        default_priority: str = "normal",
+        tenant_weights: Mapping[str, float] | None = None,
+    ):
+        """Initialize the in-memory scheduler.
+
+        Args:
+            queue_size: Maximum number of buffered operations (0 = hand-off only)
+            overflow_policy: What run_task does when the buffer is full
+            enqueue_timeout: Seconds to wait for space under the "wait" policy
+            priority_classes: Priority class names, highest first
+            default_priority: Class of runs without a known priority
+            tenant_weights: Relative share of the workers per tenant (default 1)
+        """
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.enqueue_timeout = enqueue_timeout
+        self.share = FairShare(priority_classes, default_priority, tenant_weights)
+        self._control_subscribers: set[ObjectSendStream[TaskOperation]] = set()
+
+    async def __aenter__(self):
+        """Enter async context manager."""
+        # Items carry their enqueue time so time-in-queue can be measured
+        self._runs: FairQueue[tuple[float, TaskOperation]] = FairQueue(self.share)
+        self._controls: deque[tuple[float, TaskOperation]] = deque()
+        self._idle_receivers: deque[_Receiver] = deque()
+        # Deferred runs: (due, sequence, priority, tenant, operation)
+        self._delayed: list[tuple[float, int, str, str, TaskOperation]] = []
+        self._delayed_sequence = itertools.count()
+        self._changed = anyio.Condition()
+        self._closed = False
         return self
 
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
         """Exit async context manager."""
-        await self.aexit_stack.__aexit__(exc_type, exc_value, traceback)
+        async with self._changed:
+            self._closed = True
+            while self._idle_receivers:
+                self._idle_receivers.popleft().event.set()
+
+    @property
+    def queue_length(self) -> int:
+        """Number of operations buffered and not yet received by a worker."""
+        return len(self._controls) + len(self._runs)
+
+    def _has_space(self) -> bool:
+        # A waiting receiver takes an operation directly, which is what lets a
+        # queue_size of 0 hand operations off
+        return bool(self._idle_receivers) or self.queue_length < self.queue_size
+
+    def _put(
+        self, task_operation: TaskOperation, priority: str | None, tenant: str = ""
+    ) -> None:
+        """Hand an operation to a waiting receiver or queue it (lock held).
+
+        priority None marks a control operation.
+        """
+        item = (time.monotonic(), task_operation)
+        if self._idle_receivers:
+            receiver = self._idle_receivers.popleft()
+            receiver.item = (priority, item)
+            receiver.event.set()
+        elif priority is None:
+            self._controls.append(item)
+        else:
+            self._runs.push(item, priority, tenant)
 
     @retry_scheduler_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def run_task(self, params: TaskSendParams) -> None:
-        """Schedule a task for execution."""
+        """Schedule a task for execution.
+
+        Raises:
+            SchedulerBusyError: If the queue is full and the overflow policy gives up
+        """
         logger.debug(f"Running task: {params}")
-        await self._write_stream.send(
-            _RunTask(operation="run", params=params, _current_span=get_current_span())
+        operation = _RunTask(
+            operation="run", params=params, _current_span=get_current_span()
         )
+        priority, tenant = self.share.resolve(params)
+
+        if delay := seconds_until_due(params):
+            await self._defer(operation, priority, tenant, delay)
+            return
+
+        if self.overflow_policy == "reject":
+            async with self._changed:
+                if not self._has_space():
+                    self._reject(params)
+                self._put(operation, priority, tenant)
+        else:
+            with anyio.move_on_after(self.enqueue_timeout) as scope:
+                async with self._changed:
+                    while not self._has_space():
+                        await self._changed.wait()
+                    self._put(operation, priority, tenant)
+            if scope.cancelled_caught:
+                self._reject(params)
+
+        get_metrics().set_scheduler_queue_length(self.queue_length)
 
     @retry_scheduler_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def cancel_task(self, params: TaskIdParams) -> None:
         """Cancel a scheduled task."""
         logger.debug(f"Canceling task: {params}")
-        await self._write_stream.send(
-            _CancelTask(
-                operation="cancel", params=params, _current_span=get_current_span()
-            )
+        operation = _CancelTask(
+            operation="cancel", params=params, _current_span=get_current_span()
         )
+        self._broadcast_control(operation)
+        await self._send(operation)
 
     @retry_scheduler_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def pause_task(self, params: TaskIdParams) -> None:
         """Pause a running task."""
         logger.debug(f"Pausing task: {params}")
-        await self._write_stream.send(
+        await self._send(
             _PauseTask(
                 operation="pause", params=params, _current_span=get_current_span()
             )
@@ -76,13 +199,146 @@ class InMemoryScheduler(Scheduler):
     async def resume_task(self, params: TaskIdParams) -> None:
         """Resume a paused task."""
         logger.debug(f"Resuming task: {params}")
-        await self._write_stream.send(
+        await self._send(
             _ResumeTask(
                 operation="resume", params=params, _current_span=get_current_span()
             )
         )
 
     async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
-        """Receive task operations from the scheduler."""
-        async for task_operation in self._read_stream:
+        """Receive task operations: control operations first, then runs."""
+        metrics = get_metrics()
+        while True:
+            task_operation = None
+            timeout = None
+            async with self._changed:
+                self._promote_due()
+                if self._controls:
+                    priority = None
+                    enqueued_at, task_operation = self._controls.popleft()
+                    self._changed.notify_all()
+                elif self._runs:
+                    priority, (enqueued_at, task_operation) = self._runs.pop()
+                    self._changed.notify_all()
+                elif self._closed:
+                    return
+                else:
+                    receiver = _Receiver()
+                    self._idle_receivers.append(receiver)
+                    # Producers waiting for space can now hand off to us
+                    self._changed.notify_all()
+                    if self._delayed:
+                        timeout = self._delayed[0][0] - time.monotonic()
+
+            if task_operation is None:
+                try:
+                    # Wake up when the next deferred run is due
+                    with anyio.move_on_after(timeout):
+                        await receiver.event.wait()
+                except BaseException:
+                    with anyio.CancelScope(shield=True):
+                        async with self._changed:
+                            if receiver in self._idle_receivers:
+                                self._idle_receivers.remove(receiver)
+                            elif receiver.item is not None:
+                                # Handed to us as we were cancelled: put it back
+                                self._requeue(*receiver.item)
+                    raise
+                if receiver.item is None:
+                    async with self._changed:
+                        if receiver in self._idle_receivers:
+                            self._idle_receivers.remove(receiver)
+                if receiver.item is None:
+                    if self._closed:
+                        return
+                    continue
+                priority, (enqueued_at, task_operation) = receiver.item
+
+            metrics.record_scheduler_queue_wait(
+                time.monotonic() - enqueued_at, priority=priority
+            )
+            metrics.set_scheduler_queue_length(self.queue_length)
             yield task_operation
+
+    async def receive_control_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive cancel operations as soon as cancel_task is called."""
+        send_stream, receive_stream = anyio.create_memory_object_stream[TaskOperation](
+            max_buffer_size=math.inf
+        )
+        self._control_subscribers.add(send_stream)
+        try:
+            async with receive_stream:
+                async for task_operation in receive_stream:
+                    yield task_operation
+        finally:
+            self._control_subscribers.discard(send_stream)
+            send_stream.close()
+
+    async def _defer(
+        self,
+        task_operation: TaskOperation,
+        priority: str,
+        tenant: str,
+        delay: float,
+    ) -> None:
+        """Hold a run back until it is due."""
+        async with self._changed:
+            heapq.heappush(
+                self._delayed,
+                (
+                    time.monotonic() + delay,
+                    next(self._delayed_sequence),
+                    priority,
+                    tenant,
+                    task_operation,
+                ),
+            )
+            # Idle receivers recompute when to wake up
+            while self._idle_receivers:
+                self._idle_receivers.popleft().event.set()
+        get_metrics().set_scheduler_delayed_operations(len(self._delayed))
+
+    def _promote_due(self) -> None:
+        """Queue the deferred runs that are due (lock held)."""
+        if not self._delayed or self._delayed[0][0] > time.monotonic():
+            return
+        while self._delayed and self._delayed[0][0] <= time.monotonic():
+            due, _, priority, tenant, task_operation = heapq.heappop(self._delayed)
+            # Time in queue counts from when the run became due
+            self._runs.push((due, task_operation), priority, tenant)
+        get_metrics().set_scheduler_delayed_operations(len(self._delayed))
+
+    def _requeue(self, priority: str | None, item: tuple[float, TaskOperation]) -> None:
+        """Return an operation no receiver took to the front of its queue."""
+        if priority is None:
+            self._controls.appendleft(item)
+        else:
+            _, tenant = self.share.resolve(item[1]["params"])
+            self._runs.push_front(item, priority, tenant)
+        self._changed.notify_all()
+
+    def _broadcast_control(self, task_operation: TaskOperation) -> None:
+        """Hand a control operation to every listening worker."""
+        for subscriber in list(self._control_subscribers):
+            try:
+                subscriber.send_nowait(task_operation)
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                self._control_subscribers.discard(subscriber)
+
+    async def _send(self, task_operation: TaskOperation) -> None:
+        """Queue a control operation, waiting for space if necessary."""
+        async with self._changed:
+            while not self._has_space():
+                await self._changed.wait()
+            self._put(task_operation, None)
+        get_metrics().set_scheduler_queue_length(self.queue_length)
+
+    def _reject(self, params: TaskSendParams) -> None:
+        """Record and raise a queue-full rejection."""
+        get_metrics().increment_scheduler_rejections()
+        logger.warning(
+            f"Scheduler queue full ({self.queue_size}), rejecting task {params.get('task_id')}"
+        )
+        raise SchedulerBusyError(
+            f"Scheduler queue is full ({self.queue_size} operations pending)"
+        )
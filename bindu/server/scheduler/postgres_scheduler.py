@@ -0,0 +1,445 @@
+"""PostgreSQL scheduler: a durable queue table claimed with SKIP LOCKED."""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import contextlib
+import math
+import os
+import socket
+import time
+from collections.abc import AsyncIterator, Sequence
+from datetime import timedelta
+from typing import Any
+from uuid import uuid4
+
+import anyio
+from anyio.abc import ObjectSendStream
+from opentelemetry.trace import get_current_span
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
+from bindu.server.storage.schema import task_operations_table
+from bindu.utils.logging import get_logger
+from bindu.utils.retry import retry_scheduler_operation
+
+from .base import (
+    Scheduler,
+    TaskOperation,
+    _CancelTask,
+    _PauseTask,
+    _ResumeTask,
+    _RunTask,
+    seconds_until_due,
+)
+from .codec import decode_task_operation, encode_task_operation
+
+logger = get_logger("bindu.server.scheduler.postgres_scheduler")
+
+NOTIFY_CHANNEL = "bindu_task_operations"
+CONTROL_CHANNEL = "bindu_task_control"
+
+
+class PostgresScheduler(Scheduler):
+    """A scheduler backed by the task_operations table of PostgresStorage.
+
+    Gives multi-process workers durable, at-least-once queuing on the database
+    they already use, on the engine and pool PostgresStorage.connect created:
+
+    - enqueue inserts rows and sends NOTIFY in the same statement
+    - workers LISTEN on a dedicated connection and only fall back to polling
+      every poll_timeout seconds, in case a notification is missed
+    - a claim takes up to batch_size of the oldest available rows with
+      FOR UPDATE SKIP LOCKED, so concurrent workers never block each other or
+      get the same row, and hides them for visibility_timeout seconds
+    - a handled operation is acknowledged by deleting its row; one held by a
+      worker that died becomes claimable again when its visibility expires
+
+    Operations are queued by reference: the message is already stored in the
+    same database, so only ids and options are written (see codec). A run
+    with a run_at in the future is inserted with available_at set to it, so
+    it is simply not claimable until then.
+
+    The attempts column counts claims and travels with the operation as
+    _attempts, so workers can dead-letter one that keeps taking them down.
+    Dead letters are kept per process (see Scheduler).
+
+    A cancel is also sent as the payload of a NOTIFY on bindu_task_control in
+    the same transaction, and handed to every worker listening on
+    receive_control_operations, so the running task is interrupted at once.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        batch_size: int = 1,
+        visibility_timeout: float = 60.0,
+        poll_timeout: float = 5.0,
+        consumer_name: str | None = None,
+    ):
+        """Initialize PostgreSQL scheduler.
+
+        Args:
+            storage: Connected PostgresStorage whose engine is shared
+            batch_size: Maximum operations claimed per round trip
+            visibility_timeout: Seconds a claimed operation stays hidden from
+                other workers unless it is acknowledged first
+            poll_timeout: Seconds to wait for a notification before polling
+            consumer_name: Recorded in claimed_by (default: host-pid-random)
+        """
+        self.storage = storage
+        self.batch_size = batch_size
+        self.visibility_timeout = visibility_timeout
+        self.poll_timeout = poll_timeout
+        self.consumer_name = (
+            consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self._engine: AsyncEngine | None = None
+        self._listen_conn: AsyncConnection | None = None
+        self._wakeup = asyncio.Event()
+        self._in_flight: set[int] = set()
+        self._heartbeat_task: asyncio.Task | None = None
+        self._control_subscribers: set[ObjectSendStream[TaskOperation]] = set()
+
+    async def __aenter__(self):
+        """Start listening for notifications and the visibility heartbeat."""
+        self._engine = self.storage.engine
+        try:
+            self._listen_conn = await self._engine.connect()
+            raw = await self._listen_conn.get_raw_connection()
+            await raw.driver_connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+            await raw.driver_connection.add_listener(CONTROL_CHANNEL, self._on_control)
+        except Exception as e:
+            # Still works, only slower: every wakeup comes from polling
+            logger.warning(f"LISTEN {NOTIFY_CHANNEL} failed, polling instead: {e}")
+            await self._close_listener()
+
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        logger.info(
+            f"Postgres scheduler consuming task_operations as {self.consumer_name}"
+        )
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop the heartbeat and release the listening connection."""
+        if self._heartbeat_task and not self._heartbeat_task.done():
+            self._heartbeat_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat_task
+        self._heartbeat_task = None
+        await self._close_listener()
+        self._engine = None
+
+    async def _close_listener(self) -> None:
+        """Return the listening connection to the pool."""
+        if self._listen_conn is not None:
+            with contextlib.suppress(Exception):
+                await self._listen_conn.close()
+            self._listen_conn = None
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str):
+        """Wake up the receive loop (asyncpg listener callback)."""
+        self._wakeup.set()
+
+    def _on_control(self, connection: Any, pid: int, channel: str, payload: str):
+        """Hand a notified control operation to every listening worker."""
+        try:
+            task_operation = decode_task_operation(payload)
+        except Exception as e:
+            logger.error(f"Failed to deserialize control operation: {e}")
+            return
+        for subscriber in list(self._control_subscribers):
+            try:
+                subscriber.send_nowait(task_operation)
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                self._control_subscribers.discard(subscriber)
+
+    # -------------------------------------------------------------------------
+    # Producing
+    # -------------------------------------------------------------------------
+
+    @retry_scheduler_operation()
+    async def run_task(self, params: TaskSendParams) -> None:
+        """Queue a run task operation."""
+        logger.debug(f"Scheduling run task: {params}")
+        await self._enqueue(
+            [_RunTask(operation="run", params=params, _current_span=get_current_span())]
+        )
+
+    @retry_scheduler_operation()
+    async def run_tasks(self, params_list: Sequence[TaskSendParams]) -> None:
+        """Queue several run task operations with one INSERT."""
+        if not params_list:
+            return
+        current_span = get_current_span()
+        await self._enqueue(
+            [
+                _RunTask(operation="run", params=params, _current_span=current_span)
+                for params in params_list
+            ]
+        )
+
+    @retry_scheduler_operation()
+    async def cancel_task(self, params: TaskIdParams) -> None:
+        """Queue a cancel task operation."""
+        logger.debug(f"Scheduling cancel task: {params}")
+        task_operation = _CancelTask(
+            operation="cancel", params=params, _current_span=get_current_span()
+        )
+        await self._enqueue([task_operation], control=task_operation)
+
+    @retry_scheduler_operation()
+    async def pause_task(self, params: TaskIdParams) -> None:
+        """Queue a pause task operation."""
+        logger.debug(f"Scheduling pause task: {params}")
+        await self._enqueue(
+            [
+                _PauseTask(
+                    operation="pause", params=params, _current_span=get_current_span()
+                )
+            ]
+        )
+
+    @retry_scheduler_operation()
+    async def resume_task(self, params: TaskIdParams) -> None:
+        """Queue a resume task operation."""
+        logger.debug(f"Scheduling resume task: {params}")
+        await self._enqueue(
+            [
+                _ResumeTask(
+                    operation="resume", params=params, _current_span=get_current_span()
+                )
+            ]
+        )
+
+    def _enqueue_statement(self, task_operations: Sequence[TaskOperation]):
+        """INSERT the operations and NOTIFY listeners, as one statement.
+
+        The notification is only delivered when the transaction commits, so
+        a woken worker always finds the rows.
+        """
+        inserted = (
+            insert(task_operations_table)
+            .values(
+                [
+                    {
+                        "operation": task_operation["operation"],
+                        "payload": encode_task_operation(
+                            task_operation, include_message=False
+                        ),
+                        # A deferred run is not claimable before its run_at
+                        "available_at": (
+                            func.to_timestamp(task_operation["params"]["run_at"])
+                            if seconds_until_due(task_operation["params"])
+                            else func.now()
+                        ),
+                    }
+                    for task_operation in task_operations
+                ]
+            )
+            .returning(task_operations_table.c.id)
+            .cte("inserted")
+        )
+        return select(func.pg_notify(NOTIFY_CHANNEL, "")).where(
+            exists(select(inserted.c.id))
+        )
+
+    async def _enqueue(
+        self,
+        task_operations: Sequence[TaskOperation],
+        control: TaskOperation | None = None,
+    ) -> None:
+        """Write operations to the queue table.
+
+        Args:
+            task_operations: Operations to queue
+            control: Operation to also notify on the control channel, once the
+                transaction commits
+        """
+        engine = self._require_engine()
+        async with engine.begin() as conn:
+            await conn.execute(self._enqueue_statement(task_operations))
+            if control is not None:
+                payload = encode_task_operation(control, include_message=False)
+                await conn.execute(select(func.pg_notify(CONTROL_CHANNEL, payload)))
+        get_metrics().record_scheduler_batch("enqueue", len(task_operations))
+
+    # -------------------------------------------------------------------------
+    # Consuming
+    # -------------------------------------------------------------------------
+
+    def _claim_statement(self, limit: int):
+        """Claim up to limit available operations, oldest first."""
+        candidates = (
+            select(task_operations_table.c.id)
+            .where(task_operations_table.c.available_at <= func.now())
+            .order_by(task_operations_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("candidates")
+        )
+        return (
+            update(task_operations_table)
+            .where(task_operations_table.c.id == candidates.c.id)
+            .values(
+                available_at=func.now() + timedelta(seconds=self.visibility_timeout),
+                attempts=task_operations_table.c.attempts + 1,
+                claimed_by=self.consumer_name,
+            )
+            .returning(
+                task_operations_table.c.id,
+                task_operations_table.c.payload,
+                task_operations_table.c.attempts,
+                func.extract(
+                    "epoch", func.now() - task_operations_table.c.enqueued_at
+                ).label("waited"),
+            )
+        )
+
+    async def _claim(self) -> list[Any]:
+        """Claim a batch of operations, in queue order."""
+        engine = self._require_engine()
+        async with engine.begin() as conn:
+            result = await conn.execute(self._claim_statement(self.batch_size))
+            rows = result.fetchall()
+        return sorted(rows, key=lambda row: row.id)
+
+    async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive task operations, waiting for NOTIFY when the queue is empty."""
+        self._require_engine()
+        metrics = get_metrics()
+        logger.info("Starting to receive task operations from task_operations")
+
+        while True:
+            # Cleared before claiming, so a NOTIFY sent meanwhile is not lost
+            self._wakeup.clear()
+            try:
+                rows = await self._claim()
+            except (SQLAlchemyError, OSError) as e:
+                logger.error(f"Database error in receive_task_operations: {e}")
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if not rows:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_timeout)
+                continue
+
+            metrics.record_scheduler_batch("dequeue", len(rows))
+            batch = []
+            for row in rows:
+                waited = float(row.waited or 0)
+                if task_operation := await self._decode_row(row):
+                    batch.append(task_operation)
+                    # A deferred run has only been waiting since it was due
+                    if run_at := task_operation["params"].get("run_at"):
+                        waited = min(waited, max(time.time() - float(run_at), 0.0))
+                metrics.record_scheduler_queue_wait(waited)
+            for task_operation in batch:
+                yield task_operation
+
+    async def receive_control_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive cancel operations notified on the control channel."""
+        send_stream, receive_stream = anyio.create_memory_object_stream[TaskOperation](
+            max_buffer_size=math.inf
+        )
+        self._control_subscribers.add(send_stream)
+        try:
+            async with receive_stream:
+                async for task_operation in receive_stream:
+                    yield task_operation
+        finally:
+            self._control_subscribers.discard(send_stream)
+            send_stream.close()
+
+    async def _decode_row(self, row: Any) -> TaskOperation | None:
+        """Turn a claimed row into a task operation, dead-lettering undecodable ones."""
+        try:
+            task_operation = decode_task_operation(row.payload)
+        except Exception as e:
+            logger.error(f"Dropping undecodable task operation {row.id}: {e}")
+            await self._dead_letter_undecodable(row.payload, e)
+            await self._delete(row.id)
+            return None
+
+        task_operation["_delivery_id"] = str(row.id)
+        task_operation["_attempts"] = row.attempts
+        self._in_flight.add(row.id)
+        logger.debug(f"Received task operation: {task_operation['operation']}")
+        return task_operation
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Delete a handled operation from the queue."""
+        delivery_id = task_operation.get("_delivery_id")
+        if delivery_id is None or self._engine is None:
+            return
+        operation_id = int(delivery_id)
+        self._in_flight.discard(operation_id)
+        await self._delete(operation_id)
+
+    async def release_task_operation(self, task_operation: TaskOperation) -> None:
+        """Stop hiding an operation whose handling failed, leaving it queued.
+
+        It becomes claimable again once its visibility timeout passes.
+        """
+        delivery_id = task_operation.get("_delivery_id")
+        if delivery_id is not None:
+            self._in_flight.discard(int(delivery_id))
+
+    async def _delete(self, operation_id: int) -> None:
+        """Remove one operation row."""
+        async with self._require_engine().begin() as conn:
+            await conn.execute(
+                delete(task_operations_table).where(
+                    task_operations_table.c.id == operation_id
+                )
+            )
+
+    async def _heartbeat(self) -> None:
+        """Keep operations still being handled hidden from other workers."""
+        while True:
+            try:
+                await asyncio.sleep(self.visibility_timeout / 3)
+                if self._in_flight and self._engine is not None:
+                    async with self._engine.begin() as conn:
+                        await conn.execute(
+                            update(task_operations_table)
+                            .where(task_operations_table.c.id.in_(self._in_flight))
+                            .values(
+                                available_at=func.now()
+                                + timedelta(seconds=self.visibility_timeout)
+                            )
+                        )
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in task_operations heartbeat: {e}", exc_info=True)
+
+    # -------------------------------------------------------------------------
+    # Utilities
+    # -------------------------------------------------------------------------
+
+    def _require_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            raise RuntimeError(
+                "Postgres scheduler not initialized. Use async context manager."
+            )
+        return self._engine
+
+    async def get_queue_length(self) -> int:
+        """Get the number of queued operations, claimed ones included."""
+        async with self._require_engine().connect() as conn:
+            result = await conn.execute(
+                select(func.count()).select_from(task_operations_table)
+            )
+            return result.scalar() or 0
+
+    async def clear_queue(self) -> int:
+        """Delete all queued operations. Returns number of operations removed."""
+        async with self._require_engine().begin() as conn:
+            result = await conn.execute(delete(task_operations_table))
+            self._in_flight.clear()
+            return result.rowcount
@@ -0,0 +1,288 @@
+"""Redis scheduler with priority classes and per-tenant fair queueing."""
+
+from __future__ import annotations as _annotations
+
+import time
+from collections.abc import AsyncIterator, Mapping, Sequence
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from bindu.server.metrics import get_metrics
+from bindu.utils.logging import get_logger
+
+from .base import TaskOperation
+from .fair_queue import DEFAULT_PRIORITY_CLASSES, FairShare
+from .redis_scheduler import PayloadMode, RedisScheduler
+
+logger = get_logger("bindu.server.scheduler.redis_fair_scheduler")
+
+# Score range of each rank in the sorted set: rank 0 holds control operations
+# (scored by enqueue time), rank 1 + i the runs of priority class i (scored by
+# fair finish tag)
+_RANK_SPAN = 1e12
+
+# Tags recovered from scores are only this precise at the scale of _RANK_SPAN
+_TAG_TOLERANCE = 1e-2
+
+
+class RedisFairScheduler(RedisScheduler):
+    """A Redis scheduler that serves runs by priority class, then fairly per tenant.
+
+    Operations are kept in one sorted set ("<queue_name>:fair") and popped
+    lowest score first with ZPOPMIN/BZPOPMIN. The score puts control
+    operations ahead of every run, then orders runs by priority class and,
+    within a class, by their weighted fair queueing tag (see fair_queue).
+
+    The tag state lives next to the queue: the last tag of every class and
+    tenant with runs queued in "<queue_name>:fair:tags" and the virtual time
+    of every class (the tag last served) in "<queue_name>:fair:vtime". A
+    tenant's tag is removed once its last queued run is served, so the hash
+    only holds tenants with work queued. Producers and consumers update it
+    without a transaction, so with several processes the shares are fair to
+    within a few operations rather than exactly.
+
+    Delivery is at-most-once like the list scheduler; cancels are also
+    published on the control channel.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        queue_name: str = "bindu:tasks",
+        max_connections: int = 10,
+        retry_on_timeout: bool = True,
+        poll_timeout: int = 1,
+        batch_size: int = 1,
+        payload_mode: PayloadMode = "full",
+        priority_classes: Sequence[str] = DEFAULT_PRIORITY_CLASSES,
+        default_priority: str = "normal",
+        tenant_weights: Mapping[str, float] | None = None,
+    ):
+        """Initialize Redis fair scheduler.
+
+        Args:
+            redis_url: Redis URL (redis://[password@]host:port/db)
+            queue_name: Prefix of the queue keys ("<queue_name>:fair...")
+            max_connections: Maximum Redis connection pool size
+            retry_on_timeout: Whether to retry on Redis timeout
+            poll_timeout: Seconds BZPOPMIN blocks waiting for new operations
+            batch_size: Maximum operations popped per round trip
+            payload_mode: "full" or "reference" (see RedisScheduler)
+            priority_classes: Priority class names, highest first
+            default_priority: Class of runs without a known priority
+            tenant_weights: Relative share of the workers per tenant (default 1)
+        """
+        super().__init__(
+            redis_url=redis_url,
+            queue_name=queue_name,
+            max_connections=max_connections,
+            retry_on_timeout=retry_on_timeout,
+            poll_timeout=poll_timeout,
+            batch_size=batch_size,
+            payload_mode=payload_mode,
+        )
+        self.share = FairShare(priority_classes, default_priority, tenant_weights)
+        # Separate keys, so switching from the list scheduler does not hit
+        # WRONGTYPE on the old list
+        self.fair_key = f"{queue_name}:fair"
+        self.tags_key = f"{queue_name}:fair:tags"
+        self.vtime_key = f"{queue_name}:fair:vtime"
+
+    async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive task operations in fair order, up to batch_size per round trip."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        logger.info(f"Starting to receive task operations from {self.fair_key}")
+        metrics = get_metrics()
+        self._start_delayed_mover()
+
+        while True:
+            try:
+                batch = await self._redis_client.zpopmin(self.fair_key, self.batch_size)
+                if not batch:
+                    result = await self._redis_client.bzpopmin(
+                        self.fair_key, timeout=self.poll_timeout
+                    )
+                    batch = [(result[1], result[2])] if result else []
+                if not batch:
+                    continue
+                await self._advance_virtual_time(batch)
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                continue
+
+            metrics.record_scheduler_batch("dequeue", len(batch))
+            now = time.time()
+
+            task_operations = []
+            served: dict[str, float] = {}
+            for member, score in batch:
+                enqueued_at, _, task_data = member.split("|", 2)
+                rank = int(score // _RANK_SPAN)
+                priority = self.share.priority_classes[rank - 1] if rank else None
+                metrics.record_scheduler_queue_wait(
+                    max(now - float(enqueued_at), 0.0), priority=priority
+                )
+                try:
+                    task_operation = self._deserialize_task_operation(task_data)
+                except Exception as e:
+                    logger.error(f"Failed to deserialize task operation: {e}")
+                    await self._dead_letter_undecodable(task_data, e)
+                    continue
+                if priority is not None:
+                    _, tenant = self.share.resolve(task_operation["params"])
+                    field = f"{priority}:{tenant}"
+                    served[field] = max(
+                        served.get(field, 0.0), score - rank * _RANK_SPAN
+                    )
+                task_operations.append(task_operation)
+
+            if served:
+                try:
+                    await self._forget_idle_tenants(served)
+                except redis.RedisError as e:
+                    logger.warning(f"Failed to remove tags of idle tenants: {e}")
+
+            for task_operation in task_operations:
+                logger.debug(f"Received task operation: {task_operation['operation']}")
+                yield task_operation
+
+    async def _advance_virtual_time(self, batch: Sequence[tuple[str, float]]) -> None:
+        """Record the highest tag served per class as its virtual time."""
+        served: dict[str, float] = {}
+        for _, score in batch:
+            rank = int(score // _RANK_SPAN)
+            if rank:
+                priority = self.share.priority_classes[rank - 1]
+                served[priority] = max(
+                    served.get(priority, 0.0), score - rank * _RANK_SPAN
+                )
+        if served:
+            await self._redis_client.hset(self.vtime_key, mapping=served)
+
+    async def _forget_idle_tenants(self, served: Mapping[str, float]) -> None:
+        """Remove the tags of tenants whose last queued run was just served.
+
+        Their next run would restart from the virtual time anyway. A run
+        queued between the read and the delete also restarts from it, which
+        stays within the fairness the scheduler promises across processes.
+
+        Args:
+            served: Highest tag served per "<class>:<tenant>" field
+        """
+        fields = list(served)
+        tags = await self._redis_client.hmget(self.tags_key, fields)
+        idle = [
+            field
+            for field, tag in zip(fields, tags)
+            if tag is not None and float(tag) <= served[field] + _TAG_TOLERANCE
+        ]
+        if idle:
+            await self._redis_client.hdel(self.tags_key, *idle)
+
+    async def _push_task_operation(self, task_operation: TaskOperation) -> None:
+        """Queue a task operation in the sorted set."""
+        await self._push_task_operations([task_operation])
+
+    async def _push_task_operations(
+        self, task_operations: Sequence[TaskOperation]
+    ) -> None:
+        """Queue several task operations in two round trips.
+
+        The first reads the class virtual times and bumps each tenant's last
+        tag, the second moves tags of tenants that were idle up to the
+        virtual time and adds the operations.
+        """
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        # Equal scores are ordered by member, so the enqueue time and position
+        # in the batch keep ties first come, first served
+        enqueued_at = time.time()
+        members = [
+            f"{enqueued_at:.6f}|{index:06d}-{uuid4().hex}|"
+            f"{self._serialize_task_operation(op)}"
+            for index, op in enumerate(task_operations)
+        ]
+        runs = [
+            (index, *self.share.resolve(op["params"]))
+            for index, op in enumerate(task_operations)
+            if op["operation"] == "run"
+        ]
+
+        try:
+            scores = dict.fromkeys(range(len(members)), enqueued_at)
+            tag_updates: dict[str, float] = {}
+            if runs:
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    for priority in self.share.priority_classes:
+                        pipe.hget(self.vtime_key, priority)
+                    for _, priority, tenant in runs:
+                        pipe.hincrbyfloat(
+                            self.tags_key,
+                            f"{priority}:{tenant}",
+                            self.share.cost(tenant),
+                        )
+                    results = await pipe.execute()
+
+                classes = len(self.share.priority_classes)
+                virtual_time = {
+                    priority: float(value or 0.0)
+                    for priority, value in zip(
+                        self.share.priority_classes, results[:classes]
+                    )
+                }
+                # Tags of a tenant that went idle restart from the virtual time
+                shifts: dict[str, float] = {}
+                for (index, priority, tenant), tag in zip(runs, results[classes:]):
+                    field = f"{priority}:{tenant}"
+                    tag = float(tag)
+                    if field not in shifts:
+                        previous = tag - self.share.cost(tenant)
+                        shifts[field] = max(virtual_time[priority] - previous, 0.0)
+                    tag += shifts[field]
+                    if shifts[field]:
+                        tag_updates[field] = tag
+                    rank = self.share.priority_classes.index(priority) + 1
+                    scores[index] = rank * _RANK_SPAN + tag
+
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                if tag_updates:
+                    pipe.hset(self.tags_key, mapping=tag_updates)
+                pipe.zadd(
+                    self.fair_key,
+                    {member: scores[index] for index, member in enumerate(members)},
+                )
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Failed to queue task operations in Redis: {e}")
+            raise
+
+        get_metrics().record_scheduler_batch("enqueue", len(members))
+        logger.debug(f"Queued {len(members)} task operations in {self.fair_key}")
+
+    async def get_queue_length(self) -> int:
+        """Get the number of queued operations."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        return await self._redis_client.zcard(self.fair_key)
+
+    async def clear_queue(self) -> int:
+        """Delete all queued operations and the fairness state. Returns how many."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        length = await self._redis_client.zcard(self.fair_key)
+        await self._redis_client.delete(self.fair_key, self.tags_key, self.vtime_key)
+        return length
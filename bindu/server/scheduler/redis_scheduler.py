@@ -2,14 +2,19 @@
 
 from __future__ import annotations as _annotations
 
+import asyncio
 import json
-from collections.abc import AsyncIterator
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Literal
+from uuid import uuid4
 
 import redis.asyncio as redis
 from opentelemetry.trace import get_current_span
 
-from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.common.protocol.types import DeadLetter, TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_scheduler_operation
 
@@ -20,16 +25,48 @@ from .base import (
     _PauseTask,
     _ResumeTask,
     _RunTask,
+    seconds_until_due,
 )
+from .codec import decode_task_operation, encode_task_operation
 
 logger = get_logger("bindu.server.scheduler.redis_scheduler")
 
+PayloadMode = Literal["full", "reference"]
+
+DELAYED_POLL_INTERVAL = 1.0
+"""Seconds between checks of the deferred operations for ones that are due."""
+
+_DELAYED_MOVE_LIMIT = 100
+"""Deferred operations moved to the queue per round trip."""
+
 
 class RedisScheduler(Scheduler):
     """A Redis-based scheduler for distributed task operations.
 
     Uses Redis lists for queue operations with blocking pop for efficient task distribution.
     Suitable for multi-process and multi-worker deployments.
+
+    Workers pop up to batch_size operations per round trip (LPOP with a count)
+    and only block with BLPOP when the queue is empty. run_tasks pushes many
+    operations with a single RPUSH.
+
+    With payload_mode="reference" a run operation is queued as a small
+    envelope (operation, task ids, trace ids and options) without the user
+    message: the worker reads the task, message included, from storage.
+    Queue entries then stay the same size whatever the attachments. Both
+    formats are always accepted when reading.
+
+    Cancels are queued and also published on the "<queue_name>:control"
+    pub/sub channel, which every worker subscribes to, so the worker running
+    the task interrupts it at once.
+
+    Runs with a run_at in the future are added to the "<queue_name>:delayed"
+    sorted set, scored by run_at. Every receiving worker checks it each
+    DELAYED_POLL_INTERVAL and moves the operations that are due to the
+    queue; ZREM decides which worker moves each one, so none is queued twice.
+
+    Dead letters are kept in the "<queue_name>:dead" list, newest first and
+    capped at the scheduler dead_letter_limit, so every process sees them.
     """
 
     def __init__(
@@ -39,6 +76,8 @@ class RedisScheduler(Scheduler):
         max_connections: int = 10,
         retry_on_timeout: bool = True,
         poll_timeout: int = 1,
+        batch_size: int = 1,
+        payload_mode: PayloadMode = "full",
     ):
         """Initialize Redis scheduler.
 
@@ -49,13 +88,24 @@ class RedisScheduler(Scheduler):
             retry_on_timeout: Whether to retry on Redis timeout
             poll_timeout: Timeout in seconds for blpop operations (default: 1s)
                 Higher values reduce API calls but slightly increase task start latency.
+            batch_size: Maximum operations fetched per round trip. Fetched
+                operations are held by this worker until it takes them.
+            payload_mode: "full" queues the whole params, message included;
+                "reference" leaves the message in storage
         """
         self.redis_url = redis_url
         self.queue_name = queue_name
         self.max_connections = max_connections
         self.retry_on_timeout = retry_on_timeout
         self.poll_timeout = poll_timeout
+        self.batch_size = batch_size
+        self.payload_mode = payload_mode
+        self.control_channel = f"{queue_name}:control"
+        self.delayed_key = f"{queue_name}:delayed"
+        self.dead_letter_key = f"{queue_name}:dead"
+        self.delayed_poll_interval = DELAYED_POLL_INTERVAL
         self._redis_client: redis.Redis | None = None
+        self._delayed_mover_task: asyncio.Task | None = None
 
     async def __aenter__(self):
         """Initialize Redis connection pool."""
@@ -80,7 +130,14 @@ class RedisScheduler(Scheduler):
         return self
 
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
-        """Close Redis connection pool."""
+        """Stop moving deferred operations and close Redis connection pool."""
+        if self._delayed_mover_task and not self._delayed_mover_task.done():
+            self._delayed_mover_task.cancel()
+            try:
+                await self._delayed_mover_task
+            except asyncio.CancelledError:
+                pass
+        self._delayed_mover_task = None
         if self._redis_client:
             await self._redis_client.aclose()
             logger.info("Redis scheduler connection closed")
@@ -93,7 +150,29 @@ class RedisScheduler(Scheduler):
         task_operation = _RunTask(
             operation="run", params=params, _current_span=get_current_span()
         )
-        await self._push_task_operation(task_operation)
+        if seconds_until_due(params):
+            await self._defer_task_operations([task_operation])
+        else:
+            await self._push_task_operation(task_operation)
+
+    @retry_scheduler_operation()
+    async def run_tasks(self, params_list: Sequence[TaskSendParams]) -> None:
+        """Send run task operations to Redis queue in one round trip."""
+        if not params_list:
+            return
+        logger.debug(f"Scheduling {len(params_list)} run tasks")
+        current_span = get_current_span()
+        task_operations = [
+            _RunTask(operation="run", params=params, _current_span=current_span)
+            for params in params_list
+        ]
+        due, deferred = [], []
+        for op in task_operations:
+            (deferred if seconds_until_due(op["params"]) else due).append(op)
+        if due:
+            await self._push_task_operations(due)
+        if deferred:
+            await self._defer_task_operations(deferred)
 
     @retry_scheduler_operation()
     async def cancel_task(self, params: TaskIdParams) -> None:
@@ -103,6 +182,7 @@ class RedisScheduler(Scheduler):
             operation="cancel", params=params, _current_span=get_current_span()
         )
         await self._push_task_operation(task_operation)
+        await self._publish_control(task_operation)
 
     @retry_scheduler_operation()
     async def pause_task(self, params: TaskIdParams) -> None:
@@ -123,7 +203,7 @@ class RedisScheduler(Scheduler):
         await self._push_task_operation(task_operation)
 
     async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
-        """Receive task operations from Redis queue using blocking pop."""
+        """Receive task operations from Redis queue, up to batch_size per round trip."""
         if not self._redis_client:
             raise RuntimeError(
                 "Redis client not initialized. Use async context manager."
@@ -133,34 +213,171 @@ class RedisScheduler(Scheduler):
             f"Starting to receive task operations from queue: {self.queue_name}"
         )
 
+        metrics = get_metrics()
+        self._start_delayed_mover()
+
         while True:
             try:
-                # Blocking pop with configurable timeout (reduces API calls for free tier)
-                result = await self._redis_client.blpop(
-                    self.queue_name, timeout=self.poll_timeout
-                )
-
-                if result:
-                    _, task_data = result
-                    task_operation = self._deserialize_task_operation(task_data)
-                    logger.debug(
-                        f"Received task operation: {task_operation['operation']}"
+                # Take what is already queued without blocking, then block
+                # (configurable timeout, reduces API calls for free tier) only
+                # when the queue is empty
+                batch = await self._redis_client.lpop(self.queue_name, self.batch_size)
+                if not batch:
+                    result = await self._redis_client.blpop(
+                        self.queue_name, timeout=self.poll_timeout
                     )
-                    yield task_operation
-
+                    batch = [result[1]] if result else []
             except redis.RedisError as e:
                 # Log error and continue (Redis connection issues)
                 logger.error(f"Redis error in receive_task_operations: {e}")
                 # Could add exponential backoff here for production
                 continue
-            except json.JSONDecodeError as e:
-                # Log deserialization errors but continue
-                logger.error(f"Failed to deserialize task operation: {e}")
+
+            if not batch:
                 continue
+            metrics.record_scheduler_batch("dequeue", len(batch))
+
+            for task_data in batch:
+                try:
+                    task_operation = self._deserialize_task_operation(task_data)
+                except Exception as e:
+                    # Keep it for inspection rather than dropping it
+                    logger.error(f"Failed to deserialize task operation: {e}")
+                    await self._dead_letter_undecodable(task_data, e)
+                    continue
+                logger.debug(f"Received task operation: {task_operation['operation']}")
+                yield task_operation
+
+    def _start_delayed_mover(self) -> None:
+        """Start moving due deferred operations to the queue, once per scheduler."""
+        if self._delayed_mover_task is None or self._delayed_mover_task.done():
+            self._delayed_mover_task = asyncio.create_task(self._delayed_mover())
+
+    async def _delayed_mover(self) -> None:
+        """Move due deferred operations to the queue until cancelled."""
+        while True:
+            try:
+                moved = await self._move_due_operations()
+                get_metrics().set_scheduler_delayed_operations(
+                    await self._redis_client.zcard(self.delayed_key)
+                )
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                # Log unexpected errors
-                logger.error(f"Unexpected error in receive_task_operations: {e}")
-                continue
+                logger.error(f"Error moving deferred operations: {e}", exc_info=True)
+                moved = 0
+            # A full batch means more may be due already
+            if moved < _DELAYED_MOVE_LIMIT:
+                await asyncio.sleep(self.delayed_poll_interval)
+
+    async def _move_due_operations(self) -> int:
+        """Move deferred operations whose run_at has passed to the queue.
+
+        Returns:
+            Number of operations this worker moved
+        """
+        members = await self._redis_client.zrangebyscore(
+            self.delayed_key, "-inf", time.time(), start=0, num=_DELAYED_MOVE_LIMIT
+        )
+        if not members:
+            return 0
+
+        # Only the worker whose ZREM succeeds moves an operation
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for member in members:
+                pipe.zrem(self.delayed_key, member)
+            removed = await pipe.execute()
+        claimed = [member for member, count in zip(members, removed) if count]
+
+        task_operations = []
+        for member in claimed:
+            payload = member.split("|", 1)[-1]
+            try:
+                task_operations.append(self._deserialize_task_operation(payload))
+            except Exception as e:
+                # Keep it for inspection rather than dropping it
+                logger.error(f"Failed to deserialize deferred operation: {e}")
+                await self._dead_letter_undecodable(payload, e)
+        if not task_operations:
+            return 0
+
+        try:
+            await self._push_task_operations(task_operations)
+        except redis.RedisError:
+            # Put them back so the next check moves them
+            await self._redis_client.zadd(
+                self.delayed_key, dict.fromkeys(claimed, time.time())
+            )
+            raise
+        logger.debug(f"Moved {len(task_operations)} due operations to the queue")
+        return len(task_operations)
+
+    async def _defer_task_operations(
+        self, task_operations: Sequence[TaskOperation]
+    ) -> None:
+        """Add run operations to the deferred set, scored by their run_at."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        # The random prefix keeps identical payloads distinct members
+        mapping = {
+            f"{uuid4().hex}|{self._serialize_task_operation(op)}": float(
+                op["params"]["run_at"]
+            )
+            for op in task_operations
+        }
+        try:
+            await self._redis_client.zadd(self.delayed_key, mapping)
+        except redis.RedisError as e:
+            logger.error(f"Failed to defer task operations in Redis: {e}")
+            raise
+        logger.debug(f"Deferred {len(mapping)} task operations")
+
+    async def receive_control_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive cancel operations published on the control channel."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.control_channel)
+            while True:
+                try:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=None
+                    )
+                except redis.RedisError as e:
+                    # The connection resubscribes when it reconnects
+                    logger.error(f"Redis error on {self.control_channel}: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                if message is None:
+                    continue
+                try:
+                    task_operation = self._deserialize_task_operation(message["data"])
+                except Exception as e:
+                    logger.error(f"Failed to deserialize control operation: {e}")
+                    continue
+                yield task_operation
+        finally:
+            await pubsub.aclose()
+
+    async def _publish_control(self, task_operation: TaskOperation) -> None:
+        """Publish a control operation to the workers, best effort.
+
+        The operation is already queued, so a failed publish only loses the
+        head start and is not retried (that would queue it again).
+        """
+        try:
+            await self._redis_client.publish(
+                self.control_channel, encode_task_operation(task_operation)
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to publish {task_operation['operation']}: {e}")
 
     async def _push_task_operation(self, task_operation: TaskOperation) -> None:
         """Push a task operation to Redis queue."""
@@ -172,6 +389,7 @@ class RedisScheduler(Scheduler):
         try:
             serialized_task = self._serialize_task_operation(task_operation)
             await self._redis_client.rpush(self.queue_name, serialized_task)
+            get_metrics().record_scheduler_batch("enqueue", 1)
             logger.debug(
                 f"Pushed task operation to queue: {task_operation['operation']}"
             )
@@ -182,104 +400,77 @@ class RedisScheduler(Scheduler):
             logger.error(f"Failed to serialize task operation: {e}")
             raise
 
-    def _serialize_task_operation(self, task_operation: TaskOperation) -> str:
-        """Serialize task operation to JSON string for Redis storage."""
-        from uuid import UUID
-
-        # Convert span to string representation (spans are not JSON serializable)
-        span = task_operation["_current_span"]
-
-        # Try to get span context - handle both real spans and mocks
-        span_id = None
-        trace_id = None
+    async def _push_task_operations(
+        self, task_operations: Sequence[TaskOperation]
+    ) -> None:
+        """Push several task operations to Redis queue with one RPUSH."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
 
+        serialized_tasks = [
+            self._serialize_task_operation(op) for op in task_operations
+        ]
         try:
-            if hasattr(span, "get_span_context"):
-                # Mock span with get_span_context method
-                span_context = span.get_span_context()
-                span_id = span_context.span_id
-                trace_id = span_context.trace_id
-            elif hasattr(span, "_context"):
-                # Real OpenTelemetry _Span object
-                span_context = span._context
-                span_id = span_context.span_id
-                trace_id = span_context.trace_id
-        except Exception:
-            # If we can't get span context, just use None values
-            pass
-
-        # Convert UUIDs to strings in params
-        def convert_uuids(obj):
-            """Recursively convert UUIDs to strings in nested structures."""
-            if isinstance(obj, UUID):
-                return str(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_uuids(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_uuids(item) for item in obj]
-            return obj
-
-        serializable_task = {
-            "operation": task_operation["operation"],
-            "params": convert_uuids(task_operation["params"]),
-            "span_id": format(span_id, "016x") if span_id else None,
-            "trace_id": format(trace_id, "032x") if trace_id else None,
-        }
-        return json.dumps(serializable_task)
-
-    def _deserialize_task_operation(self, task_data: str) -> TaskOperation:
-        """Deserialize task operation from JSON string."""
-        from uuid import UUID
+            await self._redis_client.rpush(self.queue_name, *serialized_tasks)
+        except redis.RedisError as e:
+            logger.error(f"Failed to push task operations to Redis: {e}")
+            raise
+        get_metrics().record_scheduler_batch("enqueue", len(serialized_tasks))
+        logger.debug(f"Pushed {len(serialized_tasks)} task operations to queue")
 
-        data = json.loads(task_data)
+    def _serialize_task_operation(self, task_operation: TaskOperation) -> str:
+        """Serialize task operation for Redis storage (see codec)."""
+        return encode_task_operation(
+            task_operation, include_message=self.payload_mode == "full"
+        )
 
-        # Convert string UUIDs back to UUID objects in params
-        def convert_strings_to_uuids(obj):
-            """Recursively convert UUID strings back to UUID objects."""
-            if isinstance(obj, str):
-                # Try to parse as UUID
-                try:
-                    return UUID(obj)
-                except (ValueError, AttributeError):
-                    return obj
-            elif isinstance(obj, dict):
-                return {k: convert_strings_to_uuids(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_strings_to_uuids(item) for item in obj]
-            return obj
-
-        # Reconstruct the task operation (span will be recreated by the worker)
-        # TODO: Properly propagate span context using trace_id/span_id
-        operation_type = data["operation"]
-        params = convert_strings_to_uuids(data["params"])
-        current_span = get_current_span()
+    def _deserialize_task_operation(self, task_data: str) -> TaskOperation:
+        """Deserialize task operation, in the current or a legacy layout."""
+        return decode_task_operation(task_data)
 
-        if operation_type == "run":
-            return _RunTask(
-                operation="run",
-                params=params,
-                _current_span=current_span,
+    async def _store_dead_letter(self, dead_letter: DeadLetter) -> None:
+        """Push a dead letter on the shared list, dropping the oldest past the limit."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
             )
-        elif operation_type == "cancel":
-            return _CancelTask(
-                operation="cancel",
-                params=params,
-                _current_span=current_span,
+
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.lpush(self.dead_letter_key, json.dumps(dead_letter))
+            pipe.ltrim(
+                self.dead_letter_key, 0, app_settings.scheduler.dead_letter_limit - 1
             )
-        elif operation_type == "pause":
-            return _PauseTask(
-                operation="pause",
-                params=params,
-                _current_span=current_span,
+            await pipe.execute()
+
+    async def list_dead_letters(self, limit: int = 100) -> list[DeadLetter]:
+        """Return up to limit dead letters from the shared list, newest first."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
             )
-        elif operation_type == "resume":
-            return _ResumeTask(
-                operation="resume",
-                params=params,
-                _current_span=current_span,
+
+        entries = await self._redis_client.lrange(self.dead_letter_key, 0, limit - 1)
+        return [json.loads(entry) for entry in entries]
+
+    async def remove_dead_letters(self, ids: Sequence[str]) -> list[DeadLetter]:
+        """Remove dead letters from the shared list; LREM decides who gets each."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
             )
-        else:
-            raise ValueError(f"Unknown operation type: {operation_type}")
+
+        wanted = set(ids)
+        entries = await self._redis_client.lrange(self.dead_letter_key, 0, -1)
+        removed = []
+        for entry in entries:
+            dead_letter = json.loads(entry)
+            if dead_letter["id"] in wanted and await self._redis_client.lrem(
+                self.dead_letter_key, 1, entry
+            ):
+                removed.append(dead_letter)
+        return removed
 
     async def get_queue_length(self) -> int:
         """Get the current length of the task queue."""
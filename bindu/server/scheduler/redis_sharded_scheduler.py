@@ -0,0 +1,410 @@
+"""Redis scheduler with context-hash shards leased to workers."""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import os
+import socket
+import time
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from bindu.server.metrics import get_metrics
+from bindu.utils.logging import get_logger
+
+from .base import TaskOperation, seconds_until_due
+from .redis_scheduler import PayloadMode, RedisScheduler
+
+logger = get_logger("bindu.server.scheduler.redis_sharded_scheduler")
+
+BUSY_POLL_INTERVAL = 0.1
+"""Seconds a worker blocks on its free shards while another shard is in flight."""
+
+
+def shard_of(context_id: Any, shards: int) -> int:
+    """Shard of a context: CRC-32 of its id, stable across processes."""
+    return zlib.crc32(str(context_id).encode()) % shards
+
+
+class RedisShardedScheduler(RedisScheduler):
+    """A Redis scheduler that keeps every context on one worker at a time.
+
+    Operations with a context_id go to one of shards lists
+    ("<queue_name>:shard:<n>"), chosen by a hash of the context. Each shard is
+    leased to a single worker, which takes one operation from it at a time:
+    the next is only popped once the worker acknowledges the previous one.
+    The operations of a context therefore run one after another, in order,
+    even across workers, while throughput grows with the number of shards.
+    Operations without a context (cancel, pause, resume) use the plain
+    "<queue_name>" list, which every worker reads.
+
+    Workers register in "<queue_name>:shard:workers" and, every
+    lease_ttl / 3 seconds, renew their leases ("<queue_name>:shard:<n>:lease",
+    SET NX with a lease_ttl expiry) and recompute their share: shard n
+    belongs to the live worker at position n % workers in name order. A
+    worker hands back a shard it no longer owns once nothing from it is in
+    flight, and takes a new one as soon as its lease is free, so shards move
+    when workers join or leave. The leases of a worker that died expire
+    after lease_ttl.
+
+    A run the agent asked to retry later (reschedules set) goes back to the
+    head of its shard rather than to the deferred set, so later operations of
+    its context stay behind it. The worker that pops it before its run_at
+    puts it back and leaves the shard alone until then. Other deferred runs
+    join the tail of their shard when due, like in the list scheduler.
+
+    Delivery is at-most-once like the list scheduler: an operation popped by
+    a worker that dies is lost.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        queue_name: str = "bindu:tasks",
+        consumer_name: str | None = None,
+        max_connections: int = 10,
+        retry_on_timeout: bool = True,
+        poll_timeout: int = 1,
+        payload_mode: PayloadMode = "full",
+        shards: int = 16,
+        lease_ttl: float = 15.0,
+    ):
+        """Initialize Redis sharded scheduler.
+
+        Args:
+            redis_url: Redis URL (redis://[password@]host:port/db)
+            queue_name: Prefix of the queue keys ("<queue_name>:shard:<n>")
+            consumer_name: Name of this worker in the leases (default: host-pid-random)
+            max_connections: Maximum Redis connection pool size
+            retry_on_timeout: Whether to retry on Redis timeout
+            poll_timeout: Seconds BLPOP blocks waiting for new operations
+            payload_mode: "full" or "reference" (see RedisScheduler)
+            shards: Number of shard queues; every process must use the same
+            lease_ttl: Seconds a lease outlives its last renewal
+        """
+        super().__init__(
+            redis_url=redis_url,
+            queue_name=queue_name,
+            max_connections=max_connections,
+            retry_on_timeout=retry_on_timeout,
+            poll_timeout=poll_timeout,
+            payload_mode=payload_mode,
+        )
+        self.shards = shards
+        self.lease_ttl = lease_ttl
+        self.consumer_name = (
+            consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self.workers_key = f"{queue_name}:shard:workers"
+        # Shards leased to this worker, those it should hand back, those
+        # with an operation in flight, and those whose head is a retry not
+        # yet due, with its run_at
+        self._held: set[int] = set()
+        self._unwanted: set[int] = set()
+        self._busy: set[int] = set()
+        self._parked: dict[int, float] = {}
+        self._lease_task: asyncio.Task | None = None
+
+    def shard_key(self, shard: int) -> str:
+        """Key of the list holding a shard's operations."""
+        return f"{self.queue_name}:shard:{shard}"
+
+    def lease_key(self, shard: int) -> str:
+        """Key holding the name of the worker leasing a shard."""
+        return f"{self.queue_name}:shard:{shard}:lease"
+
+    def _queue_key(self, task_operation: TaskOperation) -> str:
+        """List an operation is queued on."""
+        context_id = task_operation["params"].get("context_id")
+        if context_id is None:
+            return self.queue_name
+        return self.shard_key(shard_of(context_id, self.shards))
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop renewing leases, hand them back and close the connection pool."""
+        if self._lease_task and not self._lease_task.done():
+            self._lease_task.cancel()
+            try:
+                await self._lease_task
+            except asyncio.CancelledError:
+                pass
+        self._lease_task = None
+        if self._redis_client and self._held:
+            try:
+                await self._release(set(self._held))
+                await self._redis_client.zrem(self.workers_key, self.consumer_name)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to hand back shard leases: {e}")
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+    async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive operations from the leased shards, one in flight per shard."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        logger.info(
+            f"Starting to receive task operations from {self.shards} shards "
+            f"as {self.consumer_name}"
+        )
+        metrics = get_metrics()
+        self._start_delayed_mover()
+        await self._maintain_leases()
+        if self._lease_task is None or self._lease_task.done():
+            self._lease_task = asyncio.create_task(self._lease_keeper())
+
+        while True:
+            try:
+                # Shards are only handed back between pops, never while a
+                # BLPOP might still take from them
+                if releasable := self._unwanted & self._held - self._busy:
+                    await self._release(releasable)
+
+                now = time.time()
+                self._parked = {s: t for s, t in self._parked.items() if t > now}
+                free = sorted(self._held - self._busy - self._parked.keys())
+                keys = [self.queue_name, *(self.shard_key(shard) for shard in free)]
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.lpop(key)
+                    popped = [
+                        (key, task_data)
+                        for key, task_data in zip(keys, await pipe.execute())
+                        if task_data is not None
+                    ]
+                if not popped:
+                    # Block briefly when busy shards may soon be free again,
+                    # and no longer than until the first parked retry is due
+                    timeout = BUSY_POLL_INTERVAL if self._busy else self.poll_timeout
+                    if self._parked:
+                        due_in = min(self._parked.values()) - now
+                        timeout = min(timeout, max(due_in, BUSY_POLL_INTERVAL))
+                    result = await self._redis_client.blpop(keys, timeout=timeout)
+                    popped = [(result[0], result[1])] if result else []
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                await asyncio.sleep(BUSY_POLL_INTERVAL)
+                continue
+
+            if not popped:
+                continue
+            metrics.record_scheduler_batch("dequeue", len(popped))
+
+            for key, task_data in popped:
+                try:
+                    task_operation = self._deserialize_task_operation(task_data)
+                except Exception as e:
+                    logger.error(f"Failed to deserialize task operation: {e}")
+                    await self._dead_letter_undecodable(task_data, e)
+                    continue
+                if key != self.queue_name:
+                    shard = int(key.rsplit(":", 1)[1])
+                    if await self._park(shard, key, task_data, task_operation):
+                        continue
+                    self._busy.add(shard)
+                    task_operation["_delivery_id"] = str(shard)
+                logger.debug(f"Received task operation: {task_operation['operation']}")
+                yield task_operation
+
+    async def _park(
+        self, shard: int, key: str, task_data: str, task_operation: TaskOperation
+    ) -> bool:
+        """Put a retry popped before its run_at back at the head of its shard.
+
+        Returns:
+            True if the operation was put back, False if it should run now
+        """
+        run_at = task_operation["params"].get("run_at")
+        if task_operation["operation"] != "run" or not seconds_until_due(
+            task_operation["params"]
+        ):
+            return False
+        try:
+            await self._redis_client.lpush(key, task_data)
+        except redis.RedisError as e:
+            # Running it early beats losing it
+            logger.error(f"Failed to put back retry on shard {shard}: {e}")
+            return False
+        self._parked[shard] = float(run_at)
+        return True
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Free the shard of a handled operation for its next operation."""
+        shard = task_operation.get("_delivery_id")
+        if shard is not None:
+            self._busy.discard(int(shard))
+
+    async def release_task_operation(self, task_operation: TaskOperation) -> None:
+        """Free the shard of an operation whose handling failed.
+
+        Delivery is at-most-once, so the operation is not redelivered, but
+        the next operations of its shard are no longer held up.
+        """
+        await self.ack_task_operation(task_operation)
+
+    async def _lease_keeper(self) -> None:
+        """Renew and rebalance the leases every lease_ttl / 3 seconds."""
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                await self._maintain_leases()
+            except redis.RedisError as e:
+                logger.warning(f"Failed to renew shard leases: {e}")
+
+    async def _maintain_leases(self) -> None:
+        """Heartbeat, work out this worker's share and renew or take its leases."""
+        now = time.time()
+        ttl_ms = int(self.lease_ttl * 1000)
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.zadd(self.workers_key, {self.consumer_name: now})
+            pipe.zremrangebyscore(self.workers_key, "-inf", now - self.lease_ttl)
+            pipe.zrange(self.workers_key, 0, -1)
+            for shard in range(self.shards):
+                pipe.get(self.lease_key(shard))
+            _, _, workers, *owners = await pipe.execute()
+
+        workers = sorted(workers)
+        position = workers.index(self.consumer_name)
+        wanted = {
+            shard for shard in range(self.shards) if shard % len(workers) == position
+        }
+
+        lost = {shard for shard in self._held if owners[shard] != self.consumer_name}
+        if lost:
+            logger.warning(f"Shard leases {sorted(lost)} expired before renewal")
+            self._held -= lost
+            for shard in lost:
+                self._parked.pop(shard, None)
+        self._unwanted = self._held - wanted
+
+        free = sorted(shard for shard in wanted - self._held if owners[shard] is None)
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for shard in sorted(self._held):
+                pipe.pexpire(self.lease_key(shard), ttl_ms)
+            for shard in free:
+                pipe.set(self.lease_key(shard), self.consumer_name, nx=True, px=ttl_ms)
+            results = await pipe.execute()
+
+        taken = {shard for shard, ok in zip(free, results[len(self._held) :]) if ok}
+        if taken:
+            logger.info(f"Leased shards {sorted(taken)}")
+            self._held |= taken
+        get_metrics().set_scheduler_leased_shards(len(self._held))
+
+    async def _release(self, shards: set[int]) -> None:
+        """Hand back leases this worker still owns."""
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for shard in sorted(shards):
+                pipe.get(self.lease_key(shard))
+            owners = await pipe.execute()
+        owned = [
+            shard
+            for shard, owner in zip(sorted(shards), owners)
+            if owner == self.consumer_name
+        ]
+        if owned:
+            await self._redis_client.delete(*(self.lease_key(s) for s in owned))
+        self._held -= shards
+        self._unwanted -= shards
+        for shard in shards:
+            self._parked.pop(shard, None)
+        logger.info(f"Handed back shards {sorted(shards)}")
+        get_metrics().set_scheduler_leased_shards(len(self._held))
+
+    async def _push_task_operation(self, task_operation: TaskOperation) -> None:
+        """Queue a task operation on its shard."""
+        await self._push_task_operations([task_operation])
+
+    async def _push_task_operations(
+        self, task_operations: Sequence[TaskOperation]
+    ) -> None:
+        """Queue several task operations, one RPUSH per shard in a pipeline."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        by_key: dict[str, list[str]] = {}
+        for task_operation in task_operations:
+            by_key.setdefault(self._queue_key(task_operation), []).append(
+                self._serialize_task_operation(task_operation)
+            )
+        try:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                for key, entries in by_key.items():
+                    pipe.rpush(key, *entries)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Failed to push task operations to Redis: {e}")
+            raise
+        get_metrics().record_scheduler_batch("enqueue", len(task_operations))
+        logger.debug(f"Pushed {len(task_operations)} task operations to shards")
+
+    async def _defer_task_operations(
+        self, task_operations: Sequence[TaskOperation]
+    ) -> None:
+        """Put retries back at the head of their shard; defer other runs."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        retries: dict[str, list[str]] = {}
+        deferred = []
+        for task_operation in task_operations:
+            params = task_operation["params"]
+            if params.get("reschedules") and params.get("context_id") is not None:
+                retries.setdefault(self._queue_key(task_operation), []).append(
+                    self._serialize_task_operation(task_operation)
+                )
+            else:
+                deferred.append(task_operation)
+
+        if retries:
+            try:
+                async with self._redis_client.pipeline(transaction=False) as pipe:
+                    for key, entries in retries.items():
+                        # LPUSH reverses its arguments
+                        pipe.lpush(key, *reversed(entries))
+                    await pipe.execute()
+            except redis.RedisError as e:
+                logger.error(f"Failed to push retries to Redis: {e}")
+                raise
+            logger.debug(f"Put back {sum(map(len, retries.values()))} retries")
+        if deferred:
+            await super()._defer_task_operations(deferred)
+
+    async def _queue_lengths(self) -> list[int]:
+        """Lengths of the control list and every shard."""
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.llen(self.queue_name)
+            for shard in range(self.shards):
+                pipe.llen(self.shard_key(shard))
+            return await pipe.execute()
+
+    async def get_queue_length(self) -> int:
+        """Get the number of operations queued over all shards."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        return sum(await self._queue_lengths())
+
+    async def clear_queue(self) -> int:
+        """Delete every shard's operations. Returns how many were removed."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        length = sum(await self._queue_lengths())
+        await self._redis_client.delete(
+            self.queue_name, *(self.shard_key(shard) for shard in range(self.shards))
+        )
+        return length
@@ -0,0 +1,365 @@
+"""Redis Streams scheduler with consumer groups, acknowledgements and redelivery."""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import os
+import socket
+import time
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from bindu.server.metrics import get_metrics
+from bindu.utils.logging import get_logger
+
+from .base import TaskOperation
+from .redis_scheduler import PayloadMode, RedisScheduler
+
+logger = get_logger("bindu.server.scheduler.redis_streams_scheduler")
+
+
+class RedisStreamsScheduler(RedisScheduler):
+    """A Redis scheduler with at-least-once delivery.
+
+    Operations are appended to a stream with XADD and read through a consumer
+    group with XREADGROUP, so every worker sharing the group gets a disjoint
+    share of them. A delivered operation stays in the group's pending entries
+    list until the worker acknowledges it (XACK) after handling it. If the
+    worker dies first, the operation is reclaimed by another consumer with
+    XAUTOCLAIM once it has been idle for claim_idle_timeout seconds.
+
+    While operations are being handled, their consumer periodically resets
+    their idle time, so long-running tasks are not taken away from a live
+    worker. Acknowledged entries are deleted from the stream, which therefore
+    only holds pending and undelivered operations.
+
+    A reclaimed run operation may execute a second time; handlers see the
+    task's current state in storage and should treat it accordingly. Its
+    delivery count travels as _attempts, so workers can dead-letter an
+    operation that keeps taking its consumer down.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        queue_name: str = "bindu:tasks",
+        group_name: str = "bindu:workers",
+        consumer_name: str | None = None,
+        max_connections: int = 10,
+        retry_on_timeout: bool = True,
+        poll_timeout: int = 1,
+        batch_size: int = 1,
+        payload_mode: PayloadMode = "full",
+        claim_idle_timeout: float = 60.0,
+    ):
+        """Initialize Redis Streams scheduler.
+
+        Args:
+            redis_url: Redis URL (redis://[password@]host:port/db)
+            queue_name: Prefix of the stream key ("<queue_name>:stream")
+            group_name: Consumer group shared by all workers
+            consumer_name: Name of this consumer (default: host-pid-random)
+            max_connections: Maximum Redis connection pool size
+            retry_on_timeout: Whether to retry on Redis timeout
+            poll_timeout: Seconds XREADGROUP blocks waiting for new operations
+            batch_size: Maximum operations read per XREADGROUP
+            payload_mode: "full" or "reference" (see RedisScheduler)
+            claim_idle_timeout: Seconds an unacknowledged operation may stay idle
+                before another consumer reclaims it
+        """
+        super().__init__(
+            redis_url=redis_url,
+            queue_name=queue_name,
+            max_connections=max_connections,
+            retry_on_timeout=retry_on_timeout,
+            poll_timeout=poll_timeout,
+            batch_size=batch_size,
+            payload_mode=payload_mode,
+        )
+        # A separate key, so switching an existing deployment from the list
+        # scheduler does not hit WRONGTYPE on the old list
+        self.stream_name = f"{queue_name}:stream"
+        self.group_name = group_name
+        self.consumer_name = (
+            consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self.claim_idle_timeout = claim_idle_timeout
+        self._claim_cursor = "0-0"
+        self._in_flight: set[str] = set()
+        self._heartbeat_task: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        """Connect, create the consumer group and start the heartbeat."""
+        await super().__aenter__()
+        await self._ensure_group()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        logger.info(
+            f"Redis stream scheduler consuming {self.stream_name} "
+            f"as {self.consumer_name} in group {self.group_name}"
+        )
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop the heartbeat and close the connection pool."""
+        if self._heartbeat_task and not self._heartbeat_task.done():
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        self._heartbeat_task = None
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+    async def _ensure_group(self) -> None:
+        """Create the stream and consumer group if they do not exist yet."""
+        try:
+            await self._redis_client.xgroup_create(
+                self.stream_name, self.group_name, id="0", mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive task operations through the consumer group.
+
+        Stale operations of dead consumers are reclaimed every
+        claim_idle_timeout / 2 seconds, before new ones are read.
+        """
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        logger.info(
+            f"Starting to receive task operations from stream: {self.stream_name}"
+        )
+
+        metrics = get_metrics()
+        self._start_delayed_mover()
+        claim_interval = self.claim_idle_timeout / 2
+        next_claim = 0.0
+
+        while True:
+            try:
+                if time.monotonic() >= next_claim:
+                    next_claim = time.monotonic() + claim_interval
+                    # Claim one at a time so nothing sits claimed but unhandled
+                    while entry := await self._claim_stale():
+                        if task_operation := await self._decode_entry(*entry):
+                            yield task_operation
+                    await self.get_consumer_lag()
+
+                response = await self._redis_client.xreadgroup(
+                    self.group_name,
+                    self.consumer_name,
+                    {self.stream_name: ">"},
+                    count=self.batch_size,
+                    block=self.poll_timeout * 1000,
+                )
+                entries = self._stream_entries(response)
+                if not entries:
+                    continue
+                metrics.record_scheduler_batch("dequeue", len(entries))
+
+                # Decode the whole batch first so every entry is heartbeated
+                # while it waits for the worker
+                batch = [await self._decode_entry(*entry) for entry in entries]
+                for task_operation in batch:
+                    if task_operation:
+                        yield task_operation
+
+            except redis.ResponseError as e:
+                if "NOGROUP" in str(e):
+                    # Stream or group was deleted (e.g. clear_queue elsewhere)
+                    await self._ensure_group()
+                    continue
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                continue
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                continue
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge a handled operation and delete it from the stream."""
+        entry_id = task_operation.get("_delivery_id")
+        if entry_id is None or not self._redis_client:
+            return
+
+        self._in_flight.discard(entry_id)
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.xack(self.stream_name, self.group_name, entry_id)
+            pipe.xdel(self.stream_name, entry_id)
+            await pipe.execute()
+
+    async def release_task_operation(self, task_operation: TaskOperation) -> None:
+        """Stop claiming an operation whose handling failed, leaving it pending.
+
+        Another consumer (or this one) claims it again once it has been idle
+        for claim_idle_timeout.
+        """
+        entry_id = task_operation.get("_delivery_id")
+        if entry_id is not None:
+            self._in_flight.discard(entry_id)
+
+    async def _claim_stale(self) -> tuple[str, dict[str, str] | None, int] | None:
+        """Take over one operation left idle too long by another consumer.
+
+        Returns:
+            The entry id, fields and number of deliveries, or None
+        """
+        next_cursor, entries, *_ = await self._redis_client.xautoclaim(
+            self.stream_name,
+            self.group_name,
+            self.consumer_name,
+            min_idle_time=int(self.claim_idle_timeout * 1000),
+            start_id=self._claim_cursor,
+            count=1,
+        )
+        self._claim_cursor = next_cursor
+        if not entries:
+            self._claim_cursor = "0-0"
+            return None
+
+        entry_id, fields = entries[0]
+        pending = await self._redis_client.xpending_range(
+            self.stream_name, self.group_name, min=entry_id, max=entry_id, count=1
+        )
+        attempts = pending[0]["times_delivered"] if pending else 2
+        logger.warning(
+            f"Reclaimed stale task operation {entry_id} (delivery {attempts})"
+        )
+        return entry_id, fields, attempts
+
+    async def _decode_entry(
+        self, entry_id: str, fields: dict[str, str] | None, attempts: int = 1
+    ) -> TaskOperation | None:
+        """Turn a stream entry into a task operation.
+
+        Entries that cannot be decoded are dead-lettered and acknowledged,
+        otherwise they would be reclaimed forever.
+        """
+        try:
+            task_operation = self._deserialize_task_operation(fields["data"])
+        except Exception as e:
+            logger.error(f"Dropping undecodable task operation {entry_id}: {e}")
+            await self._dead_letter_undecodable((fields or {}).get("data", ""), e)
+            await self.ack_task_operation({"_delivery_id": entry_id})  # type: ignore[typeddict-item]
+            return None
+
+        task_operation["_delivery_id"] = entry_id
+        task_operation["_attempts"] = attempts
+        self._in_flight.add(entry_id)
+        logger.debug(f"Received task operation: {task_operation['operation']}")
+        return task_operation
+
+    @staticmethod
+    def _stream_entries(response: Any) -> list[tuple[str, dict[str, str]]]:
+        """Flatten an XREADGROUP reply ([[stream, entries], ...]) into entries."""
+        return [entry for _, entries in response or [] for entry in entries]
+
+    async def _heartbeat(self) -> None:
+        """Reset the idle time of operations this consumer is still handling."""
+        while True:
+            try:
+                await asyncio.sleep(self.claim_idle_timeout / 3)
+                if self._in_flight and self._redis_client:
+                    await self._redis_client.xclaim(
+                        self.stream_name,
+                        self.group_name,
+                        self.consumer_name,
+                        min_idle_time=0,
+                        message_ids=list(self._in_flight),
+                        justid=True,
+                    )
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in stream heartbeat: {e}", exc_info=True)
+
+    async def _push_task_operation(self, task_operation: TaskOperation) -> None:
+        """Append a task operation to the stream."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        try:
+            serialized_task = self._serialize_task_operation(task_operation)
+            await self._redis_client.xadd(self.stream_name, {"data": serialized_task})
+            get_metrics().record_scheduler_batch("enqueue", 1)
+            logger.debug(
+                f"Added task operation to stream: {task_operation['operation']}"
+            )
+        except redis.RedisError as e:
+            logger.error(f"Failed to add task operation to Redis stream: {e}")
+            raise
+
+    async def _push_task_operations(
+        self, task_operations: Sequence[TaskOperation]
+    ) -> None:
+        """Append several task operations to the stream in one pipeline."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        serialized_tasks = [
+            self._serialize_task_operation(op) for op in task_operations
+        ]
+        try:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                for serialized_task in serialized_tasks:
+                    pipe.xadd(self.stream_name, {"data": serialized_task})
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Failed to add task operations to Redis stream: {e}")
+            raise
+        get_metrics().record_scheduler_batch("enqueue", len(serialized_tasks))
+        logger.debug(f"Added {len(serialized_tasks)} task operations to stream")
+
+    async def get_consumer_lag(self) -> dict[str, int]:
+        """Report how far the consumer group is behind and export it as metrics.
+
+        Returns:
+            Dict with "pending" (delivered, not acknowledged) and "lag"
+            (not yet delivered) operation counts
+        """
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        length = await self._redis_client.xlen(self.stream_name)
+        summary = await self._redis_client.xpending(self.stream_name, self.group_name)
+        pending = int(summary["pending"])
+        # Acknowledged entries are deleted, so the rest of the stream is undelivered
+        lag = max(length - pending, 0)
+
+        get_metrics().set_scheduler_stream_lag(pending, lag)
+        return {"pending": pending, "lag": lag}
+
+    async def get_queue_length(self) -> int:
+        """Get the number of pending and undelivered operations in the stream."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        return await self._redis_client.xlen(self.stream_name)
+
+    async def clear_queue(self) -> int:
+        """Delete all operations, pending ones included. Returns how many."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        length = await self._redis_client.xlen(self.stream_name)
+        await self._redis_client.delete(self.stream_name)
+        self._in_flight.clear()
+        await self._ensure_group()
+        return length
@@ -38,7 +38,7 @@ AVAILABLE STORAGE OPTIONS:
 from __future__ import annotations as _annotations
 
 # Export the base storage interface
-from .base import Storage
+from .base import ContextHistory, Storage
 
 # Export all storage implementations
 from .memory_storage import InMemoryStorage
@@ -47,7 +47,16 @@ from .memory_storage import InMemoryStorage
 from .factory import create_storage, close_storage
 
 # Export SQLAlchemy schema (tables, not models)
-from .schema import contexts_table, metadata, task_feedback_table, tasks_table
+from .schema import (
+    context_messages_table,
+    contexts_table,
+    metadata,
+    task_artifacts_table,
+    task_feedback_table,
+    task_messages_table,
+    task_operations_table,
+    tasks_table,
+)
 
 # Conditional import of PostgresStorage (requires SQLAlchemy)
 try:
@@ -58,6 +67,7 @@ except ImportError:
 __all__ = [
     # Base interface
     "Storage",
+    "ContextHistory",
     # Storage implementations
     "InMemoryStorage",
     "PostgresStorage",
@@ -68,5 +78,9 @@ __all__ = [
     "metadata",
     "tasks_table",
     "contexts_table",
+    "context_messages_table",
     "task_feedback_table",
+    "task_messages_table",
+    "task_artifacts_table",
+    "task_operations_table",
 ]
@@ -3,7 +3,7 @@
 from __future__ import annotations as _annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic
+from typing import Any, Generic, NamedTuple
 from uuid import UUID
 
 from typing_extensions import TypeVar
@@ -19,6 +19,19 @@ from bindu.common.protocol.types import (
 ContextT = TypeVar("ContextT", default=Any)
 
 
+class ContextHistory(NamedTuple):
+    """Part of a context's materialized chat history, from load_context_history."""
+
+    messages: list[dict[str, str]]
+    """Chat messages numbered after the requested sequence, in order."""
+
+    first_seq: int
+    """Number of the context's first stored message (0 if there is none)."""
+
+    last_seq: int
+    """Number of the last message returned (the requested one if none was)."""
+
+
 class Storage(ABC, Generic[ContextT]):
     """Abstract storage interface for A2A protocol task and context management.
 
@@ -33,6 +46,11 @@ class Storage(ABC, Generic[ContextT]):
     - Context continuity: append_to_contexts() for incremental message history
     - Task refinements: list_tasks_by_context() to build conversation from related tasks
 
+    Projection:
+    - load_task(), list_tasks() and list_tasks_by_context() accept history_length,
+      include_history and include_artifacts so backends only fetch what the
+      caller needs. Parts left out are omitted from the returned Task.
+
     Type Parameters:
         ContextT: Custom context type for agent-specific implementations
     """
@@ -43,13 +61,20 @@ class Storage(ABC, Generic[ContextT]):
 
     @abstractmethod
     async def load_task(
-        self, task_id: UUID, history_length: int | None = None
+        self,
+        task_id: UUID,
+        history_length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task | None:
         """Load a task from storage.
 
         Args:
             task_id: Unique identifier of the task
             history_length: Optional limit on message history length
+            include_history: Whether to fetch the message history
+            include_artifacts: Whether to fetch the artifacts
 
         Returns:
             Task object if found, None otherwise
@@ -90,11 +115,34 @@ class Storage(ABC, Generic[ContextT]):
         """
 
     @abstractmethod
-    async def list_tasks(self, length: int | None = None) -> list[Task]:
+    async def withdraw_message(self, task_id: UUID, message_id: UUID) -> None:
+        """Take back the message a submit_task appended, when its run was not queued.
+
+        The message is removed if it is still the task's last one, and the
+        task is left input-required, so the client can send it again with
+        the same task ID.
+
+        Args:
+            task_id: Task the message was submitted to
+            message_id: ID of the submitted message
+        """
+
+    @abstractmethod
+    async def list_tasks(
+        self,
+        length: int | None = None,
+        *,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> list[Task]:
         """List all tasks in storage.
 
         Args:
             length: Optional limit on number of tasks to return (most recent)
+            history_length: Optional limit on message history length per task
+            include_history: Whether to fetch message histories
+            include_artifacts: Whether to fetch artifacts
 
         Returns:
             List of tasks
@@ -110,20 +158,29 @@ class Storage(ABC, Generic[ContextT]):
             Count of matching tasks
         """
         # Default inefficient implementation - override in subclasses
-        tasks = await self.list_tasks()
+        tasks = await self.list_tasks(include_history=False, include_artifacts=False)
         if status:
             return sum(1 for t in tasks if t["status"]["state"] == status)
         return len(tasks)
 
     @abstractmethod
     async def list_tasks_by_context(
-        self, context_id: UUID, length: int | None = None
+        self,
+        context_id: UUID,
+        length: int | None = None,
+        *,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> list[Task]:
         """List tasks belonging to a specific context.
 
         Args:
             context_id: Context to filter tasks by
             length: Optional limit on number of tasks to return (most recent)
+            history_length: Optional limit on message history length per task
+            include_history: Whether to fetch message histories
+            include_artifacts: Whether to fetch artifacts
 
         Returns:
             List of tasks in the context
@@ -229,6 +286,68 @@ class Storage(ABC, Generic[ContextT]):
         # Optional - override in subclass if feedback retrieval is needed
         return None
 
+    # -------------------------------------------------------------------------
+    # Context History Operations (Optional)
+    # -------------------------------------------------------------------------
+
+    async def load_context_history(
+        self, context_id: UUID, after_seq: int = 0
+    ) -> ContextHistory | None:
+        """Load the materialized chat history of a context.
+
+        Optional operation - used by workers to avoid rebuilding context-based
+        history from every earlier task on each run.
+
+        Messages are numbered with increasing sequences that are never reused,
+        even after the history is cleared, so a reader holding the messages up
+        to some sequence fetches only the ones after it, and detects a history
+        that was replaced by its different first_seq.
+
+        Args:
+            context_id: Context to load history for
+            after_seq: Return only the messages numbered after this one
+
+        Returns:
+            The messages after after_seq, or None if the history was never
+            initialized (see init_context_history)
+        """
+        # Optional - override in subclass to persist materialized history
+        return None
+
+    async def append_context_history(
+        self, context_id: UUID, task_id: UUID, messages: list[dict[str, str]]
+    ) -> None:
+        """Append a finished task's chat messages to its context's history.
+
+        Idempotent per task: the messages of a task already in the history
+        are not added again.
+
+        Args:
+            context_id: Context to update
+            task_id: Task the messages come from
+            messages: Chat messages ({"role", "content"}) to append
+        """
+        # Optional - override in subclass to persist materialized history
+        pass
+
+    async def init_context_history(
+        self,
+        context_id: UUID,
+        task_histories: list[tuple[UUID, list[dict[str, str]]]],
+    ) -> None:
+        """Fill a context's history from its finished tasks and mark it initialized.
+
+        Appends the messages of each task not in the history yet, in order, so
+        concurrent rebuilds, and tasks finishing during one, never duplicate
+        a turn. A task appended while the rebuild ran stays ahead of it.
+
+        Args:
+            context_id: Context to initialize
+            task_histories: (task_id, chat messages) of each finished task
+        """
+        # Optional - override in subclass to persist materialized history
+        pass
+
     # -------------------------------------------------------------------------
     # Webhook Persistence Operations (for long-running tasks)
     # -------------------------------------------------------------------------
@@ -67,7 +67,14 @@ async def create_storage(did: str | None = None) -> Storage:
 
     if backend == "memory":
         logger.info("Using in-memory storage (non-persistent)")
-        return InMemoryStorage()
+        memory_storage = InMemoryStorage(
+            max_tasks=app_settings.storage.memory_max_tasks,
+            max_bytes=app_settings.storage.memory_max_bytes,
+            task_ttl=app_settings.storage.memory_task_ttl,
+            sweep_interval=app_settings.storage.memory_sweep_interval,
+        )
+        await memory_storage.start_sweeper()
+        return memory_storage
 
     elif backend == "postgres":
         if not POSTGRES_AVAILABLE or PostgresStorage is None:
@@ -122,5 +129,7 @@ async def close_storage(storage: Storage) -> None:
     ):
         await storage.disconnect()
         logger.info("PostgreSQL storage connection closed")
+    elif isinstance(storage, InMemoryStorage):
+        await storage.stop_sweeper()
     else:
         logger.debug(f"Storage {type(storage).__name__} does not require cleanup")
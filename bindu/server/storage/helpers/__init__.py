@@ -1,15 +1,17 @@
-"""Helper utilities for PostgreSQL storage operations.
+"""Helper utilities for storage operations.
 
 This package provides reusable helper functions for:
 - UUID validation and normalization
 - JSONB serialization
 - Security (password masking, SQL injection prevention)
 - Database operations (timestamps, JSONB preparation)
+- Read-only snapshots for copy-on-write in-memory storage
 """
 
 from .normalization import normalize_message_uuids, normalize_uuid
 from .security import mask_database_url, sanitize_identifier
 from .serialization import serialize_for_jsonb
+from .snapshot import FrozenDict, FrozenList, freeze, thaw
 from .validation import validate_uuid_type
 
 __all__ = [
@@ -19,4 +21,8 @@ __all__ = [
     "sanitize_identifier",
     "serialize_for_jsonb",
     "validate_uuid_type",
+    "FrozenDict",
+    "FrozenList",
+    "freeze",
+    "thaw",
 ]
@@ -0,0 +1,118 @@
+"""Read-only snapshots for copy-on-write in-memory storage.
+
+Stored tasks are deeply frozen once, when they are written. Loads then hand
+out the frozen structures directly instead of deep-copying them, and every
+write builds a new snapshot that shares the unchanged parts with the old one.
+
+FrozenDict and FrozenList subclass dict and list, so JSON encoding, pydantic
+validation and equality checks behave exactly as with plain containers; only
+in-place mutation raises TypeError.
+"""
+
+from typing import Any, NoReturn
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"'{type(self).__name__}' is a read-only storage snapshot; "
+        "copy it (dict(...), list(...) or copy.deepcopy) before modifying"
+    )
+
+
+class FrozenDict(dict):
+    """A dict that rejects in-place mutation."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> dict:
+        """Return a mutable shallow copy."""
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        """Return a fully mutable deep copy."""
+        return thaw(self)
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain dict."""
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """A list that rejects in-place mutation."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    clear = _read_only
+    sort = _read_only
+    reverse = _read_only
+
+    def __copy__(self) -> list:
+        """Return a mutable shallow copy."""
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        """Return a fully mutable deep copy."""
+        return thaw(self)
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain list."""
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only snapshots.
+
+    Already-frozen values are returned as-is, so re-freezing a structure that
+    embeds an earlier snapshot only costs the new parts.
+
+    Args:
+        value: Object to freeze (dict, list, tuple, or any immutable value)
+
+    Returns:
+        Frozen equivalent of value
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a snapshot back into plain mutable containers.
+
+    Args:
+        value: Object to thaw
+
+    Returns:
+        Mutable deep copy of value
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return value
@@ -16,8 +16,13 @@ Note: All data is lost when the application stops. Use persistent storage for pr
 
 from __future__ import annotations as _annotations
 
-import copy
+import asyncio
+import json
+import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any, cast
 from uuid import UUID
 
@@ -31,11 +36,13 @@ from bindu.common.protocol.types import (
     TaskState,
     TaskStatus,
 )
+from bindu.server.metrics import get_metrics
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_storage_operation
 
-from .base import Storage
+from .base import ContextHistory, Storage
+from .helpers import FrozenDict, freeze
 
 logger = get_logger("bindu.server.storage.memory_storage")
 
@@ -46,30 +53,89 @@ class InMemoryStorage(Storage[ContextT]):
     """In-memory storage implementation for tasks and contexts.
 
     Storage Structure:
-    - tasks: Dict[UUID, Task] - All tasks indexed by task_id
+    - tasks: Dict[UUID, Task] - Read-only task snapshots indexed by task_id
     - contexts: Dict[UUID, list[UUID]] - Task IDs grouped by context_id
     - task_feedback: Dict[UUID, List[dict]] - Optional feedback storage
+    - context_histories: Dict[UUID, list[(seq, dict)]] - Materialized chat history
+      per context, numbered from one counter shared by all contexts
+
+    Indexes maintained on every write, so reads never scan all tasks:
+    - tasks and contexts keep creation order, so most-recent-N is read from the end
+    - contexts holds each context's task IDs in creation order
+    - _state_counts: Counter[str] - number of tasks in each state
+
+    Copy-on-write: stored tasks are frozen snapshots (see helpers.snapshot).
+    Reads return a fresh top-level dict over the shared snapshot instead of a
+    deep copy, and writes replace the snapshot, reusing unchanged parts.
+    Nested values in a loaded task raise TypeError if mutated in place.
+
+    Eviction: with max_tasks, max_bytes or task_ttl set, a background sweep
+    (start_sweeper) drops terminal tasks that outlived the TTL, then the least
+    recently used terminal tasks until the limits hold. Tasks that are still
+    running are never evicted, so the limits are soft while they dominate.
+    Sizes are only estimated while max_bytes is set; they cover task history,
+    artifacts and context histories, which are freed with their context's last
+    task.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_tasks: int = 0,
+        max_bytes: int = 0,
+        task_ttl: float = 0,
+        sweep_interval: float = 60.0,
+    ):
         """Initialize in-memory storage.
 
-        Note: This is an __init__ method.
+        Args:
+            max_tasks: Tasks to keep before evicting terminal ones (0 = unlimited)
+            max_bytes: Estimated task and context history and artifact bytes to
+                keep (0 = unlimited, and sizes are not estimated)
+            task_ttl: Seconds to keep a task after it reaches a terminal state
+                (0 = forever)
+            sweep_interval: Seconds between background eviction sweeps
         """
         self.tasks: dict[UUID, Task] = {}
         self.contexts: dict[UUID, list[UUID]] = {}
         self.task_feedback: dict[UUID, list[dict[str, Any]]] = {}
+        self.context_histories: dict[UUID, list[tuple[int, dict[str, str]]]] = {}
+        # Tasks whose messages are in each history, and initialized histories
+        self._history_tasks: dict[UUID, set[UUID]] = {}
+        self._history_ready: set[UUID] = set()
+        self._history_seq = 0
         self._webhook_configs: dict[UUID, PushNotificationConfig] = {}
+        self._state_counts: Counter[str] = Counter()
+
+        self.max_tasks = max_tasks
+        self.max_bytes = max_bytes
+        self.task_ttl = task_ttl
+        self.sweep_interval = sweep_interval
+        # Eviction bookkeeping: estimated size per task and per context
+        # history, and terminal tasks by the time they finished (for TTL) and
+        # by last access (for LRU)
+        self._task_sizes: dict[UUID, int] = {}
+        self._history_sizes: dict[UUID, int] = {}
+        self._total_bytes = 0
+        self._terminal_since: OrderedDict[UUID, float] = OrderedDict()
+        self._terminal_lru: OrderedDict[UUID, None] = OrderedDict()
+        self._sweep_task: asyncio.Task | None = None
 
     @retry_storage_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def load_task(
-        self, task_id: UUID, history_length: int | None = None
+        self,
+        task_id: UUID,
+        history_length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task | None:
         """Load a task from memory.
 
         Args:
             task_id: Unique identifier of the task
             history_length: Optional limit on message history length
+            include_history: Whether to include the message history
+            include_artifacts: Whether to include the artifacts
 
         Returns:
             Task object if found, None otherwise
@@ -77,18 +143,15 @@ class InMemoryStorage(Storage[ContextT]):
         if not isinstance(task_id, UUID):
             raise TypeError(f"task_id must be UUID, got {type(task_id).__name__}")
 
-        task = self.tasks.get(task_id)
-        if task is None:
+        snapshot = self.tasks.get(task_id)
+        if snapshot is None:
             return None
 
-        # Always return a deep copy to prevent mutations affecting stored task
-        task_copy = cast(Task, copy.deepcopy(task))
-
-        # Limit history if requested
-        if history_length is not None and history_length > 0 and "history" in task:
-            task_copy["history"] = task["history"][-history_length:]
-
-        return task_copy
+        if task_id in self._terminal_lru:
+            self._terminal_lru.move_to_end(task_id)
+        return self._task_view(
+            snapshot, history_length, include_history, include_artifacts
+        )
 
     @retry_storage_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def submit_task(self, context_id: UUID, message: Message) -> Task:
@@ -174,16 +237,16 @@ class InMemoryStorage(Storage[ContextT]):
                 f"Continuing existing task {task_id} from state '{current_state}'"
             )
 
-            if "history" not in existing_task:
-                existing_task["history"] = []
-            existing_task["history"].append(message)
-
             # Reset to submitted state for re-execution
-            existing_task["status"] = TaskStatus(
-                state="submitted", timestamp=datetime.now(timezone.utc).isoformat()
+            self._add_size(task_id, message)
+            snapshot = self._replace_task(
+                existing_task,
+                history=[*existing_task.get("history", []), freeze(message)],
+                status=TaskStatus(
+                    state="submitted", timestamp=datetime.now(timezone.utc).isoformat()
+                ),
             )
-
-            return existing_task
+            return self._task_view(snapshot)
 
         # Task doesn't exist - create new task
         task_status = TaskStatus(
@@ -196,14 +259,18 @@ class InMemoryStorage(Storage[ContextT]):
             status=task_status,
             history=[message],
         )
-        self.tasks[task_id] = task
+        snapshot = freeze(task)
+        self.tasks[task_id] = snapshot
+        self._state_counts["submitted"] += 1
+        self._task_sizes[task_id] = 0
+        self._add_size(task_id, message)
 
         # Add task to context
         if context_id not in self.contexts:
             self.contexts[context_id] = []
         self.contexts[context_id].append(task_id)
 
-        return task
+        return self._task_view(snapshot)
 
     @retry_storage_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def update_task(
@@ -241,34 +308,119 @@ class InMemoryStorage(Storage[ContextT]):
             raise KeyError(f"Task {task_id} not found")
 
         task = self.tasks[task_id]
-        task["status"] = TaskStatus(
-            state=state, timestamp=datetime.now(timezone.utc).isoformat()
-        )
+        changes: dict[str, Any] = {
+            "status": TaskStatus(
+                state=state, timestamp=datetime.now(timezone.utc).isoformat()
+            )
+        }
 
         if metadata:
-            if "metadata" not in task:
-                task["metadata"] = {}
-            task["metadata"].update(metadata)
+            changes["metadata"] = {**task.get("metadata", {}), **metadata}
 
         if new_artifacts:
-            if "artifacts" not in task:
-                task["artifacts"] = []
-            task["artifacts"].extend(new_artifacts)
+            changes["artifacts"] = [*task.get("artifacts", []), *new_artifacts]
+            self._add_size(task_id, new_artifacts)
 
         if new_messages:
-            if "history" not in task:
-                task["history"] = []
             # Add IDs to messages for consistency
+            stamped_messages = []
             for message in new_messages:
                 if not isinstance(message, dict):
                     raise TypeError(
                         f"Message must be dict, got {type(message).__name__}"
                     )
-                message["task_id"] = task_id
-                message["context_id"] = task["context_id"]
-                task["history"].append(message)
+                stamped_messages.append(
+                    {**message, "task_id": task_id, "context_id": task["context_id"]}
+                )
+            changes["history"] = [*task.get("history", []), *stamped_messages]
+            self._add_size(task_id, stamped_messages)
+
+        self._track_state(task_id, state)
+        return self._task_view(self._replace_task(task, **changes))
+
+    async def withdraw_message(self, task_id: UUID, message_id: UUID) -> None:
+        """Take back the message a submit_task appended, when its run was not queued.
+
+        Args:
+            task_id: Task the message was submitted to
+            message_id: ID of the submitted message
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        if not isinstance(task_id, UUID):
+            raise TypeError(f"task_id must be UUID, got {type(task_id).__name__}")
+
+        task = self.tasks.get(task_id)
+        if task is None:
+            return
+        history = task.get("history", [])
+        if not history or history[-1].get("message_id") != message_id:
+            return
+
+        if self.max_bytes:
+            size = len(json.dumps(history[-1], default=str))
+            self._task_sizes[task_id] = self._task_sizes.get(task_id, 0) - size
+            self._total_bytes -= size
+        self._replace_task(
+            task,
+            history=history[:-1],
+            status=TaskStatus(
+                state="input-required",
+                timestamp=datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+
+    def _replace_task(self, task: Task, **changes: Any) -> Task:
+        """Store a new snapshot of a task with some top-level fields replaced.
+
+        Unchanged fields, and already-frozen items inside changed ones, are
+        shared with the previous snapshot rather than copied.
+
+        Args:
+            task: Current snapshot
+            **changes: Top-level fields to replace
 
-        return task
+        Returns:
+            The new snapshot
+        """
+        snapshot = cast(Task, FrozenDict({**task, **freeze(changes)}))
+        self.tasks[task["id"]] = snapshot
+        if "status" in changes:
+            self._state_counts[task["status"]["state"]] -= 1
+            self._state_counts[snapshot["status"]["state"]] += 1
+        return snapshot
+
+    @staticmethod
+    def _task_view(
+        snapshot: Task,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> Task:
+        """Return a caller-owned view of a stored snapshot.
+
+        The top-level dict is new, so callers may add or replace fields, while
+        nested values are the shared read-only snapshot. This makes a load O(1)
+        in the size of the task instead of a deep copy.
+
+        Args:
+            snapshot: Stored task snapshot
+            history_length: Optional limit on message history length
+            include_history: Whether to keep the message history
+            include_artifacts: Whether to keep the artifacts
+
+        Returns:
+            Task view
+        """
+        view = cast(Task, dict(snapshot))
+        if not include_history:
+            view.pop("history", None)
+        elif history_length is not None and history_length > 0 and "history" in view:
+            view["history"] = snapshot["history"][-history_length:]
+        if not include_artifacts:
+            view.pop("artifacts", None)
+        return view
 
     async def update_context(self, context_id: UUID, context: ContextT) -> None:
         """Store or update context metadata.
@@ -329,21 +481,34 @@ class InMemoryStorage(Storage[ContextT]):
 
             self.contexts[context_id] = []
 
-    async def list_tasks(self, length: int | None = None) -> list[Task]:
+    async def list_tasks(
+        self,
+        length: int | None = None,
+        *,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> list[Task]:
         """List all tasks in storage.
 
         Args:
             length: Optional limit on number of tasks to return (most recent)
+            history_length: Optional limit on message history length per task
+            include_history: Whether to include message histories
+            include_artifacts: Whether to include artifacts
 
         Returns:
             List of tasks
         """
-        if length is None:
-            return list(self.tasks.values())
-
-        # Optimize: Only convert to list what we need
-        all_tasks = list(self.tasks.values())
-        return all_tasks[-length:] if length < len(all_tasks) else all_tasks
+        selected: Any = self.tasks.values()
+        if length is not None and length > 0:
+            # Walk back from the newest task so only `length` tasks are touched
+            selected = reversed(list(islice(reversed(selected), length)))
+
+        return [
+            self._task_view(task, history_length, include_history, include_artifacts)
+            for task in selected
+        ]
 
     async def count_tasks(self, status: str | None = None) -> int:
         """Count number of tasks, optionally filtered by status.
@@ -357,10 +522,16 @@ class InMemoryStorage(Storage[ContextT]):
         if status is None:
             return len(self.tasks)
 
-        return sum(1 for t in self.tasks.values() if t["status"]["state"] == status)
+        return self._state_counts[status]
 
     async def list_tasks_by_context(
-        self, context_id: UUID, length: int | None = None
+        self,
+        context_id: UUID,
+        length: int | None = None,
+        *,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> list[Task]:
         """List tasks belonging to a specific context.
 
@@ -369,6 +540,9 @@ class InMemoryStorage(Storage[ContextT]):
         Args:
             context_id: Context to filter tasks by
             length: Optional limit on number of tasks to return (most recent)
+            history_length: Optional limit on message history length per task
+            include_history: Whether to include message histories
+            include_artifacts: Whether to include artifacts
 
         Returns:
             List of tasks in the context
@@ -379,15 +553,18 @@ class InMemoryStorage(Storage[ContextT]):
         if not isinstance(context_id, UUID):
             raise TypeError(f"context_id must be UUID, got {type(context_id).__name__}")
 
-        # Get task IDs from context
+        # Get task IDs from context, slicing before loading anything
         task_ids = self.contexts.get(context_id, [])
-        tasks: list[Task] = [
-            self.tasks[task_id] for task_id in task_ids if task_id in self.tasks
-        ]
+        if length is not None and length > 0:
+            task_ids = task_ids[-length:]
 
-        if length is not None and length > 0 and length < len(tasks):
-            return tasks[-length:]
-        return tasks
+        return [
+            self._task_view(
+                self.tasks[task_id], history_length, include_history, include_artifacts
+            )
+            for task_id in task_ids
+            if task_id in self.tasks
+        ]
 
     async def list_contexts(self, length: int | None = None) -> list[dict[str, Any]]:
         """List all contexts in storage.
@@ -398,15 +575,15 @@ class InMemoryStorage(Storage[ContextT]):
         Returns:
             List of context objects with task counts
         """
-        contexts = [
+        items: Any = self.contexts.items()
+        if length is not None and length > 0:
+            items = reversed(list(islice(reversed(items), length)))
+
+        return [
             {"context_id": ctx_id, "task_count": len(task_ids), "task_ids": task_ids}
-            for ctx_id, task_ids in self.contexts.items()
+            for ctx_id, task_ids in items
         ]
 
-        if length is not None and length > 0 and length < len(contexts):
-            return contexts[-length:]
-        return contexts
-
     async def clear_context(self, context_id: UUID) -> None:
         """Clear all tasks associated with a specific context.
 
@@ -432,13 +609,14 @@ class InMemoryStorage(Storage[ContextT]):
         # Remove all tasks associated with this context
         for task_id in task_ids:
             if task_id in self.tasks:
-                del self.tasks[task_id]
+                self._forget_task(self.tasks.pop(task_id))
             # Also clear feedback for these tasks
             if task_id in self.task_feedback:
                 del self.task_feedback[task_id]
 
         # Remove the context itself
         del self.contexts[context_id]
+        self._drop_context_history(context_id)
 
         logger.info(f"Cleared context {context_id}: removed {len(task_ids)} tasks")
 
@@ -450,7 +628,16 @@ class InMemoryStorage(Storage[ContextT]):
         self.tasks.clear()
         self.contexts.clear()
         self.task_feedback.clear()
+        self.context_histories.clear()
+        self._history_tasks.clear()
+        self._history_ready.clear()
         self._webhook_configs.clear()
+        self._state_counts.clear()
+        self._task_sizes.clear()
+        self._history_sizes.clear()
+        self._total_bytes = 0
+        self._terminal_since.clear()
+        self._terminal_lru.clear()
 
     async def store_task_feedback(
         self, task_id: UUID, feedback_data: dict[str, Any]
@@ -493,6 +680,245 @@ class InMemoryStorage(Storage[ContextT]):
 
         return self.task_feedback.get(task_id)
 
+    # -------------------------------------------------------------------------
+    # Context History Operations
+    # -------------------------------------------------------------------------
+
+    async def load_context_history(
+        self, context_id: UUID, after_seq: int = 0
+    ) -> ContextHistory | None:
+        """Load the materialized chat history of a context.
+
+        Args:
+            context_id: Context to load history for
+            after_seq: Return only the messages numbered after this one
+
+        Returns:
+            Copy of the messages after after_seq, or None if the history was
+            never initialized
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        if not isinstance(context_id, UUID):
+            raise TypeError(f"context_id must be UUID, got {type(context_id).__name__}")
+
+        if context_id not in self._history_ready:
+            return None
+
+        rows = self.context_histories.get(context_id, [])
+        start = bisect_right(rows, after_seq, key=lambda row: row[0])
+        return ContextHistory(
+            messages=[dict(message) for _, message in rows[start:]],
+            first_seq=rows[0][0] if rows else 0,
+            last_seq=rows[-1][0] if start < len(rows) else after_seq,
+        )
+
+    async def append_context_history(
+        self, context_id: UUID, task_id: UUID, messages: list[dict[str, str]]
+    ) -> None:
+        """Append a finished task's chat messages to its context's history.
+
+        Args:
+            context_id: Context to update
+            task_id: Task the messages come from
+            messages: Chat messages to append
+
+        Raises:
+            TypeError: If context_id is not UUID or messages is not a list
+        """
+        if not isinstance(context_id, UUID):
+            raise TypeError(f"context_id must be UUID, got {type(context_id).__name__}")
+
+        if not isinstance(messages, list):
+            raise TypeError(f"messages must be list, got {type(messages).__name__}")
+
+        recorded = self._history_tasks.setdefault(context_id, set())
+        if task_id in recorded:
+            return
+        recorded.add(task_id)
+
+        rows = self.context_histories.setdefault(context_id, [])
+        for message in messages:
+            self._history_seq += 1
+            rows.append((self._history_seq, dict(message)))
+
+        if self.max_bytes:
+            size = len(json.dumps(messages, default=str))
+            self._history_sizes[context_id] = (
+                self._history_sizes.get(context_id, 0) + size
+            )
+            self._total_bytes += size
+
+    async def init_context_history(
+        self,
+        context_id: UUID,
+        task_histories: list[tuple[UUID, list[dict[str, str]]]],
+    ) -> None:
+        """Fill a context's history from its finished tasks and mark it initialized.
+
+        Args:
+            context_id: Context to initialize
+            task_histories: (task_id, chat messages) of each finished task
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        if not isinstance(context_id, UUID):
+            raise TypeError(f"context_id must be UUID, got {type(context_id).__name__}")
+
+        for task_id, messages in task_histories:
+            await self.append_context_history(context_id, task_id, messages)
+        self.context_histories.setdefault(context_id, [])
+        self._history_ready.add(context_id)
+
+    def _drop_context_history(self, context_id: UUID) -> None:
+        """Forget a context's materialized history."""
+        self.context_histories.pop(context_id, None)
+        self._history_tasks.pop(context_id, None)
+        self._history_ready.discard(context_id)
+        self._total_bytes -= self._history_sizes.pop(context_id, 0)
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of stored task histories, artifacts and context histories.
+
+        Always 0 unless max_bytes is set.
+        """
+        return self._total_bytes
+
+    def _add_size(self, task_id: UUID, value: Any) -> None:
+        """Add the estimated serialized size of new task content.
+
+        Args:
+            task_id: Task the content belongs to
+            value: Message, artifacts or messages being stored
+        """
+        if not self.max_bytes:
+            return
+        size = len(json.dumps(value, default=str))
+        self._task_sizes[task_id] = self._task_sizes.get(task_id, 0) + size
+        self._total_bytes += size
+
+    def _track_state(self, task_id: UUID, state: TaskState) -> None:
+        """Make a task evictable once it reaches a terminal state.
+
+        Args:
+            task_id: Task whose state changed
+            state: New task state
+        """
+        self._terminal_since.pop(task_id, None)
+        self._terminal_lru.pop(task_id, None)
+        if state in app_settings.agent.terminal_states:
+            self._terminal_since[task_id] = time.monotonic()
+            self._terminal_lru[task_id] = None
+
+    def _forget_task(self, task: Task) -> None:
+        """Drop the index and eviction bookkeeping of a removed task.
+
+        Args:
+            task: Snapshot of the task that was removed
+        """
+        task_id = task["id"]
+        self._state_counts[task["status"]["state"]] -= 1
+        self._total_bytes -= self._task_sizes.pop(task_id, 0)
+        self._terminal_since.pop(task_id, None)
+        self._terminal_lru.pop(task_id, None)
+
+    def _evict_task(self, task_id: UUID) -> None:
+        """Remove a terminal task and everything that refers to it.
+
+        A context left without tasks is removed along with its history.
+
+        Args:
+            task_id: Task to evict
+        """
+        task = self.tasks.pop(task_id)
+        self.task_feedback.pop(task_id, None)
+        self._webhook_configs.pop(task_id, None)
+        self._forget_task(task)
+
+        context_id = task["context_id"]
+        task_ids = self.contexts.get(context_id)
+        if task_ids is not None:
+            if task_id in task_ids:
+                task_ids.remove(task_id)
+            if not task_ids:
+                del self.contexts[context_id]
+                self._drop_context_history(context_id)
+
+    def _over_limit(self) -> str | None:
+        """Return the size limit currently exceeded, if any."""
+        if self.max_tasks and len(self.tasks) > self.max_tasks:
+            return "max_tasks"
+        if self.max_bytes and self._total_bytes > self.max_bytes:
+            return "max_bytes"
+        return None
+
+    def evict(self) -> int:
+        """Evict expired terminal tasks, then least recently used ones over the limits.
+
+        Returns:
+            Number of tasks evicted
+        """
+        evicted: dict[str, int] = {}
+
+        if self.task_ttl:
+            deadline = time.monotonic() - self.task_ttl
+            while self._terminal_since:
+                task_id, finished_at = next(iter(self._terminal_since.items()))
+                if finished_at > deadline:
+                    break
+                self._evict_task(task_id)
+                evicted["ttl"] = evicted.get("ttl", 0) + 1
+
+        while self._terminal_lru and (reason := self._over_limit()):
+            self._evict_task(next(iter(self._terminal_lru)))
+            evicted[reason] = evicted.get(reason, 0) + 1
+
+        metrics = get_metrics()
+        for reason, count in evicted.items():
+            metrics.increment_storage_evictions(reason, count)
+        metrics.set_storage_usage(len(self.tasks), self._total_bytes)
+
+        total = sum(evicted.values())
+        if total:
+            logger.info(f"Evicted {total} terminal tasks from memory: {evicted}")
+        return total
+
+    async def start_sweeper(self) -> None:
+        """Start the background eviction sweep if any limit is configured."""
+        if not (self.max_tasks or self.max_bytes or self.task_ttl):
+            return
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep())
+            logger.info("In-memory storage eviction sweep started")
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background eviction sweep."""
+        if self._sweep_task and not self._sweep_task.done():
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            logger.info("In-memory storage eviction sweep stopped")
+
+    async def _sweep(self) -> None:
+        """Run evict() every sweep_interval seconds."""
+        while True:
+            try:
+                await asyncio.sleep(self.sweep_interval)
+                self.evict()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in eviction sweep: {e}", exc_info=True)
+
     # -------------------------------------------------------------------------
     # Webhook Persistence Operations (for long-running tasks)
     # -------------------------------------------------------------------------
@@ -28,9 +28,19 @@ from __future__ import annotations as _annotations
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update, cast
-from sqlalchemy.dialects.postgresql import insert, JSONB, JSON
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Table, delete, func, select, true, update, cast
+from sqlalchemy.dialects.postgresql import (
+    JSON,
+    JSONB,
+    aggregate_order_by,
+    insert,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from typing_extensions import TypeVar
 
 from bindu.common.protocol.types import (
@@ -44,7 +54,7 @@ from bindu.common.protocol.types import (
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
-from .base import Storage
+from .base import ContextHistory, Storage
 from .helpers import (
     mask_database_url,
     normalize_message_uuids,
@@ -55,14 +65,20 @@ from .helpers import (
 )
 from .helpers.db_operations import get_current_utc_timestamp
 from .schema import (
+    context_messages_table,
     contexts_table,
+    task_artifacts_table,
     task_feedback_table,
+    task_messages_table,
     tasks_table,
     webhook_configs_table,
 )
 
 logger = get_logger("bindu.server.storage.postgres_storage")
 
+# Marks a task part left out of a projected select
+_NOT_SELECTED = object()
+
 ContextT = TypeVar("ContextT", default=Any)
 
 
@@ -70,8 +86,11 @@ class PostgresStorage(Storage[ContextT]):
     """PostgreSQL storage implementation using SQLAlchemy imperative mapping.
 
     Storage Structure:
-    - tasks_table: All tasks with JSONB history and artifacts
+    - tasks_table: All tasks with state and metadata
+    - task_messages_table / task_artifacts_table: History and artifacts, one row
+      per item keyed by (task_id, seq), so appends are inserts
     - contexts_table: Context metadata and message history
+    - context_messages_table: Materialized chat history, one row per message
     - task_feedback_table: Optional feedback storage
 
     Uses protocol TypedDicts directly - no ORM model classes needed.
@@ -207,6 +226,16 @@ class PostgresStorage(Storage[ContextT]):
             self._engine = None
             self._session_factory = None
 
+    @property
+    def engine(self) -> AsyncEngine:
+        """The connected engine, shared with PostgresScheduler.
+
+        Raises:
+            RuntimeError: If engine is not initialized
+        """
+        self._ensure_connected()
+        return self._engine
+
     def _ensure_connected(self) -> None:
         """Ensure engine is initialized.
 
@@ -267,32 +296,203 @@ class PostgresStorage(Storage[ContextT]):
             row: SQLAlchemy Row object
 
         Returns:
-            Task TypedDict from protocol
+            Task TypedDict from protocol, without the parts that were not selected
         """
-        return Task(
+        task = Task(
             id=row.id,
             context_id=row.context_id,
             kind=row.kind,
             status=TaskStatus(
                 state=row.state, timestamp=row.state_timestamp.isoformat()
             ),
-            history=row.history or [],
-            artifacts=row.artifacts or [],
             metadata=row.metadata or {},
         )
 
+        history = getattr(row, "history", _NOT_SELECTED)
+        if history is not _NOT_SELECTED:
+            task["history"] = history or []
+        artifacts = getattr(row, "artifacts", _NOT_SELECTED)
+        if artifacts is not _NOT_SELECTED:
+            task["artifacts"] = artifacts or []
+
+        return task
+
+    @staticmethod
+    def _aggregate_items(
+        table: Table, column: str, last: int | None = None, owner: Any = None
+    ):
+        """Build a correlated subquery folding a task's item rows into a JSONB array.
+
+        Args:
+            table: task_messages_table or task_artifacts_table
+            column: Name of the JSONB item column
+            last: Only aggregate the last N items
+            owner: Table or CTE the task rows come from (defaults to tasks_table)
+
+        Returns:
+            Scalar subquery to use as a column of a select on owner
+        """
+        owner = tasks_table if owner is None else owner
+        items = select(table.c[column], table.c.seq).where(
+            table.c.task_id == owner.c.id
+        )
+        if last is not None and last > 0:
+            items = items.order_by(table.c.seq.desc()).limit(last)
+        items = items.correlate(owner).subquery()
+
+        return (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(aggregate_order_by(items.c[column], items.c.seq)),
+                    cast([], JSONB),
+                )
+            )
+            .correlate(owner)
+            .scalar_subquery()
+        )
+
+    def _select_tasks(
+        self,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ):
+        """Select tasks with their history and artifacts folded back into arrays.
+
+        Parts that are not requested are not selected at all, so neither the
+        database nor the wire carries them.
+
+        Args:
+            history_length: Only fetch the last N history messages
+            include_history: Whether to select the message history
+            include_artifacts: Whether to select the artifacts
+
+        Returns:
+            Select statement producing rows accepted by _row_to_task
+        """
+        columns: list[Any] = [tasks_table]
+        if include_history:
+            columns.append(
+                self._aggregate_items(
+                    task_messages_table, "message", last=history_length
+                ).label("history")
+            )
+        if include_artifacts:
+            columns.append(
+                self._aggregate_items(task_artifacts_table, "artifact").label(
+                    "artifacts"
+                )
+            )
+        return select(*columns)
+
+    @staticmethod
+    def _append_items(
+        table: Table,
+        column: str,
+        owner: Any,
+        count_column: str,
+        items: list[Any],
+        name: str,
+        stamp_context: bool = False,
+    ):
+        """Build a CTE inserting items after the ones a task already has.
+
+        owner is the CTE that wrote the task row and already added len(items)
+        to its count_column, so the new items take the seqs just below it.
+        Because that write locks the task row, concurrent appends to the same
+        task get distinct seqs.
+
+        Args:
+            table: task_messages_table or task_artifacts_table
+            column: Name of the JSONB item column
+            owner: CTE returning the written task row
+            count_column: tasks column counting the items of this table
+            items: Serialized messages or artifacts
+            name: Name of the CTE
+            stamp_context: Set each item's context_id to the task's
+
+        Returns:
+            CTE returning the seq and item of every inserted row
+        """
+        elements = (
+            func.jsonb_array_elements(cast(items, JSONB))
+            .table_valued("value", with_ordinality="ordinality")
+            .render_derived()
+        )
+        seq = owner.c[count_column] - len(items) + elements.c.ordinality - 1
+        value = elements.c.value
+        if stamp_context:
+            value = func.jsonb_concat(
+                value, func.jsonb_build_object("context_id", owner.c.context_id)
+            )
+        return (
+            insert(table)
+            .from_select(
+                ["task_id", "seq", column],
+                select(owner.c.id, seq, value).select_from(
+                    owner.join(elements, true())
+                ),
+            )
+            .returning(table.c.seq, table.c[column])
+            .cte(name)
+        )
+
+    def _select_written_task(
+        self, owner: Any, new_messages: Any = None, new_artifacts: Any = None
+    ):
+        """Select a task written by a CTE, with its complete history and artifacts.
+
+        Sub-statements of one query all see the same snapshot, so rows inserted
+        by sibling CTEs are not visible to the aggregates over the item tables.
+        Their RETURNING output is appended to the existing items instead.
+
+        Args:
+            owner: CTE returning the written task row
+            new_messages: CTE returned by _append_items for task_messages
+            new_artifacts: CTE returned by _append_items for task_artifacts
+
+        Returns:
+            Select statement producing a row accepted by _row_to_task
+        """
+        parts = {}
+        for label, table, column, written in (
+            ("history", task_messages_table, "message", new_messages),
+            ("artifacts", task_artifacts_table, "artifact", new_artifacts),
+        ):
+            existing = self._aggregate_items(table, column, owner=owner)
+            if written is not None:
+                added = select(
+                    func.coalesce(
+                        func.jsonb_agg(
+                            aggregate_order_by(written.c[column], written.c.seq)
+                        ),
+                        cast([], JSONB),
+                    )
+                ).scalar_subquery()
+                existing = func.jsonb_concat(existing, added)
+            parts[label] = existing.label(label)
+
+        return select(owner, parts["history"], parts["artifacts"])
+
     # -------------------------------------------------------------------------
     # Task Operations
     # -------------------------------------------------------------------------
 
     async def load_task(
-        self, task_id: UUID, history_length: int | None = None
+        self,
+        task_id: UUID,
+        history_length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task | None:
         """Load a task from PostgreSQL using SQLAlchemy.
 
         Args:
             task_id: Unique identifier of the task
             history_length: Optional limit on message history length
+            include_history: Whether to fetch the message history
+            include_artifacts: Whether to fetch the artifacts
 
         Returns:
             Task object if found, None otherwise
@@ -306,20 +506,17 @@ class PostgresStorage(Storage[ContextT]):
 
         async def _load():
             async with self._get_session_with_schema() as session:
-                stmt = select(tasks_table).where(tasks_table.c.id == task_id)
+                # Projection happens in SQL: only the last N rows are read
+                stmt = self._select_tasks(
+                    history_length, include_history, include_artifacts
+                ).where(tasks_table.c.id == task_id)
                 result = await session.execute(stmt)
                 row = result.first()
 
                 if row is None:
                     return None
 
-                task = self._row_to_task(row)
-
-                # Limit history if requested
-                if history_length is not None and history_length > 0:
-                    task["history"] = task["history"][-history_length:]
-
-                return task
+                return self._row_to_task(row)
 
         return await self._retry_on_connection_error(_load)
 
@@ -353,57 +550,22 @@ class PostgresStorage(Storage[ContextT]):
         async def _submit():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Check if task exists
-                    stmt = select(tasks_table).where(tasks_table.c.id == task_id)
-                    result = await session.execute(stmt)
-                    existing = result.first()
-
-                    if existing:
-                        # Task exists - check if mutable
-                        current_state = existing.state
-
-                        if current_state in app_settings.agent.terminal_states:
-                            raise ValueError(
-                                f"Cannot continue task {task_id}: Task is in terminal state '{current_state}' and is immutable. "
-                                f"Create a new task with referenceTaskIds to continue the conversation."
-                            )
-
-                        logger.info(
-                            f"Continuing existing task {task_id} from state '{current_state}'"
-                        )
-
-                        serialized_message = serialize_for_jsonb(message)
-                        stmt = (
-                            update(tasks_table)
-                            .where(tasks_table.c.id == task_id)
-                            .values(
-                                history=func.jsonb_concat(
-                                    tasks_table.c.history,
-                                    cast([serialized_message], JSONB),
-                                ),
-                                state="submitted",
-                                state_timestamp=get_current_utc_timestamp(),
-                                updated_at=get_current_utc_timestamp(),
-                            )
-                            .returning(tasks_table)
-                        )
-                        result = await session.execute(stmt)
-                        updated_row = result.first()
-
-                        return self._row_to_task(updated_row)
+                    now = get_current_utc_timestamp()
 
-                    # Ensure context exists BEFORE creating task (foreign key constraint)
-                    stmt = insert(contexts_table).values(
-                        id=context_id,
-                        context_data={},
-                        message_history=[],
+                    # Ensure context exists BEFORE creating task (foreign key
+                    # constraints are checked at the end of the statement)
+                    ensured_context = (
+                        insert(contexts_table)
+                        .values(id=context_id, context_data={}, message_history=[])
+                        .on_conflict_do_nothing(index_elements=["id"])
+                        .returning(contexts_table.c.id)
+                        .cte("ensured_context")
                     )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
 
-                    serialized_message = serialize_for_jsonb(message)
-                    now = get_current_utc_timestamp()
-                    stmt = (
+                    # Create the task, or reset a non-terminal one to submitted.
+                    # A terminal task matches the conflict but not the WHERE, so
+                    # no row comes back.
+                    submitted = (
                         insert(tasks_table)
                         .values(
                             id=task_id,
@@ -411,16 +573,55 @@ class PostgresStorage(Storage[ContextT]):
                             kind="task",
                             state="submitted",
                             state_timestamp=now,
-                            history=[serialized_message],
-                            artifacts=[],
                             metadata={},
+                            message_count=1,
+                            artifact_count=0,
+                        )
+                        .on_conflict_do_update(
+                            index_elements=["id"],
+                            set_={
+                                "state": "submitted",
+                                "state_timestamp": now,
+                                "updated_at": now,
+                                "message_count": tasks_table.c.message_count + 1,
+                            },
+                            where=tasks_table.c.state.notin_(
+                                sorted(app_settings.agent.terminal_states)
+                            ),
                         )
-                        .returning(tasks_table)
+                        .returning(*tasks_table.c)
+                        .cte("submitted_task")
+                    )
+                    new_messages = self._append_items(
+                        task_messages_table,
+                        "message",
+                        submitted,
+                        "message_count",
+                        [serialize_for_jsonb(message)],
+                        "new_messages",
+                    )
+
+                    stmt = self._select_written_task(submitted, new_messages).add_cte(
+                        ensured_context
                     )
                     result = await session.execute(stmt)
-                    new_row = result.first()
+                    row = result.first()
 
-                    return self._row_to_task(new_row)
+                    if row is None:
+                        # Error path only: look up the state for the message
+                        stmt = select(tasks_table.c.state).where(
+                            tasks_table.c.id == task_id
+                        )
+                        current_state = (await session.execute(stmt)).scalar()
+                        raise ValueError(
+                            f"Cannot continue task {task_id}: Task is in terminal state '{current_state}' and is immutable. "
+                            f"Create a new task with referenceTaskIds to continue the conversation."
+                        )
+
+                    if row.message_count > 1:
+                        logger.info(f"Continuing existing task {task_id}")
+
+                    return self._row_to_task(row)
 
         return await self._retry_on_connection_error(_submit)
 
@@ -450,21 +651,20 @@ class PostgresStorage(Storage[ContextT]):
         """
         task_id = validate_uuid_type(task_id, "task_id")
 
+        # Stamp messages with the task; context_id is filled in below once the
+        # row is known, without a separate lookup
+        for message in new_messages or []:
+            if not isinstance(message, dict):
+                raise TypeError(f"Message must be dict, got {type(message).__name__}")
+            normalize_message_uuids(message, task_id=task_id)
+
         self._ensure_connected()
 
         async def _update():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Check if task exists
-                    stmt = select(tasks_table).where(tasks_table.c.id == task_id)
-                    result = await session.execute(stmt)
-                    task_row = result.first()
-
-                    if task_row is None:
-                        raise KeyError(f"Task {task_id} not found")
-
                     now = get_current_utc_timestamp()
-                    update_values = {
+                    update_values: dict[str, Any] = {
                         "state": state,
                         "state_timestamp": now,
                         "updated_at": now,
@@ -475,47 +675,126 @@ class PostgresStorage(Storage[ContextT]):
                         update_values["metadata"] = func.jsonb_concat(
                             tasks_table.c.metadata, cast(serialized_metadata, JSONB)
                         )
-
                     if new_artifacts:
-                        serialized_artifacts = serialize_for_jsonb(new_artifacts)
-                        update_values["artifacts"] = func.jsonb_concat(
-                            tasks_table.c.artifacts, cast(serialized_artifacts, JSONB)
+                        update_values["artifact_count"] = (
+                            tasks_table.c.artifact_count + len(new_artifacts)
                         )
-
                     if new_messages:
-                        for message in new_messages:
-                            if not isinstance(message, dict):
-                                raise TypeError(
-                                    f"Message must be dict, got {type(message).__name__}"
-                                )
-                            normalize_message_uuids(
-                                message, task_id=task_id, context_id=task_row.context_id
-                            )
-
-                        serialized_messages = serialize_for_jsonb(new_messages)
-                        update_values["history"] = func.jsonb_concat(
-                            tasks_table.c.history, cast(serialized_messages, JSONB)
+                        update_values["message_count"] = (
+                            tasks_table.c.message_count + len(new_messages)
                         )
 
-                    # Execute update
-                    stmt = (
+                    # One statement: update the row (locking it), insert the new
+                    # items and return the resulting task
+                    updated = (
                         update(tasks_table)
                         .where(tasks_table.c.id == task_id)
                         .values(**update_values)
-                        .returning(tasks_table)
+                        .returning(*tasks_table.c)
+                        .cte("updated_task")
+                    )
+
+                    added_artifacts = added_messages = None
+                    if new_artifacts:
+                        added_artifacts = self._append_items(
+                            task_artifacts_table,
+                            "artifact",
+                            updated,
+                            "artifact_count",
+                            serialize_for_jsonb(new_artifacts),
+                            "new_artifacts",
+                        )
+                    if new_messages:
+                        added_messages = self._append_items(
+                            task_messages_table,
+                            "message",
+                            updated,
+                            "message_count",
+                            serialize_for_jsonb(new_messages),
+                            "new_messages",
+                            stamp_context=True,
+                        )
+
+                    stmt = self._select_written_task(
+                        updated, added_messages, added_artifacts
                     )
                     result = await session.execute(stmt)
-                    updated_row = result.first()
+                    row = result.first()
+
+                    if row is None:
+                        raise KeyError(f"Task {task_id} not found")
 
-                    return self._row_to_task(updated_row)
+                    return self._row_to_task(row)
 
         return await self._retry_on_connection_error(_update)
 
-    async def list_tasks(self, length: int | None = None) -> list[Task]:
+    async def withdraw_message(self, task_id: UUID, message_id: UUID) -> None:
+        """Take back the message a submit_task appended, when its run was not queued.
+
+        Args:
+            task_id: Task the message was submitted to
+            message_id: ID of the submitted message
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        self._ensure_connected()
+
+        async def _withdraw():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    now = get_current_utc_timestamp()
+                    # Lock the task, then delete its last message if it is the
+                    # submitted one and step the task back in the same statement
+                    last_seq = (
+                        select(tasks_table.c.message_count - 1)
+                        .where(tasks_table.c.id == task_id)
+                        .with_for_update()
+                        .scalar_subquery()
+                    )
+                    withdrawn = (
+                        delete(task_messages_table)
+                        .where(
+                            task_messages_table.c.task_id == task_id,
+                            task_messages_table.c.seq == last_seq,
+                            task_messages_table.c.message["message_id"].astext
+                            == str(message_id),
+                        )
+                        .returning(task_messages_table.c.task_id)
+                        .cte("withdrawn_message")
+                    )
+                    stmt = (
+                        update(tasks_table)
+                        .where(tasks_table.c.id.in_(select(withdrawn.c.task_id)))
+                        .values(
+                            state="input-required",
+                            state_timestamp=now,
+                            updated_at=now,
+                            message_count=tasks_table.c.message_count - 1,
+                        )
+                        .add_cte(withdrawn)
+                    )
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_withdraw)
+
+    async def list_tasks(
+        self,
+        length: int | None = None,
+        *,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> list[Task]:
         """List all tasks using SQLAlchemy.
 
         Args:
             length: Optional limit on number of tasks to return
+            history_length: Optional limit on message history length per task
+            include_history: Whether to fetch message histories
+            include_artifacts: Whether to fetch artifacts
 
         Returns:
             List of tasks
@@ -524,7 +803,9 @@ class PostgresStorage(Storage[ContextT]):
 
         async def _list():
             async with self._get_session_with_schema() as session:
-                stmt = select(tasks_table).order_by(tasks_table.c.created_at.desc())
+                stmt = self._select_tasks(
+                    history_length, include_history, include_artifacts
+                ).order_by(tasks_table.c.created_at.desc())
 
                 if length is not None:
                     stmt = stmt.limit(length)
@@ -560,13 +841,22 @@ class PostgresStorage(Storage[ContextT]):
         return await self._retry_on_connection_error(_count)
 
     async def list_tasks_by_context(
-        self, context_id: UUID, length: int | None = None
+        self,
+        context_id: UUID,
+        length: int | None = None,
+        *,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> list[Task]:
         """List tasks belonging to a specific context.
 
         Args:
             context_id: Context to filter tasks by
             length: Optional limit on number of tasks to return
+            history_length: Optional limit on message history length per task
+            include_history: Whether to fetch message histories
+            include_artifacts: Whether to fetch artifacts
 
         Returns:
             List of tasks in the context
@@ -581,7 +871,9 @@ class PostgresStorage(Storage[ContextT]):
         async def _list():
             async with self._get_session_with_schema() as session:
                 stmt = (
-                    select(tasks_table)
+                    self._select_tasks(
+                        history_length, include_history, include_artifacts
+                    )
                     .where(tasks_table.c.context_id == context_id)
                     .order_by(tasks_table.c.created_at.asc())
                 )
@@ -684,26 +976,24 @@ class PostgresStorage(Storage[ContextT]):
         async def _append():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Ensure context exists
+                    # Create the context or append to it in one upsert
+                    serialized_messages = serialize_for_jsonb(messages)
                     stmt = insert(contexts_table).values(
                         id=context_id,
                         context_data={},
-                        message_history=[],
+                        message_history=serialized_messages,
                     )
-                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
-                    await session.execute(stmt)
-
-                    serialized_messages = serialize_for_jsonb(messages)
-                    stmt = (
-                        update(contexts_table)
-                        .where(contexts_table.c.id == context_id)
-                        .values(
-                            message_history=func.jsonb_concat(
-                                contexts_table.c.message_history,
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["id"],
+                        set_={
+                            "message_history": func.jsonb_concat(
+                                func.coalesce(
+                                    contexts_table.c.message_history, cast([], JSONB)
+                                ),
                                 cast(serialized_messages, JSONB),
                             ),
-                            updated_at=get_current_utc_timestamp(),
-                        )
+                            "updated_at": get_current_utc_timestamp(),
+                        },
                     )
                     await session.execute(stmt)
 
@@ -781,32 +1071,25 @@ class PostgresStorage(Storage[ContextT]):
         async def _clear():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Check if context exists
-                    stmt = select(contexts_table).where(
-                        contexts_table.c.id == context_id
+                    # Deleting the context cascades to its tasks and everything
+                    # that hangs off them; RETURNING reports how many there were
+                    task_count = (
+                        select(func.count())
+                        .where(tasks_table.c.context_id == contexts_table.c.id)
+                        .scalar_subquery()
                     )
-                    result = await session.execute(stmt)
-                    context = result.first()
-
-                    if context is None:
-                        raise ValueError(f"Context {context_id} not found")
-
-                    # Delete tasks (cascade will delete feedback)
-                    stmt = delete(tasks_table).where(
-                        tasks_table.c.context_id == context_id
+                    stmt = (
+                        delete(contexts_table)
+                        .where(contexts_table.c.id == context_id)
+                        .returning(task_count)
                     )
                     result = await session.execute(stmt)
-                    deleted_count = result.rowcount
+                    row = result.first()
 
-                    # Delete context
-                    stmt = delete(contexts_table).where(
-                        contexts_table.c.id == context_id
-                    )
-                    await session.execute(stmt)
+                    if row is None:
+                        raise ValueError(f"Context {context_id} not found")
 
-                    logger.info(
-                        f"Cleared context {context_id}: removed {deleted_count} tasks"
-                    )
+                    logger.info(f"Cleared context {context_id}: removed {row[0]} tasks")
 
         await self._retry_on_connection_error(_clear)
 
@@ -820,9 +1103,7 @@ class PostgresStorage(Storage[ContextT]):
         async def _clear():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    await session.execute(delete(webhook_configs_table))
-                    await session.execute(delete(task_feedback_table))
-                    await session.execute(delete(tasks_table))
+                    # Every other table cascades from contexts through tasks
                     await session.execute(delete(contexts_table))
                     logger.info(
                         "Cleared all tasks, contexts, feedback, and webhook configs"
@@ -899,6 +1180,208 @@ class PostgresStorage(Storage[ContextT]):
 
         return await self._retry_on_connection_error(_get)
 
+    # -------------------------------------------------------------------------
+    # Context History Operations
+    # -------------------------------------------------------------------------
+
+    async def load_context_history(
+        self, context_id: UUID, after_seq: int = 0
+    ) -> ContextHistory | None:
+        """Load the materialized chat history of a context using SQLAlchemy.
+
+        One statement reads the initialized flag, the first seq and the rows
+        after after_seq, which come from an index range scan.
+
+        Args:
+            context_id: Context to load history for
+            after_seq: Return only the messages numbered after this one
+
+        Returns:
+            The messages after after_seq, or None if the history was never
+            initialized
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        self._ensure_connected()
+
+        async def _load():
+            async with self._get_session_with_schema() as session:
+                messages = context_messages_table.c
+                first_seq = (
+                    select(func.min(messages.seq))
+                    .where(messages.context_id == context_id)
+                    .scalar_subquery()
+                )
+                new_messages = (
+                    select(
+                        func.coalesce(
+                            func.jsonb_agg(
+                                aggregate_order_by(messages.message, messages.seq)
+                            ),
+                            cast([], JSONB),
+                        ).label("messages"),
+                        func.max(messages.seq).label("last_seq"),
+                    )
+                    .where(messages.context_id == context_id, messages.seq > after_seq)
+                    .subquery("new_messages")
+                )
+                stmt = (
+                    select(
+                        contexts_table.c.history_initialized,
+                        first_seq.label("first_seq"),
+                        new_messages.c.messages,
+                        new_messages.c.last_seq,
+                    )
+                    .select_from(contexts_table)
+                    .join(new_messages, true())
+                    .where(contexts_table.c.id == context_id)
+                )
+                row = (await session.execute(stmt)).first()
+
+                if row is None or not row.history_initialized:
+                    return None
+                return ContextHistory(
+                    messages=row.messages,
+                    first_seq=row.first_seq or 0,
+                    last_seq=row.last_seq or after_seq,
+                )
+
+        return await self._retry_on_connection_error(_load)
+
+    def _lock_context(self, context_id: UUID):
+        """Build the row lock taken on a context before appending to its history.
+
+        seq comes from an identity, drawn when the insert runs rather than in
+        commit order, so two concurrent appends could commit seq 11 before 10
+        and a reader resuming after 11 would never see 10. Holding the context
+        row until commit makes appends to one context draw and commit their
+        seqs in turn.
+
+        Args:
+            context_id: Context about to be appended to
+
+        Returns:
+            The SELECT ... FOR UPDATE statement
+        """
+        return (
+            select(contexts_table.c.id)
+            .where(contexts_table.c.id == context_id)
+            .with_for_update()
+        )
+
+    def _insert_context_messages(
+        self, context_id: UUID, task_histories: list[tuple[UUID, list[dict[str, str]]]]
+    ):
+        """Build the insert of tasks' chat messages, skipping tasks already stored.
+
+        Args:
+            context_id: Context the messages belong to
+            task_histories: (task_id, chat messages) of each task, in order
+
+        Returns:
+            The INSERT statement, or None if there are no messages
+        """
+        rows = [
+            {
+                "context_id": context_id,
+                "task_id": validate_uuid_type(task_id, "task_id"),
+                "position": position,
+                "message": serialize_for_jsonb(message),
+            }
+            for task_id, messages in task_histories
+            for position, message in enumerate(messages)
+        ]
+        if not rows:
+            return None
+        return (
+            insert(context_messages_table)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=["context_id", "task_id", "position"]
+            )
+        )
+
+    async def append_context_history(
+        self, context_id: UUID, task_id: UUID, messages: list[dict[str, str]]
+    ) -> None:
+        """Append a finished task's chat messages to its context's history.
+
+        A plain insert of one row per message, after locking the context row
+        (see _lock_context); rows of a task already stored conflict and are
+        skipped.
+
+        Args:
+            context_id: Context to update
+            task_id: Task the messages come from
+            messages: Chat messages to append
+
+        Raises:
+            TypeError: If context_id is not UUID or messages is not a list
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        if not isinstance(messages, list):
+            raise TypeError(f"messages must be list, got {type(messages).__name__}")
+
+        stmt = self._insert_context_messages(context_id, [(task_id, messages)])
+        if stmt is None:
+            return
+
+        self._ensure_connected()
+
+        async def _append():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    await session.execute(self._lock_context(context_id))
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_append)
+
+    async def init_context_history(
+        self,
+        context_id: UUID,
+        task_histories: list[tuple[UUID, list[dict[str, str]]]],
+    ) -> None:
+        """Fill a context's history from its finished tasks and mark it initialized.
+
+        The insert runs as a CTE of the update that sets the flag, so a reader
+        never sees the flag without the rows; the context row is locked first
+        (see _lock_context).
+
+        Args:
+            context_id: Context to initialize
+            task_histories: (task_id, chat messages) of each finished task
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        self._ensure_connected()
+
+        async def _init():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    stmt = (
+                        update(contexts_table)
+                        .where(contexts_table.c.id == context_id)
+                        .values(history_initialized=True)
+                    )
+                    inserted = self._insert_context_messages(context_id, task_histories)
+                    if inserted is not None:
+                        await session.execute(self._lock_context(context_id))
+                        stmt = stmt.add_cte(
+                            inserted.returning(context_messages_table.c.seq).cte(
+                                "inserted_messages"
+                            )
+                        )
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_init)
+
     # -------------------------------------------------------------------------
     # Webhook Persistence Operations (for long-running tasks)
     # -------------------------------------------------------------------------
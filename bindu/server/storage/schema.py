@@ -19,13 +19,19 @@ from __future__ import annotations as _annotations
 
 from sqlalchemy import (
     TIMESTAMP,
+    BigInteger,
+    Boolean,
     Column,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     MetaData,
+    PrimaryKeyConstraint,
     String,
     Table,
+    Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
@@ -53,10 +59,11 @@ tasks_table = Table(
     Column("kind", String(50), nullable=False, default="task"),
     Column("state", String(50), nullable=False),
     Column("state_timestamp", TIMESTAMP(timezone=True), nullable=False),
-    # JSONB columns for A2A protocol data
-    Column("history", JSONB, nullable=False, server_default="[]"),
-    Column("artifacts", JSONB, nullable=True, server_default="[]"),
+    # JSONB column for A2A protocol data (history and artifacts have their own tables)
     Column("metadata", JSONB, nullable=True, server_default="{}"),
+    # Rows in task_messages / task_artifacts; the next item gets seq = count
+    Column("message_count", Integer, nullable=False, server_default="0"),
+    Column("artifact_count", Integer, nullable=False, server_default="0"),
     # Timestamps
     Column(
         "created_at",
@@ -76,11 +83,58 @@ tasks_table = Table(
     Index("idx_tasks_state", "state"),
     Index("idx_tasks_created_at", "created_at"),
     Index("idx_tasks_updated_at", "updated_at"),
-    Index("idx_tasks_history_gin", "history", postgresql_using="gin"),
     Index("idx_tasks_metadata_gin", "metadata", postgresql_using="gin"),
-    Index("idx_tasks_artifacts_gin", "artifacts", postgresql_using="gin"),
     # Table comment
-    comment="A2A protocol tasks with JSONB history and artifacts",
+    comment="A2A protocol tasks",
+)
+
+# -----------------------------------------------------------------------------
+# Task Messages and Artifacts Tables
+# -----------------------------------------------------------------------------
+# One row per history message or artifact, numbered from 0 within each task.
+# Appending is a plain insert, and the last N messages are an index range scan
+# on the primary key, instead of rewriting a JSONB array on every turn.
+
+task_messages_table = Table(
+    "task_messages",
+    metadata,
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("seq", Integer, nullable=False),
+    Column("message", JSONB, nullable=False),
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    PrimaryKeyConstraint("task_id", "seq", name="pk_task_messages"),
+    comment="A2A protocol task history, one message per row",
+)
+
+task_artifacts_table = Table(
+    "task_artifacts",
+    metadata,
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("seq", Integer, nullable=False),
+    Column("artifact", JSONB, nullable=False),
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    PrimaryKeyConstraint("task_id", "seq", name="pk_task_artifacts"),
+    comment="A2A protocol task artifacts, one artifact per row",
 )
 
 # -----------------------------------------------------------------------------
@@ -95,6 +149,8 @@ contexts_table = Table(
     # JSONB columns
     Column("context_data", JSONB, nullable=False, server_default="{}"),
     Column("message_history", JSONB, nullable=True, server_default="[]"),
+    # Whether context_messages holds the history of every finished task
+    Column("history_initialized", Boolean, nullable=False, server_default="false"),
     # Timestamps
     Column(
         "created_at",
@@ -118,6 +174,42 @@ contexts_table = Table(
     comment="Conversation contexts with message history",
 )
 
+# -----------------------------------------------------------------------------
+# Context Messages Table
+# -----------------------------------------------------------------------------
+# Materialized chat history of each context, one chat message per row. seq is
+# global and never reused, and writers lock the context row before inserting,
+# so within a context seqs commit in order: a reader resumes after the last
+# seq it has and a rebuilt history shows up as a different first seq. Rows
+# are unique per (context, task, position), which makes appending a task's
+# turn idempotent.
+
+context_messages_table = Table(
+    "context_messages",
+    metadata,
+    Column("seq", BigInteger, Identity(), primary_key=True, nullable=False),
+    Column(
+        "context_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("contexts.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("task_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("position", Integer, nullable=False),
+    Column("message", JSONB, nullable=False),
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    UniqueConstraint(
+        "context_id", "task_id", "position", name="uq_context_messages_task"
+    ),
+    Index("idx_context_messages_context_seq", "context_id", "seq"),
+    comment="Chat history of each context, one message per row",
+)
+
 # -----------------------------------------------------------------------------
 # Task Feedback Table
 # -----------------------------------------------------------------------------
@@ -187,6 +279,39 @@ webhook_configs_table = Table(
     comment="Webhook configurations for long-running task notifications",
 )
 
+# -----------------------------------------------------------------------------
+# Task Operations Table (queue of PostgresScheduler)
+# -----------------------------------------------------------------------------
+
+task_operations_table = Table(
+    "task_operations",
+    metadata,
+    # Primary key, also the FIFO order
+    Column("id", BigInteger, Identity(), primary_key=True, nullable=False),
+    Column("operation", String(20), nullable=False),
+    # Operation encoded by bindu.server.scheduler.codec
+    Column("payload", Text, nullable=False),
+    # Not claimable before this; a claim pushes it out by the visibility timeout
+    Column(
+        "available_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("claimed_by", String(255), nullable=True),
+    Column(
+        "enqueued_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    # Indexes
+    Index("idx_task_operations_available_at", "available_at", "id"),
+    # Table comment
+    comment="Task operations queued by PostgresScheduler",
+)
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
@@ -70,6 +70,7 @@ from typing import Any
 
 
 from ..utils.logging import get_logger
+from .events import InMemoryTaskEventBus, TaskEventBus
 from .handlers import ContextHandlers, MessageHandlers, TaskHandlers
 from .notifications import PushNotificationManager
 from .scheduler import Scheduler
@@ -86,6 +87,7 @@ class TaskManager:
     scheduler: Scheduler
     storage: Storage[Any]
     manifest: Any | None = None  # AgentManifest for creating workers
+    event_bus: TaskEventBus = field(default_factory=InMemoryTaskEventBus)
 
     _aexit_stack: AsyncExitStack | None = field(default=None, init=False)
     _workers: list[ManifestWorker] = field(default_factory=list, init=False)
@@ -106,6 +108,7 @@ class TaskManager:
         self._aexit_stack = AsyncExitStack()
         await self._aexit_stack.__aenter__()
         await self._aexit_stack.enter_async_context(self.scheduler)
+        await self._aexit_stack.enter_async_context(self.event_bus)
 
         # Initialize push notification manager (loads persisted webhook configs)
         await self._push_manager.initialize()
@@ -116,6 +119,7 @@ class TaskManager:
                 storage=self.storage,
                 manifest=self.manifest,
                 lifecycle_notifier=self._push_manager.notify_lifecycle,
+                event_bus=self.event_bus,
             )
             self._workers.append(worker)
             await self._aexit_stack.enter_async_context(worker.run())
@@ -128,15 +132,19 @@ class TaskManager:
             workers=self._workers,
             context_id_parser=self._parse_context_id,
             push_manager=self._push_manager,
+            event_bus=self.event_bus,
+            error_response_creator=self._create_error_response,
         )
         self._task_handlers = TaskHandlers(
             scheduler=self.scheduler,
             storage=self.storage,
             error_response_creator=self._create_error_response,
+            event_bus=self.event_bus,
         )
         self._context_handlers = ContextHandlers(
             storage=self.storage,
             error_response_creator=self._create_error_response,
+            history_cache=self._workers[0].history_cache if self._workers else None,
         )
 
         return self
@@ -208,11 +216,18 @@ class TaskManager:
         # ----------------------------
 
         # Message handler methods
-        if name in ("send_message", "stream_message"):
+        if name in ("send_message", "stream_message", "resubscribe_task"):
             return getattr(self._message_handlers, name)
 
         # Task handler methods
-        if name in ("get_task", "list_tasks", "cancel_task", "task_feedback"):
+        if name in (
+            "get_task",
+            "list_tasks",
+            "cancel_task",
+            "task_feedback",
+            "list_dead_letters",
+            "replay_dead_letters",
+        ):
             return getattr(self._task_handlers, name)
 
         # Context handler methods
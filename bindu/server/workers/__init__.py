@@ -19,8 +19,10 @@ This module provides:
 - Utility classes for message conversion and artifact building
 """
 
+from .base import RescheduleTask
 from .manifest_worker import ManifestWorker
 
 __all__ = [
     "ManifestWorker",
+    "RescheduleTask",
 ]
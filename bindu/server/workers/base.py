@@ -11,6 +11,24 @@ Architecture:
 - Handle errors and state transitions
 - Provide observability through OpenTelemetry tracing
 
+Concurrency:
+- By default operations are processed one at a time
+- With max_concurrent_tasks > 1, up to N operations run at once in a task group
+- Operations sharing a context_id always run in arrival order, one after another
+
+Rescheduling:
+- An agent raising RescheduleTask has its run queued again with a run_at
+
+Dead letters:
+- An operation whose handler fails is dead-lettered after the task is failed
+- One delivered more than app_settings.worker.max_attempts times (its workers
+  kept dying on it) is dead-lettered without being handled again
+
+Cancellation:
+- Cancels also arrive out of band from Scheduler.receive_control_operations
+- A running task is interrupted (its cancel scope is cancelled) and canceled
+- A task not running here is remembered and skipped (canceled) when dequeued
+
 Hybrid Agent Pattern:
 Workers implement the hybrid pattern by:
 - Processing tasks through multiple state transitions
@@ -21,21 +39,51 @@ Workers implement the hybrid pattern by:
 from __future__ import annotations as _annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, AsyncIterator
+from uuid import UUID
 
 import anyio
+from anyio.abc import TaskGroup
 from opentelemetry.trace import get_tracer, use_span
 
 from bindu.common.protocol.types import Artifact, Message, TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
 from bindu.server.scheduler.base import Scheduler
 from bindu.server.storage.base import Storage
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 tracer = get_tracer(__name__)
 logger = get_logger(__name__)
 
+_CANCELED_TASKS_LIMIT = 10_000
+"""Cancels remembered for tasks this worker has not dequeued yet."""
+
+
+class RescheduleTask(Exception):
+    """Raised by an agent to run the task again later instead of failing it.
+
+    The worker queues the task again with a run_at, so waiting on a
+    rate-limited upstream does not hold a worker slot.
+
+    Args:
+        retry_after: Seconds to wait; by default an exponential backoff on
+            the number of times the task was rescheduled
+        reason: Why the task is deferred, for logs
+    """
+
+    def __init__(self, retry_after: float | None = None, reason: str = ""):
+        super().__init__(reason or "Task rescheduled")
+        self.retry_after = retry_after
+        self.reason = reason
+
+    def __reduce__(self):
+        # Keep retry_after when raised in a process pool
+        return type(self), (self.retry_after, self.reason)
+
 
 @dataclass
 class Worker(ABC):
@@ -67,6 +115,21 @@ class Worker(ABC):
     storage: Storage[Any]
     """Storage backend for task and context persistence."""
 
+    max_concurrent_tasks: int | None = field(default=None, kw_only=True)
+    """Maximum operations executed at once (defaults to app_settings.worker)."""
+
+    _in_flight: int = field(default=0, init=False, repr=False)
+    _context_queues: dict[Any, deque[dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _running: dict[UUID, anyio.CancelScope] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _canceled: OrderedDict[UUID, None] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _interrupted: set[UUID] = field(default_factory=set, init=False, repr=False)
+
     # -------------------------------------------------------------------------
     # Worker Lifecycle
     # -------------------------------------------------------------------------
@@ -76,7 +139,7 @@ class Worker(ABC):
         """Start the worker and begin processing tasks.
 
         Context manager that:
-        1. Starts the worker loop in a task group
+        1. Starts the worker loop and the control loop in a task group
         2. Yields control to caller
         3. Cancels worker on exit
 
@@ -88,17 +151,206 @@ class Worker(ABC):
         """
         async with anyio.create_task_group() as tg:
             tg.start_soon(self._loop)
+            tg.start_soon(self._control_loop)
             yield
             tg.cancel_scope.cancel()
 
+    @property
+    def in_flight_count(self) -> int:
+        """Number of task operations currently being executed."""
+        return self._in_flight
+
+    @property
+    def queued_count(self) -> int:
+        """Number of received operations waiting behind their context."""
+        return sum(len(pending) for pending in self._context_queues.values())
+
     async def _loop(self) -> None:
         """Process task operations continuously.
 
         Receives task operations from scheduler and dispatches them to handlers.
         Runs until cancelled by the task group.
+
+        With a concurrency limit of 1 each operation is awaited before the next
+        one is received. Otherwise a slot is acquired before every receive, so at
+        most N operations are held by this worker (running or queued behind
+        their context) and the rest stay in the scheduler.
+        """
+        limit = self.max_concurrent_tasks or app_settings.worker.max_concurrent_tasks
+
+        if limit <= 1:
+            async for task_operation in self.scheduler.receive_task_operations():
+                await self._execute_operation(task_operation)
+            return
+
+        slots = anyio.Semaphore(limit)
+        operations = self.scheduler.receive_task_operations().__aiter__()
+
+        async with anyio.create_task_group() as tg:
+            while True:
+                await slots.acquire()
+                try:
+                    task_operation = await operations.__anext__()
+                except StopAsyncIteration:
+                    slots.release()
+                    break
+                self._dispatch_operation(tg, task_operation, slots)
+
+    def _dispatch_operation(
+        self,
+        tg: TaskGroup,
+        task_operation: dict[str, Any],
+        slots: anyio.Semaphore,
+    ) -> None:
+        """Start an operation, or queue it behind a running one of the same context.
+
+        Operations without a context_id (cancel, pause, resume) are never queued.
+        """
+        context_id = task_operation["params"].get("context_id")
+        if context_id is None:
+            tg.start_soon(self._run_in_slot, task_operation, slots)
+            return
+
+        pending = self._context_queues.get(context_id)
+        if pending is not None:
+            pending.append(task_operation)
+            self._publish_counts()
+            return
+
+        self._context_queues[context_id] = deque()
+        tg.start_soon(self._drain_context, context_id, task_operation, slots)
+
+    async def _drain_context(
+        self, context_id: Any, task_operation: dict[str, Any], slots: anyio.Semaphore
+    ) -> None:
+        """Run operations of one context sequentially until none are pending."""
+        pending = self._context_queues[context_id]
+        while True:
+            await self._run_in_slot(task_operation, slots)
+            if not pending:
+                del self._context_queues[context_id]
+                self._publish_counts()
+                return
+            task_operation = pending.popleft()
+
+    async def _run_in_slot(
+        self, task_operation: dict[str, Any], slots: anyio.Semaphore
+    ) -> None:
+        """Execute an operation and free its slot afterwards."""
+        try:
+            await self._execute_operation(task_operation)
+        except Exception as e:
+            # Never let one operation tear down the shared task group
+            logger.error(f"Unhandled error in task operation: {e}", exc_info=True)
+        finally:
+            slots.release()
+
+    async def _control_loop(self) -> None:
+        """Apply cancels sent out of band, ahead of the operation queue."""
+        try:
+            async for task_operation in self.scheduler.receive_control_operations():
+                if task_operation["operation"] == "cancel":
+                    self._request_cancel(task_operation["params"]["task_id"])
+        except Exception as e:
+            # Cancels still arrive through the queue, only later
+            logger.error(f"Control channel failed: {e}", exc_info=True)
+
+    def _request_cancel(self, task_id: Any) -> None:
+        """Interrupt the task if it runs here, otherwise skip it when dequeued."""
+        task_id = UUID(task_id) if isinstance(task_id, str) else task_id
+        scope = self._running.get(task_id)
+        if scope is not None:
+            logger.info(f"Interrupting canceled task {task_id}")
+            scope.cancel()
+            return
+
+        self._canceled[task_id] = None
+        if len(self._canceled) > _CANCELED_TASKS_LIMIT:
+            self._canceled.popitem(last=False)
+
+    async def _execute_operation(self, task_operation: dict[str, Any]) -> None:
+        """Execute one operation while tracking the in-flight count."""
+        self._in_flight += 1
+        self._publish_counts()
+        try:
+            if task_operation.get("_attempts", 1) > app_settings.worker.max_attempts:
+                await self._quarantine(task_operation)
+            elif task_operation["operation"] == "run":
+                await self._execute_run(task_operation)
+            else:
+                await self._handle_task_operation(task_operation)
+            # Only handled operations are acknowledged; one interrupted by a
+            # crash or shutdown stays with the scheduler for redelivery
+            await self.scheduler.ack_task_operation(task_operation)
+        except BaseException:
+            # Released unacknowledged, so the scheduler stops holding on to it
+            with anyio.CancelScope(shield=True):
+                await self.scheduler.release_task_operation(task_operation)
+            raise
+        finally:
+            self._in_flight -= 1
+            self._publish_counts()
+
+    async def _execute_run(self, task_operation: dict[str, Any]) -> None:
+        """Run a task in a cancel scope the control loop can interrupt.
+
+        A run canceled out of band, before or while it executes, is handled as
+        a cancel operation instead; the queued cancel then finds the task
+        already canceled.
         """
-        async for task_operation in self.scheduler.receive_task_operations():
-            await self._handle_task_operation(task_operation)
+        task_id_raw = task_operation["params"]["task_id"]
+        task_id = UUID(task_id_raw) if isinstance(task_id_raw, str) else task_id_raw
+
+        if task_id in self._canceled:
+            del self._canceled[task_id]
+            get_metrics().increment_worker_cancellations("skipped")
+        else:
+            with anyio.CancelScope() as scope:
+                self._running[task_id] = scope
+                try:
+                    await self._handle_task_operation(task_operation)
+                finally:
+                    del self._running[task_id]
+            if not scope.cancelled_caught:
+                return
+            get_metrics().increment_worker_cancellations("interrupted")
+            self._interrupted.add(task_id)
+
+        try:
+            await self._handle_task_operation({**task_operation, "operation": "cancel"})
+        finally:
+            self._interrupted.discard(task_id)
+
+    async def _quarantine(self, task_operation: dict[str, Any]) -> None:
+        """Dead-letter an operation delivered too many times, failing its run."""
+        attempts = task_operation["_attempts"]
+        if task_operation["operation"] == "run":
+            task_id_raw = task_operation["params"]["task_id"]
+            task_id = UUID(task_id_raw) if isinstance(task_id_raw, str) else task_id_raw
+            await self.storage.update_task(task_id, state="failed")
+        await self._dead_letter(
+            task_operation,
+            "max_attempts",
+            f"Delivered {attempts} times (max_attempts is "
+            f"{app_settings.worker.max_attempts})",
+        )
+
+    async def _dead_letter(
+        self, task_operation: dict[str, Any], reason: str, error: str
+    ) -> None:
+        """Hand an operation to the scheduler's dead letters, logging any failure."""
+        try:
+            await self.scheduler.dead_letter_task_operation(
+                task_operation,  # type: ignore[arg-type]
+                reason,
+                error,
+            )
+        except Exception as e:
+            logger.error(f"Failed to dead-letter {task_operation['operation']}: {e}")
+
+    def _publish_counts(self) -> None:
+        """Export in-flight and queued counts to Prometheus metrics."""
+        get_metrics().set_worker_operations(self._in_flight, self.queued_count)
 
     async def _handle_task_operation(self, task_operation: dict[str, Any]) -> None:
         """Dispatch task operation to appropriate handler.
@@ -113,7 +365,8 @@ class Worker(ABC):
         - resume: Resume paused task (future)
 
         Error Handling:
-        - Any exception during execution marks task as 'failed'
+        - Any exception during execution marks task as 'failed' and
+          dead-letters the operation
         - Preserves OpenTelemetry trace context
         """
         operation_handlers: dict[str, Any] = {
@@ -145,6 +398,7 @@ class Worker(ABC):
             task_id = UUID(task_id_raw) if isinstance(task_id_raw, str) else task_id_raw
             logger.error(f"Task {task_id} failed: {e}", exc_info=True)
             await self.storage.update_task(task_id, state="failed")
+            await self._dead_letter(task_operation, "failed", str(e))
 
     # -------------------------------------------------------------------------
     # Abstract Methods (Must Implement)
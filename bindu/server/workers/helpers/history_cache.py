@@ -0,0 +1,84 @@
+"""Materialized conversation history for context-based history.
+
+Rebuilding a context's history on every run means reading and converting
+every earlier task, so a conversation of k turns costs O(k²) over its
+lifetime. Storage keeps each context's chat-formatted history, appended to
+as tasks finish; this module caches it per process, bounded by an LRU
+across contexts.
+
+Storage is the source of truth: other workers append to it too. An entry
+records the sequences of the messages it holds, so a worker fetches only
+the messages stored after its copy, and notices a replaced history by its
+first sequence (see Storage.load_context_history).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from bindu.server.storage.base import ContextHistory
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.workers.helpers.history_cache")
+
+
+class ContextHistoryCache:
+    """LRU cache of chat-formatted history keyed by context_id."""
+
+    def __init__(self, max_contexts: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_contexts: Number of contexts to keep (0 disables caching)
+        """
+        self.max_contexts = max_contexts
+        self._entries: OrderedDict[Any, ContextHistory] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached contexts."""
+        return len(self._entries)
+
+    def get(self, context_id: Any) -> ContextHistory | None:
+        """Return the cached history for a context, marking it recently used.
+
+        Args:
+            context_id: Context identifier
+
+        Returns:
+            The history as last read from storage, or None if not cached
+        """
+        history = self._entries.get(context_id)
+        if history is not None:
+            self._entries.move_to_end(context_id)
+        return history
+
+    def put(self, context_id: Any, history: ContextHistory) -> None:
+        """Cache the full history for a context, evicting the least recently used.
+
+        Entries are replaced, never changed in place, so a run keeps the
+        messages it was given while another run of the context refreshes them.
+
+        Args:
+            context_id: Context identifier
+            history: Every stored message of the context, with its sequences
+        """
+        if self.max_contexts <= 0:
+            return
+        self._entries[context_id] = history
+        self._entries.move_to_end(context_id)
+        while len(self._entries) > self.max_contexts:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"Evicted history for context {evicted}")
+
+    def invalidate(self, context_id: Any) -> None:
+        """Drop a context from the cache.
+
+        Args:
+            context_id: Context identifier
+        """
+        self._entries.pop(context_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached context."""
+        self._entries.clear()
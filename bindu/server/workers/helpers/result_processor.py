@@ -7,6 +7,7 @@ different data structures.
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from bindu.utils.logging import get_logger
@@ -26,7 +27,10 @@ class ResultProcessor:
     """
 
     @staticmethod
-    async def collect_results(raw_results: Any) -> Any:
+    async def collect_results(
+        raw_results: Any,
+        on_chunk: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> Any:
         """Collect results from manifest execution.
 
         Handles different result types:
@@ -36,6 +40,8 @@ class ResultProcessor:
 
         Args:
             raw_results: Raw result from manifest.run()
+            on_chunk: Awaited with every non-empty value a generator yields,
+                as it is yielded
 
         Returns:
             Collected result (single value or last yielded value)
@@ -46,6 +52,8 @@ class ResultProcessor:
             try:
                 async for chunk in raw_results:
                     collected.append(chunk)
+                    if on_chunk and chunk:
+                        await on_chunk(chunk)
             except StopAsyncIteration:
                 pass
             # Return last chunk or all chunks if multiple
@@ -57,6 +65,8 @@ class ResultProcessor:
             try:
                 for chunk in raw_results:
                     collected.append(chunk)
+                    if on_chunk and chunk:
+                        await on_chunk(chunk)
             except StopIteration:
                 pass
             # Return last chunk or all chunks if multiple
@@ -27,10 +27,11 @@ Hybrid Agent Architecture (A2A Protocol):
 
 from __future__ import annotations
 
+import random
 import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from opentelemetry.trace import Status, StatusCode, get_tracer
 
@@ -45,8 +46,20 @@ from bindu.common.protocol.types import (
     TaskState,
 )
 from bindu.penguin.manifest import AgentManifest
-from bindu.server.workers.base import Worker
-from bindu.server.workers.helpers import ResponseDetector, ResultProcessor
+from bindu.server.events import (
+    TaskEventBus,
+    artifact_event,
+    chunk_event,
+    ends_stream,
+    status_event,
+)
+from bindu.server.metrics import get_metrics
+from bindu.server.workers.base import RescheduleTask, Worker
+from bindu.server.workers.helpers import (
+    ContextHistoryCache,
+    ResponseDetector,
+    ResultProcessor,
+)
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_worker_operation
 from bindu.utils.worker_utils import ArtifactBuilder, MessageConverter, TaskStateManager
@@ -86,7 +99,16 @@ class ManifestWorker(Worker):
     )
     """Optional callback for task lifecycle notifications (task_id, context_id, state, final)."""
 
-    @retry_worker_operation()
+    event_bus: TaskEventBus | None = None
+    """Bus the task's status updates and streamed chunks are published on."""
+
+    history_cache: ContextHistoryCache = field(
+        default_factory=lambda: ContextHistoryCache(
+            app_settings.worker.history_cache_size
+        )
+    )
+    """Materialized chat history per context, used for context-based history."""
+
     async def run_task(self, params: TaskSendParams) -> None:
         """Execute a task using the AgentManifest.
 
@@ -102,21 +124,35 @@ class ManifestWorker(Worker):
         6. Settle payment if task completes successfully (x402 flow)
 
         Args:
-            params: Task execution parameters containing task_id, context_id, message,
-                   and optional payment_context from middleware
+            params: Task execution parameters containing task_id, context_id,
+                   optional payment_context from middleware and, unless the
+                   scheduler queues by reference, the message (it is read from
+                   the stored task either way)
+
+        If the agent raises RescheduleTask, the task goes back to submitted
+        and is queued again with a run_at, up to
+        app_settings.worker.reschedule_max_attempts times; then it fails.
+
+        The agent is not retried in place: a failure fails the task and the
+        worker dead-letters the operation, so it can be replayed once fixed.
 
         Raises:
             ValueError: If task not found
             Exception: Re-raised after marking task as failed
         """
-        # Step 1: Load and validate task
-        task = await self.storage.load_task(params["task_id"])
+        # Step 1: Load and validate task (artifacts are not needed to run it)
+        task = await self.storage.load_task(params["task_id"], include_artifacts=False)
         if task is None:
             raise ValueError(f"Task {params['task_id']} not found")
 
         # Extract payment context if available (from x402 middleware)
         payment_context = params.get("payment_context")
 
+        # Canceled while it waited in the queue: nothing left to run
+        if task["status"]["state"] == "canceled":
+            logger.info(f"Skipping run of canceled task {task['id']}")
+            return
+
         await TaskStateManager.validate_task_state(task)
 
         # Add span event for state transition
@@ -167,9 +203,10 @@ class ManifestWorker(Worker):
                     # Pass message history as structured list of dicts
                     raw_results = self.manifest.run(message_history or [])
 
-                    # Handle generator/async generator responses
+                    # Handle generator/async generator responses, publishing
+                    # chunks as they are yielded for message/stream
                     collected_results = await ResultProcessor.collect_results(
-                        raw_results
+                        raw_results, on_chunk=self._chunk_publisher(task)
                     )
 
                     # Normalize result to extract final response (intelligent extraction)
@@ -226,6 +263,8 @@ class ManifestWorker(Worker):
                     task, results, state, payment_context=payment_context
                 )
 
+        except RescheduleTask as e:
+            await self._reschedule_task(task, params, e.retry_after)
         except Exception as e:
             # Handle task failure with error message
             # Add span event for failure
@@ -247,11 +286,14 @@ class ManifestWorker(Worker):
     async def cancel_task(self, params: TaskIdParams) -> None:
         """Cancel a running task.
 
+        A cancel reaches the worker twice, out of band and through the queue,
+        so a task that is already terminal is left as it is.
+
         Args:
             params: Task identification parameters containing task_id
         """
-        task = await self.storage.load_task(params["task_id"])
-        if task:
+        task = await self.storage.load_task(params["task_id"], include_artifacts=False)
+        if task and task["status"]["state"] not in app_settings.agent.terminal_states:
             # Add span event for cancellation
             from opentelemetry.trace import get_current_span
 
@@ -265,6 +307,10 @@ class ManifestWorker(Worker):
                     },
                 )
             await self.storage.update_task(params["task_id"], state="canceled")
+            # A working task records its own history when its run finishes,
+            # unless this worker just interrupted that run
+            if task["status"]["state"] != "working" or task["id"] in self._interrupted:
+                await self._record_context_history(task)
             await self._notify_lifecycle(
                 params["task_id"], task["context_id"], "canceled", True
             )
@@ -328,7 +374,9 @@ class ManifestWorker(Worker):
             for task_id in reference_task_ids:
                 # Ensure task_id is UUID object
                 task_id_uuid = UUID(task_id) if isinstance(task_id, str) else task_id
-                ref_task = await self.storage.load_task(task_id_uuid)
+                ref_task = await self.storage.load_task(
+                    task_id_uuid, include_artifacts=False
+                )
                 if ref_task and ref_task.get("history"):
                     referenced_messages.extend(ref_task["history"])
 
@@ -337,26 +385,106 @@ class ManifestWorker(Worker):
 
         elif self.manifest.enable_context_based_history:
             # Strategy 2: Context-based history (implicit continuation)
-            # Only enabled if configured in manifest
-            tasks_by_context = await self.storage.list_tasks_by_context(
-                task["context_id"]
-            )
-            previous_tasks = [t for t in tasks_by_context if t["id"] != task["id"]]
-
-            all_previous_messages: list[Message] = []
-            for prev_task in previous_tasks:
-                history = prev_task.get("history", [])
-                if history:
-                    all_previous_messages.extend(history)
-
-            current_messages = task.get("history", [])
-            all_messages = all_previous_messages + current_messages
+            # Only enabled if configured in manifest. Earlier tasks come from the
+            # materialized history, so only the current task is converted here.
+            previous_history = await self._load_context_history(task)
+            current_history = self.build_message_history(task.get("history", []))
+            return [dict(message) for message in previous_history] + current_history
         else:
             # No context-based history - only use current task messages
             all_messages = task.get("history", [])
 
         return self.build_message_history(all_messages) if all_messages else []
 
+    async def _load_context_history(self, task: Task) -> list[dict[str, str]]:
+        """Load the chat history of every finished task in the task's context.
+
+        The in-process copy is brought up to date with the messages stored
+        after it, which other workers may have appended; a history that was
+        replaced meanwhile is read again in full. A context without stored
+        history is rebuilt once from its terminal tasks.
+
+        Args:
+            task: Current task being executed
+
+        Returns:
+            Chat-formatted messages of earlier tasks in the context
+        """
+        context_id = task["context_id"]
+
+        cached = self.history_cache.get(context_id)
+        after_seq = cached.last_seq if cached else 0
+        stored = await self.storage.load_context_history(context_id, after_seq)
+        if stored is None:
+            history = await self._rebuild_context_history(task)
+            stored = await self.storage.load_context_history(context_id)
+            if stored is None:
+                # Storage does not keep materialized history
+                return history
+        elif cached is not None and cached.first_seq in (0, stored.first_seq):
+            stored = stored._replace(messages=cached.messages + stored.messages)
+        elif after_seq:
+            stored = await self.storage.load_context_history(context_id)
+            if stored is None:
+                return await self._rebuild_context_history(task)
+
+        self.history_cache.put(context_id, stored)
+        return stored.messages
+
+    async def _rebuild_context_history(self, task: Task) -> list[dict[str, str]]:
+        """Store the history of a context from its terminal tasks.
+
+        Args:
+            task: Current task, left out of the history
+
+        Returns:
+            Chat-formatted messages of the context's terminal tasks
+        """
+        context_id = task["context_id"]
+        tasks_by_context = await self.storage.list_tasks_by_context(
+            context_id, include_artifacts=False
+        )
+        task_histories = [
+            (prev_task["id"], self.build_message_history(prev_task.get("history", [])))
+            for prev_task in tasks_by_context
+            if prev_task["id"] != task["id"]
+            and prev_task["status"]["state"] in app_settings.agent.terminal_states
+        ]
+
+        await self.storage.init_context_history(context_id, task_histories)
+        history = [message for _, messages in task_histories for message in messages]
+        logger.debug(
+            f"Rebuilt history for context {context_id} ({len(history)} messages)"
+        )
+        return history
+
+    async def _record_context_history(
+        self, task: dict[str, Any], new_messages: list[Message] | None = None
+    ) -> None:
+        """Append a finished task's messages to its context's materialized history.
+
+        Args:
+            task: Task that reached a terminal state (history as loaded for the run)
+            new_messages: Messages added to the task when it was finalized
+        """
+        if not self.manifest.enable_context_based_history:
+            return
+
+        messages = self.build_message_history(
+            list(task.get("history", [])) + list(new_messages or [])
+        )
+        if not messages:
+            return
+
+        try:
+            await self.storage.append_context_history(
+                task["context_id"], task["id"], messages
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to record history for context {task['context_id']}: {e}"
+            )
+
     # -------------------------------------------------------------------------
     # Message Normalization
     # -------------------------------------------------------------------------
@@ -462,6 +590,7 @@ class ManifestWorker(Worker):
                 new_messages=agent_messages,
                 metadata=additional_metadata,
             )
+            await self._record_context_history(task, agent_messages)
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
         elif state in ("failed", "rejected"):
@@ -475,13 +604,54 @@ class ManifestWorker(Worker):
                 new_messages=error_message,
                 metadata=additional_metadata,
             )
+            await self._record_context_history(task, error_message)
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
         elif state == "canceled":
             # Canceled: State change only, NO new content
             await self.storage.update_task(task["id"], state=state)
+            await self._record_context_history(task)
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
+    async def _reschedule_task(
+        self, task: dict[str, Any], params: TaskSendParams, retry_after: float | None
+    ) -> None:
+        """Queue a task the agent deferred again, or fail it when out of attempts.
+
+        Args:
+            task: Task being run
+            params: Parameters of the run
+            retry_after: Seconds the agent asked to wait, if any
+        """
+        settings = app_settings.worker
+        reschedules = params.get("reschedules", 0)
+        if reschedules >= settings.reschedule_max_attempts:
+            get_metrics().increment_worker_reschedules("exhausted")
+            await self._handle_task_failure(
+                task, f"still deferred after {reschedules} reschedules"
+            )
+            return
+
+        if retry_after is None:
+            # Exponential backoff with jitter, so deferred tasks spread out
+            backoff = min(
+                settings.reschedule_base_delay * 2**reschedules,
+                settings.reschedule_max_delay,
+            )
+            retry_after = backoff * random.uniform(0.5, 1.0)
+
+        await self.storage.update_task(task["id"], state="submitted")
+        await self.scheduler.run_task(
+            {
+                **params,
+                "run_at": time.time() + retry_after,
+                "reschedules": reschedules + 1,
+            }
+        )
+        get_metrics().increment_worker_reschedules("rescheduled")
+        logger.info(f"Task {task['id']} rescheduled in {retry_after:.1f}s")
+        await self._notify_lifecycle(task["id"], task["context_id"], "submitted", False)
+
     async def _handle_task_failure(self, task: dict[str, Any], error: str) -> None:
         """Handle task execution failure.
 
@@ -501,6 +671,7 @@ class ManifestWorker(Worker):
         await self.storage.update_task(
             task["id"], state="failed", new_messages=error_message
         )
+        await self._record_context_history(task, error_message)
         await self._notify_lifecycle(task["id"], task["context_id"], "failed", True)
 
     async def _settle_payment(self, payment_context: dict[str, Any]) -> dict[str, Any]:
@@ -556,6 +727,42 @@ class ManifestWorker(Worker):
                 app_settings.x402.meta_error_key: str(e),
             }
 
+    def _chunk_publisher(self, task: Task) -> Callable[[Any], Any] | None:
+        """Build the callback publishing a run's chunks as one streamed artifact.
+
+        Args:
+            task: Task being run
+
+        Returns:
+            Callback for ResultProcessor.collect_results, or None without a bus
+        """
+        event_bus = self.event_bus
+        if event_bus is None:
+            return None
+        artifact_id = uuid4()
+
+        async def publish_chunk(chunk: Any) -> None:
+            await self._publish_event(
+                task["id"],
+                chunk_event(task["id"], task["context_id"], artifact_id, chunk),
+            )
+
+        return publish_chunk
+
+    async def _publish_event(self, task_id: UUID, event: dict[str, Any]) -> None:
+        """Publish a task event on the bus, if any, without failing the task."""
+        if self.event_bus is None:
+            return
+        try:
+            await self.event_bus.publish(task_id, event)
+        except Exception as e:
+            logger.warning(
+                "Task event publication failed",
+                task_id=str(task_id),
+                kind=event.get("kind"),
+                error=str(e),
+            )
+
     async def _notify_artifact(
         self, task_id: UUID, context_id: UUID, artifact: Artifact
     ) -> None:
@@ -566,6 +773,9 @@ class ManifestWorker(Worker):
             context_id: Context identifier
             artifact: The artifact that was generated
         """
+        await self._publish_event(
+            task_id, artifact_event(task_id, context_id, artifact, last_chunk=True)
+        )
         if self.lifecycle_notifier:
             try:
                 # Get push manager from lifecycle_notifier's bound instance
@@ -594,6 +804,11 @@ class ManifestWorker(Worker):
             state: New task state
             final: Whether this is a terminal state
         """
+        # A stream ends where the task waits for the client, too
+        await self._publish_event(
+            task_id,
+            status_event(task_id, context_id, state, final or ends_stream(state)),
+        )
         if self.lifecycle_notifier:
             try:
                 result = self.lifecycle_notifier(task_id, context_id, state, final)
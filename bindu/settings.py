@@ -356,12 +356,16 @@ class AgentSettings(BaseSettings):
     # Maps JSON-RPC method names to task_manager handler method names
     method_handlers: dict[str, str] = {
         "message/send": "send_message",
+        "message/stream": "stream_message",
+        "tasks/resubscribe": "resubscribe_task",
         "tasks/get": "get_task",
         "tasks/cancel": "cancel_task",
         "tasks/list": "list_tasks",
         "contexts/list": "list_contexts",
         "contexts/clear": "clear_context",
         "tasks/feedback": "task_feedback",
+        "tasks/deadLetters/list": "list_dead_letters",
+        "tasks/deadLetters/replay": "replay_dead_letters",
     }
 
     # Task State Configuration (A2A Protocol)
@@ -471,6 +475,13 @@ CRITICAL
     # Enable/disable structured response system
     enable_structured_responses: bool = True
 
+    # Longest a tasks/get may wait for the task to change (wait_for_change_ms)
+    max_wait_for_change_ms: int = 30000
+
+    # JSON-RPC batches: most requests per batch, and how many run at once
+    max_batch_size: int = 100
+    batch_concurrency: int = 16
+
 
 class AuthSettings(BaseSettings):
     """Authentication and authorization configuration settings.
@@ -512,11 +523,15 @@ class AuthSettings(BaseSettings):
     require_permissions: bool = False
     permissions: dict[str, list[str]] = {
         "message/send": ["agent:write"],
+        "message/stream": ["agent:write"],
         "tasks/get": ["agent:read"],
         "tasks/cancel": ["agent:write"],
+        "tasks/resubscribe": ["agent:read"],
         "tasks/list": ["agent:read"],
         "contexts/list": ["agent:read"],
         "tasks/feedback": ["agent:write"],
+        "tasks/deadLetters/list": ["agent:read"],
+        "tasks/deadLetters/replay": ["agent:write"],
     }
 
 
@@ -652,13 +667,44 @@ class StorageSettings(BaseSettings):
     # Migration settings
     run_migrations_on_startup: bool = False  # Safer default for production
 
+    # In-memory limits: only terminal tasks are ever evicted (0 disables a limit)
+    memory_max_tasks: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("memory_max_tasks", "STORAGE_MEMORY_MAX_TASKS"),
+        description="Tasks kept by in-memory storage before terminal ones are evicted.",
+    )
+    memory_max_bytes: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("memory_max_bytes", "STORAGE_MEMORY_MAX_BYTES"),
+        description="Estimated history and artifact bytes kept by in-memory storage.",
+    )
+    memory_task_ttl: float = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("memory_task_ttl", "STORAGE_MEMORY_TASK_TTL"),
+        description="Seconds a terminal task is kept in memory after it finishes.",
+    )
+    memory_sweep_interval: float = Field(
+        default=60.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "memory_sweep_interval", "STORAGE_MEMORY_SWEEP_INTERVAL"
+        ),
+        description="Seconds between background eviction sweeps of in-memory storage.",
+    )
+
 
 class SchedulerSettings(BaseSettings):
     """Scheduler backend configuration settings.
 
     Supports multiple scheduler backends:
     - memory: In-memory scheduler (default, single-process)
-    - redis: Redis scheduler (distributed, multi-process)
+    - redis: Redis scheduler (distributed, multi-process), backed by a list or
+      by a stream with a consumer group (redis_queue_type)
+    - postgres: queue table in the PostgresStorage database (multi-process,
+      no Redis needed)
 
     Redis settings must be provided via environment variables or config.
     """
@@ -669,7 +715,7 @@ class SchedulerSettings(BaseSettings):
     )
 
     # Scheduler backend selection
-    backend: Literal["memory", "redis"] = Field(
+    backend: Literal["memory", "redis", "postgres"] = Field(
         default="memory",
         validation_alias=AliasChoices("backend", "SCHEDULER_TYPE"),
     )
@@ -691,6 +737,229 @@ class SchedulerSettings(BaseSettings):
         validation_alias=AliasChoices("poll_timeout", "REDIS_POLL_TIMEOUT"),
         description="Timeout in seconds for Redis blpop operations. Higher values reduce API calls but increase task start latency.",
     )
+    batch_size: int = Field(
+        default=1,
+        ge=1,
+        validation_alias=AliasChoices(
+            "batch_size", "REDIS_BATCH_SIZE", "SCHEDULER_BATCH_SIZE"
+        ),
+        description="Operations a worker fetches per Redis or PostgreSQL round trip. Larger batches raise burst throughput but hold more operations in one worker.",
+    )
+    payload_mode: Literal["full", "reference"] = Field(
+        default="full",
+        validation_alias=AliasChoices("payload_mode", "REDIS_PAYLOAD_MODE"),
+        description="'reference' queues only task ids and options and leaves the message in storage. Switch once every worker runs a version that reads both formats.",
+    )
+    redis_queue_type: Literal["list", "stream", "fair", "sharded"] = Field(
+        default="list",
+        validation_alias=AliasChoices("redis_queue_type", "REDIS_QUEUE_TYPE"),
+        description="'list' pops operations with BLPOP; 'stream' reads them through a consumer group and acknowledges them once handled; 'fair' serves them by priority class and fairly between tenants; 'sharded' splits them over context-hash shards leased to workers, so each context runs in order on one worker at a time.",
+    )
+    stream_group: str = Field(
+        default="bindu:workers",
+        validation_alias=AliasChoices("stream_group", "REDIS_STREAM_GROUP"),
+        description="Consumer group shared by the workers reading the task stream.",
+    )
+    stream_consumer: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("stream_consumer", "REDIS_STREAM_CONSUMER"),
+        description="Consumer name of this worker in the stream group or shard leases. Defaults to host-pid-random.",
+    )
+    claim_idle_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        validation_alias=AliasChoices("claim_idle_timeout", "REDIS_CLAIM_IDLE_TIMEOUT"),
+        description="Seconds an unacknowledged operation may stay idle before another worker reclaims it.",
+    )
+    redis_shards: int = Field(
+        default=16,
+        ge=1,
+        validation_alias=AliasChoices("redis_shards", "REDIS_SHARDS"),
+        description="Shard queues of the 'sharded' queue type. At most this many workers take operations at once; every process must use the same value.",
+    )
+    shard_lease_ttl: float = Field(
+        default=15.0,
+        gt=0,
+        validation_alias=AliasChoices("shard_lease_ttl", "REDIS_SHARD_LEASE_TTL"),
+        description="Seconds a worker's shard lease outlives its last renewal, i.e. how long the shards of a dead worker stay unserved.",
+    )
+
+    # PostgreSQL queue configuration (uses the storage database)
+    visibility_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "visibility_timeout", "SCHEDULER_VISIBILITY_TIMEOUT"
+        ),
+        description="Seconds a claimed operation stays hidden from other workers before it can be claimed again.",
+    )
+    postgres_poll_interval: float = Field(
+        default=5.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "postgres_poll_interval", "SCHEDULER_POSTGRES_POLL_INTERVAL"
+        ),
+        description="Seconds between polls of the queue table when no NOTIFY arrives.",
+    )
+
+    # Priority classes and tenant fairness (memory backend and Redis "fair" queue)
+    priority_classes: list[str] = Field(
+        default=["interactive", "normal", "batch"],
+        min_length=1,
+        validation_alias=AliasChoices("priority_classes", "SCHEDULER_PRIORITY_CLASSES"),
+        description="Priority class names, highest first. Higher classes are always served before lower ones.",
+    )
+    default_priority: str = Field(
+        default="normal",
+        validation_alias=AliasChoices("default_priority", "SCHEDULER_DEFAULT_PRIORITY"),
+        description="Class of tasks sent without a priority or with an unknown one.",
+    )
+    tenant_weights: dict[str, float] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("tenant_weights", "SCHEDULER_TENANT_WEIGHTS"),
+        description="Relative share of the workers per tenant (caller DID or OAuth subject) within a class. Unlisted tenants weigh 1.",
+    )
+
+    # Dead letters: failed, undecodable or too often redelivered operations
+    dead_letter_limit: int = Field(
+        default=1000,
+        ge=1,
+        validation_alias=AliasChoices(
+            "dead_letter_limit", "SCHEDULER_DEAD_LETTER_LIMIT"
+        ),
+        description="Dead letters kept for inspection and replay; the oldest are dropped beyond it.",
+    )
+
+    # In-memory queue configuration
+    queue_size: int = Field(
+        default=1000,
+        ge=0,
+        validation_alias=AliasChoices("queue_size", "SCHEDULER_QUEUE_SIZE"),
+        description="Maximum task operations buffered by the in-memory scheduler.",
+    )
+    overflow_policy: Literal["reject", "wait"] = Field(
+        default="wait",
+        validation_alias=AliasChoices("overflow_policy", "SCHEDULER_OVERFLOW_POLICY"),
+        description="When the queue is full: 'reject' immediately or 'wait' up to enqueue_timeout.",
+    )
+    enqueue_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        validation_alias=AliasChoices("enqueue_timeout", "SCHEDULER_ENQUEUE_TIMEOUT"),
+        description="Seconds to wait for queue space under the 'wait' overflow policy.",
+    )
+
+
+class EventBusSettings(BaseSettings):
+    """Task event bus configuration settings.
+
+    Workers publish task status updates and artifact chunks on the bus;
+    message/stream and tasks/resubscribe subscribe to them. Use the redis
+    backend when requests and workers run in different processes.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        extra="allow",
+    )
+
+    backend: Literal["memory", "redis"] = Field(
+        default="memory",
+        validation_alias=AliasChoices("backend", "EVENT_BUS_BACKEND"),
+    )
+
+    # Falls back to the scheduler's REDIS_URL
+    redis_url: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("redis_url", "EVENT_BUS_REDIS_URL"),
+    )
+    channel_prefix: str = "bindu:events"
+    subscriber_buffer: int = Field(
+        default=256,
+        ge=1,
+        validation_alias=AliasChoices(
+            "subscriber_buffer", "EVENT_BUS_SUBSCRIBER_BUFFER"
+        ),
+        description="Events buffered per stream subscriber before a slow client is dropped.",
+    )
+    replay_buffer: int = Field(
+        default=256,
+        ge=0,
+        validation_alias=AliasChoices("replay_buffer", "EVENT_BUS_REPLAY_BUFFER"),
+        description="Latest events kept per task for tasks/resubscribe (0 disables replay).",
+    )
+    replay_ttl: float = Field(
+        default=300.0,
+        gt=0,
+        validation_alias=AliasChoices("replay_ttl", "EVENT_BUS_REPLAY_TTL"),
+        description="Seconds a task's events stay replayable after its final event.",
+    )
+
+
+class WorkerSettings(BaseSettings):
+    """Worker execution configuration settings.
+
+    Controls how many task operations a single worker processes at once.
+    Operations that share a context_id always run one after another.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="WORKER__",
+        extra="allow",
+    )
+
+    # Maximum number of task operations executing concurrently per worker
+    # 1 keeps the original serial behaviour
+    max_concurrent_tasks: int = Field(
+        default=1,
+        ge=1,
+        validation_alias=AliasChoices(
+            "max_concurrent_tasks", "WORKER__MAX_CONCURRENT_TASKS"
+        ),
+    )
+
+    # Number of contexts whose chat history is kept materialized in memory
+    # (LRU). 0 disables the in-process layer; persisted history is still used.
+    history_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        validation_alias=AliasChoices(
+            "history_cache_size", "WORKER__HISTORY_CACHE_SIZE"
+        ),
+    )
+
+    # Deliveries of one operation before it is dead-lettered instead of run
+    # again (only brokers that redeliver count them: Redis streams, postgres)
+    max_attempts: int = Field(
+        default=3,
+        ge=1,
+        validation_alias=AliasChoices("max_attempts", "WORKER__MAX_ATTEMPTS"),
+    )
+
+    # Runs the agent defers with RescheduleTask: how often, and the backoff
+    # between attempts when the agent does not say how long to wait
+    reschedule_max_attempts: int = Field(
+        default=5,
+        ge=0,
+        validation_alias=AliasChoices(
+            "reschedule_max_attempts", "WORKER__RESCHEDULE_MAX_ATTEMPTS"
+        ),
+    )
+    reschedule_base_delay: float = Field(
+        default=1.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "reschedule_base_delay", "WORKER__RESCHEDULE_BASE_DELAY"
+        ),
+    )
+    reschedule_max_delay: float = Field(
+        default=300.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "reschedule_max_delay", "WORKER__RESCHEDULE_MAX_DELAY"
+        ),
+    )
 
 
 class RetrySettings(BaseSettings):
@@ -946,6 +1215,8 @@ class Settings(BaseSettings):
     oauth: OAuthSettings = OAuthSettings()
     storage: StorageSettings = StorageSettings()
     scheduler: SchedulerSettings = SchedulerSettings()
+    worker: WorkerSettings = WorkerSettings()
+    events: EventBusSettings = EventBusSettings()
     retry: RetrySettings = RetrySettings()
     negotiation: NegotiationSettings = NegotiationSettings()
     sentry: SentrySettings = SentrySettings()
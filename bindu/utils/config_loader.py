@@ -69,17 +69,43 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
         SchedulerConfig instance or None if not configured
     """
     from bindu.common.models import SchedulerConfig
+    from bindu.settings import app_settings
+
+    # Queue bounds and Redis queue type default to settings (SCHEDULER_QUEUE_SIZE,
+    # REDIS_QUEUE_TYPE, ...)
+    queue_settings = {
+        "queue_size": app_settings.scheduler.queue_size,
+        "overflow_policy": app_settings.scheduler.overflow_policy,
+        "enqueue_timeout": app_settings.scheduler.enqueue_timeout,
+        "batch_size": app_settings.scheduler.batch_size,
+        "payload_mode": app_settings.scheduler.payload_mode,
+        "redis_queue_type": app_settings.scheduler.redis_queue_type,
+        "stream_group": app_settings.scheduler.stream_group,
+        "stream_consumer": app_settings.scheduler.stream_consumer,
+        "claim_idle_timeout": app_settings.scheduler.claim_idle_timeout,
+        "redis_shards": app_settings.scheduler.redis_shards,
+        "shard_lease_ttl": app_settings.scheduler.shard_lease_ttl,
+        "visibility_timeout": app_settings.scheduler.visibility_timeout,
+        "postgres_poll_interval": app_settings.scheduler.postgres_poll_interval,
+        "priority_classes": tuple(app_settings.scheduler.priority_classes),
+        "default_priority": app_settings.scheduler.default_priority,
+        "tenant_weights": app_settings.scheduler.tenant_weights,
+    }
 
     # Check if user already provided scheduler config
     if "scheduler" in user_config:
         scheduler_dict = user_config["scheduler"]
         scheduler_type = scheduler_dict.get("type")
-        if scheduler_type not in ("redis", "memory"):
+        if scheduler_type not in ("redis", "memory", "postgres"):
             logger.warning(f"Invalid scheduler type: {scheduler_type}, using memory")
             scheduler_type = "memory"
         return SchedulerConfig(
             type=scheduler_type,
             redis_url=scheduler_dict.get("redis_url"),
+            **{
+                key: scheduler_dict.get(key, value)
+                for key, value in queue_settings.items()
+            },
         )
 
     # Load from environment
@@ -87,7 +113,7 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
     if not scheduler_type:
         return None
 
-    if scheduler_type not in ("redis", "memory"):
+    if scheduler_type not in ("redis", "memory", "postgres"):
         logger.warning(f"Invalid scheduler type: {scheduler_type}, using memory")
         scheduler_type = "memory"
 
@@ -101,7 +127,9 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
             logger.debug("Loaded REDIS_URL from environment")
 
     return SchedulerConfig(
-        type=cast(Literal["redis", "memory"], scheduler_type), redis_url=redis_url
+        type=cast(Literal["redis", "memory", "postgres"], scheduler_type),
+        redis_url=redis_url,
+        **queue_settings,
     )
 
 
@@ -26,6 +26,28 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+def get_caller_identity(request: Request) -> str | None:
+    """Identify the authenticated caller of a request.
+
+    Uses the user context the auth middleware attached: the client's DID when
+    it authenticated with one (its signature is verified by then), otherwise
+    the OAuth subject.
+
+    Args:
+        request: Starlette request object
+
+    Returns:
+        DID or subject, or None for unauthenticated requests
+    """
+    user = getattr(request.state, "user", None)
+    if not user:
+        return None
+    client_id = user.get("client_id") or ""
+    if client_id.startswith("did:"):
+        return client_id
+    return user.get("sub") or None
+
+
 def extract_error_fields(err_alias: Type[Any]) -> Tuple[int, str]:
     """Extract error code and message from JSONRPCError type alias.
 
@@ -38,6 +60,34 @@ def extract_error_fields(err_alias: Type[Any]) -> Tuple[int, str]:
     return int(code), str(msg)
 
 
+def jsonrpc_error_body(
+    code: int,
+    message: str,
+    data: str | None = None,
+    request_id: Any = None,
+) -> dict[str, Any]:
+    """Build the body of a JSON-RPC error response.
+
+    Args:
+        code: JSON-RPC error code
+        message: Error message
+        data: Optional additional error data
+        request_id: Optional JSON-RPC request ID
+
+    Returns:
+        The JSON-RPC error object, ready to serialize
+    """
+    error_dict: dict[str, Any] = {"code": code, "message": message}
+    if data:
+        error_dict["data"] = data
+
+    return {
+        "jsonrpc": "2.0",
+        "error": error_dict,
+        "id": str(request_id) if request_id is not None else None,
+    }
+
+
 def jsonrpc_error(
     code: int,
     message: str,
@@ -57,16 +107,8 @@ def jsonrpc_error(
     Returns:
         JSONResponse with JSON-RPC error format
     """
-    error_dict: dict[str, Any] = {"code": code, "message": message}
-    if data:
-        error_dict["data"] = data
-
     return JSONResponse(
-        content={
-            "jsonrpc": "2.0",
-            "error": error_dict,
-            "id": str(request_id) if request_id is not None else None,
-        },
+        content=jsonrpc_error_body(code, message, data, request_id),
         status_code=status,
     )
 
@@ -219,12 +219,122 @@ async def get_tables_in_schema(
     return [row[0] for row in result.fetchall()]
 
 
+async def get_table_columns(
+    connection: AsyncConnection, schema_name: str, table_name: str
+) -> set[str]:
+    """Get the column names of a table in a specific schema.
+
+    Args:
+        connection: SQLAlchemy async connection
+        schema_name: Schema holding the table
+        table_name: Table to inspect
+
+    Returns:
+        Column names, empty if the table does not exist
+    """
+    result = await connection.execute(
+        text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = :schema_name AND table_name = :table_name"
+        ),
+        {"schema_name": schema_name, "table_name": table_name},
+    )
+    return {row[0] for row in result.fetchall()}
+
+
+# Alembic only migrates the default schema and create_all never alters an
+# existing table, so DID schemas created by older versions are brought up to
+# date here. Each step mirrors a migration and runs when its column check
+# still finds the old layout.
+
+_MOVE_TASK_ITEMS_TO_ROWS = (  # 20261018_0001
+    """
+    INSERT INTO task_messages (task_id, seq, message)
+    SELECT t.id, e.ordinality - 1, e.value
+    FROM tasks t,
+         jsonb_array_elements(COALESCE(t.history, '[]'::jsonb))
+             WITH ORDINALITY AS e(value, ordinality)
+    """,
+    """
+    INSERT INTO task_artifacts (task_id, seq, artifact)
+    SELECT t.id, e.ordinality - 1, e.value
+    FROM tasks t,
+         jsonb_array_elements(COALESCE(t.artifacts, '[]'::jsonb))
+             WITH ORDINALITY AS e(value, ordinality)
+    """,
+    "DROP INDEX IF EXISTS idx_tasks_history_gin",
+    "DROP INDEX IF EXISTS idx_tasks_artifacts_gin",
+    "ALTER TABLE tasks DROP COLUMN history, DROP COLUMN artifacts",
+)
+
+_ADD_TASK_ITEM_COUNTS = (  # 20261018_0002
+    """
+    ALTER TABLE tasks
+        ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0,
+        ADD COLUMN artifact_count INTEGER NOT NULL DEFAULT 0
+    """,
+    """
+    UPDATE tasks t
+    SET message_count = COALESCE(
+            (SELECT MAX(seq) + 1 FROM task_messages m WHERE m.task_id = t.id), 0
+        ),
+        artifact_count = COALESCE(
+            (SELECT MAX(seq) + 1 FROM task_artifacts a WHERE a.task_id = t.id), 0
+        )
+    """,
+)
+
+_ADD_CONTEXT_HISTORY_FLAG = (  # 20261018_0004
+    """
+    ALTER TABLE contexts
+        ADD COLUMN history_initialized BOOLEAN NOT NULL DEFAULT false
+    """,
+    """
+    UPDATE contexts
+    SET context_data = context_data - 'chat_history'
+    WHERE context_data ? 'chat_history'
+    """,
+)
+
+
+async def upgrade_did_schema(connection: AsyncConnection, schema_name: str) -> int:
+    """Bring the existing tables of a DID schema up to the current layout.
+
+    Runs after create_all on a connection whose search_path is the schema, so
+    the tables new since the schema was created already exist.
+
+    Args:
+        connection: SQLAlchemy async connection, inside a transaction
+        schema_name: Schema to upgrade
+
+    Returns:
+        Number of upgrade steps applied
+    """
+    steps = []
+    task_columns = await get_table_columns(connection, schema_name, "tasks")
+    if "history" in task_columns:
+        steps.append(_MOVE_TASK_ITEMS_TO_ROWS)
+    if task_columns and "message_count" not in task_columns:
+        steps.append(_ADD_TASK_ITEM_COUNTS)
+    context_columns = await get_table_columns(connection, schema_name, "contexts")
+    if context_columns and "history_initialized" not in context_columns:
+        steps.append(_ADD_CONTEXT_HISTORY_FLAG)
+
+    for statements in steps:
+        for statement in statements:
+            await connection.execute(text(statement))
+    if steps:
+        logger.info(f"Upgraded schema '{schema_name}' ({len(steps)} steps)")
+    return len(steps)
+
+
 async def initialize_did_schema(
     engine: AsyncEngine, schema_name: str, create_tables: bool = True
 ) -> str:
     """Initialize a complete schema for a DID with all necessary tables.
 
     This is the main entry point for setting up a new DID's database schema.
+    Tables of a schema created by an older version are upgraded in place.
 
     Args:
         engine: SQLAlchemy async engine
@@ -257,6 +367,7 @@ async def initialize_did_schema(
                 metadata.create_all(sync_conn, checkfirst=True)
 
             await conn.run_sync(create_tables_sync)
+            await upgrade_did_schema(conn, schema_name)
 
         if created:
             logger.info(f"Initialized schema '{schema_name}' with all tables")
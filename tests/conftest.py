@@ -39,7 +39,7 @@ class _SpanCtx:
 
 
 class _Tracer:
-    def start_as_current_span(self, name: str):  # noqa: ARG002
+    def start_as_current_span(self, name: str, **kwargs):  # noqa: ARG002
         return _SpanCtx()
 
     def start_span(self, name: str):  # noqa: ARG002
@@ -56,7 +56,34 @@ class _Status:
         pass
 
 
+class _TraceFlags(int):
+    DEFAULT = 0
+    SAMPLED = 1
+
+
+class _SpanContext:
+    def __init__(self, trace_id, span_id, is_remote=False, trace_flags=0):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.is_remote = is_remote
+        self.trace_flags = trace_flags
+
+
+class _NonRecordingSpan(_Span):
+    def __init__(self, context):
+        self._context = context
+
+    def get_span_context(self):
+        return self._context
+
+    def is_recording(self):
+        return False
+
+
 ot_trace.get_current_span = get_current_span  # type: ignore[attr-defined]
+ot_trace.NonRecordingSpan = _NonRecordingSpan  # type: ignore[attr-defined]
+ot_trace.SpanContext = _SpanContext  # type: ignore[attr-defined]
+ot_trace.TraceFlags = _TraceFlags  # type: ignore[attr-defined]
 ot_trace.get_tracer = lambda name: _Tracer()  # type: ignore[attr-defined]
 ot_trace.Status = _Status  # type: ignore[attr-defined]
 ot_trace.StatusCode = _StatusCode  # type: ignore[attr-defined]
@@ -241,6 +268,7 @@ from tests.mocks import (  # noqa: E402
     MockDIDExtension,
     MockManifest,
     MockNotificationService,
+    MockRedis,
 )
 from tests.utils import create_test_context, create_test_message, create_test_task  # noqa: E402
 
@@ -268,6 +296,12 @@ async def scheduler() -> AsyncGenerator[InMemoryScheduler, None]:
         yield sched
 
 
+@pytest.fixture
+def fake_redis() -> MockRedis:
+    """Create a shared in-process Redis server."""
+    return MockRedis()
+
+
 @pytest.fixture
 def mock_agent() -> MockAgent:
     """Create a mock agent that returns normal responses."""
@@ -1,5 +1,6 @@
 """Mock objects for testing."""
 
+import asyncio
 import json
 from typing import Any, Callable, Dict, Optional
 from uuid import UUID
@@ -221,3 +222,296 @@ class MockNotificationService:
                 "error": error,
             }
         )
+
+
+class MockRedisPipeline:
+    """Queues calls on a MockRedis and runs them on execute()."""
+
+    def __init__(self, client: "MockRedis"):
+        """Initialize mock pipeline.
+
+        Note: This is an __init__ method for a mock test object.
+        """
+        self._client = client
+        self._calls: list[Any] = []
+
+    async def __aenter__(self):
+        """Enter the pipeline context."""
+        return self
+
+    async def __aexit__(self, *exc):
+        """Exit the pipeline context."""
+        pass
+
+    def __getattr__(self, name):
+        """Queue any command the client supports."""
+
+        def queue(*args, **kwargs):
+            self._calls.append(getattr(self._client, name)(*args, **kwargs))
+
+        return queue
+
+    async def execute(self):
+        """Run the queued commands in order."""
+        return [await call for call in self._calls]
+
+
+class MockRedisPubSub:
+    """A pub/sub connection, fed by MockRedis.publish()."""
+
+    def __init__(self, server: "MockRedis"):
+        """Initialize mock pub/sub connection.
+
+        Note: This is an __init__ method for a mock test object.
+        """
+        self._server = server
+        self._messages: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        self.channels: set[str] = set()
+        server.connections.append(self)
+
+    async def subscribe(self, *channels):
+        """Subscribe to channels."""
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        """Unsubscribe from channels."""
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        """Return the next message, or None once the timeout passes."""
+        try:
+            return await asyncio.wait_for(self._messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        """Close the connection."""
+        self._server.connections.remove(self)
+
+
+class MockRedis:
+    """In-process Redis with just enough of the list, string, hash and sorted set commands.
+
+    Tests needing more (streams, a controllable clock) subclass it.
+    """
+
+    def __init__(self):
+        """Initialize mock Redis server.
+
+        Note: This is an __init__ method for a mock test object.
+        """
+        self.lists: Dict[str, list[str]] = {}
+        self.strings: Dict[str, str] = {}
+        self.counters: Dict[str, int] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.zsets: Dict[str, Dict[str, float]] = {}
+        self.ttls: Dict[str, int] = {}
+        self.connections: list[MockRedisPubSub] = []
+
+    async def ping(self):
+        """Answer a ping."""
+        return True
+
+    async def aclose(self):
+        """Close the client."""
+        pass
+
+    def pipeline(self, transaction=True):
+        """Start a pipeline."""
+        return MockRedisPipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        """Open a pub/sub connection."""
+        return MockRedisPubSub(self)
+
+    async def publish(self, channel, message):
+        """Deliver a message to the connections subscribed to the channel."""
+        receivers = [c for c in self.connections if channel in c.channels]
+        for connection in receivers:
+            connection._messages.put_nowait(
+                {"type": "message", "channel": channel, "data": message}
+            )
+        return len(receivers)
+
+    def _exists(self, name) -> bool:
+        return any(
+            name in keys
+            for keys in (
+                self.lists,
+                self.strings,
+                self.counters,
+                self.hashes,
+                self.zsets,
+            )
+        )
+
+    async def delete(self, *names):
+        """Delete keys of any type."""
+        deleted = 0
+        for name in names:
+            deleted += self._exists(name)
+            for keys in (
+                self.lists,
+                self.strings,
+                self.counters,
+                self.hashes,
+                self.zsets,
+                self.ttls,
+            ):
+                keys.pop(name, None)
+        return deleted
+
+    async def pexpire(self, name, ms):
+        """Record the TTL of a key that exists."""
+        if not self._exists(name):
+            return False
+        self.ttls[name] = ms
+        return True
+
+    # Strings
+
+    async def get(self, name):
+        """Get a string."""
+        return self.strings.get(name)
+
+    async def set(self, name, value, nx=False, px=None):
+        """Set a string, only if absent when nx is given."""
+        if nx and name in self.strings:
+            return None
+        self.strings[name] = value
+        return True
+
+    async def incr(self, name):
+        """Increment a counter."""
+        self.counters[name] = self.counters.get(name, 0) + 1
+        return self.counters[name]
+
+    # Lists
+
+    async def rpush(self, name, *values):
+        """Append to a list."""
+        self.lists.setdefault(name, []).extend(values)
+        return len(self.lists[name])
+
+    async def lpush(self, name, *values):
+        """Prepend to a list."""
+        self.lists.setdefault(name, [])[:0] = reversed(values)
+        return len(self.lists[name])
+
+    async def lpop(self, name, count=None):
+        """Pop the head of a list."""
+        entries = self.lists.get(name, [])
+        return entries.pop(0) if entries else None
+
+    async def blpop(self, keys, timeout=0):
+        """Pop the head of the first non-empty list, after a short wait if none."""
+        for key in keys:
+            if value := await self.lpop(key):
+                return key, value
+        await asyncio.sleep(0.01)
+        return None
+
+    async def llen(self, name):
+        """Length of a list."""
+        return len(self.lists.get(name, []))
+
+    async def lrange(self, name, start, end):
+        """Slice of a list, inclusive of end."""
+        entries = self.lists.get(name, [])
+        return entries[start:] if end == -1 else entries[start : end + 1]
+
+    async def ltrim(self, name, start, end):
+        """Keep only a slice of a list, inclusive of end."""
+        self.lists[name] = await self.lrange(name, start, end)
+        return True
+
+    async def lrem(self, name, count, value):
+        """Remove the first occurrence of a value."""
+        entries = self.lists.get(name, [])
+        if value not in entries:
+            return 0
+        entries.remove(value)
+        return 1
+
+    # Hashes
+
+    async def hget(self, name, key):
+        """Get a hash field."""
+        return self.hashes.get(name, {}).get(key)
+
+    async def hmget(self, name, keys):
+        """Get several hash fields."""
+        return [self.hashes.get(name, {}).get(key) for key in keys]
+
+    async def hset(self, name, mapping):
+        """Set hash fields."""
+        self.hashes.setdefault(name, {}).update(
+            {key: str(value) for key, value in mapping.items()}
+        )
+        return len(mapping)
+
+    async def hincrbyfloat(self, name, key, amount):
+        """Increment a hash field."""
+        fields = self.hashes.setdefault(name, {})
+        fields[key] = str(float(fields.get(key, 0.0)) + amount)
+        return float(fields[key])
+
+    async def hdel(self, name, *keys):
+        """Delete hash fields."""
+        fields = self.hashes.get(name, {})
+        return sum(fields.pop(key, None) is not None for key in keys)
+
+    # Sorted sets
+
+    async def zadd(self, name, mapping):
+        """Add members to a sorted set."""
+        self.zsets.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    async def zcard(self, name):
+        """Size of a sorted set."""
+        return len(self.zsets.get(name, {}))
+
+    def _by_score(self, name) -> list[tuple[float, str]]:
+        return sorted(
+            (score, member) for member, score in self.zsets.get(name, {}).items()
+        )
+
+    async def zrange(self, name, start, end):
+        """Members of a sorted set by rank, inclusive of end."""
+        members = [member for _, member in self._by_score(name)]
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    async def zrangebyscore(self, name, min, max, start=None, num=None):
+        """Members of a sorted set scored up to max."""
+        members = [
+            member
+            for score, member in self._by_score(name)
+            if float(min) <= score <= float(max)
+        ]
+        return members if start is None else members[start : start + num]
+
+    async def zpopmin(self, name, count=1):
+        """Pop the lowest scored members of a sorted set."""
+        popped = [(member, score) for score, member in self._by_score(name)[:count]]
+        for member, _ in popped:
+            del self.zsets[name][member]
+        return popped
+
+    async def bzpopmin(self, name, timeout=0):
+        """Pop the lowest scored member, after a short wait if there is none."""
+        popped = await self.zpopmin(name)
+        if not popped:
+            await asyncio.sleep(0.01)
+            return None
+        return (name, *popped[0])
+
+    async def zrem(self, name, *members):
+        """Remove members from a sorted set."""
+        zset = self.zsets.get(name, {})
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    async def zremrangebyscore(self, name, min, max):
+        """Remove the members of a sorted set scored up to max."""
+        stale = await self.zrangebyscore(name, min, max)
+        return await self.zrem(name, *stale)
@@ -0,0 +1,163 @@
+"""Unit tests for JSON-RPC batches on the A2A protocol endpoint."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.applications import BinduApplication
+from bindu.common.protocol.types import a2a_response_ta
+from bindu.server.endpoints.a2a_protocol import agent_run_endpoint, dump_a2a_response
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.task_manager import TaskManager
+from tests.utils import create_test_message
+
+
+def _make_request(payload: object) -> object:
+    """Create a minimal mock request carrying a JSON body."""
+
+    async def body():
+        return json.dumps(payload, default=str).encode()
+
+    return SimpleNamespace(
+        body=body,
+        headers={},
+        client=SimpleNamespace(host="127.0.0.1"),
+        state=SimpleNamespace(),
+    )
+
+
+def _get(task_id) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid4()),
+        "method": "tasks/get",
+        "params": {"taskId": str(task_id)},
+    }
+
+
+async def _run(tm: TaskManager, payload: object):
+    app = cast(BinduApplication, SimpleNamespace(task_manager=tm))
+    return await agent_run_endpoint(app, _make_request(payload))  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_batch_responses_come_back_in_request_order():
+    """Test that each request of a batch gets its own response, in order."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            tasks = []
+            for _ in range(3):
+                message = create_test_message(text="Test message")
+                tasks.append(await storage.submit_task(message["context_id"], message))
+            batch = [_get(task["id"]) for task in tasks]
+            batch.insert(1, {**_get(uuid4()), "method": "tasks/unknown"})
+            batch.append(_get(uuid4()))
+            batch.append({"jsonrpc": "2.0", "id": "broken"})
+
+            response = await _run(tm, batch)
+
+    assert response.status_code == 200
+    answers = json.loads(response.body)
+    assert [answer["id"] for answer in answers] == [
+        request.get("id") for request in batch
+    ]
+    assert [answers[i]["result"]["id"] for i in (0, 2, 3)] == [
+        str(task["id"]) for task in tasks
+    ]
+    assert answers[1]["error"]["code"] == -32601
+    assert answers[4]["error"]["code"] == -32001
+    assert answers[5]["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_concurrently_up_to_the_limit():
+    """Test that batched requests overlap, but no more than batch_concurrency."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            running = peak = 0
+            get_task = tm.get_task
+
+            async def slow_get_task(request):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.02)
+                running -= 1
+                return await get_task(request)
+
+            tm.get_task = slow_get_task  # type: ignore[method-assign]
+            with patch("bindu.settings.app_settings.agent.batch_concurrency", 3):
+                await _run(tm, [_get(uuid4()) for _ in range(8)])
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_invalid_batches_are_rejected():
+    """Test empty and oversized batches, and streaming methods inside one."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            empty = await _run(tm, [])
+            with patch("bindu.settings.app_settings.agent.max_batch_size", 2):
+                oversized = await _run(tm, [_get(uuid4()) for _ in range(3)])
+            stream = {
+                "jsonrpc": "2.0",
+                "id": str(uuid4()),
+                "method": "message/stream",
+                "params": {
+                    "message": {
+                        "kind": "message",
+                        "messageId": str(uuid4()),
+                        "contextId": str(uuid4()),
+                        "taskId": str(uuid4()),
+                        "role": "user",
+                        "parts": [{"kind": "text", "text": "Test message"}],
+                    }
+                },
+            }
+            streamed = await _run(tm, [stream])
+
+    assert json.loads(empty.body)["error"]["code"] == -32600
+    assert json.loads(oversized.body)["error"]["code"] == -32600
+    answer = json.loads(streamed.body)[0]
+    assert answer["error"]["code"] == -32600
+    assert "cannot be batched" in answer["error"]["data"]
+
+
+@pytest.mark.asyncio
+async def test_responses_serialize_as_through_the_union():
+    """Test that method-specific serialization matches the response union."""
+    storage = InMemoryStorage()
+    message = create_test_message(text="Test message")
+    task = await storage.submit_task(message["context_id"], message)
+    responses = {
+        "tasks/get": {"jsonrpc": "2.0", "id": uuid4(), "result": task},
+        "tasks/list": {"jsonrpc": "2.0", "id": uuid4(), "result": [task, task]},
+        "tasks/cancel": {
+            "jsonrpc": "2.0",
+            "id": uuid4(),
+            "error": {"code": -32001, "message": "Task not found"},
+        },
+        # Does not fit its method's declared type: serialized through the union
+        "tasks/pushNotification/get": {"jsonrpc": "2.0", "id": uuid4(), "result": 1},
+    }
+
+    for method, response in responses.items():
+        assert dump_a2a_response(method, response) == a2a_response_ta.dump_json(
+            response, by_alias=True, serialize_as_any=True
+        )
@@ -0,0 +1,215 @@
+"""Unit tests for dead-lettering task operations and replaying them."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from opentelemetry.trace import get_current_span
+
+from bindu.server.metrics import get_metrics
+from bindu.server.scheduler.dead_letter import DeadLetterRing, new_dead_letter
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.task_manager import TaskManager
+from bindu.server.workers.base import Worker
+from tests.utils import assert_jsonrpc_success, create_test_message
+
+
+@dataclass
+class FailingWorker(Worker):
+    """Worker whose runs always fail."""
+
+    runs: list[Any] = field(default_factory=list)
+
+    async def run_task(self, params):
+        self.runs.append(params["task_id"])
+        raise RuntimeError("agent exploded")
+
+    async def cancel_task(self, params):
+        pass
+
+    def build_message_history(self, history):
+        return history
+
+    def build_artifacts(self, result):
+        return []
+
+
+def _run_operation(task_id, context_id, **extra) -> dict[str, Any]:
+    return {
+        "operation": "run",
+        "params": {"task_id": task_id, "context_id": context_id},
+        "_current_span": get_current_span(),
+        **extra,
+    }
+
+
+async def _submit(storage: InMemoryStorage) -> dict[str, Any]:
+    message = create_test_message(text="hello")
+    return await storage.submit_task(message["context_id"], message)
+
+
+class TestDeadLetterRing:
+    """Test the in-process dead letters."""
+
+    def test_keeps_the_newest_up_to_the_limit(self):
+        """Test that the oldest entry is dropped when the ring is full."""
+        ring = DeadLetterRing(limit=2)
+        for payload in ("a", "b", "c"):
+            ring.add(new_dead_letter(None, "undecodable", "bad", payload=payload))
+
+        assert len(ring) == 2
+        assert [entry["payload"] for entry in ring.list(10)] == ["c", "b"]
+        assert [entry["payload"] for entry in ring.list(1)] == ["c"]
+
+    def test_an_entry_is_removed_once(self):
+        """Test that a second removal of the same id returns nothing."""
+        ring = DeadLetterRing(limit=10)
+        dead_letter = new_dead_letter(None, "undecodable", "bad", payload="x")
+        ring.add(dead_letter)
+
+        assert ring.remove([dead_letter["id"]]) == [dead_letter]
+        assert ring.remove([dead_letter["id"]]) == []
+
+    def test_operation_is_kept_without_its_message(self):
+        """Test that a decoded operation is stored by reference."""
+        task_id = uuid4()
+        operation = _run_operation(task_id, uuid4(), _attempts=2)
+        operation["params"]["message"] = create_test_message(text="secret")
+
+        dead_letter = new_dead_letter(operation, "failed", "boom")
+
+        assert dead_letter["task_id"] == str(task_id)
+        assert dead_letter["attempts"] == 2
+        assert "secret" not in dead_letter["payload"]
+
+
+class TestWorkerDeadLetters:
+    """Test the worker dead-lettering operations."""
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_dead_lettered_once(self):
+        """Test that a failing agent runs once and its operation is kept."""
+        storage = InMemoryStorage()
+        task = await _submit(storage)
+        async with InMemoryScheduler() as scheduler:
+            worker = FailingWorker(scheduler=scheduler, storage=storage)
+            async with worker.run():
+                await scheduler.run_task(
+                    {"task_id": task["id"], "context_id": task["context_id"]}
+                )
+                async with asyncio.timeout(1.0):
+                    while not await scheduler.list_dead_letters():
+                        await asyncio.sleep(0.005)
+
+            (dead_letter,) = await scheduler.list_dead_letters()
+
+        assert worker.runs == [task["id"]]
+        assert dead_letter["reason"] == "failed"
+        assert dead_letter["error"] == "agent exploded"
+        assert dead_letter["task_id"] == str(task["id"])
+        stored = await storage.load_task(task["id"])
+        assert stored["status"]["state"] == "failed"
+        text = get_metrics().generate_prometheus_text()
+        assert 'scheduler_dead_letters_total{reason="failed"}' in text
+
+    @pytest.mark.asyncio
+    async def test_operation_past_max_attempts_is_not_run(self):
+        """Test that a redelivered operation over max_attempts is quarantined."""
+        storage = InMemoryStorage()
+        task = await _submit(storage)
+        async with InMemoryScheduler() as scheduler:
+            worker = FailingWorker(scheduler=scheduler, storage=storage)
+
+            await worker._execute_operation(
+                _run_operation(task["id"], task["context_id"], _attempts=4)
+            )
+            (dead_letter,) = await scheduler.list_dead_letters()
+
+        assert worker.runs == []
+        assert dead_letter["reason"] == "max_attempts"
+        assert dead_letter["attempts"] == 4
+        stored = await storage.load_task(task["id"])
+        assert stored["status"]["state"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_operation_that_raises_is_released_not_acked(self):
+        """Test that an operation whose failure handling raises is given back."""
+        storage = InMemoryStorage()
+        task = await _submit(storage)
+        async with InMemoryScheduler() as scheduler:
+            worker = FailingWorker(scheduler=scheduler, storage=storage)
+            scheduler.ack_task_operation = AsyncMock()
+            scheduler.release_task_operation = AsyncMock()
+            storage.update_task = AsyncMock(side_effect=ConnectionError("db down"))
+            operation = _run_operation(task["id"], task["context_id"])
+
+            with pytest.raises(ConnectionError):
+                await worker._execute_operation(operation)
+
+        scheduler.ack_task_operation.assert_not_awaited()
+        scheduler.release_task_operation.assert_awaited_once_with(operation)
+
+
+class TestDeadLetterRPCs:
+    """Test tasks/deadLetters/list and tasks/deadLetters/replay."""
+
+    @pytest.mark.asyncio
+    async def test_list_and_replay(self):
+        """Test that a replayed run is resubmitted and leaves the dead letters."""
+        storage = InMemoryStorage()
+        task = await _submit(storage)
+        await storage.update_task(task["id"], state="failed")
+        async with InMemoryScheduler() as scheduler:
+            await scheduler.dead_letter_task_operation(
+                _run_operation(task["id"], task["context_id"], _attempts=1),
+                "failed",
+                "boom",
+            )
+            await scheduler.dead_letter_task_operation(
+                None, "undecodable", "bad", payload="not json"
+            )
+            async with TaskManager(
+                scheduler=scheduler, storage=storage, manifest=None
+            ) as tm:
+                listed = await tm.list_dead_letters(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": uuid4(),
+                        "method": "tasks/deadLetters/list",
+                        "params": {"limit": 10},
+                    }
+                )
+                assert_jsonrpc_success(listed)
+                undecodable, failed = listed["result"]
+
+                replayed = await tm.replay_dead_letters(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": uuid4(),
+                        "method": "tasks/deadLetters/replay",
+                        "params": {},
+                    }
+                )
+                again = await tm.replay_dead_letters(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": uuid4(),
+                        "method": "tasks/deadLetters/replay",
+                        "params": {"ids": [failed["id"]]},
+                    }
+                )
+
+            assert scheduler.queue_length == 1
+            assert await scheduler.list_dead_letters() == [undecodable]
+
+        assert replayed["result"] == {
+            "replayed": [failed["id"]],
+            "skipped": [undecodable["id"]],
+        }
+        assert again["result"] == {"replayed": [], "skipped": [failed["id"]]}
+        stored = await storage.load_task(task["id"])
+        assert stored["status"]["state"] == "submitted"
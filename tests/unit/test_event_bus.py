@@ -0,0 +1,328 @@
+"""Unit tests for the task event bus and message/stream on top of it."""
+
+import asyncio
+import json
+from typing import Any, cast
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+from starlette.responses import StreamingResponse
+
+from bindu.common.models import AgentManifest
+from bindu.server.events import (
+    InMemoryTaskEventBus,
+    RedisTaskEventBus,
+    SubscriberLaggedError,
+    status_event,
+)
+from bindu.server.metrics import get_metrics
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.task_manager import TaskManager
+from tests.mocks import MockManifest, MockRedis
+from tests.utils import create_test_message
+
+
+class ChunkManifest(MockManifest):
+    """Manifest whose agent streams its answer in chunks."""
+
+    def run(self, message_history: list):
+        yield "Hel"
+        yield ""
+        yield "lo"
+
+
+def _event(task_id, state="working", final=False):
+    return status_event(task_id, uuid4(), state, final)
+
+
+async def _read_stream(response: StreamingResponse) -> list[dict[str, Any]]:
+    events = []
+    async for chunk in response.body_iterator:
+        assert chunk.startswith("data: ") and chunk.endswith("\n\n")
+        events.append(json.loads(chunk[len("data: ") :]))
+    await response.background()
+    return events
+
+
+class TestInMemoryTaskEventBus:
+    """Test local fan-out and bounded buffers."""
+
+    @pytest.mark.asyncio
+    async def test_events_reach_every_subscriber_of_the_task(self):
+        """Test fan-out per task and cleanup on unsubscribe."""
+        bus = InMemoryTaskEventBus()
+        task_id, other = uuid4(), uuid4()
+
+        async with bus.subscribe(task_id) as first, bus.subscribe(task_id) as second:
+            await bus.publish(other, _event(other))
+            await bus.publish(task_id, _event(task_id, "completed", final=True))
+
+            assert (await first.__anext__())["status"]["state"] == "completed"
+            assert (await second.__anext__())["final"] is True
+            assert first._queue.empty()
+
+        assert not bus.has_subscribers(task_id)
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_dropped_without_affecting_others(self):
+        """Test that overflowing a buffer ends that subscriber only."""
+        bus = InMemoryTaskEventBus(subscriber_buffer=2)
+        task_id = uuid4()
+
+        async with bus.subscribe(task_id) as slow, bus.subscribe(task_id) as fast:
+            for _ in range(2):
+                await bus.publish(task_id, _event(task_id))
+                await fast.__anext__()
+            await bus.publish(task_id, _event(task_id))
+
+            with pytest.raises(SubscriberLaggedError):
+                await slow.__anext__()
+            assert slow._queue.empty()
+            assert (await fast.__anext__())["kind"] == "status-update"
+
+        text = get_metrics().generate_prometheus_text()
+        assert "task_event_subscribers_lagged_total" in text
+
+    @pytest.mark.asyncio
+    async def test_events_are_numbered_and_replayed_up_to_the_buffer(self):
+        """Test sequences, the replay cap and replay after a sequence."""
+        bus = InMemoryTaskEventBus(replay_buffer=3)
+        task_id = uuid4()
+
+        published = [await bus.publish(task_id, _event(task_id)) for _ in range(4)]
+
+        assert [e["sequence"] for e in published] == [1, 2, 3, 4]
+        assert [e["sequence"] for e in await bus.replay(task_id, 0)] == [2, 3, 4]
+        assert [e["sequence"] for e in await bus.replay(task_id, 3)] == [4]
+        assert await bus.replay(uuid4(), 0) == []
+
+    @pytest.mark.asyncio
+    async def test_resubscriber_gets_the_replay_then_live_events_once(self):
+        """Test that events both replayed and delivered live arrive once."""
+        bus = InMemoryTaskEventBus()
+        task_id = uuid4()
+        for _ in range(3):
+            await bus.publish(task_id, _event(task_id))
+
+        async with bus.subscribe(task_id, after_sequence=1) as subscription:
+            # Delivered live although the replay already holds it
+            subscription.put((await bus.replay(task_id, 2))[0])
+            await bus.publish(task_id, _event(task_id, "completed", final=True))
+
+            received = [(await subscription.__anext__())["sequence"] for _ in range(3)]
+
+        assert received == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_replay_expires_after_the_final_event(self):
+        """Test that a finished task's events are dropped after replay_ttl."""
+        bus = InMemoryTaskEventBus(replay_ttl=0.01)
+        running, finished = uuid4(), uuid4()
+        await bus.publish(running, _event(running))
+        await bus.publish(finished, _event(finished, "completed", final=True))
+
+        await asyncio.sleep(0.02)
+        with patch("bindu.server.events.memory_event_bus.SWEEP_INTERVAL", 0):
+            bus._next_sweep = 0.0
+
+            assert await bus.replay(finished, 0) == []
+            assert len(await bus.replay(running, 0)) == 1
+
+
+class TestRedisTaskEventBus:
+    """Test the pub/sub backend across two processes sharing a server."""
+
+    @pytest.mark.asyncio
+    async def test_events_cross_processes_on_the_task_channel(self):
+        """Test that a publisher reaches a subscriber on another bus."""
+        server = MockRedis()
+        task_id = uuid4()
+        with patch("redis.asyncio.from_url", return_value=server):
+            async with (
+                RedisTaskEventBus("redis://localhost:6379/0") as worker_side,
+                RedisTaskEventBus("redis://localhost:6379/0") as request_side,
+            ):
+                async with request_side.subscribe(task_id) as subscription:
+                    (listener,) = [
+                        c
+                        for c in server.connections
+                        if c.channels & {f"bindu:events:{task_id}"}
+                    ]
+                    await worker_side.publish(task_id, _event(task_id, "working"))
+
+                    event = await asyncio.wait_for(subscription.__anext__(), 1.0)
+                    assert event["task_id"] == str(task_id)
+
+                assert listener.channels == {"bindu:events:_"}
+
+                # A third process replays what it missed
+                async with RedisTaskEventBus("redis://localhost:6379/0") as late:
+                    await worker_side.publish(
+                        task_id, _event(task_id, "completed", final=True)
+                    )
+                    async with late.subscribe(task_id, after_sequence=1) as replayed:
+                        event = await replayed.__anext__()
+
+        assert event["sequence"] == 2 and event["final"] is True
+        replay_key = f"bindu:events:{task_id}:replay"
+        assert len(server.lists[replay_key]) == 2
+        assert server.ttls[replay_key] == 300_000
+        assert server.connections == []
+
+    @pytest.mark.asyncio
+    async def test_replay_list_is_capped(self):
+        """Test that only the newest replay_buffer events are kept."""
+        server = MockRedis()
+        task_id = uuid4()
+        with patch("redis.asyncio.from_url", return_value=server):
+            async with RedisTaskEventBus(
+                "redis://localhost:6379/0", replay_buffer=2
+            ) as bus:
+                for _ in range(3):
+                    await bus.publish(task_id, _event(task_id))
+
+                replayed = await bus.replay(task_id, 0)
+
+        assert [e["sequence"] for e in replayed] == [2, 3]
+
+
+class TestStreamMessage:
+    """Test message/stream running through the scheduler and a worker."""
+
+    @pytest.mark.asyncio
+    async def test_stream_relays_the_worker_run(self):
+        """Test that chunks and the final status come from the worker's run."""
+        storage = InMemoryStorage()
+        manifest = cast(AgentManifest, ChunkManifest())
+        message = create_test_message(text="hi")
+
+        async with TaskManager(
+            scheduler=InMemoryScheduler(), storage=storage, manifest=manifest
+        ) as tm:
+            response = await tm.stream_message(
+                {
+                    "jsonrpc": "2.0",
+                    "id": uuid4(),
+                    "method": "message/stream",
+                    "params": {"message": message},
+                }
+            )
+            assert isinstance(response, StreamingResponse)
+            events = await asyncio.wait_for(_read_stream(response), 5.0)
+            assert not tm.event_bus.has_subscribers(events[0]["task_id"])
+
+        states = [e["status"]["state"] for e in events if e["kind"] == "status-update"]
+        assert states == ["submitted", "working", "completed"]
+        assert events[-1]["final"] is True
+
+        chunks = [e for e in events if e.get("append")]
+        assert [c["artifact"]["parts"][0]["text"] for c in chunks] == ["Hel", "lo"]
+        assert len({c["artifact"]["artifact_id"] for c in chunks}) == 1
+        (artifact,) = [e for e in events if e.get("last_chunk")]
+        assert (
+            artifact["artifact"]["artifact_id"] != chunks[0]["artifact"]["artifact_id"]
+        )
+
+        stored = await storage.load_task(message["task_id"])
+        assert stored["status"]["state"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_from_storage_when_an_event_is_lost(self):
+        """Test that a stream hearing nothing ends once the stored task is over."""
+        storage = InMemoryStorage()
+        message = create_test_message(text="hi")
+
+        async with TaskManager(
+            scheduler=InMemoryScheduler(), storage=storage, manifest=None
+        ) as tm:
+            with patch(
+                "bindu.server.handlers.message_handlers.STREAM_IDLE_CHECK_INTERVAL",
+                0.01,
+            ):
+                response = await tm.stream_message(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": uuid4(),
+                        "method": "message/stream",
+                        "params": {"message": message},
+                    }
+                )
+                await storage.update_task(message["task_id"], state="failed")
+                events = await asyncio.wait_for(_read_stream(response), 5.0)
+
+        assert [e["status"]["state"] for e in events] == ["submitted", "failed"]
+        assert events[-1]["final"] is True
+
+
+async def _stream_to_completion(tm: TaskManager) -> list[dict[str, Any]]:
+    response = await tm.stream_message(
+        {
+            "jsonrpc": "2.0",
+            "id": uuid4(),
+            "method": "message/stream",
+            "params": {"message": create_test_message(text="hi")},
+        }
+    )
+    return await asyncio.wait_for(_read_stream(response), 5.0)
+
+
+def _resubscribe(task_id, **params) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid4(),
+        "method": "tasks/resubscribe",
+        "params": {"task_id": task_id, **params},
+    }
+
+
+class TestResubscribe:
+    """Test tasks/resubscribe."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_the_last_sequence_seen(self):
+        """Test that a dropped client gets exactly the events it missed."""
+        manifest = cast(AgentManifest, ChunkManifest())
+        async with TaskManager(
+            scheduler=InMemoryScheduler(), storage=InMemoryStorage(), manifest=manifest
+        ) as tm:
+            streamed = await _stream_to_completion(tm)
+            task_id = UUID(streamed[0]["task_id"])
+
+            response = await tm.resubscribe_task(
+                _resubscribe(task_id, after_sequence=2)
+            )
+            resumed = await asyncio.wait_for(_read_stream(response), 5.0)
+
+        assert [e["sequence"] for e in streamed] == list(range(1, len(streamed) + 1))
+        assert resumed == streamed[2:]
+
+    @pytest.mark.asyncio
+    async def test_expired_task_starts_from_the_stored_state(self):
+        """Test that without kept events the stored final state ends the stream."""
+        storage = InMemoryStorage()
+        message = create_test_message(text="hi")
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state="completed")
+
+        async with TaskManager(
+            scheduler=InMemoryScheduler(), storage=storage, manifest=None
+        ) as tm:
+            response = await tm.resubscribe_task(_resubscribe(task["id"]))
+            events = await asyncio.wait_for(_read_stream(response), 5.0)
+
+        (event,) = events
+        assert event["status"]["state"] == "completed"
+        assert event["final"] is True
+
+    @pytest.mark.asyncio
+    async def test_unknown_task(self):
+        """Test that an unknown task is a TaskNotFoundError."""
+        async with TaskManager(
+            scheduler=InMemoryScheduler(), storage=InMemoryStorage(), manifest=None
+        ) as tm:
+            response = await tm.resubscribe_task(_resubscribe(uuid4()))
+            assert not tm.event_bus._subscriptions
+
+        assert response["error"]["code"] == -32001
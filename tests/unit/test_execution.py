@@ -0,0 +1,90 @@
+"""Unit tests for sync handler execution backends."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bindu.common.models import ExecutionConfig
+from bindu.penguin.config_validator import ConfigValidator
+from bindu.penguin.execution import ExecutionBackend
+from bindu.server.metrics import get_metrics
+
+
+def _blocking_handler(messages):
+    time.sleep(0.2)
+    return f"done: {messages}"
+
+
+def _streaming_handler(messages):
+    for word in messages.split():
+        yield (word, threading.get_ident())
+
+
+@pytest.mark.asyncio
+async def test_thread_backend_keeps_event_loop_responsive():
+    """Test that a blocking sync call does not freeze the loop."""
+    backend = ExecutionBackend(ExecutionConfig(backend="thread"))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        result = await backend.call(_blocking_handler, "hi")
+    finally:
+        ticker_task.cancel()
+
+    assert result == "done: hi"
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_thread_backend_streams_sync_generator_off_loop():
+    """Test that sync generator chunks are produced in the pool, in order."""
+    backend = ExecutionBackend(ExecutionConfig(backend="thread", max_workers=2))
+
+    chunks = [chunk async for chunk in backend.iterate(_streaming_handler, "a b c")]
+
+    assert [word for word, _ in chunks] == ["a", "b", "c"]
+    assert all(ident != threading.get_ident() for _, ident in chunks)
+
+
+@pytest.mark.asyncio
+async def test_inline_backend_calls_directly():
+    """Test that the inline backend runs on the calling thread."""
+    backend = ExecutionBackend(ExecutionConfig(backend="inline"))
+
+    assert not backend.offloads
+    assert await backend.call(threading.get_ident) == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_pool_usage_is_exported_to_metrics():
+    """Test that pool gauges appear in the Prometheus output."""
+    backend = ExecutionBackend(ExecutionConfig(backend="thread", max_workers=3))
+    await backend.call(_blocking_handler, "x")
+
+    text = get_metrics().generate_prometheus_text()
+    assert 'agent_execution_pool_size{backend="thread"} 3' in text
+    assert 'agent_execution_pool_busy{backend="thread"} 0' in text
+    assert 'agent_execution_pool_waiting{backend="thread"} 0' in text
+
+
+def test_config_validator_rejects_unknown_backend():
+    """Test that execution.backend is validated."""
+    with pytest.raises(ValueError, match="execution.backend"):
+        ConfigValidator.validate_and_process(
+            {"author": "a", "deployment": {}, "execution": {"backend": "gpu"}}
+        )
+
+
+def test_config_validator_defaults_to_thread_backend():
+    """Test that sync handlers are offloaded by default."""
+    config = ConfigValidator.validate_and_process({"author": "a", "deployment": {}})
+    assert config["execution"] == {"backend": "thread"}
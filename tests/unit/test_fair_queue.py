@@ -0,0 +1,148 @@
+"""Unit tests for priority classes and per-tenant fair queueing."""
+
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.metrics import get_metrics
+from bindu.server.scheduler.fair_queue import DEFAULT_TENANT, FairQueue, FairShare
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+
+
+def _drain(queue: FairQueue) -> list:
+    return [queue.pop()[1] for _ in range(len(queue))]
+
+
+class TestFairShare:
+    """Test resolving the priority class and tenant of an operation."""
+
+    def test_unknown_priority_falls_back_to_default(self):
+        """Test that a missing or unknown priority uses the default class."""
+        share = FairShare()
+
+        assert share.resolve({"priority": "batch", "tenant": "did:a"}) == (
+            "batch",
+            "did:a",
+        )
+        assert share.resolve({"priority": "urgent"}) == ("normal", DEFAULT_TENANT)
+
+    def test_default_must_be_a_class(self):
+        """Test that a default outside the classes is refused."""
+        with pytest.raises(ValueError, match="not one of"):
+            FairShare(priority_classes=("high", "low"), default_priority="normal")
+
+
+class TestFairQueue:
+    """Test the serving order of FairQueue."""
+
+    def test_higher_class_is_served_first(self):
+        """Test that classes are served strictly in order."""
+        queue = FairQueue(FairShare())
+        queue.push("batch", "batch", "a")
+        queue.push("normal", "normal", "a")
+        queue.push("interactive", "interactive", "a")
+
+        assert queue.lengths() == {"interactive": 1, "normal": 1, "batch": 1}
+        assert _drain(queue) == ["interactive", "normal", "batch"]
+
+    def test_tenants_take_turns(self):
+        """Test that a tenant's backlog does not hold up another tenant."""
+        queue = FairQueue(FairShare())
+        for i in range(100):
+            queue.push(f"a{i}", "normal", "a")
+        queue.push("b0", "normal", "b")
+        queue.push("b1", "normal", "b")
+
+        assert _drain(queue)[:4] == ["a0", "b0", "a1", "b1"]
+
+    def test_weights_set_the_share(self):
+        """Test that a tenant of weight 2 gets twice the turns."""
+        queue = FairQueue(FairShare(tenant_weights={"heavy": 2.0}))
+        for i in range(6):
+            queue.push(("heavy", i), "normal", "heavy")
+            queue.push(("light", i), "normal", "light")
+
+        first = [tenant for tenant, _ in _drain(queue)[:6]]
+        assert first.count("heavy") == 4
+        assert first.count("light") == 2
+
+    def test_late_tenant_does_not_get_a_burst(self):
+        """Test that a tenant arriving late starts from the current virtual time."""
+        queue = FairQueue(FairShare())
+        for i in range(10):
+            queue.push(f"a{i}", "normal", "a")
+        for _ in range(5):
+            queue.pop()
+        queue.push("b0", "normal", "b")
+        queue.push("b1", "normal", "b")
+
+        assert _drain(queue)[:4] == ["a5", "b0", "a6", "b1"]
+
+    def test_item_put_back_goes_first_in_its_class(self):
+        """Test that push_front jumps the class without moving the tenant's tag."""
+        queue = FairQueue(FairShare())
+        queue.push("a0", "normal", "a")
+        queue.push("b0", "normal", "b")
+        queue.push("i0", "interactive", "a")
+        queue.push("a1", "normal", "a")
+        queue.push_front("b-back", "normal", "b")
+
+        assert _drain(queue) == ["i0", "b-back", "a0", "b0", "a1"]
+
+    def test_pop_from_empty_queue(self):
+        """Test that popping an empty queue raises IndexError."""
+        with pytest.raises(IndexError):
+            FairQueue(FairShare()).pop()
+
+
+class TestInMemorySchedulerFairness:
+    """Test InMemoryScheduler ordering runs by class and tenant."""
+
+    @pytest.mark.asyncio
+    async def test_runs_are_served_by_priority_then_tenant(self):
+        """Test the order in which queued runs and a cancel are received."""
+        async with InMemoryScheduler() as scheduler:
+            params = [
+                {"priority": "batch", "tenant": "a"},
+                {"tenant": "a"},
+                {"tenant": "a"},
+                {"tenant": "b"},
+                {"priority": "interactive", "tenant": "b"},
+            ]
+            task_ids = []
+            for extra in params:
+                task_ids.append(uuid4())
+                await scheduler.run_task(
+                    {"task_id": task_ids[-1], "context_id": uuid4(), **extra}
+                )
+            await scheduler.cancel_task({"task_id": task_ids[0]})
+
+            received = []
+            async for operation in scheduler.receive_task_operations():
+                received.append(
+                    (operation["operation"], operation["params"]["task_id"])
+                )
+                if len(received) == 6:
+                    break
+
+        assert received == [
+            ("cancel", task_ids[0]),
+            ("run", task_ids[4]),
+            ("run", task_ids[1]),
+            ("run", task_ids[3]),
+            ("run", task_ids[2]),
+            ("run", task_ids[0]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_wait_is_recorded_per_class(self):
+        """Test that time in queue is exported per priority class."""
+        async with InMemoryScheduler() as scheduler:
+            await scheduler.run_task(
+                {"task_id": uuid4(), "context_id": uuid4(), "priority": "batch"}
+            )
+            async for _ in scheduler.receive_task_operations():
+                break
+
+        text = get_metrics().generate_prometheus_text()
+        assert 'scheduler_priority_wait_seconds_count{priority="batch"}' in text
@@ -1,6 +1,9 @@
 """Unit tests for ManifestWorker and hybrid agent pattern."""
 
+import asyncio
+import time
 from typing import cast
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -8,7 +11,10 @@ import pytest
 from bindu.common.models import AgentManifest
 from bindu.common.protocol.types import TaskSendParams
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage import ContextHistory
 from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers import RescheduleTask
+from bindu.server.workers.helpers import ContextHistoryCache
 from bindu.server.workers.manifest_worker import ManifestWorker
 from tests.mocks import MockAgent, MockManifest
 from tests.utils import assert_task_state, create_test_message
@@ -456,6 +462,166 @@ class TestErrorHandling:
             await worker.run_task(params)
 
 
+class TestCancellation:
+    """Test cancels that reach the worker both out of band and queued."""
+
+    @pytest.mark.asyncio
+    async def test_canceled_task_is_not_run(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that a run dequeued after its task was canceled does nothing."""
+        agent = MockAgent(response="Should not run")
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, MockManifest(agent_fn=agent)),
+        )
+        message = create_test_message(text="Do something")
+        task = await storage.submit_task(message["context_id"], message)
+
+        await worker.cancel_task({"task_id": task["id"]})
+        await worker.run_task(
+            cast(
+                TaskSendParams,
+                {"task_id": task["id"], "context_id": task["context_id"]},
+            )
+        )
+
+        assert_task_state(await storage.load_task(task["id"]), "canceled")
+        assert agent.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_leaves_terminal_task_alone(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+        mock_manifest: MockManifest,
+    ):
+        """Test that a second cancel does not overwrite a finished task."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, mock_manifest),
+        )
+        message = create_test_message(text="Do something")
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state="completed")
+
+        await worker.cancel_task({"task_id": task["id"]})
+
+        assert_task_state(await storage.load_task(task["id"]), "completed")
+
+
+class TestRescheduling:
+    """Test agents deferring a task with RescheduleTask."""
+
+    @staticmethod
+    def _deferring_agent(retry_after=None):
+        def agent(messages):
+            raise RescheduleTask(retry_after=retry_after, reason="rate limited")
+
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_deferred_task_is_queued_again(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that the task goes back to submitted with a run_at."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(
+                AgentManifest,
+                MockManifest(agent_fn=self._deferring_agent(retry_after=30)),
+            ),
+        )
+        message = create_test_message(text="Call the upstream")
+        task = await storage.submit_task(message["context_id"], message)
+
+        with patch.object(scheduler, "run_task") as run_task:
+            await worker.run_task(
+                cast(
+                    TaskSendParams,
+                    {"task_id": task["id"], "context_id": task["context_id"]},
+                )
+            )
+
+        assert_task_state(await storage.load_task(task["id"]), "submitted")
+        (params,) = run_task.call_args.args
+        assert params["task_id"] == task["id"]
+        assert params["reschedules"] == 1
+        assert 29 < params["run_at"] - time.time() <= 30
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_with_reschedules(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that without retry_after the delay backs off exponentially."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(
+                AgentManifest, MockManifest(agent_fn=self._deferring_agent())
+            ),
+        )
+        message = create_test_message(text="Call the upstream")
+        task = await storage.submit_task(message["context_id"], message)
+
+        with patch.object(scheduler, "run_task") as run_task:
+            await worker.run_task(
+                cast(
+                    TaskSendParams,
+                    {
+                        "task_id": task["id"],
+                        "context_id": task["context_id"],
+                        "reschedules": 3,
+                    },
+                )
+            )
+
+        # Base delay 1s: 8s, with jitter between half and all of it
+        delay = run_task.call_args.args[0]["run_at"] - time.time()
+        assert 3.5 < delay <= 8
+
+    @pytest.mark.asyncio
+    async def test_task_fails_when_out_of_reschedules(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that a task deferred too often fails instead."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(
+                AgentManifest, MockManifest(agent_fn=self._deferring_agent())
+            ),
+        )
+        message = create_test_message(text="Call the upstream")
+        task = await storage.submit_task(message["context_id"], message)
+
+        with patch.object(scheduler, "run_task") as run_task:
+            await worker.run_task(
+                cast(
+                    TaskSendParams,
+                    {
+                        "task_id": task["id"],
+                        "context_id": task["context_id"],
+                        "reschedules": 5,
+                    },
+                )
+            )
+
+        assert_task_state(await storage.load_task(task["id"]), "failed")
+        run_task.assert_not_called()
+
+
 class TestLifecycleNotifications:
     """Test lifecycle notification callbacks."""
 
@@ -504,3 +670,210 @@ class TestLifecycleNotifications:
 
         # Should have received notifications
         assert len(notifications) > 0
+
+
+class TestContextHistoryCache:
+    """Test the materialized history used for context-based history."""
+
+    async def _run(self, worker, storage, context_id, text):
+        message = create_test_message(text=text, context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+        await worker.run_task(
+            cast(
+                TaskSendParams,
+                {"task_id": task["id"], "context_id": context_id, "message": message},
+            )
+        )
+        return task
+
+    def _worker(self, storage, scheduler, agent=None):
+        manifest = MockManifest(agent_fn=agent or MockAgent(response="Answer"))
+        manifest.enable_context_based_history = True
+        return ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_appended_to_context_history(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that history grows incrementally as tasks complete."""
+        worker = self._worker(storage, scheduler)
+        context_id = uuid4()
+
+        await self._run(worker, storage, context_id, "First question")
+        await self._run(worker, storage, context_id, "Second question")
+
+        history = (await storage.load_context_history(context_id)).messages
+        assert [m["content"] for m in history] == [
+            "First question",
+            "Answer",
+            "Second question",
+            "Answer",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_history_is_not_rebuilt_from_earlier_tasks(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that a warm context does not list the context's tasks again."""
+        worker = self._worker(storage, scheduler)
+        context_id = uuid4()
+        await self._run(worker, storage, context_id, "First question")
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("history should come from the cache")
+
+        storage.list_tasks_by_context = fail
+        message = create_test_message(text="Follow-up", context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+
+        history = await worker._build_complete_message_history(task)
+
+        assert [m["content"] for m in history] == [
+            "First question",
+            "Answer",
+            "Follow-up",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_new_worker_loads_persisted_history(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that a restarted worker reuses the history persisted in storage."""
+        context_id = uuid4()
+        await self._run(
+            self._worker(storage, scheduler), storage, context_id, "First question"
+        )
+
+        restarted = self._worker(storage, scheduler)
+        assert len(restarted.history_cache) == 0
+        message = create_test_message(text="Follow-up", context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+
+        history = await restarted._build_complete_message_history(task)
+
+        assert [m["content"] for m in history] == [
+            "First question",
+            "Answer",
+            "Follow-up",
+        ]
+        assert len(restarted.history_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_history_is_rebuilt_once(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that contexts without persisted history are rebuilt and stored."""
+        worker = self._worker(storage, scheduler)
+        context_id = uuid4()
+        await self._run(worker, storage, context_id, "First question")
+        storage._drop_context_history(context_id)
+        worker.history_cache.clear()
+
+        message = create_test_message(text="Follow-up", context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+        await worker._build_complete_message_history(task)
+
+        history = (await storage.load_context_history(context_id)).messages
+        assert [m["content"] for m in history] == ["First question", "Answer"]
+
+    @pytest.mark.asyncio
+    async def test_turns_finished_by_another_worker_are_picked_up(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that a cached context still sees turns other workers stored."""
+        first, other = (
+            self._worker(storage, scheduler),
+            self._worker(storage, scheduler),
+        )
+        context_id = uuid4()
+        await self._run(first, storage, context_id, "First question")
+        await self._run(other, storage, context_id, "Second question")
+
+        message = create_test_message(text="Follow-up", context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+        history = await first._build_complete_message_history(task)
+
+        assert [m["content"] for m in history] == [
+            "First question",
+            "Answer",
+            "Second question",
+            "Answer",
+            "Follow-up",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_replaced_history_is_read_again(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that a history rebuilt elsewhere replaces the cached copy."""
+        worker = self._worker(storage, scheduler)
+        context_id = uuid4()
+        await self._run(worker, storage, context_id, "First question")
+        await self._run(worker, storage, context_id, "Second question")
+
+        # Another process clears the history and stores a different one
+        storage._drop_context_history(context_id)
+        await storage.init_context_history(
+            context_id, [(uuid4(), [{"role": "user", "content": "Replaced"}])]
+        )
+
+        message = create_test_message(text="Follow-up", context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+        history = await worker._build_complete_message_history(task)
+
+        assert [m["content"] for m in history] == ["Replaced", "Follow-up"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rebuilds_do_not_duplicate_turns(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that racing rebuilds and records store each turn once."""
+        context_id = uuid4()
+        done = await self._run(
+            self._worker(storage, scheduler), storage, context_id, "First question"
+        )
+        storage._drop_context_history(context_id)
+
+        workers = [self._worker(storage, scheduler) for _ in range(2)]
+        message = create_test_message(text="Follow-up", context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+        await asyncio.gather(
+            *(worker._build_complete_message_history(task) for worker in workers)
+        )
+        # The finished task records its turn late, after the rebuilds
+        await workers[0]._record_context_history(await storage.load_task(done["id"]))
+
+        history = (await storage.load_context_history(context_id)).messages
+        assert [m["content"] for m in history] == ["First question", "Answer"]
+
+
+def test_history_cache_evicts_least_recently_used():
+    """Test that the history cache is bounded across contexts."""
+    cache = ContextHistoryCache(max_contexts=2)
+    empty = ContextHistory(messages=[], first_seq=0, last_seq=0)
+    cache.put("a", empty)
+    cache.put("b", empty)
+    cache.get("a")
+    cache.put("c", empty)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == empty
+    assert cache.get("c") == empty
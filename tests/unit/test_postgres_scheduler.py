@@ -0,0 +1,309 @@
+"""Unit tests for PostgresScheduler with a statement-recording fake engine."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from opentelemetry.trace import get_current_span
+from sqlalchemy.dialects import postgresql
+
+from bindu.common.models import SchedulerConfig
+from bindu.server.scheduler.codec import decode_task_operation, encode_task_operation
+from bindu.server.scheduler.factory import create_scheduler
+from bindu.server.scheduler.postgres_scheduler import (
+    CONTROL_CHANNEL,
+    NOTIFY_CHANNEL,
+    PostgresScheduler,
+)
+from bindu.server.storage.postgres_storage import PostgresStorage
+
+
+class _Result:
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+        self.rowcount = len(self._rows)
+
+    def fetchall(self):
+        return self._rows
+
+    def scalar(self):
+        return self._rows[0] if self._rows else None
+
+
+class _Connection:
+    """Records statements; claims are answered from the engine's queue."""
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __await__(self):
+        yield from []
+        return self
+
+    async def execute(self, statement):
+        self._engine.statements.append(statement)
+        sql = self._engine.sql(statement)
+        if sql.startswith("WITH candidates"):
+            return _Result(self._engine.claims.pop(0) if self._engine.claims else [])
+        return _Result()
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self._engine)
+
+    async def close(self):
+        pass
+
+
+class FakeEngine:
+    """Stands in for the AsyncEngine shared by PostgresStorage."""
+
+    def __init__(self):
+        self.statements = []
+        self.claims: list[list[SimpleNamespace]] = []
+        self.listeners = {}
+
+    @staticmethod
+    def sql(statement) -> str:
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    def begin(self):
+        return _Connection(self)
+
+    def connect(self):
+        return _Connection(self)
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def notify(self):
+        self.listeners[NOTIFY_CHANNEL](None, 0, NOTIFY_CHANNEL, "")
+
+
+def _row(row_id: int, operation: str = "cancel", task_id=None, attempts: int = 1):
+    payload = encode_task_operation(
+        {
+            "operation": operation,
+            "params": {"task_id": task_id or uuid4()},
+            "_current_span": get_current_span(),
+        }
+    )
+    return SimpleNamespace(id=row_id, payload=payload, attempts=attempts, waited=0.25)
+
+
+@pytest.fixture
+def engine():
+    """Fake engine."""
+    return FakeEngine()
+
+
+@pytest_asyncio.fixture
+async def scheduler(engine):
+    """PostgresScheduler entered on the fake engine."""
+    storage = SimpleNamespace(engine=engine)
+    async with PostgresScheduler(
+        storage=storage, batch_size=10, poll_timeout=30
+    ) as scheduler:
+        yield scheduler
+
+
+class TestPostgresSchedulerStatements:
+    """Test the SQL the scheduler sends."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_inserts_and_notifies_in_one_statement(
+        self, scheduler, engine
+    ):
+        """Test that run_tasks writes every row and NOTIFY in one statement."""
+        engine.statements.clear()
+        task_ids = [uuid4(), uuid4()]
+
+        await scheduler.run_tasks(
+            [
+                {
+                    "task_id": task_id,
+                    "context_id": uuid4(),
+                    "message": {"parts": [{"kind": "text", "text": "hi"}]},
+                }
+                for task_id in task_ids
+            ]
+        )
+
+        assert len(engine.statements) == 1
+        sql = engine.sql(engine.statements[0])
+        assert sql.startswith("WITH inserted AS")
+        assert "INSERT INTO task_operations" in sql
+        assert "pg_notify" in sql
+        payloads = [
+            value
+            for key, value in engine.statements[0].compile().params.items()
+            if isinstance(value, str) and value.startswith("{")
+        ]
+        decoded = [decode_task_operation(payload) for payload in payloads]
+        assert [op["params"]["task_id"] for op in decoded] == task_ids
+        # Queued by reference: the message stays in storage
+        assert all("message" not in op["params"] for op in decoded)
+
+    def test_deferred_run_is_not_available_before_run_at(self, engine):
+        """Test that a future run_at becomes the row's available_at."""
+        scheduler = PostgresScheduler(storage=None)
+        run_at = time.time() + 60
+        operations = [
+            {
+                "operation": "run",
+                "params": {"task_id": uuid4(), "context_id": uuid4(), **extra},
+                "_current_span": get_current_span(),
+            }
+            for extra in ({}, {"run_at": run_at})
+        ]
+
+        statement = scheduler._enqueue_statement(operations)
+
+        sql = engine.sql(statement)
+        assert "now()" in sql
+        assert "to_timestamp(" in sql
+        assert run_at in statement.compile().params.values()
+
+    def test_claim_skips_locked_rows(self, engine):
+        """Test that a claim is a single SKIP LOCKED update of a batch."""
+        scheduler = PostgresScheduler(storage=None, visibility_timeout=30)
+
+        sql = engine.sql(scheduler._claim_statement(10))
+
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "ORDER BY task_operations.id" in sql
+        assert "UPDATE task_operations SET available_at=(now() +" in sql
+        assert (
+            "RETURNING task_operations.id, task_operations.payload, "
+            "task_operations.attempts" in sql
+        )
+
+
+class TestPostgresSchedulerDelivery:
+    """Test receiving and acknowledging operations."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_yielded_in_queue_order_and_acked(self, scheduler, engine):
+        """Test that a claimed batch is yielded by id and acks delete rows."""
+        first, second = uuid4(), uuid4()
+        engine.claims.append(
+            [_row(8, task_id=second, attempts=2), _row(7, task_id=first)]
+        )
+
+        operations = scheduler.receive_task_operations()
+        received = [await operations.__anext__() for _ in range(2)]
+        await operations.aclose()
+
+        assert [op["params"]["task_id"] for op in received] == [first, second]
+        assert [op["_delivery_id"] for op in received] == ["7", "8"]
+        # Claims so far travel with the operation
+        assert [op["_attempts"] for op in received] == [1, 2]
+        assert scheduler._in_flight == {7, 8}
+
+        engine.statements.clear()
+        await scheduler.ack_task_operation(received[0])
+
+        assert scheduler._in_flight == {8}
+        assert engine.sql(engine.statements[0]).startswith(
+            "DELETE FROM task_operations WHERE task_operations.id ="
+        )
+
+        # A failed operation stops being hidden, without being deleted
+        engine.statements.clear()
+        await scheduler.release_task_operation(received[1])
+
+        assert scheduler._in_flight == set()
+        assert engine.statements == []
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_an_idle_consumer(self, scheduler, engine):
+        """Test that an empty queue waits for NOTIFY instead of polling."""
+        operations = scheduler.receive_task_operations()
+        pending = asyncio.ensure_future(operations.__anext__())
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        engine.claims.append([_row(1, operation="pause")])
+        engine.notify()
+
+        received = await asyncio.wait_for(pending, timeout=1.0)
+        await operations.aclose()
+        assert received["operation"] == "pause"
+
+    @pytest.mark.asyncio
+    async def test_undecodable_row_is_deleted(self, scheduler, engine):
+        """Test that a poison row is removed instead of being claimed forever."""
+        engine.claims.append(
+            [SimpleNamespace(id=3, payload="not json", attempts=1, waited=0), _row(4)]
+        )
+
+        operations = scheduler.receive_task_operations()
+        received = await operations.__anext__()
+        await operations.aclose()
+
+        assert received["_delivery_id"] == "4"
+        (dead_letter,) = await scheduler.list_dead_letters()
+        assert dead_letter["reason"] == "undecodable"
+        assert dead_letter["payload"] == "not json"
+        deletes = [
+            engine.sql(statement)
+            for statement in engine.statements
+            if engine.sql(statement).startswith("DELETE")
+        ]
+        assert len(deletes) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_is_notified_on_the_control_channel(self, scheduler, engine):
+        """Test that a cancel is queued and also sent to listening workers."""
+        task_id = uuid4()
+        engine.statements.clear()
+        controls = scheduler.receive_control_operations()
+        pending = asyncio.ensure_future(controls.__anext__())
+        await asyncio.sleep(0)
+
+        await scheduler.cancel_task({"task_id": task_id})
+        sql = [engine.sql(statement) for statement in engine.statements]
+        assert sql[0].startswith("WITH inserted AS")
+        assert "pg_notify" in sql[1]
+        payload = next(
+            value
+            for value in engine.statements[1].compile().params.values()
+            if value != CONTROL_CHANNEL
+        )
+        engine.listeners[CONTROL_CHANNEL](None, 0, CONTROL_CHANNEL, payload)
+
+        received = await asyncio.wait_for(pending, timeout=1.0)
+        await controls.aclose()
+        assert received["operation"] == "cancel"
+        assert received["params"]["task_id"] == task_id
+
+
+class TestPostgresSchedulerFactory:
+    """Test creating the scheduler through the factory."""
+
+    @pytest.mark.asyncio
+    async def test_requires_postgres_storage(self):
+        """Test that the postgres backend refuses other storages."""
+        with pytest.raises(ValueError, match="requires PostgresStorage"):
+            await create_scheduler(SchedulerConfig(type="postgres"), storage=None)
+
+    @pytest.mark.asyncio
+    async def test_shares_postgres_storage(self):
+        """Test that the scheduler is built on the given storage."""
+        storage = PostgresStorage(database_url="postgresql://localhost/bindu")
+        config = SchedulerConfig(type="postgres", batch_size=20, visibility_timeout=15)
+
+        scheduler = await create_scheduler(config, storage=storage)
+
+        assert isinstance(scheduler, PostgresScheduler)
+        assert scheduler.storage is storage
+        assert scheduler.batch_size == 20
+        assert scheduler.visibility_timeout == 15
@@ -10,9 +10,12 @@ This module tests the PostgreSQL storage backend with focus on:
 
 import pytest
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sqlalchemy.dialects import postgresql
+
 from bindu.server.storage.postgres_storage import PostgresStorage
 from bindu.server.storage.helpers import serialize_for_jsonb as _serialize_for_jsonb
 from tests.utils import create_test_message
@@ -224,6 +227,255 @@ class TestPostgresStorageTaskOperations:
         assert isinstance(task["artifacts"], list)
 
 
+class _RecordingSession:
+    """Fake AsyncSession that records statements and replays result rows."""
+
+    def __init__(self, rows):
+        self.statements = []
+        self._rows = iter(rows)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def begin(self):
+        return self
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        row = next(self._rows, None)
+        result.first.return_value = row
+        result.scalar.return_value = row[0] if isinstance(row, tuple) else row
+        return result
+
+    def sql(self, index):
+        return str(self.statements[index].compile(dialect=postgresql.dialect()))
+
+
+def _task_row(task_id, context_id, state="working"):
+    row = MagicMock()
+    row.id = task_id
+    row.context_id = context_id
+    row.kind = "task"
+    row.state = state
+    row.state_timestamp = datetime.now(timezone.utc)
+    row.history = []
+    row.artifacts = []
+    row.metadata = {}
+    row.message_count = 1
+    row.artifact_count = 0
+    return row
+
+
+def _connected_storage(session):
+    storage = PostgresStorage()
+    storage._engine = MagicMock()
+    storage._session_factory = lambda: session
+    return storage
+
+
+class TestPostgresStorageItemTables:
+    """Test that history and artifacts are stored one row per item."""
+
+    @pytest.mark.asyncio
+    async def test_load_task_reads_only_last_messages(self):
+        """Test that history_length becomes a LIMIT on task_messages."""
+        task_id, context_id = uuid4(), uuid4()
+        session = _RecordingSession([_task_row(task_id, context_id)])
+        storage = _connected_storage(session)
+
+        await storage.load_task(task_id, history_length=3)
+
+        sql = session.sql(0)
+        assert "FROM task_messages" in sql
+        assert "ORDER BY task_messages.seq DESC" in sql
+        assert "LIMIT" in sql
+        assert "tasks.history" not in sql
+
+    @pytest.mark.asyncio
+    async def test_update_task_appends_with_inserts(self):
+        """Test that new messages and artifacts are inserted, not concatenated."""
+        task_id, context_id = uuid4(), uuid4()
+        session = _RecordingSession([_task_row(task_id, context_id)])
+        storage = _connected_storage(session)
+
+        await storage.update_task(
+            task_id,
+            state="completed",
+            new_artifacts=[{"artifact_id": uuid4(), "parts": []}],
+            new_messages=[create_test_message(task_id=task_id, context_id=context_id)],
+        )
+
+        sql = session.sql(0)
+        assert "INSERT INTO task_artifacts" in sql
+        assert "INSERT INTO task_messages" in sql
+        assert "SET history" not in sql
+
+    @pytest.mark.asyncio
+    async def test_withdraw_message_deletes_only_the_last_row(self):
+        """Test that a withdrawn message is deleted with the task stepped back."""
+        session = _RecordingSession([None])
+        storage = _connected_storage(session)
+
+        await storage.withdraw_message(uuid4(), uuid4())
+
+        (stmt,) = session.statements
+        sql = session.sql(0)
+        assert "DELETE FROM task_messages" in sql
+        assert "FOR UPDATE" in sql
+        assert "message_count - " in sql
+        assert stmt.compile().params["state"] == "input-required"
+
+
+class TestPostgresStorageContextHistory:
+    """Test that context chat history is stored one row per message."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_appended_and_read_as_rows(self):
+        """Test inserts into context_messages and reads after a sequence."""
+        context_id = uuid4()
+        row = SimpleNamespace(
+            history_initialized=True,
+            first_seq=3,
+            messages=[{"role": "user", "content": "Hi"}],
+            last_seq=9,
+        )
+        session = _RecordingSession([None, None, None, row])
+        storage = _connected_storage(session)
+
+        await storage.append_context_history(
+            context_id, uuid4(), [{"role": "user", "content": "Hi"}]
+        )
+        await storage.init_context_history(context_id, [])
+        history = await storage.load_context_history(context_id, after_seq=8)
+
+        lock_sql, append_sql, init_sql, load_sql = (session.sql(i) for i in range(4))
+        assert lock_sql.endswith("FOR UPDATE")
+        assert "INSERT INTO context_messages" in append_sql
+        assert "ON CONFLICT (context_id, task_id, position) DO NOTHING" in append_sql
+        assert "context_data" not in append_sql
+        assert "SET history_initialized" in init_sql
+        assert "context_messages.seq >" in load_sql
+        assert history == (row.messages, 3, 9)
+
+    @pytest.mark.asyncio
+    async def test_history_rows_are_inserted_under_the_context_lock(self):
+        """Test that seqs are drawn only once the context row is locked."""
+        session = _RecordingSession([None, None])
+        storage = _connected_storage(session)
+
+        await storage.init_context_history(
+            uuid4(), [(uuid4(), [{"role": "user", "content": "Hi"}])]
+        )
+
+        lock_sql, init_sql = session.sql(0), session.sql(1)
+        assert lock_sql.startswith("SELECT contexts.id")
+        assert lock_sql.endswith("FOR UPDATE")
+        assert "INSERT INTO context_messages" in init_sql
+        assert "SET history_initialized" in init_sql
+
+    @pytest.mark.asyncio
+    async def test_uninitialized_history_loads_as_none(self):
+        """Test that a context whose history was never rebuilt reports None."""
+        row = SimpleNamespace(
+            history_initialized=False, first_seq=None, messages=[], last_seq=None
+        )
+        storage = _connected_storage(_RecordingSession([row]))
+
+        assert await storage.load_context_history(uuid4()) is None
+
+
+class TestPostgresStorageRoundTrips:
+    """Test that every task mutation is a single statement."""
+
+    @pytest.mark.asyncio
+    async def test_task_lifecycle_is_one_statement_per_call(self):
+        """Test submit, working and completed without extra lookups or reloads."""
+        task_id, context_id = uuid4(), uuid4()
+        row = _task_row(task_id, context_id)
+        session = _RecordingSession([row, row, row])
+        storage = _connected_storage(session)
+
+        message = create_test_message(task_id=task_id, context_id=context_id)
+        await storage.submit_task(context_id, message)
+        await storage.update_task(task_id, state="working")
+        await storage.update_task(
+            task_id,
+            state="completed",
+            new_artifacts=[{"artifact_id": uuid4(), "parts": []}],
+            new_messages=[create_test_message()],
+        )
+
+        assert len(session.statements) == 3
+        submit_sql = session.sql(0)
+        assert "INSERT INTO contexts" in submit_sql
+        assert "ON CONFLICT (id) DO UPDATE" in submit_sql
+        assert "INSERT INTO task_messages" in submit_sql
+
+    @pytest.mark.asyncio
+    async def test_update_missing_task_raises_key_error(self):
+        """Test that an UPDATE matching no row is reported as not found."""
+        session = _RecordingSession([])
+        storage = _connected_storage(session)
+
+        with patch(
+            "bindu.server.storage.postgres_storage.app_settings"
+        ) as mock_settings:
+            mock_settings.storage.postgres_max_retries = 1
+            mock_settings.storage.postgres_retry_delay = 0.01
+            with pytest.raises(KeyError):
+                await storage.update_task(uuid4(), state="working")
+
+        assert len(session.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_to_terminal_task_raises_value_error(self):
+        """Test that a terminal task is not continued."""
+        task_id, context_id = uuid4(), uuid4()
+        session = _RecordingSession([None, ("completed",)])
+        storage = _connected_storage(session)
+
+        with patch(
+            "bindu.server.storage.postgres_storage.app_settings"
+        ) as mock_settings:
+            mock_settings.storage.postgres_max_retries = 1
+            mock_settings.storage.postgres_retry_delay = 0.01
+            mock_settings.agent.terminal_states = frozenset({"completed"})
+            with pytest.raises(ValueError, match="terminal state 'completed'"):
+                await storage.submit_task(
+                    context_id,
+                    create_test_message(task_id=task_id, context_id=context_id),
+                )
+
+    @pytest.mark.asyncio
+    async def test_projection_leaves_parts_out_of_the_query(self):
+        """Test that unrequested history and artifacts are not selected."""
+        task_id, context_id = uuid4(), uuid4()
+        row = SimpleNamespace(
+            id=task_id,
+            context_id=context_id,
+            kind="task",
+            state="working",
+            state_timestamp=datetime.now(timezone.utc),
+            metadata={},
+        )
+        session = _RecordingSession([row])
+        storage = _connected_storage(session)
+
+        task = await storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
+
+        sql = session.sql(0)
+        assert "task_messages" not in sql
+        assert "task_artifacts" not in sql
+        assert "history" not in task
+        assert "artifacts" not in task
+
+
 class TestPostgresStorageRetryLogic:
     """Test PostgresStorage retry logic."""
 
@@ -0,0 +1,222 @@
+"""Unit tests for RedisFairScheduler against an in-process fake of sorted sets."""
+
+import asyncio
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from bindu.common.models import SchedulerConfig
+from bindu.server.scheduler.factory import create_scheduler
+from bindu.server.scheduler.redis_fair_scheduler import RedisFairScheduler
+from bindu.settings import app_settings
+
+
+async def _connect(fake_redis, **kwargs) -> RedisFairScheduler:
+    scheduler = RedisFairScheduler(
+        redis_url="redis://localhost:6379/0", poll_timeout=0, **kwargs
+    )
+    with patch("redis.asyncio.from_url", return_value=fake_redis):
+        await scheduler.__aenter__()
+    return scheduler
+
+
+async def _receive(scheduler: RedisFairScheduler, count: int) -> list:
+    operations = scheduler.receive_task_operations()
+    try:
+        return [
+            await asyncio.wait_for(operations.__anext__(), timeout=1.0)
+            for _ in range(count)
+        ]
+    finally:
+        await operations.aclose()
+
+
+class TestRedisFairOrdering:
+    """Test the order operations come out of the sorted set."""
+
+    @pytest.mark.asyncio
+    async def test_controls_then_classes_then_tenants(self, fake_redis):
+        """Test that cancels go first, then runs by class and tenant turn."""
+        scheduler = await _connect(fake_redis, batch_size=10)
+        tenants = ["a", "a", "a", "b"]
+        task_ids = [uuid4() for _ in tenants]
+        await scheduler.run_tasks(
+            [
+                {"task_id": task_id, "context_id": uuid4(), "tenant": tenant}
+                for task_id, tenant in zip(task_ids, tenants)
+            ]
+        )
+        urgent = uuid4()
+        await scheduler.run_task(
+            {"task_id": urgent, "context_id": uuid4(), "priority": "interactive"}
+        )
+        await scheduler.cancel_task({"task_id": task_ids[2]})
+
+        assert await scheduler.get_queue_length() == 6
+        received = await _receive(scheduler, 6)
+
+        assert [(op["operation"], op["params"]["task_id"]) for op in received] == [
+            ("cancel", task_ids[2]),
+            ("run", urgent),
+            ("run", task_ids[0]),
+            ("run", task_ids[3]),
+            ("run", task_ids[1]),
+            ("run", task_ids[2]),
+        ]
+        # Priority and tenant travel with the operation
+        assert received[2]["params"]["tenant"] == "a"
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_idle_tenant_restarts_from_virtual_time(self, fake_redis):
+        """Test that a tenant arriving late cannot jump a long backlog."""
+        scheduler = await _connect(fake_redis, batch_size=4)
+        backlog = [uuid4() for _ in range(8)]
+        await scheduler.run_tasks(
+            [{"task_id": task_id, "tenant": "a"} for task_id in backlog]
+        )
+        await _receive(scheduler, 4)
+
+        late = [uuid4(), uuid4()]
+        await scheduler.run_tasks(
+            [{"task_id": task_id, "tenant": "b"} for task_id in late]
+        )
+        received = await _receive(scheduler, 4)
+
+        assert [op["params"]["task_id"] for op in received] == [
+            backlog[4],
+            late[0],
+            backlog[5],
+            late[1],
+        ]
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_tags_of_tenants_without_queued_runs_are_removed(self, fake_redis):
+        """Test that a tenant's tag goes once its last queued run is served."""
+        scheduler = await _connect(fake_redis)
+        await scheduler.run_tasks(
+            [{"task_id": uuid4(), "tenant": tenant} for tenant in ("a", "a", "b")]
+        )
+
+        await _receive(scheduler, 2)
+        assert list(fake_redis.hashes[scheduler.tags_key]) == ["normal:a"]
+
+        await _receive(scheduler, 1)
+        assert fake_redis.hashes[scheduler.tags_key] == {}
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_clear_queue_drops_fairness_state(self, fake_redis):
+        """Test that clearing the queue removes the tags too."""
+        scheduler = await _connect(fake_redis)
+        await scheduler.run_task({"task_id": uuid4(), "tenant": "a"})
+
+        assert await scheduler.clear_queue() == 1
+        assert fake_redis.zsets == {}
+        assert fake_redis.hashes == {}
+        await scheduler.__aexit__(None, None, None)
+
+
+class TestRedisDeferredOperations:
+    """Test runs deferred with run_at through the delayed sorted set."""
+
+    @pytest.mark.asyncio
+    async def test_deferred_run_is_moved_once_due(self, fake_redis):
+        """Test that a run is held in the delayed set until its run_at."""
+        scheduler = await _connect(fake_redis)
+        later, soon = uuid4(), uuid4()
+        await scheduler.run_tasks(
+            [
+                {"task_id": later, "run_at": time.time() + 3600},
+                {"task_id": soon, "run_at": time.time() + 0.05, "tenant": "a"},
+            ]
+        )
+
+        assert await scheduler.get_queue_length() == 0
+        assert await scheduler._move_due_operations() == 0
+
+        await asyncio.sleep(0.06)
+        assert await scheduler._move_due_operations() == 1
+        assert await scheduler._move_due_operations() == 0
+
+        (received,) = await _receive(scheduler, 1)
+        assert received["params"]["task_id"] == soon
+        assert received["params"]["tenant"] == "a"
+        assert len(fake_redis.zsets[scheduler.delayed_key]) == 1
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_receiving_worker_moves_due_runs(self, fake_redis):
+        """Test that the mover started by a receiving worker queues due runs."""
+        scheduler = await _connect(fake_redis)
+        scheduler.delayed_poll_interval = 0.01
+        task_id = uuid4()
+        await scheduler.run_task({"task_id": task_id, "run_at": time.time() + 0.05})
+
+        (received,) = await _receive(scheduler, 1)
+
+        assert received["params"]["task_id"] == task_id
+        await scheduler.__aexit__(None, None, None)
+        assert scheduler._delayed_mover_task is None
+
+
+class TestRedisDeadLetters:
+    """Test the dead letters shared through a Redis list."""
+
+    @pytest.mark.asyncio
+    async def test_dead_letters_are_shared_and_removed_once(self, fake_redis):
+        """Test that every process sees a dead letter and only one removes it."""
+        scheduler = await _connect(fake_redis)
+        other = await _connect(fake_redis)
+        task_id = uuid4()
+        await scheduler.run_task({"task_id": task_id, "tenant": "a"})
+        (operation,) = await _receive(scheduler, 1)
+
+        await scheduler.dead_letter_task_operation(operation, "failed", "boom")
+        (dead_letter,) = await other.list_dead_letters()
+
+        assert dead_letter["task_id"] == str(task_id)
+        assert dead_letter["operation"] == "run"
+        assert dead_letter["error"] == "boom"
+        assert await scheduler.remove_dead_letters([dead_letter["id"]]) == [dead_letter]
+        assert await other.remove_dead_letters([dead_letter["id"]]) == []
+        assert await other.list_dead_letters() == []
+        await scheduler.__aexit__(None, None, None)
+        await other.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_list_is_capped(self, fake_redis):
+        """Test that only the newest dead_letter_limit entries are kept."""
+        scheduler = await _connect(fake_redis)
+        with patch.object(app_settings.scheduler, "dead_letter_limit", 2):
+            for payload in ("a", "b", "c"):
+                await scheduler.dead_letter_task_operation(
+                    None, "undecodable", "bad", payload=payload
+                )
+
+        dead_letters = await scheduler.list_dead_letters()
+
+        assert [entry["payload"] for entry in dead_letters] == ["c", "b"]
+        await scheduler.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_factory_creates_fair_scheduler():
+    """Test that redis_queue_type="fair" selects the fair scheduler."""
+    config = SchedulerConfig(
+        type="redis",
+        redis_url="redis://localhost:6379/0",
+        redis_queue_type="fair",
+        priority_classes=("high", "low"),
+        default_priority="low",
+        tenant_weights={"did:bindu:vip": 3.0},
+    )
+
+    scheduler = await create_scheduler(config)
+
+    assert isinstance(scheduler, RedisFairScheduler)
+    assert scheduler.share.priority_classes == ("high", "low")
+    assert scheduler.share.cost("did:bindu:vip") == pytest.approx(1 / 3)
@@ -1,11 +1,15 @@
 """Unit tests for RedisScheduler."""
 
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
+from opentelemetry.trace import get_current_span
 
 from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.metrics import get_metrics
 from bindu.server.scheduler.redis_scheduler import RedisScheduler
 
 
@@ -22,8 +26,11 @@ def mock_redis_client():
     client.ping = AsyncMock()
     client.rpush = AsyncMock()
     client.blpop = AsyncMock()
+    client.lpop = AsyncMock(return_value=None)
     client.llen = AsyncMock(return_value=0)
     client.delete = AsyncMock(return_value=0)
+    client.zrangebyscore = AsyncMock(return_value=[])
+    client.zcard = AsyncMock(return_value=0)
     client.aclose = AsyncMock()
     return client
 
@@ -120,8 +127,8 @@ class TestRedisSchedulerTaskOperations:
         # Verify serialized data
         serialized = call_args[0][1]
         data = json.loads(serialized)
-        assert data["operation"] == "run"
-        assert data["params"]["task_id"] == "test-task-123"
+        assert data["op"] == "run"
+        assert data["task_id"] == "test-task-123"
 
     @pytest.mark.asyncio
     async def test_cancel_task(self, scheduler, mock_redis_client):
@@ -134,8 +141,8 @@ class TestRedisSchedulerTaskOperations:
         call_args = mock_redis_client.rpush.call_args
         serialized = call_args[0][1]
         data = json.loads(serialized)
-        assert data["operation"] == "cancel"
-        assert data["params"]["task_id"] == "test-task-123"
+        assert data["op"] == "cancel"
+        assert data["task_id"] == "test-task-123"
 
     @pytest.mark.asyncio
     async def test_pause_task(self, scheduler, mock_redis_client):
@@ -148,7 +155,7 @@ class TestRedisSchedulerTaskOperations:
         call_args = mock_redis_client.rpush.call_args
         serialized = call_args[0][1]
         data = json.loads(serialized)
-        assert data["operation"] == "pause"
+        assert data["op"] == "pause"
 
     @pytest.mark.asyncio
     async def test_resume_task(self, scheduler, mock_redis_client):
@@ -161,7 +168,145 @@ class TestRedisSchedulerTaskOperations:
         call_args = mock_redis_client.rpush.call_args
         serialized = call_args[0][1]
         data = json.loads(serialized)
-        assert data["operation"] == "resume"
+        assert data["op"] == "resume"
+
+
+class TestRedisSchedulerBatching:
+    """Test batched dequeue and multi-operation enqueue."""
+
+    @pytest.mark.asyncio
+    async def test_receive_takes_queued_batch_without_blocking(
+        self, redis_url, mock_redis_client
+    ):
+        """Test that queued operations are popped together with LPOP count."""
+        scheduler = RedisScheduler(redis_url=redis_url, batch_size=3)
+        scheduler._redis_client = mock_redis_client
+        queued = [
+            json.dumps({"operation": "cancel", "params": {"task_id": f"task-{i}"}})
+            for i in range(3)
+        ]
+        mock_redis_client.lpop.return_value = queued
+
+        operations = scheduler.receive_task_operations()
+        received = [await operations.__anext__() for _ in range(3)]
+        await operations.aclose()
+
+        assert [op["params"]["task_id"] for op in received] == [
+            "task-0",
+            "task-1",
+            "task-2",
+        ]
+        mock_redis_client.lpop.assert_called_once_with("bindu:tasks", 3)
+        mock_redis_client.blpop.assert_not_called()
+        assert (
+            'scheduler_batch_size_bucket{direction="dequeue",le="5"}'
+            in get_metrics().generate_prometheus_text()
+        )
+
+    @pytest.mark.asyncio
+    async def test_receive_blocks_only_when_queue_is_empty(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that BLPOP is used once LPOP finds nothing."""
+        mock_redis_client.blpop.return_value = (
+            "bindu:tasks",
+            json.dumps({"operation": "pause", "params": {"task_id": "task-1"}}),
+        )
+
+        operations = scheduler.receive_task_operations()
+        received = await operations.__anext__()
+        await operations.aclose()
+
+        assert received["operation"] == "pause"
+        mock_redis_client.blpop.assert_called_once_with("bindu:tasks", timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_bad_entry_does_not_drop_rest_of_batch(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that one undecodable operation is dead-lettered on its own."""
+        mock_redis_client.lpop.return_value = [
+            "not json",
+            json.dumps({"operation": "resume", "params": {"task_id": "task-1"}}),
+        ]
+        scheduler._store_dead_letter = AsyncMock()
+
+        operations = scheduler.receive_task_operations()
+        received = await operations.__anext__()
+        await operations.aclose()
+
+        assert received["operation"] == "resume"
+        (dead_letter,) = scheduler._store_dead_letter.await_args.args
+        assert dead_letter["reason"] == "undecodable"
+        assert dead_letter["payload"] == "not json"
+
+    @pytest.mark.asyncio
+    async def test_run_tasks_pushes_in_one_round_trip(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that run_tasks sends every operation with a single RPUSH."""
+        await scheduler.run_tasks(
+            [TaskSendParams(task_id=f"task-{i}", context_id="ctx") for i in range(4)]
+        )
+
+        mock_redis_client.rpush.assert_called_once()
+        key, *values = mock_redis_client.rpush.call_args[0]
+        assert key == "bindu:tasks"
+        assert [json.loads(value)["task_id"] for value in values] == [
+            "task-0",
+            "task-1",
+            "task-2",
+            "task-3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_deferred_runs_go_to_the_delayed_set(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that runs with a future run_at are scored by it, not queued."""
+        run_at = time.time() + 60
+        await scheduler.run_tasks(
+            [
+                TaskSendParams(task_id="task-0", context_id="ctx"),
+                TaskSendParams(task_id="task-1", context_id="ctx", run_at=run_at),
+            ]
+        )
+
+        key, *values = mock_redis_client.rpush.call_args[0]
+        assert [json.loads(value)["task_id"] for value in values] == ["task-0"]
+        key, mapping = mock_redis_client.zadd.call_args[0]
+        assert key == "bindu:tasks:delayed"
+        ((member, score),) = mapping.items()
+        assert json.loads(member.split("|", 1)[1])["task_id"] == "task-1"
+        assert score == run_at
+
+    @pytest.mark.asyncio
+    async def test_undecodable_deferred_operation_is_dead_lettered(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that a due operation that cannot be decoded is kept, not lost."""
+        due = json.dumps({"operation": "resume", "params": {"task_id": "task-1"}})
+        mock_redis_client.zrangebyscore.return_value = ["a|not json", f"b|{due}"]
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 1])
+        mock_redis_client.pipeline = MagicMock()
+        mock_redis_client.pipeline.return_value.__aenter__.return_value = pipe
+        scheduler._store_dead_letter = AsyncMock()
+
+        assert await scheduler._move_due_operations() == 1
+
+        key, *values = mock_redis_client.rpush.call_args[0]
+        assert [json.loads(value)["task_id"] for value in values] == ["task-1"]
+        (dead_letter,) = scheduler._store_dead_letter.await_args.args
+        assert dead_letter["reason"] == "undecodable"
+        assert dead_letter["payload"] == "not json"
+
+    @pytest.mark.asyncio
+    async def test_run_tasks_with_nothing_to_send(self, scheduler, mock_redis_client):
+        """Test that an empty run_tasks does not touch Redis."""
+        await scheduler.run_tasks([])
+
+        mock_redis_client.rpush.assert_not_called()
 
 
 class TestRedisSchedulerSerialization:
@@ -188,8 +333,8 @@ class TestRedisSchedulerSerialization:
         serialized = scheduler._serialize_task_operation(task_op)
         data = json.loads(serialized)
 
-        assert data["operation"] == "run"
-        assert data["params"]["task_id"] == "test-123"
+        assert data["op"] == "run"
+        assert data["task_id"] == "test-123"
         assert "span_id" in data
         assert "trace_id" in data
 
@@ -250,6 +395,81 @@ class TestRedisSchedulerSerialization:
             scheduler._deserialize_task_operation(serialized)
 
 
+class TestRedisSchedulerReferenceEnvelope:
+    """Test queueing operations by reference instead of embedding the message."""
+
+    def _run_operation(self, text: str):
+        task_id, context_id = uuid4(), uuid4()
+        params = TaskSendParams(
+            task_id=task_id,
+            context_id=context_id,
+            message={
+                "message_id": uuid4(),
+                "role": "user",
+                "parts": [{"kind": "text", "text": text}],
+            },
+            history_length=5,
+        )
+        return {
+            "operation": "run",
+            "params": params,
+            "_current_span": get_current_span(),
+        }
+
+    def test_envelope_leaves_message_out(self, redis_url):
+        """Test that the envelope holds ids and options but no message."""
+        scheduler = RedisScheduler(redis_url=redis_url, payload_mode="reference")
+        operation = self._run_operation("hello")
+
+        data = json.loads(scheduler._serialize_task_operation(operation))
+
+        assert "params" not in data
+        assert data["task_id"] == str(operation["params"]["task_id"])
+        assert data["context_id"] == str(operation["params"]["context_id"])
+        assert data["options"] == {"history_length": 5}
+
+    def test_envelope_size_does_not_depend_on_message(self, redis_url):
+        """Test that attachments do not grow the queued payload."""
+        scheduler = RedisScheduler(redis_url=redis_url, payload_mode="reference")
+
+        small = scheduler._serialize_task_operation(self._run_operation("hi"))
+        large = scheduler._serialize_task_operation(self._run_operation("x" * 100_000))
+
+        assert len(small) == len(large) < 300
+
+    def test_envelope_round_trip(self, redis_url):
+        """Test that ids come back as UUIDs and options are kept."""
+        scheduler = RedisScheduler(redis_url=redis_url, payload_mode="reference")
+        operation = self._run_operation("hello")
+
+        decoded = scheduler._deserialize_task_operation(
+            scheduler._serialize_task_operation(operation)
+        )
+
+        assert decoded["operation"] == "run"
+        assert decoded["params"] == {
+            "task_id": operation["params"]["task_id"],
+            "context_id": operation["params"]["context_id"],
+            "history_length": 5,
+        }
+
+    def test_reader_accepts_both_formats(self, redis_url):
+        """Test that either mode reads entries written by the other."""
+        full = RedisScheduler(redis_url=redis_url)
+        reference = RedisScheduler(redis_url=redis_url, payload_mode="reference")
+        operation = self._run_operation("hello")
+
+        from_full = reference._deserialize_task_operation(
+            full._serialize_task_operation(operation)
+        )
+        from_reference = full._deserialize_task_operation(
+            reference._serialize_task_operation(operation)
+        )
+
+        assert from_full["params"]["message"]["parts"][0]["text"] == "hello"
+        assert from_reference["params"]["task_id"] == operation["params"]["task_id"]
+
+
 class TestRedisSchedulerUtilities:
     """Test RedisScheduler utility methods."""
 
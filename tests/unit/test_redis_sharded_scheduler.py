@@ -0,0 +1,194 @@
+"""Unit tests for RedisShardedScheduler against an in-process fake of lists and leases."""
+
+import asyncio
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from bindu.common.models import SchedulerConfig
+from bindu.server.scheduler.factory import create_scheduler
+from bindu.server.scheduler.redis_sharded_scheduler import (
+    RedisShardedScheduler,
+    shard_of,
+)
+
+
+async def _connect(fake_redis, name: str, shards: int = 4) -> RedisShardedScheduler:
+    scheduler = RedisShardedScheduler(
+        redis_url="redis://localhost:6379/0",
+        consumer_name=name,
+        poll_timeout=0,
+        shards=shards,
+    )
+    with patch("redis.asyncio.from_url", return_value=fake_redis):
+        await scheduler.__aenter__()
+    return scheduler
+
+
+def _context_in_shard(shard: int, shards: int = 4):
+    while shard_of(context_id := uuid4(), shards) != shard:
+        pass
+    return context_id
+
+
+class TestShardedQueueing:
+    """Test where operations are queued."""
+
+    @pytest.mark.asyncio
+    async def test_runs_go_to_their_context_shard(self, fake_redis):
+        """Test that runs are split by context and controls use the plain list."""
+        scheduler = await _connect(fake_redis, "a")
+        first, second = _context_in_shard(1), _context_in_shard(3)
+        await scheduler.run_tasks(
+            [
+                {"task_id": uuid4(), "context_id": first},
+                {"task_id": uuid4(), "context_id": second},
+                {"task_id": uuid4(), "context_id": first},
+            ]
+        )
+        await scheduler.cancel_task({"task_id": uuid4()})
+
+        assert len(fake_redis.lists[scheduler.shard_key(1)]) == 2
+        assert len(fake_redis.lists[scheduler.shard_key(3)]) == 1
+        assert len(fake_redis.lists[scheduler.queue_name]) == 1
+        assert await scheduler.get_queue_length() == 4
+        assert await scheduler.clear_queue() == 4
+        assert fake_redis.lists == {}
+        await scheduler.__aexit__(None, None, None)
+
+
+class TestShardedDelivery:
+    """Test that a shard has one operation in flight at a time."""
+
+    @pytest.mark.asyncio
+    async def test_next_operation_of_a_context_waits_for_the_ack(self, fake_redis):
+        """Test that a context's second run waits until the first is released."""
+        scheduler = await _connect(fake_redis, "a")
+        context_id = _context_in_shard(2)
+        task_ids = [uuid4(), uuid4()]
+        await scheduler.run_tasks(
+            [{"task_id": task_id, "context_id": context_id} for task_id in task_ids]
+        )
+        other = uuid4()
+        await scheduler.run_task({"task_id": other, "context_id": _context_in_shard(0)})
+
+        operations = scheduler.receive_task_operations()
+        received = [await operations.__anext__() for _ in range(2)]
+        assert {op["params"]["task_id"] for op in received} == {task_ids[0], other}
+
+        pending = asyncio.ensure_future(operations.__anext__())
+        await asyncio.sleep(0.2)
+        assert not pending.done()
+
+        first = next(op for op in received if op["params"]["task_id"] == task_ids[0])
+        await scheduler.release_task_operation(first)
+        second = await asyncio.wait_for(pending, timeout=1.0)
+
+        assert second["params"]["task_id"] == task_ids[1]
+        assert second["_delivery_id"] == "2"
+        await operations.aclose()
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_retry_keeps_its_place_ahead_of_the_context(self, fake_redis):
+        """Test that a context's next run waits for an earlier run's retry."""
+        scheduler = await _connect(fake_redis, "a")
+        context_id = _context_in_shard(2)
+        task_ids = [uuid4(), uuid4()]
+        await scheduler.run_tasks(
+            [{"task_id": task_id, "context_id": context_id} for task_id in task_ids]
+        )
+
+        operations = scheduler.receive_task_operations()
+        first = await operations.__anext__()
+        await scheduler.run_task(
+            {**first["params"], "run_at": time.time() + 0.3, "reschedules": 1}
+        )
+        await scheduler.ack_task_operation(first)
+
+        pending = asyncio.ensure_future(operations.__anext__())
+        await asyncio.sleep(0.1)
+        assert not pending.done()
+        assert 2 in scheduler._parked
+
+        retry = await asyncio.wait_for(pending, timeout=1.0)
+        assert retry["params"]["task_id"] == task_ids[0]
+        assert retry["params"]["reschedules"] == 1
+        await scheduler.ack_task_operation(retry)
+        second = await asyncio.wait_for(operations.__anext__(), timeout=1.0)
+        assert second["params"]["task_id"] == task_ids[1]
+        await operations.aclose()
+        await scheduler.__aexit__(None, None, None)
+
+
+class TestShardLeases:
+    """Test leasing and rebalancing the shards between workers."""
+
+    @pytest.mark.asyncio
+    async def test_shards_are_rebalanced_when_workers_join_and_leave(self, fake_redis):
+        """Test that a joining worker gets its share and a leaving one hands it back."""
+        a = await _connect(fake_redis, "a")
+        b = await _connect(fake_redis, "b")
+
+        await a._maintain_leases()
+        assert a._held == {0, 1, 2, 3}
+
+        await b._maintain_leases()
+        # Still leased to a, which hands them back on its next round
+        assert b._held == set()
+        await a._maintain_leases()
+        assert a._unwanted == {1, 3}
+
+        a._busy.add(3)
+        await a._release(a._unwanted & a._held - a._busy)
+        await b._maintain_leases()
+        assert (a._held, b._held) == ({0, 2, 3}, {1})
+
+        a._busy.clear()
+        await a._release(a._unwanted & a._held)
+        await b._maintain_leases()
+        assert (a._held, b._held) == ({0, 2}, {1, 3})
+
+        await a.__aexit__(None, None, None)
+        await b._maintain_leases()
+        assert b._held == {0, 1, 2, 3}
+        await b.__aexit__(None, None, None)
+        assert fake_redis.strings == {}
+
+    @pytest.mark.asyncio
+    async def test_leases_of_a_dead_worker_are_taken_over(self, fake_redis):
+        """Test that the shards of a worker that stopped renewing move on."""
+        dead = await _connect(fake_redis, "a")
+        await dead._maintain_leases()
+        survivor = await _connect(fake_redis, "b")
+
+        # The dead worker's heartbeat and leases expire
+        fake_redis.zsets[survivor.workers_key]["a"] -= 60
+        fake_redis.strings.clear()
+        await survivor._maintain_leases()
+
+        assert survivor._held == {0, 1, 2, 3}
+        assert "a" not in fake_redis.zsets[survivor.workers_key]
+        await survivor.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_factory_creates_sharded_scheduler():
+    """Test that redis_queue_type="sharded" selects the sharded scheduler."""
+    config = SchedulerConfig(
+        type="redis",
+        redis_url="redis://localhost:6379/0",
+        redis_queue_type="sharded",
+        redis_shards=8,
+        shard_lease_ttl=5.0,
+        stream_consumer="worker-1",
+    )
+
+    scheduler = await create_scheduler(config)
+
+    assert isinstance(scheduler, RedisShardedScheduler)
+    assert scheduler.shards == 8
+    assert scheduler.lease_ttl == 5.0
+    assert scheduler.consumer_name == "worker-1"
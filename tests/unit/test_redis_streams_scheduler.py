@@ -0,0 +1,402 @@
+"""Unit tests for RedisStreamsScheduler against an in-process fake of Redis Streams."""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+import redis.asyncio as redis
+
+from bindu.common.models import SchedulerConfig
+from bindu.server.metrics import get_metrics
+from bindu.server.scheduler.factory import create_scheduler
+from bindu.server.scheduler.redis_streams_scheduler import RedisStreamsScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.base import Worker
+from tests.mocks import MockRedis
+
+
+class FakeStreamRedis(MockRedis):
+    """Adds the Redis Streams commands, with a controllable idle clock."""
+
+    def __init__(self):
+        super().__init__()
+        self.streams: dict[str, dict[str, dict[str, str]]] = {}
+        self.groups: dict[tuple[str, str], dict[str, Any]] = {}
+        self.clock_offset_ms = 0
+        self._next_id = 0
+
+    def _now(self) -> int:
+        return int(time.monotonic() * 1000) + self.clock_offset_ms
+
+    @staticmethod
+    def _seq(entry_id: str) -> int:
+        return int(entry_id.split("-")[0])
+
+    async def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        if (name, groupname) in self.groups:
+            raise redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+        self.streams.setdefault(name, {})
+        self.groups[(name, groupname)] = {"last": 0, "pending": {}}
+
+    async def xadd(self, name, fields):
+        self._next_id += 1
+        entry_id = f"{self._next_id}-0"
+        self.streams.setdefault(name, {})[entry_id] = dict(fields)
+        return entry_id
+
+    async def xreadgroup(
+        self, groupname, consumername, streams, count=None, block=None
+    ):
+        ((name, _),) = streams.items()
+        group = self.groups.get((name, groupname))
+        if group is None:
+            raise redis.ResponseError("NOGROUP No such key or consumer group")
+        fresh = [
+            (entry_id, fields)
+            for entry_id, fields in self.streams[name].items()
+            if self._seq(entry_id) > group["last"]
+        ][:count]
+        if not fresh:
+            await asyncio.sleep(0.01)
+            return []
+        for entry_id, _ in fresh:
+            group["last"] = self._seq(entry_id)
+            group["pending"][entry_id] = [consumername, self._now(), 1]
+        return [[name, fresh]]
+
+    async def xack(self, name, groupname, *ids):
+        pending = self.groups[(name, groupname)]["pending"]
+        return sum(pending.pop(entry_id, None) is not None for entry_id in ids)
+
+    async def xdel(self, name, *ids):
+        return sum(
+            self.streams[name].pop(entry_id, None) is not None for entry_id in ids
+        )
+
+    async def xautoclaim(
+        self, name, groupname, consumername, min_idle_time, start_id="0-0", count=None
+    ):
+        pending = self.groups[(name, groupname)]["pending"]
+        claimed = []
+        for entry_id in sorted(pending, key=self._seq):
+            owner = pending[entry_id]
+            if self._seq(entry_id) < self._seq(start_id):
+                continue
+            if self._now() - owner[1] < min_idle_time:
+                continue
+            pending[entry_id] = [consumername, self._now(), owner[2] + 1]
+            claimed.append((entry_id, self.streams[name].get(entry_id)))
+            if len(claimed) == count:
+                break
+        return ["0-0", claimed, []]
+
+    async def xclaim(
+        self, name, groupname, consumername, min_idle_time, message_ids, justid=False
+    ):
+        pending = self.groups[(name, groupname)]["pending"]
+        for entry_id in message_ids:
+            if entry_id in pending:
+                pending[entry_id][:2] = [consumername, self._now()]
+        return list(message_ids)
+
+    async def xlen(self, name):
+        return len(self.streams.get(name, {}))
+
+    async def xpending(self, name, groupname):
+        return {"pending": len(self.groups[(name, groupname)]["pending"])}
+
+    async def xpending_range(self, name, groupname, min, max, count):
+        pending = self.groups[(name, groupname)]["pending"]
+        return [
+            {"message_id": entry_id, "times_delivered": pending[entry_id][2]}
+            for entry_id in sorted(pending, key=self._seq)
+            if self._seq(min) <= self._seq(entry_id) <= self._seq(max)
+        ][:count]
+
+    async def delete(self, *names):
+        deleted = 0
+        for name in names:
+            deleted += self.streams.pop(name, None) is not None
+            for key in [key for key in self.groups if key[0] == name]:
+                del self.groups[key]
+        return deleted + await super().delete(*names)
+
+
+@pytest.fixture
+def fake_redis():
+    """Shared fake Redis server."""
+    return FakeStreamRedis()
+
+
+async def _connect(fake_redis, **kwargs) -> RedisStreamsScheduler:
+    scheduler = RedisStreamsScheduler(
+        redis_url="redis://localhost:6379/0", poll_timeout=0, **kwargs
+    )
+    with patch("redis.asyncio.from_url", return_value=fake_redis):
+        await scheduler.__aenter__()
+    return scheduler
+
+
+async def _receive_one(scheduler: RedisStreamsScheduler):
+    operations = scheduler.receive_task_operations()
+    try:
+        return await asyncio.wait_for(operations.__anext__(), timeout=1.0)
+    finally:
+        await operations.aclose()
+
+
+class TestRedisStreamsDelivery:
+    """Test delivery and acknowledgement through the consumer group."""
+
+    @pytest.mark.asyncio
+    async def test_operation_is_pending_until_acknowledged(self, fake_redis):
+        """Test that a received operation stays pending until it is acked."""
+        scheduler = await _connect(fake_redis)
+        task_id, context_id = uuid4(), uuid4()
+
+        await scheduler.run_task({"task_id": task_id, "context_id": context_id})
+        operation = await _receive_one(scheduler)
+
+        assert operation["operation"] == "run"
+        assert operation["params"]["task_id"] == task_id
+        assert isinstance(operation["params"]["context_id"], UUID)
+        assert await scheduler.get_consumer_lag() == {"pending": 1, "lag": 0}
+
+        await scheduler.ack_task_operation(operation)
+
+        assert await scheduler.get_consumer_lag() == {"pending": 0, "lag": 0}
+        assert await scheduler.get_queue_length() == 0
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_released_operation_stays_pending(self, fake_redis):
+        """Test that a released operation is no longer claimed but not acked."""
+        scheduler = await _connect(fake_redis)
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+        operation = await _receive_one(scheduler)
+
+        await scheduler.release_task_operation(operation)
+
+        assert scheduler._in_flight == set()
+        assert await scheduler.get_consumer_lag() == {"pending": 1, "lag": 0}
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_group_is_created_once(self, fake_redis):
+        """Test that a second scheduler joins the existing consumer group."""
+        first = await _connect(fake_redis)
+        second = await _connect(fake_redis)
+
+        assert list(fake_redis.groups) == [("bindu:tasks:stream", "bindu:workers")]
+        assert first.consumer_name != second.consumer_name
+        await first.__aexit__(None, None, None)
+        await second.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_lag_counts_undelivered_operations(self, fake_redis):
+        """Test that consumer lag is reported and exported as metrics."""
+        scheduler = await _connect(fake_redis)
+        for _ in range(3):
+            await scheduler.cancel_task({"task_id": uuid4()})
+
+        await _receive_one(scheduler)
+
+        assert await scheduler.get_consumer_lag() == {"pending": 1, "lag": 2}
+        text = get_metrics().generate_prometheus_text()
+        assert "scheduler_stream_pending 1" in text
+        assert "scheduler_stream_lag 2" in text
+        await scheduler.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_undecodable_entry_is_dropped(self, fake_redis):
+        """Test that a poison entry is dead-lettered instead of redelivered."""
+        scheduler = await _connect(fake_redis)
+        await fake_redis.xadd(scheduler.stream_name, {"data": "not json"})
+        await scheduler.cancel_task({"task_id": uuid4()})
+
+        operation = await _receive_one(scheduler)
+
+        assert operation["operation"] == "cancel"
+        assert await scheduler.get_consumer_lag() == {"pending": 1, "lag": 0}
+        (dead_letter,) = fake_redis.lists[scheduler.dead_letter_key]
+        assert json.loads(dead_letter)["reason"] == "undecodable"
+        assert json.loads(dead_letter)["payload"] == "not json"
+        await scheduler.__aexit__(None, None, None)
+
+
+class TestRedisStreamsBatching:
+    """Test batched reads and pipelined appends."""
+
+    @pytest.mark.asyncio
+    async def test_run_tasks_and_batched_receive(self, fake_redis):
+        """Test that a batch is appended together and read in one XREADGROUP."""
+        scheduler = await _connect(fake_redis, batch_size=5)
+        task_ids = [uuid4() for _ in range(3)]
+
+        await scheduler.run_tasks(
+            [{"task_id": task_id, "context_id": uuid4()} for task_id in task_ids]
+        )
+        operations = scheduler.receive_task_operations()
+        received = [await operations.__anext__() for _ in range(3)]
+        await operations.aclose()
+
+        assert [op["params"]["task_id"] for op in received] == task_ids
+        # The whole batch is heartbeated, not only the operation being handled
+        assert len(scheduler._in_flight) == 3
+        await scheduler.__aexit__(None, None, None)
+
+
+class TestRedisStreamsRedelivery:
+    """Test reclaiming operations of consumers that stopped acknowledging."""
+
+    @pytest.mark.asyncio
+    async def test_stale_operation_is_reclaimed_by_another_consumer(self, fake_redis):
+        """Test that an operation left by a crashed worker is delivered again."""
+        crashed = await _connect(fake_redis, claim_idle_timeout=30)
+        task_id = uuid4()
+        await crashed.run_task({"task_id": task_id, "context_id": uuid4()})
+        lost = await _receive_one(crashed)
+        await crashed.__aexit__(None, None, None)
+
+        survivor = await _connect(fake_redis, claim_idle_timeout=30)
+        fake_redis.clock_offset_ms += 31_000
+
+        reclaimed = await _receive_one(survivor)
+
+        assert reclaimed["params"]["task_id"] == task_id
+        assert reclaimed["_delivery_id"] == lost["_delivery_id"]
+        assert (lost["_attempts"], reclaimed["_attempts"]) == (1, 2)
+        pending = fake_redis.groups[(survivor.stream_name, "bindu:workers")]["pending"]
+        assert pending[reclaimed["_delivery_id"]][0] == survivor.consumer_name
+        await survivor.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_recent_operation_is_not_reclaimed(self, fake_redis):
+        """Test that operations younger than claim_idle_timeout stay put."""
+        owner = await _connect(fake_redis, claim_idle_timeout=30)
+        await owner.cancel_task({"task_id": uuid4()})
+        await _receive_one(owner)
+
+        other = await _connect(fake_redis, claim_idle_timeout=30)
+        assert await other._claim_stale() is None
+        await owner.__aexit__(None, None, None)
+        await other.__aexit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_in_flight_operations_fresh(self, fake_redis):
+        """Test that operations being handled have their idle time reset."""
+        scheduler = await _connect(fake_redis, claim_idle_timeout=0.03)
+        await scheduler.cancel_task({"task_id": uuid4()})
+        operation = await _receive_one(scheduler)
+        pending = fake_redis.groups[(scheduler.stream_name, "bindu:workers")]["pending"]
+        delivered_at = pending[operation["_delivery_id"]][1]
+
+        await asyncio.sleep(0.05)
+
+        assert pending[operation["_delivery_id"]][1] > delivered_at
+        await scheduler.__aexit__(None, None, None)
+
+
+@dataclass
+class RecordingWorker(Worker):
+    """Worker that records handled task ids."""
+
+    handled: list[Any] = field(default_factory=list)
+
+    async def run_task(self, params):
+        self.handled.append(params["task_id"])
+
+    async def cancel_task(self, params):
+        pass
+
+    def build_message_history(self, history):
+        return history
+
+    def build_artifacts(self, result):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_worker_acknowledges_handled_operations(fake_redis):
+    """Test that the worker loop acks each operation after handling it."""
+    scheduler = await _connect(fake_redis)
+    worker = RecordingWorker(
+        scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=2
+    )
+    task_ids = [uuid4() for _ in range(3)]
+
+    async with worker.run():
+        for task_id in task_ids:
+            await scheduler.run_task({"task_id": task_id, "context_id": uuid4()})
+        async with asyncio.timeout(1.0):
+            while await scheduler.get_queue_length():
+                await asyncio.sleep(0.005)
+
+    assert sorted(worker.handled) == sorted(task_ids)
+    assert await scheduler.get_consumer_lag() == {"pending": 0, "lag": 0}
+    await scheduler.__aexit__(None, None, None)
+
+
+@dataclass
+class BlockingWorker(RecordingWorker):
+    """Worker whose runs never finish on their own."""
+
+    canceled: list[Any] = field(default_factory=list)
+
+    async def run_task(self, params):
+        self.handled.append(params["task_id"])
+        await asyncio.Event().wait()
+
+    async def cancel_task(self, params):
+        self.canceled.append(params["task_id"])
+
+
+@pytest.mark.asyncio
+async def test_cancel_interrupts_running_task_over_pubsub(fake_redis):
+    """Test that a cancel reaches the running task ahead of the queue."""
+    scheduler = await _connect(fake_redis)
+    worker = BlockingWorker(scheduler=scheduler, storage=InMemoryStorage())
+    running, queued = uuid4(), uuid4()
+
+    async with worker.run():
+        await scheduler.run_tasks(
+            [
+                {"task_id": running, "context_id": uuid4()},
+                {"task_id": queued, "context_id": uuid4()},
+            ]
+        )
+        async with asyncio.timeout(1.0):
+            while not worker.handled or not fake_redis.connections:
+                await asyncio.sleep(0.005)
+
+        await scheduler.cancel_task({"task_id": running})
+        async with asyncio.timeout(1.0):
+            while worker.handled != [running, queued]:
+                await asyncio.sleep(0.005)
+
+    # The interrupted run was canceled before the queued cancel was handled
+    assert worker.canceled[0] == running
+    await scheduler.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_factory_creates_streams_scheduler():
+    """Test that redis_queue_type="stream" selects the streams scheduler."""
+    config = SchedulerConfig(
+        type="redis",
+        redis_url="redis://localhost:6379/0",
+        redis_queue_type="stream",
+        stream_group="agents",
+        claim_idle_timeout=10,
+    )
+
+    scheduler = await create_scheduler(config)
+
+    assert isinstance(scheduler, RedisStreamsScheduler)
+    assert scheduler.group_name == "agents"
+    assert scheduler.claim_idle_timeout == 10
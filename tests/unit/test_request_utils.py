@@ -1,10 +1,12 @@
 """Unit tests for request utilities."""
 
+import json
 from unittest.mock import Mock
 
 from bindu.utils.request_utils import (
     get_client_ip,
     jsonrpc_error,
+    jsonrpc_error_body,
 )
 
 
@@ -73,6 +75,22 @@ class TestJsonRpcError:
 
         assert response.status_code == 500
 
+    def test_body_matches_response(self):
+        """Test that the response carries the shared error body."""
+        body = jsonrpc_error_body(-32601, "Method not found", "No such method", 7)
+
+        assert body == {
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32601,
+                "message": "Method not found",
+                "data": "No such method",
+            },
+            "id": "7",
+        }
+        response = jsonrpc_error(-32601, "Method not found", "No such method", 7)
+        assert json.loads(response.body) == body
+
     def test_error_response_format(self):
         """Test that error response has correct JSON-RPC format."""
         response = jsonrpc_error(code=-32600, message="Invalid Request")
@@ -1,10 +1,13 @@
 """Unit tests for task scheduler (InMemoryScheduler)."""
 
 import asyncio
+import time
 from uuid import uuid4
 
 import pytest
 
+from bindu.server.metrics import get_metrics
+from bindu.server.scheduler import SchedulerBusyError
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
 
 
@@ -72,3 +75,97 @@ async def test_scheduler_operations():
         assert received[1]["operation"] == "cancel"
         assert received[2]["operation"] == "pause"
         assert received[3]["operation"] == "resume"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_run_task_returns_without_consumer():
+    """Test that run_task is buffered instead of waiting for a worker."""
+    async with InMemoryScheduler(queue_size=2) as scheduler:
+        await asyncio.wait_for(
+            scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()}),
+            timeout=0.5,
+        )
+        assert scheduler.queue_length == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reject_policy_raises_when_full():
+    """Test that a full queue rejects immediately under the reject policy."""
+    async with InMemoryScheduler(queue_size=1, overflow_policy="reject") as scheduler:
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+        with pytest.raises(SchedulerBusyError):
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_policy_times_out_when_full():
+    """Test that the wait policy gives up after enqueue_timeout."""
+    async with InMemoryScheduler(
+        queue_size=1, overflow_policy="wait", enqueue_timeout=0.05
+    ) as scheduler:
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+        with pytest.raises(SchedulerBusyError):
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_queue_metrics():
+    """Test that queue depth and wait time are exported."""
+    async with InMemoryScheduler(queue_size=4) as scheduler:
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+        assert "scheduler_queue_length 1" in get_metrics().generate_prometheus_text()
+
+        async for _ in scheduler.receive_task_operations():
+            break
+
+        text = get_metrics().generate_prometheus_text()
+        assert "scheduler_queue_length 0" in text
+        assert "scheduler_queue_wait_seconds_count" in text
+
+
+@pytest.mark.asyncio
+async def test_scheduler_defers_run_until_run_at():
+    """Test that a run with a future run_at is only received once due."""
+    async with InMemoryScheduler(queue_size=1) as scheduler:
+        deferred, immediate = uuid4(), uuid4()
+        await scheduler.run_task(
+            {"task_id": deferred, "context_id": uuid4(), "run_at": time.time() + 0.1}
+        )
+        # Deferred runs do not take up the buffer
+        assert scheduler.queue_length == 0
+        await scheduler.run_task({"task_id": immediate, "context_id": uuid4()})
+
+        received = []
+        async for op in scheduler.receive_task_operations():
+            received.append((op["params"]["task_id"], time.time()))
+            if len(received) == 2:
+                break
+
+        assert [task_id for task_id, _ in received] == [immediate, deferred]
+        assert received[1][1] >= received[0][1] + 0.05
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wakes_waiting_receiver_for_deferred_run():
+    """Test that a receiver already waiting picks up a run once it is due."""
+    async with InMemoryScheduler() as scheduler:
+
+        async def consumer():
+            async for op in scheduler.receive_task_operations():
+                return op
+
+        consumer_task = asyncio.create_task(consumer())
+        await asyncio.sleep(0.01)
+
+        task_id = uuid4()
+        await scheduler.run_task(
+            {"task_id": task_id, "context_id": uuid4(), "run_at": time.time() + 0.05}
+        )
+        assert "scheduler_delayed_operations 1" in (
+            get_metrics().generate_prometheus_text()
+        )
+
+        op = await asyncio.wait_for(consumer_task, timeout=1.0)
+        assert op["params"]["task_id"] == task_id
@@ -0,0 +1,177 @@
+"""Unit tests for the scheduler task operation codec."""
+
+import json
+from uuid import UUID, uuid4
+
+import orjson
+import pytest
+from opentelemetry.trace import NonRecordingSpan, SpanContext, get_current_span
+
+from bindu.server.scheduler.codec import (
+    FORMAT_VERSION,
+    decode_legacy,
+    decode_task_operation,
+    encode_task_operation,
+)
+
+
+def _run_operation(text: str = "hello", **params):
+    task_id, context_id = uuid4(), uuid4()
+    return {
+        "operation": "run",
+        "params": {
+            "task_id": task_id,
+            "context_id": context_id,
+            "message": {
+                "message_id": uuid4(),
+                "task_id": task_id,
+                "context_id": context_id,
+                "reference_task_ids": [uuid4()],
+                "kind": "message",
+                "role": "user",
+                "parts": [{"kind": "text", "text": text}],
+            },
+            **params,
+        },
+        "_current_span": get_current_span(),
+    }
+
+
+class TestTypedLayout:
+    """Test encoding and decoding in the versioned layout."""
+
+    def test_round_trip_restores_schema_uuids(self):
+        """Test that exactly the schema's UUID fields come back as UUIDs."""
+        operation = _run_operation(history_length=3)
+
+        decoded = decode_task_operation(encode_task_operation(operation))
+
+        assert decoded["operation"] == "run"
+        assert decoded["params"] == operation["params"]
+        message = decoded["params"]["message"]
+        assert isinstance(message["message_id"], UUID)
+        assert all(isinstance(ref, UUID) for ref in message["reference_task_ids"])
+
+    def test_text_that_looks_like_a_uuid_is_left_alone(self):
+        """Test that user text is never turned into a UUID."""
+        text = str(uuid4())
+
+        decoded = decode_task_operation(encode_task_operation(_run_operation(text)))
+
+        assert decoded["params"]["message"]["parts"][0]["text"] == text
+
+    def test_options_are_opaque(self):
+        """Test that options keep their values, UUID-looking strings included."""
+        nonce = str(uuid4())
+        operation = _run_operation(payment_context={"nonce": nonce})
+
+        decoded = decode_task_operation(encode_task_operation(operation))
+
+        assert decoded["params"]["payment_context"] == {"nonce": nonce}
+
+    def test_layout_is_tagged_and_compact(self):
+        """Test the top-level layout of an encoded operation."""
+        data = orjson.loads(encode_task_operation(_run_operation(history_length=3)))
+
+        assert data["v"] == FORMAT_VERSION
+        assert data["op"] == "run"
+        assert set(data) == {
+            "v",
+            "op",
+            "task_id",
+            "context_id",
+            "message",
+            "options",
+            "span_id",
+            "trace_id",
+        }
+        assert data["options"] == {"history_length": 3}
+
+    def test_by_reference_leaves_message_out(self):
+        """Test that include_message=False drops only the message."""
+        operation = _run_operation()
+
+        decoded = decode_task_operation(
+            encode_task_operation(operation, include_message=False)
+        )
+
+        assert decoded["params"] == {
+            "task_id": operation["params"]["task_id"],
+            "context_id": operation["params"]["context_id"],
+        }
+
+    def test_span_becomes_remote_parent(self):
+        """Test that the queuing span comes back as the operation's parent."""
+        operation = _run_operation()
+        operation["_current_span"] = NonRecordingSpan(
+            SpanContext(trace_id=0xABC, span_id=0x12, is_remote=False)
+        )
+
+        decoded = decode_task_operation(encode_task_operation(operation))
+        span_context = decoded["_current_span"].get_span_context()
+
+        assert (span_context.trace_id, span_context.span_id) == (0xABC, 0x12)
+        assert span_context.is_remote
+
+    def test_operation_without_span_ids_uses_current_span(self):
+        """Test that missing or malformed span ids fall back to the current span."""
+        for span_id in (None, "not hex"):
+            data = orjson.dumps(
+                {
+                    "v": FORMAT_VERSION,
+                    "op": "cancel",
+                    "task_id": str(uuid4()),
+                    "span_id": span_id,
+                    "trace_id": "abc",
+                }
+            )
+
+            decoded = decode_task_operation(data)
+
+            assert not hasattr(decoded["_current_span"], "get_span_context")
+
+    def test_unknown_operation(self):
+        """Test that an unknown operation type is rejected."""
+        data = orjson.dumps({"v": FORMAT_VERSION, "op": "explode"})
+
+        with pytest.raises(ValueError, match="Unknown operation type"):
+            decode_task_operation(data)
+
+
+class TestLegacyReader:
+    """Test reading entries queued before the layout was versioned."""
+
+    def test_full_params_entry(self):
+        """Test the original {"operation", "params"} layout."""
+        task_id = uuid4()
+        entry = json.dumps(
+            {
+                "operation": "cancel",
+                "params": {"task_id": str(task_id)},
+                "span_id": None,
+                "trace_id": None,
+            }
+        )
+
+        decoded = decode_task_operation(entry)
+
+        assert decoded["operation"] == "cancel"
+        assert decoded["params"] == {"task_id": task_id}
+
+    def test_reference_envelope_entry(self):
+        """Test the untagged reference envelope."""
+        task_id, context_id = uuid4(), uuid4()
+        entry = {
+            "operation": "run",
+            "task_id": str(task_id),
+            "context_id": str(context_id),
+            "options": {"history_length": 2},
+        }
+
+        decoded = decode_legacy(entry)
+
+        assert decoded["params"] == {
+            "task_id": task_id,
+            "context_id": context_id,
+            "history_length": 2,
+        }
@@ -1,4 +1,8 @@
-from bindu.utils.schema_manager import sanitize_did_for_schema
+from unittest.mock import MagicMock
+
+import pytest
+
+from bindu.utils.schema_manager import sanitize_did_for_schema, upgrade_did_schema
 
 
 def test_basic_sanitization():
@@ -42,3 +46,48 @@ def test_deterministic_hashing():
     result2 = sanitize_did_for_schema(long_did)
 
     assert result1 == result2
+
+
+class _FakeConnection:
+    """Answers column lookups from a dict and records every other statement."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        result = MagicMock()
+        if params and "table_name" in params:
+            names = self.columns.get(params["table_name"], ())
+            result.fetchall.return_value = [(name,) for name in names]
+        else:
+            self.statements.append(str(statement))
+        return result
+
+
+@pytest.mark.asyncio
+async def test_old_did_schema_is_upgraded():
+    conn = _FakeConnection(
+        {"tasks": {"id", "history", "artifacts"}, "contexts": {"id", "context_data"}}
+    )
+
+    assert await upgrade_did_schema(conn, "did_old") == 3
+
+    sql = "\n".join(conn.statements)
+    assert "INSERT INTO task_messages" in sql
+    assert "DROP COLUMN history" in sql
+    assert "ADD COLUMN message_count" in sql
+    assert "ADD COLUMN history_initialized" in sql
+
+
+@pytest.mark.asyncio
+async def test_current_did_schema_is_left_alone():
+    conn = _FakeConnection(
+        {
+            "tasks": {"id", "message_count", "artifact_count"},
+            "contexts": {"id", "history_initialized"},
+        }
+    )
+
+    assert await upgrade_did_schema(conn, "did_new") == 0
+    assert conn.statements == []
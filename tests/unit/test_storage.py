@@ -1,9 +1,14 @@
 """Unit tests for storage layer (InMemoryStorage)."""
 
+import asyncio
+import copy
+import json
 from uuid import uuid4
 
 import pytest
 
+from bindu.common.protocol.types import a2a_response_ta
+from bindu.server.metrics import get_metrics
 from bindu.server.storage.memory_storage import InMemoryStorage
 from tests.utils import assert_task_state, create_test_message
 
@@ -384,3 +389,319 @@ class TestDataIntegrity:
         loaded_task = await storage.load_task(task_id)
         # Check if metadata exists and has the custom field
         assert loaded_task is not None
+
+
+class TestCopyOnWriteSnapshots:
+    """Test that loads share read-only snapshots instead of deep copies."""
+
+    @pytest.mark.asyncio
+    async def test_loads_share_nested_snapshot(self, storage: InMemoryStorage):
+        """Test that loading a task does not copy its history."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+
+        task1 = await storage.load_task(task["id"])
+        task2 = await storage.load_task(task["id"])
+
+        assert task1 is not task2
+        assert task1["history"] is task2["history"]
+
+    @pytest.mark.asyncio
+    async def test_nested_mutation_is_rejected(self, storage: InMemoryStorage):
+        """Test that callers cannot corrupt stored history in place."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+        loaded = await storage.load_task(task["id"])
+
+        with pytest.raises(TypeError):
+            loaded["history"].append(create_test_message(text="Injected"))
+        with pytest.raises(TypeError):
+            loaded["history"][0]["parts"] = []
+
+        reloaded = await storage.load_task(task["id"])
+        assert len(reloaded["history"]) == 1
+        assert reloaded["history"][0]["parts"][0]["text"] == "Test task"
+
+    @pytest.mark.asyncio
+    async def test_submitted_message_is_detached(self, storage: InMemoryStorage):
+        """Test that mutating the submitted message does not change storage."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+
+        message["parts"][0]["text"] = "Changed"
+
+        loaded = await storage.load_task(task["id"])
+        assert loaded["history"][0]["parts"][0]["text"] == "Test task"
+
+    @pytest.mark.asyncio
+    async def test_update_creates_new_version(self, storage: InMemoryStorage):
+        """Test that an earlier load keeps seeing the version it loaded."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+        before = await storage.load_task(task["id"])
+
+        await storage.update_task(
+            task["id"],
+            state="completed",
+            new_messages=[create_test_message(text="Reply", role="agent")],
+        )
+
+        after = await storage.load_task(task["id"])
+        assert before["status"]["state"] == "submitted"
+        assert len(before["history"]) == 1
+        assert after["status"]["state"] == "completed"
+        assert len(after["history"]) == 2
+        assert after["history"][0] is before["history"][0]
+
+    @pytest.mark.asyncio
+    async def test_deepcopy_returns_mutable_task(self, storage: InMemoryStorage):
+        """Test that callers can still take a private mutable copy."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+
+        private = copy.deepcopy(await storage.load_task(task["id"]))
+        private["history"].append(create_test_message(text="Local only"))
+
+        reloaded = await storage.load_task(task["id"])
+        assert len(reloaded["history"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_serializes_as_protocol_task(self, storage: InMemoryStorage):
+        """Test that snapshots serialize like plain dicts."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+        loaded = await storage.load_task(task["id"])
+
+        response = {"jsonrpc": "2.0", "id": uuid4(), "result": loaded}
+        payload = json.loads(a2a_response_ta.dump_json(response, by_alias=True))
+
+        assert payload["result"]["history"][0]["parts"][0]["text"] == "Test task"
+
+
+class TestEviction:
+    """Test TTL and LRU eviction of terminal tasks."""
+
+    async def _submit(self, storage: InMemoryStorage, context_id=None, state=None):
+        message = create_test_message(context_id=context_id, text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+        if state is not None:
+            await storage.update_task(task["id"], state=state)
+        return task
+
+    @pytest.mark.asyncio
+    async def test_max_tasks_evicts_least_recently_used_terminal(self):
+        """Test that the least recently used terminal task goes first."""
+        storage = InMemoryStorage(max_tasks=2)
+        first = await self._submit(storage, state="completed")
+        second = await self._submit(storage, state="completed")
+        await storage.load_task(first["id"])
+        third = await self._submit(storage, state="completed")
+
+        assert storage.evict() == 1
+        assert await storage.load_task(second["id"]) is None
+        assert await storage.load_task(first["id"]) is not None
+        assert await storage.load_task(third["id"]) is not None
+
+    @pytest.mark.asyncio
+    async def test_non_terminal_tasks_are_never_evicted(self):
+        """Test that running tasks survive even when over the limit."""
+        storage = InMemoryStorage(max_tasks=1, max_bytes=1)
+        running = await self._submit(storage, state="working")
+        submitted = await self._submit(storage)
+
+        assert storage.evict() == 0
+        assert len(storage.tasks) == 2
+        assert await storage.load_task(running["id"]) is not None
+        assert await storage.load_task(submitted["id"]) is not None
+
+    @pytest.mark.asyncio
+    async def test_ttl_evicts_expired_terminal_tasks(self):
+        """Test that terminal tasks older than the TTL are evicted."""
+        storage = InMemoryStorage(task_ttl=0.01)
+        done = await self._submit(storage, state="failed")
+        running = await self._submit(storage, state="working")
+        await asyncio.sleep(0.02)
+
+        assert storage.evict() == 1
+        assert await storage.load_task(done["id"]) is None
+        assert await storage.load_task(running["id"]) is not None
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_tracks_history_and_artifacts(self):
+        """Test that the byte estimate grows with content and drives eviction."""
+        storage = InMemoryStorage(max_bytes=1 << 20)
+        task = await self._submit(storage)
+        before = storage.total_bytes
+        await storage.update_task(
+            task["id"],
+            state="completed",
+            new_artifacts=[
+                {"artifact_id": uuid4(), "parts": [{"kind": "text", "text": "x" * 500}]}
+            ],
+        )
+        assert storage.total_bytes > before + 500
+
+        storage.max_bytes = before
+        assert storage.evict() == 1
+        assert storage.total_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_counts_context_history(self):
+        """Test that context histories count until their context is evicted."""
+        storage = InMemoryStorage(max_bytes=1 << 20)
+        task = await self._submit(storage, state="completed")
+        before = storage.total_bytes
+        await storage.append_context_history(
+            task["context_id"], task["id"], [{"role": "user", "content": "x" * 500}]
+        )
+        assert storage.total_bytes > before + 500
+
+        storage.max_bytes = 1
+        assert storage.evict() == 1
+        assert storage.total_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_sizes_are_not_estimated_without_max_bytes(self):
+        """Test that no size is measured unless max_bytes is set."""
+        storage = InMemoryStorage()
+        task = await self._submit(storage, state="completed")
+        await storage.append_context_history(
+            task["context_id"], task["id"], [{"role": "user", "content": "x"}]
+        )
+        assert storage.total_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_eviction_keeps_context_and_feedback_consistent(self):
+        """Test that evicted tasks leave no dangling references."""
+        storage = InMemoryStorage(max_tasks=1)
+        context_id = uuid4()
+        old = await self._submit(storage, context_id=context_id, state="completed")
+        await storage.store_task_feedback(old["id"], {"rating": 5})
+        await storage.init_context_history(
+            context_id, [(old["id"], [{"role": "user"}])]
+        )
+        other = await self._submit(storage, state="completed")
+
+        storage.evict()
+
+        assert await storage.get_task_feedback(old["id"]) is None
+        assert await storage.load_context(context_id) is None
+        assert await storage.load_context_history(context_id) is None
+        assert await storage.load_context(other["context_id"]) == [other["id"]]
+
+    @pytest.mark.asyncio
+    async def test_evictions_are_exported(self):
+        """Test that eviction counts show up in metrics."""
+        storage = InMemoryStorage(max_tasks=1)
+        await self._submit(storage, state="canceled")
+        await self._submit(storage, state="canceled")
+        storage.evict()
+
+        text = get_metrics().generate_prometheus_text()
+        assert 'storage_evictions_total{reason="max_tasks"}' in text
+        assert "storage_tasks 1" in text
+
+    @pytest.mark.asyncio
+    async def test_background_sweeper_evicts(self):
+        """Test that the sweeper evicts without an explicit call."""
+        storage = InMemoryStorage(task_ttl=0.01, sweep_interval=0.01)
+        task = await self._submit(storage, state="completed")
+        await storage.start_sweeper()
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            await storage.stop_sweeper()
+
+        assert task["id"] not in storage.tasks
+
+
+class TestIndexes:
+    """Test the incrementally maintained state and recency indexes."""
+
+    @pytest.mark.asyncio
+    async def test_count_by_state_follows_transitions(self, storage: InMemoryStorage):
+        """Test that per-state counts track every transition."""
+        tasks = []
+        for _ in range(3):
+            message = create_test_message(text="Test task")
+            tasks.append(await storage.submit_task(message["context_id"], message))
+
+        await storage.update_task(tasks[0]["id"], state="working")
+        await storage.update_task(tasks[1]["id"], state="working")
+        await storage.update_task(tasks[1]["id"], state="completed")
+
+        assert await storage.count_tasks(status="submitted") == 1
+        assert await storage.count_tasks(status="working") == 1
+        assert await storage.count_tasks(status="completed") == 1
+        assert await storage.count_tasks(status="failed") == 0
+        assert await storage.count_tasks() == 3
+
+        await storage.clear_context(tasks[1]["context_id"])
+        assert await storage.count_tasks(status="completed") == 0
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_returns_most_recent(self, storage: InMemoryStorage):
+        """Test that a length limit keeps the newest tasks in creation order."""
+        ids = []
+        for _ in range(5):
+            message = create_test_message(text="Test task")
+            ids.append(
+                (await storage.submit_task(message["context_id"], message))["id"]
+            )
+
+        await storage.update_task(ids[0], state="working")
+
+        recent = await storage.list_tasks(length=2)
+        assert [task["id"] for task in recent] == ids[-2:]
+
+    @pytest.mark.asyncio
+    async def test_list_by_context_returns_most_recent(self, storage: InMemoryStorage):
+        """Test that a context listing slices before loading tasks."""
+        context_id = uuid4()
+        ids = []
+        for _ in range(4):
+            message = create_test_message(context_id=context_id, text="Test task")
+            ids.append((await storage.submit_task(context_id, message))["id"])
+
+        recent = await storage.list_tasks_by_context(context_id, length=3)
+        assert [task["id"] for task in recent] == ids[-3:]
+
+        contexts = await storage.list_contexts(length=1)
+        assert contexts[0]["context_id"] == context_id
+
+
+class TestProjection:
+    """Test that reads can leave out history and artifacts."""
+
+    @pytest.mark.asyncio
+    async def test_load_task_without_history(self, storage: InMemoryStorage):
+        """Test that a state-only load omits history and artifacts."""
+        message = create_test_message(text="Test task")
+        task = await storage.submit_task(message["context_id"], message)
+
+        loaded = await storage.load_task(
+            task["id"], include_history=False, include_artifacts=False
+        )
+
+        assert loaded["status"]["state"] == "submitted"
+        assert "history" not in loaded
+        assert "artifacts" not in loaded
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_with_last_messages(self, storage: InMemoryStorage):
+        """Test that listings honour history_length per task."""
+        message = create_test_message(text="First")
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(
+            task["id"],
+            state="input-required",
+            new_messages=[create_test_message(text="Second")],
+        )
+
+        tasks = await storage.list_tasks(history_length=1)
+        by_context = await storage.list_tasks_by_context(
+            task["context_id"], history_length=1
+        )
+
+        for listed in (tasks[0], by_context[0]):
+            assert [m["parts"][0]["text"] for m in listed["history"]] == ["Second"]
@@ -1,5 +1,8 @@
 """Unit tests for TaskManager."""
 
+import asyncio
+import time
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -10,8 +13,10 @@ from bindu.common.protocol.types import (
     GetTaskRequest,
     ListContextsRequest,
     ListTasksRequest,
+    SendMessageRequest,
     TaskFeedbackRequest,
 )
+from bindu.server.events import status_event
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
 from bindu.server.storage.memory_storage import InMemoryStorage
 from bindu.server.task_manager import TaskManager
@@ -112,6 +117,100 @@ async def test_get_task_with_history_limit():
                 assert len(retrieved_task["history"]) <= 5
 
 
+def _long_poll(task_id, **params) -> GetTaskRequest:
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid4(),
+        "method": "tasks/get",
+        "params": {"task_id": task_id, **params},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_task_waits_for_the_next_state():
+    """Test that a long-poll answers as soon as a worker publishes a new state."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            message = create_test_message(text="Test message")
+            task = await storage.submit_task(message["context_id"], message)
+
+            async def work():
+                await asyncio.sleep(0.05)
+                await storage.update_task(task["id"], state="working")
+                await tm.event_bus.publish(
+                    task["id"],
+                    status_event(task["id"], task["context_id"], "working", False),
+                )
+
+            started = time.monotonic()
+            with patch(
+                "bindu.server.handlers.task_handlers.LONG_POLL_RECHECK_INTERVAL", 10.0
+            ):
+                worker = asyncio.create_task(work())
+                response = await tm.get_task(
+                    _long_poll(task["id"], wait_for_change_ms=5000)
+                )
+                await worker
+
+            assert response["result"]["status"]["state"] == "working"
+            assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_get_task_wait_times_out_or_returns_at_once():
+    """Test the timeout, and no wait for a stale known_state or a terminal task."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            message = create_test_message(text="Test message")
+            task = await storage.submit_task(message["context_id"], message)
+
+            started = time.monotonic()
+            timed_out = await tm.get_task(_long_poll(task["id"], wait_for_change_ms=50))
+            assert 0.05 <= time.monotonic() - started < 1.0
+            assert timed_out["result"]["status"]["state"] == "submitted"
+
+            started = time.monotonic()
+            await tm.get_task(
+                _long_poll(task["id"], wait_for_change_ms=5000, known_state="working")
+            )
+            await storage.update_task(task["id"], state="completed")
+            await tm.get_task(_long_poll(task["id"], wait_for_change_ms=5000))
+            assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_get_task_wait_sees_changes_the_bus_missed():
+    """Test that the stored state is re-read when no event arrives."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            message = create_test_message(text="Test message")
+            task = await storage.submit_task(message["context_id"], message)
+
+            async def work_elsewhere():
+                await asyncio.sleep(0.05)
+                await storage.update_task(task["id"], state="failed")
+
+            with patch(
+                "bindu.server.handlers.task_handlers.LONG_POLL_RECHECK_INTERVAL", 0.01
+            ):
+                worker = asyncio.create_task(work_elsewhere())
+                response = await tm.get_task(
+                    _long_poll(task["id"], wait_for_change_ms=5000)
+                )
+                await worker
+
+            assert response["result"]["status"]["state"] == "failed"
+
+
 @pytest.mark.asyncio
 async def test_list_empty_tasks():
     """Test listing tasks when none exist."""
@@ -362,3 +461,48 @@ async def test_push_not_supported():
             # Should return PushNotificationNotSupportedError (-32005)
             if not tm._push_manager.is_push_supported():
                 assert_jsonrpc_error(response, -32005)
+
+
+@pytest.mark.asyncio
+async def test_send_message_can_be_retried_after_queue_full():
+    """Test that a busy reply leaves the task open for the same message again."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler(queue_size=0, overflow_policy="reject") as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            first = create_test_message(text="Hello")
+            await storage.submit_task(first["context_id"], first)
+            await storage.update_task(first["task_id"], state="input-required")
+
+            message = create_test_message(
+                text="Answer", task_id=first["task_id"], context_id=first["context_id"]
+            )
+
+            def request() -> SendMessageRequest:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": uuid4(),
+                    "method": "message/send",
+                    "params": {"message": dict(message)},
+                }
+
+            response = await tm.send_message(request())
+
+            assert_jsonrpc_error(response, -32040)
+            task = await storage.load_task(first["task_id"])
+            assert task["status"]["state"] == "input-required"
+            assert [m["message_id"] for m in task["history"]] == [first["message_id"]]
+
+            # A receiver waiting makes room for the retry
+            operations = scheduler.receive_task_operations()
+            received = asyncio.ensure_future(operations.__anext__())
+            await asyncio.sleep(0.05)
+            response = await tm.send_message(request())
+            await asyncio.wait_for(received, timeout=1.0)
+            await operations.aclose()
+
+            assert_jsonrpc_success(response)
+            task = await storage.load_task(first["task_id"])
+            assert task["status"]["state"] == "submitted"
+            assert len(task["history"]) == 2
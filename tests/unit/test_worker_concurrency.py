@@ -0,0 +1,171 @@
+"""Unit tests for concurrent task execution in the base Worker loop."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.base import Worker
+
+
+@dataclass
+class GatedWorker(Worker):
+    """Worker whose run_task blocks until the test releases it."""
+
+    started: list[Any] = field(default_factory=list)
+    finished: list[Any] = field(default_factory=list)
+    gate: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def run_task(self, params):
+        self.started.append(params["task_id"])
+        await self.gate.wait()
+        self.finished.append(params["task_id"])
+
+    async def cancel_task(self, params):
+        self.finished.append(("cancel", params["task_id"]))
+
+    def build_message_history(self, history):
+        return history
+
+    def build_artifacts(self, result):
+        return []
+
+
+async def _wait_for(predicate, timeout: float = 1.0) -> None:
+    """Poll until predicate() is true."""
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_operations_in_different_contexts_run_concurrently():
+    """Test that independent contexts execute at the same time."""
+    async with InMemoryScheduler() as scheduler:
+        worker = GatedWorker(
+            scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=4
+        )
+        async with worker.run():
+            task_ids = [uuid4() for _ in range(3)]
+            for task_id in task_ids:
+                await scheduler.run_task({"task_id": task_id, "context_id": uuid4()})
+
+            await _wait_for(lambda: len(worker.started) == 3)
+            assert worker.in_flight_count == 3
+            assert worker.finished == []
+
+            worker.gate.set()
+            await _wait_for(lambda: len(worker.finished) == 3)
+            assert worker.in_flight_count == 0
+
+
+@pytest.mark.asyncio
+async def test_operations_in_same_context_run_in_order():
+    """Test that a context's operations are queued behind the running one."""
+    async with InMemoryScheduler() as scheduler:
+        worker = GatedWorker(
+            scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=4
+        )
+        async with worker.run():
+            context_id = uuid4()
+            first, second = uuid4(), uuid4()
+            await scheduler.run_task({"task_id": first, "context_id": context_id})
+            await scheduler.run_task({"task_id": second, "context_id": context_id})
+
+            await _wait_for(lambda: worker.queued_count == 1)
+            assert worker.started == [first]
+            assert worker.in_flight_count == 1
+
+            worker.gate.set()
+            await _wait_for(lambda: len(worker.finished) == 2)
+            assert worker.started == [first, second]
+            assert worker.queued_count == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected():
+    """Test that no more than max_concurrent_tasks operations are held."""
+    async with InMemoryScheduler() as scheduler:
+        worker = GatedWorker(
+            scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=2
+        )
+        async with worker.run():
+
+            async def submit_all():
+                for _ in range(4):
+                    await scheduler.run_task(
+                        {"task_id": uuid4(), "context_id": uuid4()}
+                    )
+
+            producer = asyncio.create_task(submit_all())
+
+            await _wait_for(lambda: len(worker.started) == 2)
+            await asyncio.sleep(0.05)
+            assert len(worker.started) == 2
+
+            worker.gate.set()
+            await asyncio.wait_for(producer, timeout=1.0)
+            await _wait_for(lambda: len(worker.finished) == 4)
+
+
+@pytest.mark.asyncio
+async def test_cancel_is_not_queued_behind_context():
+    """Test that operations without a context_id bypass context ordering."""
+    async with InMemoryScheduler() as scheduler:
+        worker = GatedWorker(
+            scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=2
+        )
+        async with worker.run():
+            task_id = uuid4()
+            await scheduler.run_task({"task_id": task_id, "context_id": uuid4()})
+            await _wait_for(lambda: worker.started == [task_id])
+
+            await scheduler.cancel_task({"task_id": task_id})
+            await _wait_for(lambda: ("cancel", task_id) in worker.finished)
+
+            worker.gate.set()
+
+
+@pytest.mark.asyncio
+async def test_cancel_interrupts_running_task():
+    """Test that a serial worker stops a running task when it is canceled."""
+    async with InMemoryScheduler() as scheduler:
+        worker = GatedWorker(
+            scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=1
+        )
+        async with worker.run():
+            running, queued = uuid4(), uuid4()
+            await scheduler.run_task({"task_id": running, "context_id": uuid4()})
+            await scheduler.run_task({"task_id": queued, "context_id": uuid4()})
+            await _wait_for(lambda: worker.started == [running])
+
+            await scheduler.cancel_task({"task_id": running})
+
+            await _wait_for(lambda: worker.started == [running, queued])
+            assert running not in worker.finished
+            assert worker.finished[0] == ("cancel", running)
+
+
+@pytest.mark.asyncio
+async def test_canceled_queued_task_is_skipped():
+    """Test that a task canceled while queued is canceled instead of run."""
+    async with InMemoryScheduler() as scheduler:
+        worker = GatedWorker(
+            scheduler=scheduler, storage=InMemoryStorage(), max_concurrent_tasks=1
+        )
+        async with worker.run():
+            running, queued = uuid4(), uuid4()
+            await scheduler.run_task({"task_id": running, "context_id": uuid4()})
+            await scheduler.run_task({"task_id": queued, "context_id": uuid4()})
+            await _wait_for(lambda: worker.started == [running])
+
+            await scheduler.cancel_task({"task_id": queued})
+            worker.gate.set()
+
+            await _wait_for(lambda: len(worker.finished) == 3)
+            assert worker.started == [running]
+            assert worker.finished == [running, ("cancel", queued), ("cancel", queued)]
@@ -135,6 +135,25 @@ class TestX402Middleware:
         call_next.assert_called_once()
         assert response.body == b"ok"
 
+    @pytest.mark.asyncio
+    async def test_dispatch_batch(self, middleware):
+        """Test that batches pass through unless they hold a paid method."""
+        free = json.dumps([{"method": "tasks/get", "params": {}}]).encode()
+        call_next = AsyncMock(return_value=Response(content=b"ok"))
+        response = await middleware.dispatch(_make_request(body=free), call_next)
+        assert response.body == b"ok"
+
+        protected_method = app_settings.x402.protected_methods[0]
+        paid = json.dumps(
+            [{"method": "tasks/get"}, {"method": protected_method}]
+        ).encode()
+        call_next = AsyncMock(return_value=Response(content=b"ok"))
+        response = await middleware.dispatch(_make_request(body=paid), call_next)
+
+        call_next.assert_not_called()
+        assert response.status_code == 400
+        assert json.loads(response.body)["error"]["code"] == -32600
+
     @pytest.mark.asyncio
     async def test_dispatch_invalid_json_body(self, middleware):
         """Test dispatch with invalid JSON body."""